@@ -1,84 +0,0 @@
-﻿"""
-Anthropic Claude provider implementation
-"""
-from typing import List, Dict, Optional
-from anthropic import Anthropic
-from ai.base_provider import LLMProvider
-
-class AnthropicProvider(LLMProvider):
-    """Anthropic Claude provider"""
-    
-    def __init__(self, api_key: str, model: str = "claude-3-sonnet-20240229", 
-                 temperature: float = 0.7, max_tokens: int = 2000):
-        super().__init__(api_key, model, temperature, max_tokens)
-        self.client = Anthropic(api_key=api_key)
-    
-    def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
-        """Generate response using Anthropic API"""
-        try:
-            kwargs = {
-                "model": self.model,
-                "max_tokens": self.max_tokens,
-                "temperature": self.temperature,
-                "messages": [{"role": "user", "content": prompt}]
-            }
-            
-            if system_prompt:
-                kwargs["system"] = system_prompt
-            
-            response = self.client.messages.create(**kwargs)
-            return response.content[0].text
-        except Exception as e:
-            raise Exception(f"Anthropic API error: {str(e)}")
-    
-    def chat(self, messages: List[Dict[str, str]]) -> str:
-        """Chat with message history"""
-        try:
-            # Extract system message if present
-            system_prompt = None
-            chat_messages = []
-            
-            for msg in messages:
-                if msg["role"] == "system":
-                    system_prompt = msg["content"]
-                else:
-                    chat_messages.append(msg)
-            
-            kwargs = {
-                "model": self.model,
-                "max_tokens": self.max_tokens,
-                "temperature": self.temperature,
-                "messages": chat_messages
-            }
-            
-            if system_prompt:
-                kwargs["system"] = system_prompt
-            
-            response = self.client.messages.create(**kwargs)
-            return response.content[0].text
-        except Exception as e:
-            raise Exception(f"Anthropic API error: {str(e)}")
-    
-    def test_connection(self) -> bool:
-        """Test Anthropic connection"""
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=10,
-                messages=[{"role": "user", "content": "test"}]
-            )
-            return True
-        except Exception as e:
-            print(f"Anthropic connection test failed: {e}")
-            return False
-    
-    @staticmethod
-    def get_available_models() -> List[str]:
-        """Get available Anthropic models"""
-        return [
-            "claude-3-opus-20240229",
-            "claude-3-sonnet-20240229",
-            "claude-3-haiku-20240307",
-            "claude-2.1",
-            "claude-2.0",
-        ]
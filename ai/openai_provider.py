@@ -1,71 +0,0 @@
-﻿"""
-OpenAI provider implementation
-"""
-from typing import List, Dict, Optional
-from openai import OpenAI
-from ai.base_provider import LLMProvider
-
-class OpenAIProvider(LLMProvider):
-    """OpenAI GPT provider"""
-    
-    def __init__(self, api_key: str, model: str = "gpt-4-turbo-preview", 
-                 temperature: float = 0.7, max_tokens: int = 2000):
-        super().__init__(api_key, model, temperature, max_tokens)
-        self.client = OpenAI(api_key=api_key)
-    
-    def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
-        """Generate response using OpenAI API"""
-        messages = []
-        
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        
-        messages.append({"role": "user", "content": prompt})
-        
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            raise Exception(f"OpenAI API error: {str(e)}")
-    
-    def chat(self, messages: List[Dict[str, str]]) -> str:
-        """Chat with message history"""
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            raise Exception(f"OpenAI API error: {str(e)}")
-    
-    def test_connection(self) -> bool:
-        """Test OpenAI connection"""
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": "test"}],
-                max_tokens=5
-            )
-            return True
-        except Exception as e:
-            print(f"OpenAI connection test failed: {e}")
-            return False
-    
-    @staticmethod
-    def get_available_models() -> List[str]:
-        """Get available OpenAI models"""
-        return [
-            "gpt-4-turbo-preview",
-            "gpt-4",
-            "gpt-4-32k",
-            "gpt-3.5-turbo",
-            "gpt-3.5-turbo-16k",
-        ]
@@ -1,15 +1,37 @@
-"""LLM provider implementations"""
-from .base_provider import BaseLLMProvider
-from .openai_provider import OpenAIProvider
-from .anthropic_provider import AnthropicProvider
-from .bedrock_provider import BedrockProvider
-from .ollama_provider import OllamaProvider
+"""LLM provider implementations
+
+Concrete providers are loaded on first attribute access so that importing
+this package does not import every vendor SDK.
+"""
+from .base_provider import BaseLLMProvider, StreamInterruptedError
+from .cached_provider import CachedLLMProvider, ResponseCache
+from .routing_provider import RoutingLLMProvider, BackendHealth
+from .registry import ProviderRegistry
+
+_LAZY_PROVIDERS = {
+    'OpenAIProvider': 'openai',
+    'AnthropicProvider': 'anthropic',
+    'BedrockProvider': 'bedrock',
+    'OllamaProvider': 'ollama',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_PROVIDERS:
+        return ProviderRegistry.get_provider_class(_LAZY_PROVIDERS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'BaseLLMProvider',
+    'StreamInterruptedError',
     'OpenAIProvider',
     'AnthropicProvider',
     'BedrockProvider',
-    'OllamaProvider'
+    'OllamaProvider',
+    'CachedLLMProvider',
+    'ResponseCache',
+    'RoutingLLMProvider',
+    'BackendHealth',
+    'ProviderRegistry'
 ]
-
@@ -1,16 +1,89 @@
 """Anthropic Claude provider implementation"""
 
-import json
-from typing import Dict, Any, Optional
-from anthropic import Anthropic
-from .base_provider import BaseLLMProvider
+from typing import Dict, Any, Iterator, Optional
+from anthropic import Anthropic, AsyncAnthropic
+from core.json_recovery import JSONRecovery
+from core.json_schemas import split_schema
+from .base_provider import BaseLLMProvider, StreamInterruptedError
 
 class AnthropicProvider(BaseLLMProvider):
     """Anthropic Claude API provider"""
     
+    provider_name = "anthropic"
+    
+    AVAILABLE_MODELS = [
+        "claude-3-opus-20240229",
+        "claude-3-sonnet-20240229",
+        "claude-3-haiku-20240307",
+        "claude-2.1",
+        "claude-2.0",
+    ]
+    
+    CONTEXT_WINDOW = 200000
+    CONTEXT_WINDOWS = {
+        "claude-2": 100000,
+    }
+    
     def __init__(self, api_key: str, model_name: str = "claude-3-sonnet-20240229", **kwargs):
         super().__init__(model_name, **kwargs)
         self.client = Anthropic(api_key=api_key)
+        self.async_client = AsyncAnthropic(api_key=api_key)
+    
+    @classmethod
+    def from_config(cls, model_name: str, api_key: Optional[str] = None,
+                    endpoint_url: Optional[str] = None, **kwargs) -> "AnthropicProvider":
+        """Create provider from generic settings fields"""
+        return cls(api_key=api_key, model_name=model_name, **kwargs)
+    
+    def _request_kwargs(self, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """Build Messages API request arguments"""
+        kwargs = {
+            "model": self.model_name,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens
+        }
+        
+        if system_prompt:
+            kwargs["system"] = system_prompt
+        
+        return kwargs
+    
+    def supports_structured_output(self) -> bool:
+        """True when schemas are enforced through forced tool use"""
+        from config.settings import Settings
+        return Settings.LLM_STRUCTURED_OUTPUT
+    
+    def _json_request_kwargs(self, prompt: str, system_prompt: Optional[str] = None,
+                             schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build request arguments for generate_json()
+        
+        With a schema, the model is forced to call a single tool whose
+        input_schema is the schema; the tool input is the response.
+        """
+        structured = bool(schema) and self.supports_structured_output()
+        kwargs = self._request_kwargs(self._json_prompt(prompt, schema, enforced=structured), system_prompt)
+        
+        if structured:
+            name, body = split_schema(schema)
+            kwargs["tools"] = [{
+                "name": name,
+                "description": "Record the response as structured data.",
+                "input_schema": body
+            }]
+            kwargs["tool_choice"] = {"type": "tool", "name": name}
+        
+        return kwargs
+    
+    def _read_json_response(self, response, structured: bool) -> Dict[str, Any]:
+        """Extract JSON from a Messages API response (tool input or text)"""
+        for block in response.content:
+            if getattr(block, "type", None) == "tool_use":
+                JSONRecovery.record_parse(self.provider_name, 'native', structured=True)
+                return block.input
+        
+        text = "".join(getattr(block, "text", "") for block in response.content)
+        return self._parse_json_response(text, structured=structured)
     
     def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """Generate text from prompt
@@ -23,17 +96,26 @@ class AnthropicProvider(BaseLLMProvider):
             Generated text
         """
         try:
-            kwargs = {
-                "model": self.model_name,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": self.temperature,
-                "max_tokens": self.max_tokens
-            }
+            response = self.client.messages.create(**self._request_kwargs(prompt, system_prompt))
             
-            if system_prompt:
-                kwargs["system"] = system_prompt
+            return response.content[0].text
+        
+        except Exception as e:
+            print(f"Anthropic API error: {e}")
+            return f"Error generating response: {str(e)}"
+    
+    async def agenerate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """Generate text from prompt using the async client
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
             
-            response = self.client.messages.create(**kwargs)
+        Returns:
+            Generated text
+        """
+        try:
+            response = await self.async_client.messages.create(**self._request_kwargs(prompt, system_prompt))
             
             return response.content[0].text
         
@@ -41,46 +123,70 @@ class AnthropicProvider(BaseLLMProvider):
             print(f"Anthropic API error: {e}")
             return f"Error generating response: {str(e)}"
     
-    def generate_json(self, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
+    def generate_stream(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Generate text from prompt, yielding chunks as they arrive
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            
+        Yields:
+            Text chunks in order
+        """
+        started = False
+        try:
+            with self.client.messages.stream(**self._request_kwargs(prompt, system_prompt)) as stream:
+                for text in stream.text_stream:
+                    if text:
+                        started = True
+                        yield text
+        
+        except Exception as e:
+            print(f"Anthropic API error: {e}")
+            if started:
+                raise StreamInterruptedError(f"Anthropic stream interrupted: {e}") from e
+            yield f"Error generating response: {str(e)}"
+    
+    def generate_json(self, prompt: str, system_prompt: Optional[str] = None,
+                      schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Generate JSON response from prompt
         
         Args:
             prompt: User prompt (should request JSON format)
             system_prompt: Optional system prompt
+            schema: Optional JSON schema, enforced through tool use
             
         Returns:
             Parsed JSON response
         """
-        response_text = ""
         try:
-            if "JSON" not in prompt and "json" not in prompt:
-                prompt += "\n\nRespond with valid JSON only."
-            
-            response_text = self.generate(prompt, system_prompt)
+            kwargs = self._json_request_kwargs(prompt, system_prompt, schema)
+            response = self.client.messages.create(**kwargs)
             
-            # Clean response
-            response_text = response_text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
+            return self._read_json_response(response, structured="tools" in kwargs)
+        
+        except Exception as e:
+            print(f"Anthropic API error: {e}")
+            return self._parse_json_response(f"Error generating response: {str(e)}")
+    
+    async def agenerate_json(self, prompt: str, system_prompt: Optional[str] = None,
+                             schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Generate JSON response from prompt using the async client
+        
+        Args:
+            prompt: User prompt (should request JSON format)
+            system_prompt: Optional system prompt
+            schema: Optional JSON schema, enforced through tool use
             
-            response_text = response_text.strip()
+        Returns:
+            Parsed JSON response
+        """
+        try:
+            kwargs = self._json_request_kwargs(prompt, system_prompt, schema)
+            response = await self.async_client.messages.create(**kwargs)
             
-            return json.loads(response_text)
-        
-        except json.JSONDecodeError as e:
-            print(f"JSON parsing error: {e}")
-            return {
-                "error": f"Failed to parse JSON response: {e}",
-                "raw_response": response_text
-            }
+            return self._read_json_response(response, structured="tools" in kwargs)
+        
         except Exception as e:
-            print(f"Error: {e}")
-            return {
-                "error": str(e),
-                "raw_response": response_text
-            }
-
+            print(f"Anthropic API error: {e}")
+            return self._parse_json_response(f"Error generating response: {str(e)}")
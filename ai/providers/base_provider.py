@@ -1,11 +1,29 @@
 """Base class for LLM providers"""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional
+from core.json_recovery import JSONRecovery
+
+
+class StreamInterruptedError(RuntimeError):
+    """A streamed completion failed after some of its text was yielded"""
+
 
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers"""
     
+    # Registry name, used to label logs and JSON parse statistics
+    provider_name = "llm"
+    
+    # Common model names offered in the settings UI
+    AVAILABLE_MODELS: List[str] = []
+    
+    # Context window (tokens) assumed when a provider does not know better,
+    # and known windows by model-name prefix (longest prefix wins)
+    CONTEXT_WINDOW = 8192
+    CONTEXT_WINDOWS: Dict[str, int] = {}
+    
     def __init__(self, model_name: str, temperature: float = 0.7, 
                  max_tokens: int = 2000, **kwargs):
         """Initialize provider
@@ -21,6 +39,62 @@ class BaseLLMProvider(ABC):
         self.max_tokens = max_tokens
         self.extra_params = kwargs
     
+    @classmethod
+    def from_config(cls, model_name: str, api_key: Optional[str] = None,
+                    endpoint_url: Optional[str] = None, **kwargs) -> "BaseLLMProvider":
+        """Create provider from generic settings fields
+        
+        Each provider maps api_key/endpoint_url onto its own constructor
+        arguments; providers that need neither ignore them.
+        
+        Args:
+            model_name: Name of the model to use
+            api_key: API key (if the provider needs one)
+            endpoint_url: Endpoint URL or region (if the provider needs one)
+            **kwargs: temperature, max_tokens, etc.
+            
+        Returns:
+            Provider instance
+        """
+        return cls(model_name, **kwargs)
+    
+    @classmethod
+    def get_available_models(cls) -> List[str]:
+        """Get list of common models for this provider"""
+        return list(cls.AVAILABLE_MODELS)
+    
+    def context_window(self) -> int:
+        """Get the context window of the configured model in tokens"""
+        matches = [prefix for prefix in self.CONTEXT_WINDOWS if (self.model_name or "").startswith(prefix)]
+        if matches:
+            return self.CONTEXT_WINDOWS[max(matches, key=len)]
+        return self.CONTEXT_WINDOW
+    
+    def prompt_token_budget(self) -> int:
+        """Get the token budget for system prompt plus user prompt
+        
+        The context window minus room for the response, capped by
+        Settings.LLM_PROMPT_TOKEN_BUDGET.
+        """
+        from config.settings import Settings
+        window = self.context_window()
+        reserved = min(self.max_tokens or 0, window // 2)
+        return min(window - reserved, Settings.LLM_PROMPT_TOKEN_BUDGET)
+    
+    def token_counter(self):
+        """Get a token counter for this provider's model (approximate by default)"""
+        from core.prompt_packer import TokenCounter
+        return TokenCounter(self.model_name)
+    
+    def test_connection(self) -> bool:
+        """Test the connection to the provider
+        
+        Returns:
+            True if a short completion succeeds
+        """
+        response = self.generate("test")
+        return bool(response) and not response.startswith(("Error:", "Error generating response"))
+    
     @abstractmethod
     def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """Generate text from prompt
@@ -35,18 +109,110 @@ class BaseLLMProvider(ABC):
         pass
     
     @abstractmethod
-    def generate_json(self, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
+    def generate_json(self, prompt: str, system_prompt: Optional[str] = None,
+                      schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Generate JSON response from prompt
         
         Args:
             prompt: User prompt
             system_prompt: Optional system prompt
+            schema: Optional JSON schema (see core.json_schemas) enforced
+                through the provider's structured-output mode when it has one
             
         Returns:
             Parsed JSON response
         """
         pass
     
+    def supports_structured_output(self) -> bool:
+        """True when generate_json(schema=...) uses a native structured-output mode"""
+        return False
+    
+    def _json_prompt(self, prompt: str, schema: Optional[Dict[str, Any]] = None,
+                     enforced: bool = False) -> str:
+        """Add JSON format instructions to a prompt
+        
+        Args:
+            prompt: User prompt
+            schema: Optional JSON schema
+            enforced: The provider enforces the schema itself, so it is not
+                repeated in the prompt
+            
+        Returns:
+            Prompt with instructions appended
+        """
+        if schema and not enforced:
+            from core.json_schemas import schema_instruction
+            return f"{prompt}\n\n{schema_instruction(schema)}"
+        if "JSON" not in prompt and "json" not in prompt:
+            prompt += "\n\nRespond with valid JSON only."
+        return prompt
+    
+    def _parse_json_response(self, response_text: str, structured: bool = False) -> Dict[str, Any]:
+        """Parse JSON from a completion
+        
+        Args:
+            response_text: Raw completion text (or provider error string)
+            structured: The completion came from a native structured-output mode
+            
+        Returns:
+            Parsed JSON response or error dict
+        """
+        if not response_text or not response_text.strip():
+            return {"error": f"Empty response from {self.provider_name}", "raw_response": response_text}
+        
+        if response_text.startswith(("Error:", "Error generating response")):
+            return {"error": response_text, "raw_response": response_text}
+        
+        return JSONRecovery.parse_response(response_text, source=self.provider_name, structured=structured)
+    
+    def generate_stream(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Generate text from prompt, yielding chunks as they arrive
+        
+        Providers without a streaming API fall back to a single chunk
+        containing the full completion. Failures before the first chunk
+        are yielded as one "Error..." string, like generate(); a failure
+        after it raises StreamInterruptedError, so a cut-short text is
+        never mistaken for a complete one.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            
+        Yields:
+            Text chunks in order
+        """
+        yield self.generate(prompt, system_prompt)
+    
+    async def agenerate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """Generate text from prompt without blocking the event loop
+        
+        Providers with an async client override this; the default runs
+        generate() in a worker thread.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            
+        Returns:
+            Generated text
+        """
+        return await asyncio.to_thread(self.generate, prompt, system_prompt)
+    
+    async def agenerate_json(self, prompt: str, system_prompt: Optional[str] = None,
+                             schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Generate JSON response from prompt without blocking the event loop
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            schema: Optional JSON schema (see generate_json)
+            
+        Returns:
+            Parsed JSON response
+        """
+        return await asyncio.to_thread(self.generate_json, prompt, system_prompt, schema)
+    
     def format_messages(self, prompt: str, system_prompt: Optional[str] = None) -> list:
         """Format messages for chat-based models
         
@@ -1,18 +1,46 @@
 """AWS Bedrock provider implementation"""
 
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 import boto3
-from .base_provider import BaseLLMProvider
+from .base_provider import BaseLLMProvider, StreamInterruptedError
 
 class BedrockProvider(BaseLLMProvider):
     """AWS Bedrock API provider"""
     
+    provider_name = "bedrock"
+    
+    AVAILABLE_MODELS = [
+        "anthropic.claude-3-opus-20240229-v1:0",
+        "anthropic.claude-3-sonnet-20240229-v1:0",
+        "anthropic.claude-3-haiku-20240307-v1:0",
+        "anthropic.claude-v2:1",
+        "anthropic.claude-v2",
+        "amazon.titan-text-express-v1",
+        "amazon.titan-text-lite-v1",
+    ]
+    
+    CONTEXT_WINDOWS = {
+        "anthropic.claude-3": 200000,
+        "anthropic.claude-v2": 100000,
+        "amazon.titan-text-express": 8192,
+        "amazon.titan-text-lite": 4096,
+    }
+    
     def __init__(self, model_name: str = "anthropic.claude-3-sonnet-20240229-v1:0", 
                  region_name: str = "us-east-1", **kwargs):
         super().__init__(model_name, **kwargs)
         self.client = boto3.client('bedrock-runtime', region_name=region_name)
     
+    @classmethod
+    def from_config(cls, model_name: str, api_key: Optional[str] = None,
+                    endpoint_url: Optional[str] = None, **kwargs) -> "BedrockProvider":
+        """Create provider from generic settings fields
+        
+        Credentials come from the AWS environment; endpoint_url carries the region.
+        """
+        return cls(model_name=model_name, region_name=endpoint_url or "us-east-1", **kwargs)
+    
     def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """Generate text from prompt
         
@@ -36,8 +64,58 @@ class BedrockProvider(BaseLLMProvider):
             print(f"Bedrock API error: {e}")
             return f"Error generating response: {str(e)}"
     
-    def _generate_anthropic(self, prompt: str, system_prompt: Optional[str] = None) -> str:
-        """Generate using Anthropic models on Bedrock"""
+    def generate_stream(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Generate text from prompt, yielding chunks as they arrive
+        
+        Uses invoke_model_with_response_stream; each event carries a JSON
+        chunk in the model's native streaming format.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            
+        Yields:
+            Text chunks in order
+        """
+        started = False
+        try:
+            is_anthropic = "anthropic" in self.model_name.lower()
+            if is_anthropic:
+                request_body = self._anthropic_request_body(prompt, system_prompt)
+            elif "titan" in self.model_name.lower():
+                request_body = self._titan_request_body(prompt, system_prompt)
+            else:
+                yield "Unsupported model type"
+                return
+            
+            response = self.client.invoke_model_with_response_stream(
+                modelId=self.model_name,
+                body=json.dumps(request_body)
+            )
+            
+            for event in response['body']:
+                chunk = event.get('chunk')
+                if not chunk:
+                    continue
+                data = json.loads(chunk['bytes'])
+                if is_anthropic:
+                    if data.get('type') != 'content_block_delta':
+                        continue
+                    text = data.get('delta', {}).get('text', '')
+                else:
+                    text = data.get('outputText', '')
+                if text:
+                    started = True
+                    yield text
+        
+        except Exception as e:
+            print(f"Bedrock API error: {e}")
+            if started:
+                raise StreamInterruptedError(f"Bedrock stream interrupted: {e}") from e
+            yield f"Error generating response: {str(e)}"
+    
+    def _anthropic_request_body(self, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """Build request body for Anthropic models on Bedrock"""
         request_body = {
             "anthropic_version": "bedrock-2023-05-31",
             "messages": [{"role": "user", "content": prompt}],
@@ -48,72 +126,63 @@ class BedrockProvider(BaseLLMProvider):
         if system_prompt:
             request_body["system"] = system_prompt
         
-        response = self.client.invoke_model(
-            modelId=self.model_name,
-            body=json.dumps(request_body)
-        )
-        
-        response_body = json.loads(response['body'].read())
-        return response_body['content'][0]['text']
+        return request_body
     
-    def _generate_titan(self, prompt: str, system_prompt: Optional[str] = None) -> str:
-        """Generate using Titan models on Bedrock"""
+    def _titan_request_body(self, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """Build request body for Titan models on Bedrock"""
         full_prompt = prompt
         if system_prompt:
             full_prompt = f"{system_prompt}\n\n{prompt}"
         
-        request_body = {
+        return {
             "inputText": full_prompt,
             "textGenerationConfig": {
                 "temperature": self.temperature,
                 "maxTokenCount": self.max_tokens
             }
         }
+    
+    def _generate_anthropic(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """Generate using Anthropic models on Bedrock"""
+        response = self.client.invoke_model(
+            modelId=self.model_name,
+            body=json.dumps(self._anthropic_request_body(prompt, system_prompt))
+        )
         
+        response_body = json.loads(response['body'].read())
+        return response_body['content'][0]['text']
+    
+    def _generate_titan(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """Generate using Titan models on Bedrock"""
         response = self.client.invoke_model(
             modelId=self.model_name,
-            body=json.dumps(request_body)
+            body=json.dumps(self._titan_request_body(prompt, system_prompt))
         )
         
         response_body = json.loads(response['body'].read())
         return response_body['results'][0]['outputText']
     
-    def generate_json(self, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
+    def generate_json(self, prompt: str, system_prompt: Optional[str] = None,
+                      schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Generate JSON response from prompt
         
+        InvokeModel has no structured-output mode, so the schema is given
+        to the model in the prompt.
+        
         Args:
             prompt: User prompt (should request JSON format)
             system_prompt: Optional system prompt
+            schema: Optional JSON schema
             
         Returns:
             Parsed JSON response
         """
         response_text = ""
         try:
-            if "JSON" not in prompt and "json" not in prompt:
-                prompt += "\n\nRespond with valid JSON only."
+            response_text = self.generate(self._json_prompt(prompt, schema), system_prompt)
             
-            response_text = self.generate(prompt, system_prompt)
-            
-            # Clean response
-            response_text = response_text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            
-            response_text = response_text.strip()
-            
-            return json.loads(response_text)
+            return self._parse_json_response(response_text)
         
-        except json.JSONDecodeError as e:
-            print(f"JSON parsing error: {e}")
-            return {
-                "error": f"Failed to parse JSON response: {e}",
-                "raw_response": response_text
-            }
         except Exception as e:
             print(f"Error: {e}")
             return {
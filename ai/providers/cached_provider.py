@@ -0,0 +1,418 @@
+"""Response cache layer for LLM providers"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional
+from .base_provider import BaseLLMProvider
+
+
+class ResponseCache:
+    """Content-addressed cache for LLM responses
+
+    Two tiers: a size-bounded in-memory LRU in front of a file-backed
+    store (one JSON file per key). Entries expire after ``ttl_seconds``.
+    Writes prune the file store (expired files, then the oldest beyond
+    ``max_files``) at most once per ``PRUNE_INTERVAL_SECONDS``.
+    """
+
+    PRUNE_INTERVAL_SECONDS = 600
+
+    _instance = None
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: int = 512,
+                 ttl_seconds: int = 7 * 24 * 3600, max_files: int = 5000):
+        """Initialize cache
+
+        Args:
+            cache_dir: Directory for the persistent tier (None disables it)
+            max_entries: Maximum entries kept in memory
+            ttl_seconds: Entry lifetime in seconds (0 means no expiry)
+            max_files: Maximum files kept in cache_dir (0 means no limit)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_files = max_files
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._last_prune = 0.0
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def get_instance(cls) -> "ResponseCache":
+        """Get shared cache instance configured from Settings"""
+        if cls._instance is None:
+            from config.settings import Settings
+            cls._instance = cls(
+                cache_dir=Settings.LLM_CACHE_DIR if Settings.LLM_CACHE_PERSIST else None,
+                max_entries=Settings.LLM_CACHE_MAX_ENTRIES,
+                ttl_seconds=Settings.LLM_CACHE_TTL_SECONDS,
+                max_files=Settings.LLM_CACHE_MAX_FILES
+            )
+        return cls._instance
+
+    @staticmethod
+    def make_key(provider_name: str, model_name: str, temperature: Any, max_tokens: Any,
+                 system_prompt: Optional[str], prompt: str, kind: str = "text") -> str:
+        """Build a content-addressed cache key
+
+        Args:
+            provider_name: Provider class name
+            model_name: Model name
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+            prompt: User prompt
+            kind: Response kind ('text' or 'json')
+
+        Returns:
+            Hex digest identifying the request
+        """
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        material = json.dumps(
+            [provider_name, model_name, str(temperature), str(max_tokens),
+             system_prompt or "", prompt_hash, kind],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _expired(self, created_at: float) -> bool:
+        return bool(self.ttl_seconds) and (time.time() - created_at) > self.ttl_seconds
+
+    def _file_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _record(self, service: str, field: str):
+        stats = self._stats.setdefault(
+            service, {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'bypassed': 0}
+        )
+        stats[field] += 1
+
+    def get(self, key: str, service: str = "default") -> Optional[Any]:
+        """Look up a cached response
+
+        Args:
+            key: Cache key from make_key()
+            service: Calling service name (for hit-rate accounting)
+
+        Returns:
+            Cached value or None on miss
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, value = entry
+                if not self._expired(created_at):
+                    self._memory.move_to_end(key)
+                    self._record(service, 'memory_hits')
+                    return copy.deepcopy(value)
+                del self._memory[key]
+
+        if self.cache_dir:
+            path = self._file_for(key)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if not self._expired(data['created_at']):
+                    with self._lock:
+                        self._store_memory(key, data['created_at'], data['value'])
+                        self._record(service, 'disk_hits')
+                    return copy.deepcopy(data['value'])
+                path.unlink(missing_ok=True)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"[WARNING] Could not read LLM cache entry {key[:12]}: {e}")
+
+        with self._lock:
+            self._record(service, 'misses')
+        return None
+
+    def _store_memory(self, key: str, created_at: float, value: Any):
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def set(self, key: str, value: Any):
+        """Store a response in both tiers
+
+        Args:
+            key: Cache key from make_key()
+            value: JSON-serializable response
+        """
+        created_at = time.time()
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._store_memory(key, created_at, value)
+
+        if self.cache_dir:
+            path = self._file_for(key)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'created_at': created_at, 'value': value}, f)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                print(f"[WARNING] Could not write LLM cache entry {key[:12]}: {e}")
+            self._maybe_prune()
+
+    def _maybe_prune(self):
+        now = time.time()
+        with self._lock:
+            if now - self._last_prune < self.PRUNE_INTERVAL_SECONDS:
+                return
+            self._last_prune = now
+        try:
+            self.prune()
+        except Exception as e:
+            print(f"[WARNING] Could not prune LLM cache: {e}")
+
+    def prune(self) -> int:
+        """Delete expired files, then the oldest beyond max_files, from the disk tier
+
+        A file is written once per entry, so its mtime is the entry's
+        created_at and no file has to be read.
+
+        Returns:
+            Number of files removed
+        """
+        if not self.cache_dir or not self.cache_dir.exists():
+            return 0
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        entries.sort()
+
+        now = time.time()
+        excess = len(entries) - self.max_files if self.max_files else 0
+        removed = 0
+        for index, (modified_at, path) in enumerate(entries):
+            if index >= excess and not (self.ttl_seconds and now - modified_at > self.ttl_seconds):
+                # Oldest first: the remaining files are newer still
+                break
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def record_bypass(self, service: str = "default"):
+        """Count a call that skipped the cache"""
+        with self._lock:
+            self._record(service, 'bypassed')
+
+    def clear(self):
+        """Remove all entries from both tiers"""
+        with self._lock:
+            self._memory.clear()
+        if self.cache_dir and self.cache_dir.exists():
+            for path in self.cache_dir.glob("*/*.json"):
+                path.unlink(missing_ok=True)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-service hit statistics
+
+        Returns:
+            Dict mapping service name to counters and hit_rate (0-1)
+        """
+        with self._lock:
+            result = {}
+            for service, stats in self._stats.items():
+                hits = stats['memory_hits'] + stats['disk_hits']
+                lookups = hits + stats['misses']
+                result[service] = dict(stats, hit_rate=round(hits / lookups, 3) if lookups else 0.0)
+            return result
+
+
+class CachedLLMProvider(BaseLLMProvider):
+    """Wraps a provider and serves repeated prompts from ResponseCache"""
+
+    def __init__(self, provider: BaseLLMProvider, cache: Optional[ResponseCache] = None,
+                 service: str = "default"):
+        """Initialize wrapper
+
+        Args:
+            provider: Underlying LLM provider
+            cache: Response cache (shared instance if None)
+            service: Calling service name used for hit-rate accounting
+        """
+        super().__init__(provider.model_name, temperature=provider.temperature,
+                         max_tokens=provider.max_tokens)
+        self.provider = provider
+        self.cache = cache or ResponseCache.get_instance()
+        self.service = service
+
+    def __getattr__(self, name):
+        # Delegate provider-specific helpers (e.g. list_models, base_url)
+        return getattr(self.provider, name)
+
+    @property
+    def provider_name(self) -> str:
+        return self.provider.provider_name
+
+    def supports_structured_output(self) -> bool:
+        return self.provider.supports_structured_output()
+
+    def context_window(self) -> int:
+        return self.provider.context_window()
+
+    def prompt_token_budget(self) -> int:
+        return self.provider.prompt_token_budget()
+
+    def token_counter(self):
+        return self.provider.token_counter()
+
+    def for_service(self, service: Optional[str]) -> "CachedLLMProvider":
+        """Get a view of this provider that reports stats under another service name"""
+        if not service or service == self.service:
+            return self
+        return CachedLLMProvider(self.provider, cache=self.cache, service=service)
+
+    @staticmethod
+    def _json_kind(schema: Optional[Dict[str, Any]]) -> str:
+        # The schema changes the request, so it is part of the key
+        if not schema:
+            return "json"
+        digest = hashlib.sha256(json.dumps(schema, sort_keys=True).encode('utf-8')).hexdigest()
+        return f"json:{digest[:16]}"
+
+    def _key(self, prompt: str, system_prompt: Optional[str], kind: str) -> str:
+        return ResponseCache.make_key(
+            type(self.provider).__name__, self.provider.model_name,
+            self.provider.temperature, self.provider.max_tokens,
+            system_prompt, prompt, kind
+        )
+
+    def generate(self, prompt: str, system_prompt: Optional[str] = None,
+                 use_cache: bool = True) -> str:
+        """Generate text from prompt, using the cache when allowed
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            use_cache: Set False to force a fresh completion
+
+        Returns:
+            Generated text
+        """
+        if not use_cache:
+            self.cache.record_bypass(self.service)
+            return self.provider.generate(prompt, system_prompt)
+
+        key = self._key(prompt, system_prompt, "text")
+        cached = self.cache.get(key, self.service)
+        if cached is not None:
+            return cached
+
+        response = self.provider.generate(prompt, system_prompt)
+        # Providers report failures as text; never cache those
+        if response and not response.startswith(("Error:", "Error generating response")):
+            self.cache.set(key, response)
+        return response
+
+    def generate_stream(self, prompt: str, system_prompt: Optional[str] = None,
+                        use_cache: bool = True) -> Iterator[str]:
+        """Stream text from prompt; a cache hit is yielded as a single chunk
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            use_cache: Set False to force a fresh completion
+
+        Yields:
+            Text chunks in order
+        """
+        if not use_cache:
+            self.cache.record_bypass(self.service)
+            yield from self.provider.generate_stream(prompt, system_prompt)
+            return
+
+        key = self._key(prompt, system_prompt, "text")
+        cached = self.cache.get(key, self.service)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        for chunk in self.provider.generate_stream(prompt, system_prompt):
+            chunks.append(chunk)
+            yield chunk
+
+        response = "".join(chunks)
+        if response and not response.startswith(("Error:", "Error generating response")):
+            self.cache.set(key, response)
+
+    def generate_json(self, prompt: str, system_prompt: Optional[str] = None,
+                      schema: Optional[Dict[str, Any]] = None,
+                      use_cache: bool = True) -> Dict[str, Any]:
+        """Generate JSON response from prompt, using the cache when allowed
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            schema: Optional JSON schema
+            use_cache: Set False to force a fresh completion
+
+        Returns:
+            Parsed JSON response
+        """
+        if not use_cache:
+            self.cache.record_bypass(self.service)
+            return self.provider.generate_json(prompt, system_prompt, schema)
+
+        key = self._key(prompt, system_prompt, self._json_kind(schema))
+        cached = self.cache.get(key, self.service)
+        if cached is not None:
+            return cached
+
+        response = self.provider.generate_json(prompt, system_prompt, schema)
+        if response and not (isinstance(response, dict) and 'error' in response):
+            self.cache.set(key, response)
+        return response
+
+    async def agenerate(self, prompt: str, system_prompt: Optional[str] = None,
+                        use_cache: bool = True) -> str:
+        """Async variant of generate()"""
+        if not use_cache:
+            self.cache.record_bypass(self.service)
+            return await self.provider.agenerate(prompt, system_prompt)
+
+        key = self._key(prompt, system_prompt, "text")
+        cached = self.cache.get(key, self.service)
+        if cached is not None:
+            return cached
+
+        response = await self.provider.agenerate(prompt, system_prompt)
+        if response and not response.startswith(("Error:", "Error generating response")):
+            self.cache.set(key, response)
+        return response
+
+    async def agenerate_json(self, prompt: str, system_prompt: Optional[str] = None,
+                             schema: Optional[Dict[str, Any]] = None,
+                             use_cache: bool = True) -> Dict[str, Any]:
+        """Async variant of generate_json()"""
+        if not use_cache:
+            self.cache.record_bypass(self.service)
+            return await self.provider.agenerate_json(prompt, system_prompt, schema)
+
+        key = self._key(prompt, system_prompt, self._json_kind(schema))
+        cached = self.cache.get(key, self.service)
+        if cached is not None:
+            return cached
+
+        response = await self.provider.agenerate_json(prompt, system_prompt, schema)
+        if response and not (isinstance(response, dict) and 'error' in response):
+            self.cache.set(key, response)
+        return response
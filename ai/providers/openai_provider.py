@@ -1,16 +1,94 @@
 """OpenAI provider implementation"""
 
-import json
-from typing import Dict, Any, Optional
-from openai import OpenAI
-from .base_provider import BaseLLMProvider
+from typing import Dict, Any, Iterator, Optional
+from openai import OpenAI, AsyncOpenAI
+from core.json_schemas import split_schema
+from .base_provider import BaseLLMProvider, StreamInterruptedError
 
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI API provider"""
     
+    provider_name = "openai"
+    
+    AVAILABLE_MODELS = [
+        "gpt-4-turbo-preview",
+        "gpt-4",
+        "gpt-4-32k",
+        "gpt-3.5-turbo",
+        "gpt-3.5-turbo-16k",
+    ]
+    
+    CONTEXT_WINDOWS = {
+        "gpt-4": 8192,
+        "gpt-4-32k": 32768,
+        "gpt-4-turbo": 128000,
+        "gpt-4-1106": 128000,
+        "gpt-4-0125": 128000,
+        "gpt-4o": 128000,
+        "gpt-3.5-turbo": 16385,
+    }
+    
+    # response_format support by model-name prefix: json_schema (structured
+    # outputs) or json_object (JSON mode); older models get prompt-only JSON
+    JSON_SCHEMA_MODELS = ("gpt-4o", "gpt-4.1", "o1", "o3", "o4")
+    JSON_OBJECT_MODELS = ("gpt-4-turbo", "gpt-4-1106", "gpt-4-0125", "gpt-3.5-turbo")
+    
     def __init__(self, api_key: str, model_name: str = "gpt-4", **kwargs):
         super().__init__(model_name, **kwargs)
         self.client = OpenAI(api_key=api_key)
+        self.async_client = AsyncOpenAI(api_key=api_key)
+    
+    @classmethod
+    def from_config(cls, model_name: str, api_key: Optional[str] = None,
+                    endpoint_url: Optional[str] = None, **kwargs) -> "OpenAIProvider":
+        """Create provider from generic settings fields"""
+        return cls(api_key=api_key, model_name=model_name, **kwargs)
+    
+    def token_counter(self):
+        """Get a tiktoken-based counter (approximate if tiktoken is missing)"""
+        from core.prompt_packer import TokenCounter
+        return TokenCounter(self.model_name, use_tiktoken=True)
+    
+    def _request_kwargs(self, prompt: str, system_prompt: Optional[str] = None,
+                        response_format: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build chat completion request arguments"""
+        kwargs = {
+            "model": self.model_name,
+            "messages": self.format_messages(prompt, system_prompt),
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens
+        }
+        
+        if response_format:
+            kwargs["response_format"] = response_format
+        
+        return kwargs
+    
+    def _json_mode(self) -> Optional[str]:
+        """Get the response_format type the model supports ('json_schema', 'json_object' or None)"""
+        from config.settings import Settings
+        if not Settings.LLM_STRUCTURED_OUTPUT:
+            return None
+        model = self.model_name or ""
+        if model.startswith(self.JSON_SCHEMA_MODELS):
+            return "json_schema"
+        if model.startswith(self.JSON_OBJECT_MODELS):
+            return "json_object"
+        return None
+    
+    def supports_structured_output(self) -> bool:
+        """True when the model accepts a JSON response_format"""
+        return self._json_mode() is not None
+    
+    def _response_format(self, schema: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Build response_format for generate_json()"""
+        mode = self._json_mode()
+        if mode == "json_schema" and schema:
+            name, body = split_schema(schema)
+            return {"type": "json_schema", "json_schema": {"name": name, "schema": body, "strict": True}}
+        if mode:
+            return {"type": "json_object"}
+        return None
     
     def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """Generate text from prompt
@@ -23,14 +101,26 @@ class OpenAIProvider(BaseLLMProvider):
             Generated text
         """
         try:
-            messages = self.format_messages(prompt, system_prompt)
+            response = self.client.chat.completions.create(**self._request_kwargs(prompt, system_prompt))
             
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
-            )
+            return response.choices[0].message.content
+        
+        except Exception as e:
+            print(f"OpenAI API error: {e}")
+            return f"Error generating response: {str(e)}"
+    
+    async def agenerate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """Generate text from prompt using the async client
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            
+        Returns:
+            Generated text
+        """
+        try:
+            response = await self.async_client.chat.completions.create(**self._request_kwargs(prompt, system_prompt))
             
             return response.choices[0].message.content
         
@@ -38,49 +128,90 @@ class OpenAIProvider(BaseLLMProvider):
             print(f"OpenAI API error: {e}")
             return f"Error generating response: {str(e)}"
     
-    def generate_json(self, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
+    def generate_stream(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Generate text from prompt, yielding chunks as they arrive
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            
+        Yields:
+            Text chunks in order
+        """
+        started = False
+        try:
+            stream = self.client.chat.completions.create(
+                **self._request_kwargs(prompt, system_prompt),
+                stream=True
+            )
+            
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                text = chunk.choices[0].delta.content
+                if text:
+                    started = True
+                    yield text
+        
+        except Exception as e:
+            print(f"OpenAI API error: {e}")
+            if started:
+                raise StreamInterruptedError(f"OpenAI stream interrupted: {e}") from e
+            yield f"Error generating response: {str(e)}"
+    
+    def generate_json(self, prompt: str, system_prompt: Optional[str] = None,
+                      schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Generate JSON response from prompt
         
+        Uses response_format so the completion is valid JSON (matching
+        schema on models with structured outputs).
+        
         Args:
             prompt: User prompt (should request JSON format)
             system_prompt: Optional system prompt
+            schema: Optional JSON schema
             
         Returns:
             Parsed JSON response
         """
-        response_text = ""
+        response_format = self._response_format(schema)
+        enforced = response_format is not None and response_format["type"] == "json_schema"
+        prompt = self._json_prompt(prompt, schema, enforced=enforced)
+        
         try:
-            # Add JSON format instruction
-            if "JSON" not in prompt and "json" not in prompt:
-                prompt += "\n\nRespond with valid JSON only."
-            
-            response_text = self.generate(prompt, system_prompt)
-            
-            # Try to extract JSON from response
-            # Remove markdown code blocks if present
-            response_text = response_text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            
-            response_text = response_text.strip()
+            response = self.client.chat.completions.create(
+                **self._request_kwargs(prompt, system_prompt, response_format)
+            )
+            response_text = response.choices[0].message.content
+        except Exception as e:
+            print(f"OpenAI API error: {e}")
+            response_text = f"Error generating response: {str(e)}"
+        
+        return self._parse_json_response(response_text, structured=response_format is not None)
+    
+    async def agenerate_json(self, prompt: str, system_prompt: Optional[str] = None,
+                             schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Generate JSON response from prompt using the async client
+        
+        Args:
+            prompt: User prompt (should request JSON format)
+            system_prompt: Optional system prompt
+            schema: Optional JSON schema
             
-            return json.loads(response_text)
+        Returns:
+            Parsed JSON response
+        """
+        response_format = self._response_format(schema)
+        enforced = response_format is not None and response_format["type"] == "json_schema"
+        prompt = self._json_prompt(prompt, schema, enforced=enforced)
         
-        except json.JSONDecodeError as e:
-            print(f"JSON parsing error: {e}")
-            print(f"Response: {response_text[:200]}")
-            return {
-                "error": f"Failed to parse JSON response: {e}",
-                "raw_response": response_text
-            }
+        try:
+            response = await self.async_client.chat.completions.create(
+                **self._request_kwargs(prompt, system_prompt, response_format)
+            )
+            response_text = response.choices[0].message.content
         except Exception as e:
-            print(f"Error: {e}")
-            return {
-                "error": str(e),
-                "raw_response": response_text
-            }
-
+            print(f"OpenAI API error: {e}")
+            response_text = f"Error generating response: {str(e)}"
+        
+        return self._parse_json_response(response_text, structured=response_format is not None)
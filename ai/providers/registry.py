@@ -0,0 +1,98 @@
+"""Registry of LLM providers with lazy SDK imports"""
+
+import importlib
+import threading
+from typing import Dict, List, Optional, Tuple, Type
+from .base_provider import BaseLLMProvider
+
+
+class ProviderRegistry:
+    """Maps provider names to provider classes
+
+    Provider modules (and the SDKs they pull in: openai, anthropic, boto3,
+    httpx) are only imported the first time a provider is requested, so
+    start-up cost is paid for the configured backend alone.
+    """
+
+    # name -> (module path, class name)
+    _providers: Dict[str, Tuple[str, str]] = {
+        'openai': ('ai.providers.openai_provider', 'OpenAIProvider'),
+        'anthropic': ('ai.providers.anthropic_provider', 'AnthropicProvider'),
+        'bedrock': ('ai.providers.bedrock_provider', 'BedrockProvider'),
+        'ollama': ('ai.providers.ollama_provider', 'OllamaProvider'),
+    }
+    _classes: Dict[str, Type[BaseLLMProvider]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def register(cls, name: str, module_path: str, class_name: str):
+        """Register a provider implementation
+
+        Args:
+            name: Provider name as stored in llm_settings.provider_name
+            module_path: Dotted module path containing the class
+            class_name: Provider class name
+        """
+        with cls._lock:
+            cls._providers[name.lower()] = (module_path, class_name)
+            cls._classes.pop(name.lower(), None)
+
+    @classmethod
+    def available_providers(cls) -> List[str]:
+        """Get registered provider names"""
+        return list(cls._providers.keys())
+
+    @classmethod
+    def get_provider_class(cls, name: str) -> Type[BaseLLMProvider]:
+        """Get provider class, importing its module on first use
+
+        Args:
+            name: Provider name
+
+        Returns:
+            Provider class
+
+        Raises:
+            ValueError: If the provider is not registered
+        """
+        key = (name or "").lower()
+        provider_class = cls._classes.get(key)
+        if provider_class is not None:
+            return provider_class
+
+        if key not in cls._providers:
+            raise ValueError(f"Unknown provider: {name}")
+
+        with cls._lock:
+            if key not in cls._classes:
+                module_path, class_name = cls._providers[key]
+                module = importlib.import_module(module_path)
+                cls._classes[key] = getattr(module, class_name)
+            return cls._classes[key]
+
+    @classmethod
+    def create(cls, name: str, model_name: str, api_key: Optional[str] = None,
+               endpoint_url: Optional[str] = None, **kwargs) -> BaseLLMProvider:
+        """Create a provider instance
+
+        Args:
+            name: Provider name ('openai', 'anthropic', 'bedrock', 'ollama')
+            model_name: Model name
+            api_key: API key (if the provider needs one)
+            endpoint_url: Endpoint URL or region (if the provider needs one)
+            **kwargs: temperature, max_tokens, etc.
+
+        Returns:
+            Provider instance
+        """
+        provider_class = cls.get_provider_class(name)
+        return provider_class.from_config(model_name, api_key=api_key,
+                                          endpoint_url=endpoint_url, **kwargs)
+
+    @classmethod
+    def get_available_models(cls, name: str) -> List[str]:
+        """Get common models for a provider (empty list if unknown)"""
+        try:
+            return cls.get_provider_class(name).get_available_models()
+        except ValueError:
+            return []
@@ -0,0 +1,420 @@
+"""Failover and hedged-request routing across several LLM providers"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+from typing import Dict, Any, Iterator, List, Optional
+from .base_provider import BaseLLMProvider
+
+
+class BackendHealth:
+    """Latency window and circuit breaker for one backend
+
+    The circuit opens after ``failure_threshold`` consecutive failures and
+    rejects requests for ``cooldown_seconds``; the next request after that
+    is a trial (half-open) that closes the circuit on success or reopens it
+    on failure.
+    """
+
+    WINDOW = 50        # Latencies kept for percentile estimates
+    MIN_SAMPLES = 5    # Successes needed before a p95 is reported
+
+    _registry: Dict[str, "BackendHealth"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, name: str, failure_threshold: int = 3, cooldown_seconds: float = 30.0):
+        """Initialize backend health
+
+        Args:
+            name: Backend label (provider:model)
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown_seconds: Time the circuit stays open
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._latencies: deque = deque(maxlen=self.WINDOW)
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._counters = {'requests': 0, 'failures': 0, 'rejected': 0, 'circuit_opens': 0}
+
+    @classmethod
+    def for_backend(cls, name: str) -> "BackendHealth":
+        """Get the shared health record for a backend (configured from Settings)"""
+        with cls._registry_lock:
+            if name not in cls._registry:
+                from config.settings import Settings
+                cls._registry[name] = cls(
+                    name,
+                    failure_threshold=Settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+                    cooldown_seconds=Settings.LLM_CIRCUIT_COOLDOWN_SECONDS
+                )
+            return cls._registry[name]
+
+    @classmethod
+    def get_all_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """Get stats for every backend seen so far"""
+        with cls._registry_lock:
+            backends = list(cls._registry.values())
+        return {health.name: health.snapshot() for health in backends}
+
+    @property
+    def state(self) -> str:
+        """Circuit state: 'closed', 'open' or 'half_open'"""
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return 'closed'
+        if time.monotonic() - self._opened_at >= self.cooldown_seconds:
+            return 'half_open'
+        return 'open'
+
+    def allow_request(self) -> bool:
+        """True unless the circuit is open"""
+        with self._lock:
+            if self._state() == 'open':
+                self._counters['rejected'] += 1
+                return False
+            return True
+
+    def record(self, latency: Optional[float], failed: bool):
+        """Record the outcome of one request
+
+        Args:
+            latency: Seconds until the backend answered (None to leave the
+                latency window unchanged, e.g. for streams)
+            failed: The backend returned an error
+        """
+        with self._lock:
+            self._counters['requests'] += 1
+            if not failed:
+                if latency is not None:
+                    self._latencies.append(latency)
+                self._consecutive_failures = 0
+                self._opened_at = None
+                return
+
+            self._counters['failures'] += 1
+            self._consecutive_failures += 1
+            if self._state() == 'half_open' or (
+                    self._opened_at is None and self._consecutive_failures >= self.failure_threshold):
+                self._opened_at = time.monotonic()
+                self._counters['circuit_opens'] += 1
+                print(f"[WARNING] LLM backend {self.name} circuit open for {self.cooldown_seconds:.0f}s "
+                      f"after {self._consecutive_failures} failures")
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Latency percentile of recent successes in seconds (None if too few samples)"""
+        with self._lock:
+            samples = sorted(self._latencies)
+        if len(samples) < self.MIN_SAMPLES:
+            return None
+        index = min(int(round(fraction * (len(samples) - 1))), len(samples) - 1)
+        return samples[index]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get counters, circuit state and latency percentiles"""
+        p50, p95 = self.percentile(0.5), self.percentile(0.95)
+        with self._lock:
+            return dict(
+                self._counters,
+                state=self._state(),
+                p50_seconds=round(p50, 3) if p50 is not None else None,
+                p95_seconds=round(p95, 3) if p95 is not None else None
+            )
+
+
+class RoutingLLMProvider(BaseLLMProvider):
+    """Routes requests across backends with failover, circuit breaking and hedging
+
+    Backends are tried in order (the first is the user's primary). A
+    backend whose circuit is open is skipped. When hedging is enabled and
+    a backend has not answered within its p95 latency, the request is also
+    sent to the next backend and the first successful answer wins.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+    _stats = {'requests': 0, 'failovers': 0, 'hedged': 0, 'hedge_wins': 0}
+    _stats_lock = threading.Lock()
+
+    def __init__(self, backends: List[BaseLLMProvider], hedge: bool = True,
+                 min_hedge_delay: float = 2.0):
+        """Initialize router
+
+        Args:
+            backends: Providers in priority order (at least one)
+            hedge: Send a backup request when the primary is slower than its p95
+            min_hedge_delay: Lower bound in seconds for the hedge deadline
+        """
+        primary = backends[0]
+        super().__init__(primary.model_name, temperature=primary.temperature,
+                         max_tokens=primary.max_tokens)
+        self.backends = list(backends)
+        self.hedge = hedge
+        self.min_hedge_delay = min_hedge_delay
+
+    def __getattr__(self, name):
+        # Delegate provider-specific helpers (e.g. list_models, base_url)
+        return getattr(self.backends[0], name)
+
+    @property
+    def provider_name(self) -> str:
+        return self.backends[0].provider_name
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm-hedge")
+            return cls._executor
+
+    @classmethod
+    def _count(cls, field: str):
+        with cls._stats_lock:
+            cls._stats[field] += 1
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """Get routing counters and per-backend health
+
+        Returns:
+            Dict with requests/failovers/hedged/hedge_wins and a 'backends'
+            mapping of backend label to BackendHealth.snapshot()
+        """
+        with cls._stats_lock:
+            stats = dict(cls._stats)
+        stats['backends'] = BackendHealth.get_all_stats()
+        return stats
+
+    @staticmethod
+    def backend_label(backend: BaseLLMProvider) -> str:
+        """Label identifying a backend in health stats"""
+        label = f"{backend.provider_name}:{backend.model_name}"
+        base_url = getattr(backend, 'base_url', None)
+        return f"{label}@{base_url}" if base_url else label
+
+    def _health(self, backend: BaseLLMProvider) -> BackendHealth:
+        return BackendHealth.for_backend(self.backend_label(backend))
+
+    def context_window(self) -> int:
+        # Prompts must fit whichever backend ends up answering
+        return min(backend.context_window() for backend in self.backends)
+
+    def prompt_token_budget(self) -> int:
+        return min(backend.prompt_token_budget() for backend in self.backends)
+
+    def token_counter(self):
+        return self.backends[0].token_counter()
+
+    def supports_structured_output(self) -> bool:
+        return all(backend.supports_structured_output() for backend in self.backends)
+
+    def test_connection(self) -> bool:
+        return self.backends[0].test_connection()
+
+    @staticmethod
+    def _is_error(result: Any) -> bool:
+        """True for provider failures (not for well-formed answers or JSON parse errors)"""
+        if isinstance(result, str):
+            return not result or result.startswith(("Error:", "Error generating response"))
+        if isinstance(result, dict) and 'error' in result:
+            raw = result.get('raw_response')
+            return not raw or str(raw).startswith(("Error:", "Error generating response"))
+        return result is None
+
+    def _candidates(self) -> List[BaseLLMProvider]:
+        """Backends whose circuit allows a request, in priority order"""
+        candidates = [backend for backend in self.backends if self._health(backend).allow_request()]
+        # With every circuit open, trying anyway beats failing without a request
+        return candidates or list(self.backends)
+
+    def _hedge_deadline(self, backend: BaseLLMProvider) -> Optional[float]:
+        """Seconds to wait before hedging (None until the backend has a p95)"""
+        if not self.hedge:
+            return None
+        p95 = self._health(backend).percentile(0.95)
+        if p95 is None:
+            return None
+        return max(p95, self.min_hedge_delay)
+
+    def _timed_call(self, backend: BaseLLMProvider, method: str, args: tuple) -> Any:
+        start = time.monotonic()
+        try:
+            result = getattr(backend, method)(*args)
+        except Exception as e:
+            print(f"[ERROR] LLM backend {self.backend_label(backend)} raised: {e}")
+            result = f"Error generating response: {str(e)}"
+        self._health(backend).record(time.monotonic() - start, self._is_error(result))
+        return result
+
+    async def _atimed_call(self, backend: BaseLLMProvider, method: str, args: tuple) -> Any:
+        start = time.monotonic()
+        try:
+            result = await getattr(backend, method)(*args)
+        except Exception as e:
+            print(f"[ERROR] LLM backend {self.backend_label(backend)} raised: {e}")
+            result = f"Error generating response: {str(e)}"
+        self._health(backend).record(time.monotonic() - start, self._is_error(result))
+        return result
+
+    def _route(self, method: str, *args) -> Any:
+        """Call method on backends in order until one succeeds, hedging slow ones"""
+        self._count('requests')
+        candidates = self._candidates()
+        result: Any = None
+        index = 0
+        while index < len(candidates):
+            backend = candidates[index]
+            backup = candidates[index + 1] if index + 1 < len(candidates) else None
+            deadline = self._hedge_deadline(backend) if backup is not None else None
+
+            if deadline is None:
+                result = self._timed_call(backend, method, args)
+                if not self._is_error(result):
+                    return result
+                index += 1
+            else:
+                executor = self._get_executor()
+                primary_future = executor.submit(self._timed_call, backend, method, args)
+                try:
+                    result = primary_future.result(timeout=deadline)
+                    if not self._is_error(result):
+                        return result
+                    index += 1
+                except FuturesTimeout:
+                    print(f"[INFO] {self.backend_label(backend)} slower than {deadline:.1f}s; "
+                          f"hedging to {self.backend_label(backup)}")
+                    self._count('hedged')
+                    backup_future = executor.submit(self._timed_call, backup, method, args)
+                    # The slower request keeps running; its latency still counts
+                    for future in as_completed([primary_future, backup_future]):
+                        result = future.result()
+                        if not self._is_error(result):
+                            if future is backup_future:
+                                self._count('hedge_wins')
+                            return result
+                    index += 2
+
+            if index < len(candidates):
+                self._count('failovers')
+                print(f"[WARNING] LLM backend failed, failing over to {self.backend_label(candidates[index])}")
+        return result
+
+    async def _aroute(self, method: str, *args) -> Any:
+        """Async variant of _route(); the losing hedged request is cancelled"""
+        self._count('requests')
+        candidates = self._candidates()
+        result: Any = None
+        index = 0
+        while index < len(candidates):
+            backend = candidates[index]
+            backup = candidates[index + 1] if index + 1 < len(candidates) else None
+            deadline = self._hedge_deadline(backend) if backup is not None else None
+
+            primary_task = asyncio.ensure_future(self._atimed_call(backend, method, args))
+            done, _ = await asyncio.wait({primary_task}, timeout=deadline)
+            if done:
+                result = primary_task.result()
+                if not self._is_error(result):
+                    return result
+                index += 1
+            else:
+                print(f"[INFO] {self.backend_label(backend)} slower than {deadline:.1f}s; "
+                      f"hedging to {self.backend_label(backup)}")
+                self._count('hedged')
+                backup_task = asyncio.ensure_future(self._atimed_call(backup, method, args))
+                pending = {primary_task, backup_task}
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    winner = next((task for task in done if not self._is_error(task.result())), None)
+                    if winner is not None:
+                        for task in pending:
+                            task.cancel()
+                        if winner is backup_task:
+                            self._count('hedge_wins')
+                        return winner.result()
+                    result = next(iter(done)).result()
+                index += 2
+
+            if index < len(candidates):
+                self._count('failovers')
+                print(f"[WARNING] LLM backend failed, failing over to {self.backend_label(candidates[index])}")
+        return result
+
+    def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """Generate text from prompt on the first healthy backend
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+
+        Returns:
+            Generated text (last backend's error string if all fail)
+        """
+        return self._route('generate', prompt, system_prompt)
+
+    def generate_json(self, prompt: str, system_prompt: Optional[str] = None,
+                      schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Generate JSON response from prompt on the first healthy backend
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            schema: Optional JSON schema
+
+        Returns:
+            Parsed JSON response
+        """
+        return self._route('generate_json', prompt, system_prompt, schema)
+
+    async def agenerate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """Async variant of generate()"""
+        return await self._aroute('agenerate', prompt, system_prompt)
+
+    async def agenerate_json(self, prompt: str, system_prompt: Optional[str] = None,
+                             schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Async variant of generate_json()"""
+        return await self._aroute('agenerate_json', prompt, system_prompt, schema)
+
+    def generate_stream(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Stream text from the first healthy backend
+
+        Fails over only if a backend errors before its first chunk;
+        streams are not hedged.
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+
+        Yields:
+            Text chunks in order
+        """
+        self._count('requests')
+        error = None
+        for index, backend in enumerate(self._candidates()):
+            if index:
+                self._count('failovers')
+            health = self._health(backend)
+            start = time.monotonic()
+            started = False
+            for chunk in backend.generate_stream(prompt, system_prompt):
+                if not started:
+                    if self._is_error(chunk):
+                        health.record(time.monotonic() - start, True)
+                        error = chunk
+                        break
+                    # Time to first chunk is not comparable with full
+                    # completions, so it stays out of the latency window
+                    health.record(None, False)
+                    started = True
+                yield chunk
+            if started:
+                return
+        if error:
+            yield error
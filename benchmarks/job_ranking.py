@@ -0,0 +1,103 @@
+"""
+Job ranking benchmark - per-job Python loop vs the batched JobRanker
+
+Scores synthetic jobs (skill id lists drawn from the skill taxonomy, with
+common skills more likely, like real postings) against one resume with
+the loop rank_jobs_by_compatibility used to run (a set intersection per
+job, then a full sort) and with core.job_ranker, for a page of results
+and for a large job cache. Skills are pre-extracted in both cases, as
+they are now (document_features), so only the scoring is timed. The last
+column ranks a job set encoded once beforehand (JobRanker.encode), the
+cost of each further resume scored against the same jobs.
+
+Usage:
+    python benchmarks/job_ranking.py [--sizes 10,1000,10000] [--top-k N] [--repeat N]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core import job_ranker
+from core.job_ranker import JobRanker
+from core.skill_matcher import TAXONOMY_PATH
+
+
+def legacy_rank(resume_skills, job_skills):
+    """The per-job loop: match percentage, then sort (returns job indexes)"""
+    resume = set(resume_skills)
+    scores = []
+    for skills in job_skills:
+        if skills is None:
+            scores.append(0.0)
+            continue
+        skills = set(skills)
+        if not skills:
+            scores.append(50.0)
+            continue
+        scores.append(round(len(resume & skills) / len(skills) * 100, 2))
+    return sorted(range(len(job_skills)), key=lambda index: scores[index], reverse=True)
+
+
+def synthetic_jobs(count: int, seed: int = 11):
+    """(resume skills, per-job skill lists) with a skewed skill popularity"""
+    rng = random.Random(seed)
+    with open(TAXONOMY_PATH, encoding="utf-8") as f:
+        skill_ids = [skill["id"] for skill in json.load(f)["skills"]]
+    popularity = [1.0 / (rank + 1) for rank in range(len(skill_ids))]
+    jobs = [
+        sorted(set(rng.choices(skill_ids, weights=popularity, k=rng.randint(0, 12))))
+        for _ in range(count)
+    ]
+    resume = sorted(set(rng.choices(skill_ids, weights=popularity, k=15)))
+    return resume, jobs
+
+
+def median_ms(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10,1000,10000,50000", help="comma-separated job counts")
+    parser.add_argument("--top-k", type=int, default=20, help="jobs returned by the top-k ranking")
+    parser.add_argument("--repeat", type=int, default=7, help="timed runs per size")
+    args = parser.parse_args()
+
+    ranker = JobRanker()
+    backend = "scipy.sparse" if job_ranker.SCIPY_AVAILABLE else "dense numpy"
+    print(f"JobRanker backend: {backend}\n")
+    print(f"{'jobs':>8} {'python loop':>14} {'ranker (all)':>14} {f'ranker (top {args.top_k})':>16} "
+          f"{'encoded (top)':>14}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        resume, jobs = synthetic_jobs(size)
+
+        # Same order on match score (the ranker only adds a tie-break)
+        expected = legacy_rank(resume, jobs)
+        ranked = ranker.rank(resume, jobs)
+        scores = ranker.score(resume, jobs)['match_score']
+        if [scores[index] for index in expected] != [result['match_score'] for result in ranked]:
+            sys.exit(f"Score mismatch at {size} jobs")
+
+        loop = median_ms(lambda: legacy_rank(resume, jobs), args.repeat)
+        full = median_ms(lambda: ranker.rank(resume, jobs), args.repeat)
+        top = median_ms(lambda: ranker.rank(resume, jobs, top_k=args.top_k), args.repeat)
+        encoded = ranker.encode(jobs)
+        reused = median_ms(lambda: ranker.rank(resume, encoded, top_k=args.top_k), args.repeat)
+        print(f"{size:>8} {loop:>11.2f} ms {full:>11.2f} ms {top:>13.2f} ms {reused:>11.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+JSON recovery benchmark - success rate and parse time on malformed LLM output
+
+Runs core.json_recovery over the corpus in benchmarks/json_corpus/ plus any
+completions captured at runtime in data/logs/malformed_json/ (enable with
+JSON_CAPTURE_MALFORMED=True), then times the repair pass on synthetic
+responses of growing size to show that cost stays linear.
+
+Usage:
+    python benchmarks/json_recovery.py [--repeat N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.json_recovery import JSONRecovery, JSONRecoveryError
+
+CORPUS_DIRS = [
+    PROJECT_ROOT / "benchmarks" / "json_corpus",
+    PROJECT_ROOT / "data" / "logs" / "malformed_json",
+]
+
+
+def load_corpus() -> dict:
+    """Load corpus files keyed by relative path"""
+    corpus = {}
+    for directory in CORPUS_DIRS:
+        if directory.exists():
+            for path in sorted(directory.glob("*.txt")):
+                corpus[str(path.relative_to(PROJECT_ROOT))] = path.read_text(encoding="utf-8")
+    return corpus
+
+
+def time_call(func, text: str, repeat: int) -> float:
+    """Median wall time of func(text) in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            func(text)
+        except JSONRecoveryError:
+            pass
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def synthetic_response(item_count: int) -> str:
+    """Malformed question list (unquoted items, comments, trailing commas)"""
+    items = []
+    for i in range(item_count):
+        items.append(
+            '  {"question_text": "Describe project %d and the trade-offs you made",\n'
+            '   "question_type": behavioral, // model comment\n'
+            '   "ideal_answer_points": [Context, "Decision", Outcome,],\n'
+            '   "score": %d%%,\n'
+            '  }' % (i, i % 100)
+        )
+    return "Here are the questions:\n[\n" + ",\n".join(items) + "\n]"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="timing repetitions")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    print(f"Corpus: {len(corpus)} responses")
+    print("=" * 72)
+
+    recovered = 0
+    for name, text in corpus.items():
+        try:
+            value, tier = JSONRecovery.loads_with_info(text)
+            recovered += 1
+            shape = f"{type(value).__name__}[{len(value)}]"
+            status = f"[OK]   {tier:6s} {shape}"
+        except JSONRecoveryError as e:
+            status = f"[FAIL] {e}"
+        elapsed = time_call(JSONRecovery.loads, text, args.repeat)
+        print(f"{name:55s} {elapsed:7.3f} ms  {status}")
+
+    if corpus:
+        print(f"\nRecovered {recovered}/{len(corpus)} ({recovered / len(corpus):.0%})")
+
+    print("\nScaling (repair path on synthetic malformed output)")
+    print("=" * 72)
+    for item_count in (10, 100, 1000, 10000):
+        text = synthetic_response(item_count)
+        elapsed = time_call(JSONRecovery.loads, text, max(args.repeat // 4, 3))
+        value = JSONRecovery.loads(text)
+        print(f"{len(text) / 1024:9.1f} KB  {elapsed:9.2f} ms  "
+              f"{elapsed / (len(text) / 1024):6.3f} ms/KB  items={len(value)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Prepared statement benchmark - hot lookups with and without the statement cache
+
+Runs the hot single-row queries through execute_query() with a plain
+dictionary cursor and with prepared=True (server-side prepared statement
+cached on the pooled connection), and reports per-call latency plus the
+server's statement counters so the saved parse work is visible.
+
+Needs the configured MySQL database with at least one row in each table;
+queries whose table is empty are skipped.
+
+Usage:
+    python benchmarks/prepared_statements.py [--iterations N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from database.connection import DatabaseManager, StatementCache, execute_query
+
+# name -> (query as issued by the service, query returning a sample parameter)
+HOT_QUERIES = {
+    "PracticeService question lookup": (
+        """
+            SELECT q.*, qs.set_name
+            FROM questions q
+            JOIN question_sets qs ON q.set_id = qs.set_id
+            WHERE q.id = %s
+            """,
+        "SELECT id FROM questions LIMIT 1",
+    ),
+    "MockInterviewService.get_session": (
+        """
+        SELECT * FROM mock_interview_sessions WHERE session_id = %s
+        """,
+        "SELECT session_id FROM mock_interview_sessions LIMIT 1",
+    ),
+    "CoachService.get_messages (last N)": (
+        """
+            SELECT seq, role, content, created_at FROM coach_messages
+            WHERE conversation_id = %s AND seq < 2147483647
+            ORDER BY seq DESC
+            LIMIT 40
+            """,
+        "SELECT conversation_id FROM coach_messages LIMIT 1",
+    ),
+    "JSearchService.get_job_by_id": (
+        "SELECT * FROM jsearch_jobs WHERE job_id = %s",
+        "SELECT job_id FROM jsearch_jobs LIMIT 1",
+    ),
+}
+
+STATUS_COUNTERS = ("Com_stmt_prepare", "Com_stmt_execute", "Com_select")
+
+
+def server_counters() -> dict:
+    """Global statement counters from the server"""
+    rows = execute_query(
+        "SHOW GLOBAL STATUS WHERE Variable_name IN (%s, %s, %s)",
+        STATUS_COUNTERS, fetch_all=True
+    ) or []
+    return {row["Variable_name"]: int(row["Value"]) for row in rows}
+
+
+def time_calls(query: str, param, iterations: int, prepared: bool) -> list:
+    """Run query iterations times and return per-call latencies in ms"""
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        execute_query(query, (param,), fetch_one=True, prepared=prepared)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def summarize(latencies: list) -> str:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"median {statistics.median(ordered):7.3f} ms   p95 {p95:7.3f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500, help="calls per query and mode")
+    args = parser.parse_args()
+
+    if not DatabaseManager.test_connection():
+        sys.exit("Database not reachable; check the DB_* settings")
+
+    for name, (query, sample_query) in HOT_QUERIES.items():
+        try:
+            sample = execute_query(sample_query, fetch_one=True)
+        except Exception as e:
+            print(f"{name}: skipped ({e})")
+            continue
+        if not sample:
+            print(f"{name}: skipped (no rows)")
+            continue
+        param = next(iter(sample.values()))
+
+        # Warm up both paths (pool connections, server caches)
+        time_calls(query, param, 10, prepared=False)
+        time_calls(query, param, 10, prepared=True)
+
+        print(f"\n{name}")
+        for prepared in (False, True):
+            before = server_counters()
+            latencies = time_calls(query, param, args.iterations, prepared)
+            after = server_counters()
+            deltas = ", ".join(
+                f"{counter}={after.get(counter, 0) - before.get(counter, 0)}"
+                for counter in STATUS_COUNTERS
+            )
+            label = "prepared" if prepared else "plain   "
+            print(f"  {label}  {summarize(latencies)}   ({deltas})")
+
+    print(f"\nStatement cache: {StatementCache.get_stats()}")
+    print("Counter deltas are server-wide and include the counter queries themselves.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Projection benchmark - bytes transferred per view load, full rows vs summaries
+
+Replays the service reads each list view issues when it is built, once
+with the full-row (detail) methods the views used to call and once with
+the summary methods they call now, and reports the bytes the server sent
+plus the size of the decoded rows handed to the view.
+
+Needs the configured MySQL database; pick a user with real resumes, JDs
+and sessions (defaults to the user with the most job descriptions).
+Bytes_sent is a server-wide counter, so run it on an otherwise idle server.
+
+Usage:
+    python benchmarks/projection_bytes.py [--user-id N] [--repeat N]
+"""
+
+import argparse
+import statistics
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from database.connection import DatabaseManager, execute_query
+from services.application_service import ApplicationService
+from services.jd_service import JobDescriptionService
+from services.jsearch_service import JSearchService
+from services.practice_service import PracticeService
+from services.resume_service import ResumeService
+
+# view -> (reads before: full rows, reads after: summaries), each a list of
+# callables taking the user id, in the order the view issues them on build
+VIEW_LOADS = {
+    "Writer view": (
+        [
+            ResumeService.get_all_resumes,
+            ResumeService.get_active_resume,
+            ResumeService.get_all_resumes,
+            JobDescriptionService.get_user_job_descriptions,
+            JobDescriptionService.get_user_job_descriptions,
+            ResumeService.get_active_resume,
+            JobDescriptionService.get_user_job_descriptions,
+        ],
+        [
+            ResumeService.get_resume_summaries,
+            lambda user_id: ResumeService.get_resume_summaries(user_id, active_only=True),
+            ResumeService.get_resume_summaries,
+            lambda user_id: JobDescriptionService.get_user_jds(user_id, limit=20),
+            lambda user_id: JobDescriptionService.get_user_jds(user_id, limit=20),
+            lambda user_id: JobDescriptionService.get_user_jds(user_id, limit=20),
+        ],
+    ),
+    "Questions view / mock interview setup": (
+        [ResumeService.get_all_resumes, JobDescriptionService.get_user_job_descriptions],
+        [ResumeService.get_resume_summaries,
+         lambda user_id: JobDescriptionService.get_user_jds(user_id, limit=20)],
+    ),
+    "Planner view": (
+        [JSearchService.get_saved_jobs, ApplicationService.get_applications, JSearchService.get_saved_jobs],
+        [JSearchService.get_saved_job_summaries, ApplicationService.get_applications_page,
+         JSearchService.get_saved_job_summaries],
+    ),
+    "Practice history": (
+        [lambda user_id: PracticeService.get_sessions(user_id, limit=10)],
+        [lambda user_id: PracticeService.get_session_summaries(user_id, limit=10)],
+    ),
+}
+
+
+def bytes_sent() -> int:
+    """Server-wide Bytes_sent counter"""
+    row = execute_query("SHOW GLOBAL STATUS LIKE 'Bytes_sent'", fetch_one=True)
+    return int(row["Value"])
+
+
+def payload_size(value) -> int:
+    """Approximate size of the decoded rows (text as UTF-8)"""
+    if isinstance(value, dict):
+        return sum(payload_size(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(payload_size(v) for v in value)
+    if value is None:
+        return 0
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return len(str(value).encode("utf-8"))
+
+
+def measure(reads, user_id: int, overhead: int) -> tuple:
+    """Run one view load and return (server bytes sent, decoded payload bytes)"""
+    before = bytes_sent()
+    payload = sum(payload_size(read(user_id)) for read in reads)
+    return bytes_sent() - before - overhead, payload
+
+
+def default_user() -> int:
+    row = execute_query("""
+        SELECT user_id FROM job_descriptions
+        GROUP BY user_id ORDER BY COUNT(*) DESC LIMIT 1
+    """, fetch_one=True)
+    return row["user_id"] if row else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user-id", type=int, default=None, help="user whose views are loaded")
+    parser.add_argument("--repeat", type=int, default=5, help="loads per view and variant")
+    args = parser.parse_args()
+
+    if not DatabaseManager.test_connection():
+        sys.exit("Database not reachable; check the DB_* settings")
+
+    user_id = args.user_id or default_user()
+
+    # Bytes the counter query itself adds between two reads
+    samples = []
+    for _ in range(5):
+        first = bytes_sent()
+        samples.append(bytes_sent() - first)
+    overhead = int(statistics.median(samples))
+
+    print(f"User {user_id}, median of {args.repeat} loads (counter overhead {overhead} B subtracted)\n")
+    print(f"{'view':40} {'variant':9} {'server bytes':>14} {'row bytes':>12}")
+    for name, (full_reads, summary_reads) in VIEW_LOADS.items():
+        results = {}
+        for label, reads in (("full", full_reads), ("summary", summary_reads)):
+            runs = [measure(reads, user_id, overhead) for _ in range(args.repeat)]
+            sent = int(statistics.median(run[0] for run in runs))
+            payload = int(statistics.median(run[1] for run in runs))
+            results[label] = sent
+            print(f"{name:40} {label:9} {sent:>14,} {payload:>12,}")
+        if results["full"]:
+            saved = 1 - results["summary"] / results["full"]
+            print(f"{'':40} {'saved':9} {saved:>14.1%}")
+
+
+if __name__ == "__main__":
+    main()
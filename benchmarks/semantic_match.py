@@ -0,0 +1,92 @@
+"""
+Semantic match benchmark - quick match latency vs the LLM analysis budget
+
+Times SemanticMatchService.match_texts on a resume / job description pair:
+model load, the first match (segments embedded by the model) and repeated
+matches (embeddings from the in-process cache), to check the quick tier
+stays well under a second on the CPU.
+
+Uses the configured EMBEDDING_MODEL; needs sentence-transformers and
+SEMANTIC_MATCH_ENABLED=true (plus EMBEDDING_MODEL_DOWNLOAD=true the first
+time a named model is used). Embeddings are also written to
+document_embeddings when the database is reachable; without it the store
+errors are printed and the timings are unaffected.
+
+Usage:
+    python benchmarks/semantic_match.py [--resume FILE] [--jd FILE] [--repeat N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.embedding_model import EmbeddingModel
+from services.semantic_match_service import SemanticMatchService
+
+SAMPLE_RESUME = """EXPERIENCE
+Senior Software Engineer, Acme Analytics (2019 - present)
+- Built batch and streaming data pipelines in Python and Spark on AWS
+- Moved 40 services to Docker and Kubernetes, cutting deploy time by 70%
+- Designed PostgreSQL schemas and tuned slow queries for the reporting API
+- Mentored four engineers and ran the team's code review process
+
+Software Engineer, Brightside (2016 - 2019)
+- Developed REST APIs with Django and Flask
+- Added CI pipelines with GitHub Actions and automated test coverage reports
+
+SKILLS
+Python, SQL, Spark, AWS, Docker, Kubernetes, PostgreSQL, Django, Flask, Git
+"""
+
+SAMPLE_JD = """Senior Data Engineer
+
+Requirements:
+- 5+ years of experience building production data pipelines
+- Strong Python and SQL; experience with Spark or a similar engine
+- Hands-on experience with cloud infrastructure (AWS or GCP)
+- Container orchestration with Kubernetes
+- Experience with Airflow or another workflow scheduler
+- Familiarity with Terraform and infrastructure as code
+- Clear written and verbal communication with non-technical stakeholders
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resume", help="resume text file (default: built-in sample)")
+    parser.add_argument("--jd", help="job description text file (default: built-in sample)")
+    parser.add_argument("--repeat", type=int, default=20, help="timed cached matches")
+    args = parser.parse_args()
+
+    resume = Path(args.resume).read_text(encoding="utf-8") if args.resume else SAMPLE_RESUME
+    jd = Path(args.jd).read_text(encoding="utf-8") if args.jd else SAMPLE_JD
+
+    model = EmbeddingModel.get_instance()
+    started = time.perf_counter()
+    model.encode(["warm up"])
+    load_ms = (time.perf_counter() - started) * 1000
+    if not model.available:
+        sys.exit("Embedding model not available; install sentence-transformers and set "
+                 "SEMANTIC_MATCH_ENABLED=true")
+
+    first = SemanticMatchService.match_texts(resume, jd)
+    cached = [SemanticMatchService.match_texts(resume, jd)["elapsed_ms"] for _ in range(args.repeat)]
+
+    print(f"Model {model.model_name}: loaded in {load_ms:.0f} ms")
+    print(f"Resume segments: {len(SemanticMatchService.resume_segments(resume))}, "
+          f"JD requirements: {len(SemanticMatchService.requirement_bullets(jd))}")
+    print(f"First match (embeds both documents): {first['elapsed_ms']:.1f} ms")
+    print(f"Cached match, median of {args.repeat}: {statistics.median(cached):.1f} ms")
+    print(f"\nScore {first['compatibility_score']} (semantic {first['semantic_score']}, "
+          f"skills {first['skill_score']})")
+    print(f"Matched: {', '.join(first['matched_skills']) or '-'}")
+    print(f"Missing: {', '.join(first['missing_skills']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Skill matching benchmark - six-regex scan vs the compiled skill matcher
+
+Extracts skills from 1,000 job descriptions with the six IGNORECASE
+patterns TextExtractor used to run and with core.skill_matcher, and
+reports the time per corpus and per description plus how the results
+differ (the matcher also resolves aliases such as "k8s" and "Postgres").
+
+The descriptions are synthetic (seeded, so runs are comparable) unless
+--from-db is given, which uses the most recent jsearch_jobs descriptions.
+
+Usage:
+    python benchmarks/skill_matching.py [--count N] [--repeat N] [--from-db]
+"""
+
+import argparse
+import json
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.skill_matcher import TAXONOMY_PATH, SkillMatcher
+
+# The patterns TextExtractor.extract_skills ran before the matcher
+LEGACY_SKILLS_PATTERNS = [
+    r'\b(Python|Java|JavaScript|TypeScript|C\+\+|C#|Ruby|PHP|Swift|Kotlin|Go|Rust|R|MATLAB|Scala|Perl)\b',
+    r'\b(HTML|CSS|React|Angular|Vue\.js|Node\.js|Django|Flask|FastAPI|Express|Spring|\.NET|Laravel)\b',
+    r'\b(MySQL|PostgreSQL|MongoDB|Redis|SQLite|Oracle|SQL Server|DynamoDB|Cassandra|Neo4j)\b',
+    r'\b(AWS|Azure|GCP|Docker|Kubernetes|Jenkins|GitLab|GitHub|CI/CD|Terraform|Ansible)\b',
+    r'\b(TensorFlow|PyTorch|Scikit-learn|Pandas|NumPy|Keras|Machine Learning|Deep Learning|NLP|Computer Vision)\b',
+    r'\b(Git|Jira|Agile|Scrum|REST API|GraphQL|Microservices|Linux|Unix|Bash|PowerShell)\b',
+]
+
+FILLER = [
+    "You will work closely with product managers and designers to ship features our customers love.",
+    "We value ownership, clear communication and a bias for action.",
+    "The team is responsible for the reliability and performance of services used by millions of people.",
+    "You should be comfortable reviewing code, writing design documents and mentoring other engineers.",
+    "We offer flexible hours, a generous learning budget and comprehensive health coverage.",
+    "Experience working in a fast-paced environment with changing priorities is a plus.",
+    "Help us go to market faster by improving our release process and developer tooling.",
+    "Candidates should express ideas clearly, both in writing and in meetings.",
+    "Our R&D group partners with customers to prototype new capabilities.",
+]
+
+
+def legacy_extract(text: str) -> list:
+    """TextExtractor.extract_skills as it was: six findall passes"""
+    skills = set()
+    for pattern in LEGACY_SKILLS_PATTERNS:
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        skills.update(match.strip() for match in matches)
+    return sorted(skills)
+
+
+def synthetic_corpus(count: int, seed: int = 7) -> list:
+    """Job descriptions mixing filler with skill names, aliases and case variants"""
+    rng = random.Random(seed)
+    with open(TAXONOMY_PATH, encoding="utf-8") as f:
+        skills = json.load(f)["skills"]
+    terms = []
+    for skill in skills:
+        terms.extend([skill['name'], *skill.get('aliases', []), *skill.get('exact', [])])
+
+    corpus = []
+    for _ in range(count):
+        sentences = []
+        for _ in range(rng.randint(25, 45)):
+            if rng.random() < 0.35:
+                picked = rng.sample(terms, rng.randint(1, 4))
+                if rng.random() < 0.3:
+                    picked = [term.lower() for term in picked]
+                sentences.append(f"Experience with {', '.join(picked)} is required.")
+            else:
+                sentences.append(rng.choice(FILLER))
+        corpus.append(" ".join(sentences))
+    return corpus
+
+
+def db_corpus(count: int) -> list:
+    """Most recent job descriptions from jsearch_jobs"""
+    from database.connection import DatabaseManager, execute_query
+    if not DatabaseManager.test_connection():
+        sys.exit("Database not reachable; check the DB_* settings")
+    rows = execute_query(
+        "SELECT description FROM jsearch_jobs WHERE description IS NOT NULL ORDER BY job_id DESC LIMIT %s",
+        (count,), fetch_all=True
+    ) or []
+    return [row['description'] for row in rows]
+
+
+def time_corpus(extract, corpus: list, repeat: int) -> float:
+    """Median wall time in ms to extract skills from the whole corpus"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in corpus:
+            extract(text)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000, help="job descriptions in the corpus")
+    parser.add_argument("--repeat", type=int, default=5, help="timed passes over the corpus")
+    parser.add_argument("--from-db", action="store_true", help="use jsearch_jobs descriptions")
+    args = parser.parse_args()
+
+    # Build the matcher before timing (compiled once per process)
+    matcher = SkillMatcher.get_instance()
+    corpus = db_corpus(args.count) if args.from_db else synthetic_corpus(args.count)
+    if not corpus:
+        sys.exit("No job descriptions to scan")
+    chars = sum(len(text) for text in corpus)
+
+    print(f"{len(corpus)} job descriptions, {chars / len(corpus):,.0f} characters on average\n")
+    results = {}
+    for label, extract in (("six regexes", legacy_extract), ("skill matcher", matcher.match)):
+        elapsed = time_corpus(extract, corpus, args.repeat)
+        results[label] = elapsed
+        print(f"{label:14} {elapsed:9.1f} ms total   {elapsed * 1000 / len(corpus):8.1f} us per description")
+    print(f"{'speedup':14} {results['six regexes'] / results['skill matcher']:9.1f}x")
+
+    # Compare results on canonical ids
+    same = extra = missed = 0
+    for text in corpus:
+        legacy = matcher.canonical_ids(legacy_extract(text))
+        current = set(matcher.match(text))
+        same += legacy == current
+        extra += len(current - legacy)
+        missed += len(legacy - current)
+    print(f"\nIdentical skill sets: {same}/{len(corpus)}")
+    print(f"Skills only the matcher finds (aliases, C++/.NET boundaries): {extra}")
+    print(f"Skills only the six regexes find (e.g. lowercase 'go', 'R&D'): {missed}")
+
+
+if __name__ == "__main__":
+    main()
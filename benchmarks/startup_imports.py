@@ -0,0 +1,81 @@
+"""
+Startup import benchmark - measures the cost of importing the LLM layer
+
+Each scenario runs in a fresh interpreter so module caches do not carry
+over between runs. Compares the lazy registry path (what the app does at
+startup) with eagerly touching every provider class.
+
+Usage:
+    python benchmarks/startup_imports.py [--runs N]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+SDK_MODULES = ["openai", "anthropic", "boto3", "requests", "httpx"]
+
+SCENARIOS = {
+    "ai.providers (lazy)": "import ai.providers",
+    "services.llm_service (lazy)": "import services.llm_service",
+    "all providers (eager)": (
+        "import ai.providers as p\n"
+        "for name in ('OpenAIProvider', 'AnthropicProvider', 'BedrockProvider', 'OllamaProvider'):\n"
+        "    getattr(p, name)"
+    ),
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "sdks": [m for m in {sdks!r} if m in sys.modules],
+}}))
+"""
+
+
+def run_scenario(code: str) -> dict:
+    """Run one scenario in a fresh interpreter and return its measurements"""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(code=code, sdks=SDK_MODULES)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "failed")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="runs per scenario")
+    args = parser.parse_args()
+
+    print(f"Startup import benchmark ({args.runs} runs per scenario)")
+    print("=" * 60)
+
+    for label, code in SCENARIOS.items():
+        try:
+            samples = [run_scenario(code) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"[FAIL] {label}: {e}")
+            continue
+
+        times_ms = [s["seconds"] * 1000 for s in samples]
+        sdks = ", ".join(samples[-1]["sdks"]) or "none"
+        print(f"{label:32s} median {statistics.median(times_ms):8.1f} ms  "
+              f"min {min(times_ms):8.1f} ms")
+        print(f"{'':32s} SDKs loaded: {sdks}")
+
+
+if __name__ == "__main__":
+    main()
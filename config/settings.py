@@ -19,6 +19,28 @@ class Settings:
     DB_USER = os.getenv('DB_USER', 'root')
     DB_PASSWORD = os.getenv('DB_PASSWORD', '')
     
+    # Connection pool: idle size, extra connections under load, seconds to
+    # wait for a free connection, idle seconds before a connection is
+    # replaced / pinged before reuse
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 5))
+    DB_POOL_MAX_OVERFLOW = int(os.getenv('DB_POOL_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 30))
+    DB_POOL_RECYCLE_SECONDS = float(os.getenv('DB_POOL_RECYCLE_SECONDS', 1800))
+    DB_POOL_PING_AFTER_SECONDS = float(os.getenv('DB_POOL_PING_AFTER_SECONDS', 30))
+    
+    # Server-side prepared statements for queries that opt in with
+    # execute_query(..., prepared=True); up to DB_STATEMENT_CACHE_SIZE
+    # statements stay prepared on each pooled connection
+    DB_PREPARED_STATEMENTS = os.getenv('DB_PREPARED_STATEMENTS', 'True').lower() == 'true'
+    DB_STATEMENT_CACHE_SIZE = int(os.getenv('DB_STATEMENT_CACHE_SIZE', 32))
+    
+    # Process-local cache for resume, JD and question set reads; writes
+    # through the services invalidate it, the TTL bounds staleness from
+    # writes made by other processes
+    QUERY_CACHE_ENABLED = os.getenv('QUERY_CACHE_ENABLED', 'True').lower() == 'true'
+    QUERY_CACHE_TTL_SECONDS = int(os.getenv('QUERY_CACHE_TTL_SECONDS', 300))
+    QUERY_CACHE_MAX_ENTRIES = int(os.getenv('QUERY_CACHE_MAX_ENTRIES', 256))
+    
     # API Keys
     JSEARCH_API_KEY = os.getenv('JSEARCH_API_KEY', '')
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
@@ -44,6 +66,51 @@ class Settings:
     DOCUMENTS_DIR = DATA_DIR / 'documents'
     LOGS_DIR = DATA_DIR / 'logs'
     
+    # LLM response cache
+    LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'True').lower() == 'true'
+    LLM_CACHE_PERSIST = os.getenv('LLM_CACHE_PERSIST', 'True').lower() == 'true'
+    LLM_CACHE_TTL_SECONDS = int(os.getenv('LLM_CACHE_TTL_SECONDS', 7 * 24 * 3600))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', 512))
+    # Files kept in LLM_CACHE_DIR (oldest removed first; 0 means no limit)
+    LLM_CACHE_MAX_FILES = int(os.getenv('LLM_CACHE_MAX_FILES', 5000))
+    LLM_CACHE_DIR = DATA_DIR / 'llm_cache'
+    
+    # Opt-in failover to the user's other saved (inactive) LLM settings:
+    # circuit breaker and hedged requests (backup sent when the primary
+    # exceeds its p95 latency). Off by default: prompts would go to
+    # providers the user switched away from, and hedging doubles paid calls
+    LLM_FAILOVER_ENABLED = os.getenv('LLM_FAILOVER_ENABLED', 'False').lower() == 'true'
+    LLM_HEDGE_ENABLED = os.getenv('LLM_HEDGE_ENABLED', 'False').lower() == 'true'
+    LLM_HEDGE_MIN_DELAY_SECONDS = float(os.getenv('LLM_HEDGE_MIN_DELAY_SECONDS', 2.0))
+    LLM_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('LLM_CIRCUIT_FAILURE_THRESHOLD', 3))
+    LLM_CIRCUIT_COOLDOWN_SECONDS = float(os.getenv('LLM_CIRCUIT_COOLDOWN_SECONDS', 30))
+    
+    # Concurrent LLM calls for batch jobs (e.g. post-session evaluation)
+    LLM_BATCH_MAX_WORKERS = int(os.getenv('LLM_BATCH_MAX_WORKERS', 4))
+    
+    # Most recent coach messages loaded as chat history (then packed to the token budget)
+    COACH_HISTORY_MESSAGES = int(os.getenv('COACH_HISTORY_MESSAGES', 40))
+    
+    # Prompt packing (tokens available for system + user prompt, capped by the model context)
+    LLM_PROMPT_TOKEN_BUDGET = int(os.getenv('LLM_PROMPT_TOKEN_BUDGET', 6000))
+    OLLAMA_NUM_CTX = int(os.getenv('OLLAMA_NUM_CTX', 4096))
+    
+    # Use native structured output (OpenAI response_format, Anthropic tool use,
+    # Ollama format) for generate_json(); False sends the schema in the prompt only
+    LLM_STRUCTURED_OUTPUT = os.getenv('LLM_STRUCTURED_OUTPUT', 'True').lower() == 'true'
+    
+    # Local sentence-embedding model for the quick semantic resume/JD match
+    # (optional sentence-transformers install, CPU); off by default, the
+    # quick match then uses skill overlap. EMBEDDING_MODEL is a model name
+    # or a local directory; a named model is only downloaded when
+    # EMBEDDING_MODEL_DOWNLOAD is set, otherwise it must already be cached
+    SEMANTIC_MATCH_ENABLED = os.getenv('SEMANTIC_MATCH_ENABLED', 'False').lower() == 'true'
+    EMBEDDING_MODEL = os.getenv('EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2')
+    EMBEDDING_MODEL_DOWNLOAD = os.getenv('EMBEDDING_MODEL_DOWNLOAD', 'False').lower() == 'true'
+    
+    # Save completions that needed JSON repair to logs/malformed_json (benchmark corpus)
+    JSON_CAPTURE_MALFORMED = os.getenv('JSON_CAPTURE_MALFORMED', 'False').lower() == 'true'
+    
     # Create directories if they don't exist
     @classmethod
     def ensure_directories(cls):
@@ -0,0 +1,97 @@
+"""
+Local sentence-embedding model for semantic matching
+
+Wraps a small sentence-transformers model (all-MiniLM-L6-v2 by default,
+~90 MB, 384 dimensions) run on the CPU. The model is loaded on first use
+(or by warm_up() in the background) and kept for the life of the
+process; when SEMANTIC_MATCH_ENABLED is off, sentence-transformers is not
+installed or the model cannot be loaded, available is False and callers
+fall back to skill overlap. Only a local directory or an already cached
+model is loaded unless EMBEDDING_MODEL_DOWNLOAD is set.
+"""
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from config.settings import Settings
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+
+class EmbeddingModel:
+    """Process-wide CPU sentence-embedding model"""
+
+    _instance: Optional["EmbeddingModel"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, model_name: Optional[str] = None, batch_size: int = 32):
+        """Initialize (the model itself is loaded on first use)
+
+        Args:
+            model_name: sentence-transformers model name or local path
+            batch_size: Texts encoded per forward pass
+        """
+        self.model_name = model_name or Settings.EMBEDDING_MODEL
+        self.batch_size = batch_size
+        self._model = None
+        self._load_failed = not SENTENCE_TRANSFORMERS_AVAILABLE
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "EmbeddingModel":
+        """Shared model for the configured EMBEDDING_MODEL"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @property
+    def available(self) -> bool:
+        """True unless the model is disabled, not installed or failed to load"""
+        return Settings.SEMANTIC_MATCH_ENABLED and not self._load_failed
+
+    def _get_model(self):
+        if self._model is None and self.available:
+            with self._lock:
+                if self._model is None and not self._load_failed:
+                    try:
+                        print(f"[INFO] Loading embedding model {self.model_name}...")
+                        local = Path(self.model_name).expanduser().is_dir()
+                        self._model = SentenceTransformer(
+                            self.model_name, device='cpu',
+                            local_files_only=local or not Settings.EMBEDDING_MODEL_DOWNLOAD
+                        )
+                    except Exception as e:
+                        # Not retried: a missing download would stall every match
+                        print(f"[WARNING] Embedding model unavailable, using skill overlap only: {e}")
+                        self._load_failed = True
+        return self._model
+
+    def warm_up(self):
+        """Load the model in a background thread so the first match is fast"""
+        if self._model is None and self.available:
+            threading.Thread(target=self._get_model, daemon=True).start()
+
+    def encode(self, texts: List[str]) -> Optional[np.ndarray]:
+        """Embed texts
+
+        Returns:
+            float32 array of shape (len(texts), dimensions) with unit-length
+            rows (dot product = cosine similarity), or None if the model is
+            not available
+        """
+        model = self._get_model()
+        if model is None:
+            return None
+        if not texts:
+            return np.zeros((0, model.get_sentence_embedding_dimension()), dtype=np.float32)
+        vectors = model.encode(list(texts), batch_size=self.batch_size, convert_to_numpy=True,
+                               normalize_embeddings=True, show_progress_bar=False)
+        return np.asarray(vectors, dtype=np.float32)
@@ -0,0 +1,187 @@
+"""
+Job ranker - scores many jobs against one resume in batched array operations
+
+Jobs are encoded once as rows of a binary skill-incidence matrix (skill
+ids from the document features); scoring a resume against them is then a
+single sparse matrix product with a few weight vectors:
+
+- match_score: share of the job's skills the resume covers (0-100), the
+  score the app has always shown
+- weighted_jaccard: Jaccard overlap with rarer skills weighted higher
+  (IDF over the encoded jobs)
+- tfidf_cosine: cosine similarity of the IDF-weighted skill vectors
+
+Ranking is by match_score, then tfidf_cosine; with top_k only the best k
+rows are selected (argpartition) and sorted. Keep the EncodedJobs of a
+job set that is ranked repeatedly: encoding walks every skill in Python,
+scoring does not.
+"""
+import math
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+try:
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Score of a job whose description names no known skills (nothing to compare)
+NO_SKILLS_SCORE = 50.0
+
+
+class EncodedJobs:
+    """A job set encoded for ranking (matrix plus resume-independent sums)"""
+
+    def __init__(self, job_skills: Sequence[Optional[Iterable[str]]]):
+        """Encode jobs
+
+        Args:
+            job_skills: Per job, its skill ids (None for a job without a
+                description, which always scores 0)
+        """
+        lists = [skills or () for skills in job_skills]
+        lengths = np.fromiter(map(len, lists), dtype=np.int64, count=len(lists))
+        flat = list(chain.from_iterable(lists))
+        self.vocabulary: Dict[str, int] = {skill: column for column, skill in enumerate(dict.fromkeys(flat))}
+
+        rows = np.repeat(np.arange(len(lists)), lengths)
+        columns = np.fromiter(map(self.vocabulary.__getitem__, flat), dtype=np.int64, count=len(flat))
+        shape = (len(lists), len(self.vocabulary))
+        if SCIPY_AVAILABLE:
+            # Converting from COO sums duplicates; a skill listed twice still counts once
+            self.matrix = sparse.coo_matrix((np.ones(len(flat)), (rows, columns)), shape=shape).tocsr()
+            self.matrix.data[:] = 1.0
+        else:
+            self.matrix = np.zeros(shape, dtype=np.float64)
+            self.matrix[rows, columns] = 1.0
+
+        self.no_description = np.fromiter((skills is None for skills in job_skills), dtype=bool,
+                                          count=len(lists))
+
+        # Smoothed IDF over the jobs: skills most jobs ask for weigh less
+        document_frequency = np.asarray(self.matrix.sum(axis=0)).ravel()
+        self.idf = np.log((1.0 + len(lists)) / (1.0 + document_frequency)) + 1.0
+        self.unseen_idf = math.log(1.0 + len(lists)) + 1.0
+
+        sums = np.asarray(self.matrix @ np.column_stack([np.ones_like(self.idf), self.idf, self.idf ** 2]))
+        self.skill_count, self.job_weight, self.job_norm_sq = sums.reshape(len(lists), 3).T
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+
+class JobRanker:
+    """Batch scoring and top-k selection of jobs by skill overlap"""
+
+    def __init__(self, no_skills_score: float = NO_SKILLS_SCORE):
+        """Initialize ranker
+
+        Args:
+            no_skills_score: match_score for jobs with a description but no
+                recognized skills
+        """
+        self.no_skills_score = no_skills_score
+
+    @staticmethod
+    def encode(job_skills: Sequence[Optional[Iterable[str]]]) -> EncodedJobs:
+        """Encode jobs once for ranking against several resumes"""
+        return EncodedJobs(job_skills)
+
+    def score(self, resume_skills: Iterable[str],
+              jobs: Union[EncodedJobs, Sequence[Optional[Iterable[str]]]]) -> Dict[str, np.ndarray]:
+        """Score every job against the resume
+
+        Args:
+            resume_skills: Resume skill ids
+            jobs: EncodedJobs, or per job its skill ids (None for a job
+                without a description)
+
+        Returns:
+            Dict of arrays (one value per job): match_score,
+            weighted_jaccard, tfidf_cosine, skill_count, matched_count
+        """
+        if not isinstance(jobs, EncodedJobs):
+            jobs = EncodedJobs(jobs)
+
+        resume = np.zeros(len(jobs.vocabulary), dtype=np.float64)
+        unseen = 0
+        for skill in set(resume_skills):
+            column = jobs.vocabulary.get(skill)
+            if column is None:
+                # Counts on the resume's side only (document frequency 0)
+                unseen += 1
+            else:
+                resume[column] = 1.0
+
+        # One product yields every resume-dependent per-job sum
+        weighted = jobs.idf * resume
+        sums = np.asarray(jobs.matrix @ np.column_stack([resume, weighted, jobs.idf * weighted]))
+        matched, matched_weight, dot = sums.reshape(len(jobs), 3).T
+        resume_weight = float(weighted.sum()) + unseen * jobs.unseen_idf
+        resume_norm = math.sqrt(float(jobs.idf @ weighted) + unseen * jobs.unseen_idf ** 2)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            match_score = np.where(jobs.skill_count > 0, matched / jobs.skill_count * 100.0,
+                                   self.no_skills_score)
+            union = jobs.job_weight + resume_weight - matched_weight
+            weighted_jaccard = np.where(union > 0, matched_weight / union, 0.0)
+            norms = np.sqrt(jobs.job_norm_sq) * resume_norm
+            tfidf_cosine = np.where(norms > 0, dot / norms, 0.0)
+
+        match_score[jobs.no_description] = 0.0
+        weighted_jaccard[jobs.no_description] = 0.0
+        tfidf_cosine[jobs.no_description] = 0.0
+
+        return {
+            'match_score': np.round(match_score, 2),
+            'weighted_jaccard': np.round(weighted_jaccard, 4),
+            'tfidf_cosine': np.round(tfidf_cosine, 4),
+            'skill_count': jobs.skill_count.astype(int),
+            'matched_count': matched.astype(int),
+        }
+
+    def rank(self, resume_skills: Iterable[str],
+             jobs: Union[EncodedJobs, Sequence[Optional[Iterable[str]]]],
+             top_k: Optional[int] = None) -> List[Dict[str, float]]:
+        """Rank jobs by match_score, then tfidf_cosine (ties keep input order)
+
+        Args:
+            resume_skills: Resume skill ids
+            jobs: EncodedJobs, or per job its skill ids (None if it has no description)
+            top_k: Return only the best k jobs (None for all)
+
+        Returns:
+            [{'index': position of the job, 'match_score',
+              'weighted_jaccard', 'tfidf_cosine'}, ...], best first
+        """
+        if not len(jobs):
+            return []
+        scores = self.score(resume_skills, jobs)
+        match_score = scores['match_score']
+        cosine = scores['tfidf_cosine']
+
+        candidates = np.arange(len(match_score))
+        if top_k is not None and 0 < top_k < len(candidates):
+            # Distinct match scores differ by well over 0.01, so the cosine
+            # term only breaks ties; exact ties are resolved by the sort below
+            key = match_score + cosine * 1e-3
+            candidates = np.argpartition(-key, top_k - 1)[:top_k]
+            boundary = key[candidates].min()
+            candidates = np.union1d(candidates, np.flatnonzero(key == boundary))
+        order = candidates[np.lexsort((candidates, -cosine[candidates], -match_score[candidates]))]
+        if top_k is not None and top_k > 0:
+            order = order[:top_k]
+
+        weighted_jaccard = scores['weighted_jaccard']
+        return [
+            {
+                'index': int(index),
+                'match_score': float(match_score[index]),
+                'weighted_jaccard': float(weighted_jaccard[index]),
+                'tfidf_cosine': float(cosine[index]),
+            }
+            for index in order
+        ]
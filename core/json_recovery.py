@@ -0,0 +1,488 @@
+"""
+JSON recovery - extracts and repairs JSON from LLM completions
+
+Shared by all providers and services. Parsing is tiered so well-formed
+output stays cheap:
+
+1. Strict: json.loads on the completion with code fences removed
+2. Block: json raw_decode from the first plausible '{' or '[' (prose around
+   the JSON is ignored)
+3. Repair: a single linear pass that rewrites the first JSON value,
+   fixing the mistakes local models make (comments, unquoted or
+   single-quoted strings, trailing/missing commas, raw control characters,
+   "85%" numbers, Python literals, truncated output)
+"""
+import json
+import re
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+_DECODER = json.JSONDecoder()
+
+_WHITESPACE_RE = re.compile(r"\s*")
+# Next character that needs attention inside a double-quoted string
+_DQ_SPECIAL_RE = re.compile(r'["\\\n\r\t]')
+_SQ_SPECIAL_RE = re.compile(r"['\"\\\n\r\t]")
+# Structural characters for balanced-block extraction
+_BLOCK_SPECIAL_RE = re.compile(r'["\\\[\]{}]')
+# Unquoted key or value (stops at structure or a line break)
+_BARE_RE = re.compile(r'[^,:\[\]{}"\n\r]+')
+_NUMBER_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+_LITERALS = {
+    'true': 'true', 'false': 'false', 'null': 'null',
+    'True': 'true', 'False': 'false', 'None': 'null',
+}
+_VALID_ESCAPES = set('"\\/bfnrtu')
+_CONTROL_ESCAPES = {'\n': '\\n', '\r': '\\r', '\t': '\\t'}
+
+# Object parse states
+_KEY, _COLON, _VALUE, _AFTER = 'key', 'colon', 'value', 'after'
+
+
+class JSONRecoveryError(ValueError):
+    """Raised when no JSON value can be recovered from a completion"""
+
+
+class JSONRecovery:
+    """Extract and repair JSON from LLM output"""
+
+    # Per-provider parse outcomes, split by whether a native structured
+    # output mode was used: {source: {mode: counters}}
+    _stats: Dict[str, Dict[str, Dict[str, int]]] = {}
+    _stats_lock = threading.Lock()
+
+    @staticmethod
+    def strip_fences(text: str) -> str:
+        """Remove markdown code fences around a completion"""
+        text = text.strip()
+        start = text.find("```")
+        if start == -1:
+            return text
+        # Skip the fence line (``` or ```json)
+        body_start = text.find("\n", start)
+        if body_start == -1:
+            body = text[start + 3:].replace("```", "")
+            return (body[4:] if body.startswith("json") else body).strip()
+        end = text.find("```", body_start)
+        return text[body_start + 1:end if end != -1 else len(text)].strip()
+
+    @staticmethod
+    def find_start(text: str) -> int:
+        """Find where the JSON value most likely starts
+
+        Prefers a bracket that ends a line or is followed by a quote,
+        bracket or comment, so prose like "Here are [5] questions:" is
+        skipped.
+
+        Returns:
+            Index of the opening '{' or '[', or -1
+        """
+        first = -1
+        for match in re.finditer(r"[\[{]", text):
+            index = match.start()
+            if first == -1:
+                first = index
+            if text[index + 1:index + 2] in ('\n', '\r'):
+                return index
+            following = _WHITESPACE_RE.match(text, index + 1).end()
+            if following >= len(text) or text[following] in "\"'{[]}/":
+                return index
+        return first
+
+    @staticmethod
+    def find_block(text: str) -> Optional[str]:
+        """Extract the first balanced JSON object/array from text
+
+        Brackets inside strings are ignored. If the text ends before the
+        value closes, the remainder from the opening bracket is returned.
+        """
+        start = JSONRecovery.find_start(text)
+        if start == -1:
+            return None
+
+        depth = 0
+        in_string = False
+        # Jump between structural characters instead of visiting every char
+        position = start
+        while True:
+            match = _BLOCK_SPECIAL_RE.search(text, position)
+            if match is None:
+                return text[start:]
+            char = match.group()
+            position = match.end()
+            if in_string:
+                if char == '\\':
+                    position += 1
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char in '[{':
+                depth += 1
+            elif char in ']}':
+                depth -= 1
+                if depth == 0:
+                    return text[start:position]
+
+    @staticmethod
+    def repair(text: str) -> str:
+        """Rewrite the first JSON value in text as valid JSON
+
+        Runs in one left-to-right pass; output is built in a list and joined
+        once, so cost is linear in the input length.
+
+        Args:
+            text: Completion text containing (possibly malformed) JSON
+
+        Returns:
+            Repaired JSON text (may still be invalid for badly broken input)
+        """
+        start = JSONRecovery.find_start(text)
+        if start == -1:
+            return text.strip()
+
+        out: List[str] = []
+        stack: List[List[str]] = []  # [container, state]
+        n = len(text)
+        i = start
+
+        def before_value():
+            # Called before emitting a value; inserts missing separators
+            if not stack:
+                return
+            frame = stack[-1]
+            if frame[1] == _AFTER:
+                out.append(',')
+                frame[1] = _KEY if frame[0] == '{' else _VALUE
+            if frame[0] == '{' and frame[1] == _COLON:
+                out.append(':')
+                frame[1] = _VALUE
+
+        def after_value():
+            if stack:
+                frame = stack[-1]
+                frame[1] = _COLON if (frame[0] == '{' and frame[1] == _KEY) else _AFTER
+
+        def close_frame(frame):
+            if out and out[-1] == ',':
+                out.pop()
+            if frame[0] == '{':
+                if frame[1] == _COLON:
+                    out.append(':null')
+                elif frame[1] == _VALUE and out and out[-1] == ':':
+                    out.append('null')
+                out.append('}')
+            else:
+                out.append(']')
+
+        while i < n:
+            char = text[i]
+
+            if char in ' \t\r\n':
+                i += 1
+
+            elif char == '/' and text.startswith('//', i):
+                newline = text.find('\n', i)
+                i = n if newline == -1 else newline + 1
+
+            elif char == '/' and text.startswith('/*', i):
+                end = text.find('*/', i + 2)
+                i = n if end == -1 else end + 2
+
+            elif char in '{[':
+                before_value()
+                out.append(char)
+                stack.append([char, _KEY if char == '{' else _VALUE])
+                i += 1
+
+            elif char in '}]':
+                wanted = '{' if char == '}' else '['
+                if any(frame[0] == wanted for frame in stack):
+                    # Close any inner containers the model forgot to close
+                    while stack:
+                        frame = stack.pop()
+                        close_frame(frame)
+                        if frame[0] == wanted:
+                            break
+                    if not stack:
+                        break  # first top-level value is complete
+                    after_value()
+                i += 1
+
+            elif char == ',':
+                frame = stack[-1]
+                if frame[1] == _AFTER:
+                    out.append(',')
+                    frame[1] = _KEY if frame[0] == '{' else _VALUE
+                elif frame[0] == '{' and frame[1] == _VALUE:
+                    out.append('null,')
+                    frame[1] = _KEY
+                i += 1
+
+            elif char == ':':
+                frame = stack[-1]
+                if frame[0] == '{' and frame[1] == _COLON:
+                    out.append(':')
+                    frame[1] = _VALUE
+                i += 1
+
+            elif char in '"\'':
+                before_value()
+                i = JSONRecovery._read_string(text, i, out)
+                after_value()
+
+            else:
+                frame = stack[-1]
+                is_key = frame[0] == '{' and frame[1] in (_KEY, _AFTER)
+                match = _BARE_RE.match(text, i)
+                if not match:
+                    i += 1
+                    continue
+                token = match.group().strip()
+                i = match.end()
+                # Stray closing quote of a value missing its opening quote
+                if i < n and text[i] == '"':
+                    following = _WHITESPACE_RE.match(text, i + 1).end()
+                    if following >= n or text[following] in ',]}\n':
+                        i += 1
+                token = token.strip('"\'').strip()
+                if not token:
+                    continue
+                before_value()
+                if is_key:
+                    out.append(json.dumps(token, ensure_ascii=False))
+                else:
+                    out.append(JSONRecovery._bare_value(token))
+                after_value()
+
+        # Truncated output: close whatever is still open
+        while stack:
+            close_frame(stack.pop())
+
+        return ''.join(out)
+
+    @staticmethod
+    def _read_string(text: str, i: int, out: List[str]) -> int:
+        """Copy a quoted string starting at text[i] as a JSON string
+
+        Single-quoted strings become double-quoted, raw control characters
+        and invalid escapes are escaped, and an unterminated string is
+        closed at the end of input.
+
+        Returns:
+            Index just after the closing quote
+        """
+        quote = text[i]
+        special = _DQ_SPECIAL_RE if quote == '"' else _SQ_SPECIAL_RE
+        n = len(text)
+        parts = ['"']
+        position = i + 1
+        while True:
+            match = special.search(text, position)
+            if match is None:
+                parts.append(text[position:])
+                parts.append('"')
+                out.append(''.join(parts))
+                return n
+            parts.append(text[position:match.start()])
+            char = match.group()
+            position = match.end()
+            if char == '\\':
+                escaped = text[position] if position < n else ''
+                if escaped == "'":
+                    parts.append("'")
+                elif escaped and escaped in _VALID_ESCAPES:
+                    if escaped == 'u' and not re.match(r'[0-9a-fA-F]{4}', text[position + 1:position + 5]):
+                        parts.append('\\\\u')
+                    else:
+                        parts.append('\\' + escaped)
+                else:
+                    parts.append('\\\\' + escaped)
+                position += 1
+            elif char in _CONTROL_ESCAPES:
+                parts.append(_CONTROL_ESCAPES[char])
+            elif char == '"' and quote == "'":
+                parts.append('\\"')
+            else:
+                # Closing quote - unless it is an unescaped quote inside the
+                # text ('"hello" he said'), i.e. followed on the same line
+                # by something other than a separator
+                following = _WHITESPACE_RE.match(text, position).end()
+                if following < n and text[following] not in ',:]}\n\r' \
+                        and '\n' not in text[position:following] \
+                        and text[following] not in '"\'{[':
+                    parts.append('\\"')
+                    continue
+                parts.append('"')
+                out.append(''.join(parts))
+                return position
+
+    @staticmethod
+    def _bare_value(token: str) -> str:
+        """Convert an unquoted value to JSON"""
+        if token in _LITERALS:
+            return _LITERALS[token]
+        number = token[:-1].strip() if token.endswith('%') else token
+        if _NUMBER_RE.fullmatch(number):
+            return number
+        return json.dumps(token, ensure_ascii=False)
+
+    @staticmethod
+    def loads_with_info(text: str, repair: bool = True) -> Tuple[Any, str]:
+        """Parse JSON from a completion
+
+        Args:
+            text: Completion text
+            repair: Allow the repair pass when strict parsing fails
+
+        Returns:
+            (value, tier) where tier is 'strict', 'block' or 'repair'
+
+        Raises:
+            JSONRecoveryError: If no JSON value could be recovered
+        """
+        if not text or not text.strip():
+            raise JSONRecoveryError("Empty response")
+
+        cleaned = JSONRecovery.strip_fences(text)
+        try:
+            return json.loads(cleaned), 'strict'
+        except ValueError:
+            pass
+
+        start = JSONRecovery.find_start(cleaned)
+        if start == -1:
+            raise JSONRecoveryError("No JSON object or array found in response")
+
+        try:
+            return _DECODER.raw_decode(cleaned, start)[0], 'block'
+        except ValueError as e:
+            error = e
+
+        if not repair:
+            raise JSONRecoveryError(f"Failed to parse JSON response: {error}")
+
+        repaired = JSONRecovery.repair(cleaned)
+        try:
+            return json.loads(repaired, strict=False), 'repair'
+        except ValueError as e:
+            raise JSONRecoveryError(f"Failed to parse JSON response: {e}")
+
+    @staticmethod
+    def loads(text: str, repair: bool = True) -> Any:
+        """Parse JSON from a completion (see loads_with_info)
+
+        Raises:
+            JSONRecoveryError: If no JSON value could be recovered
+        """
+        return JSONRecovery.loads_with_info(text, repair)[0]
+
+    @staticmethod
+    def parse_response(response_text: str, source: str = "llm", structured: bool = False) -> Any:
+        """Parse a provider completion into JSON, provider-style
+
+        Args:
+            response_text: Raw completion text
+            source: Provider/service name used in logs, captures and stats
+            structured: The completion came from a native structured-output mode
+
+        Returns:
+            Parsed JSON, or {"error": ..., "raw_response": ...} on failure
+        """
+        try:
+            value, tier = JSONRecovery.loads_with_info(response_text)
+            JSONRecovery.record_parse(source, tier, structured)
+            if tier == 'repair':
+                print(f"[DEBUG] Repaired malformed JSON from {source}")
+                JSONRecovery.capture_malformed(response_text, source)
+            return value
+        except JSONRecoveryError as e:
+            JSONRecovery.record_parse(source, 'failed', structured)
+            print(f"[ERROR] JSON parsing error ({source}): {e}")
+            if response_text:
+                print(f"[DEBUG] Response text (first 500 chars): {response_text[:500]}")
+                JSONRecovery.capture_malformed(response_text, source)
+            return {
+                "error": str(e),
+                "raw_response": response_text
+            }
+
+    @staticmethod
+    def _counters(source: str, structured: bool) -> Dict[str, int]:
+        mode = 'structured' if structured else 'prompt'
+        return JSONRecovery._stats.setdefault(source, {}).setdefault(mode, {
+            'calls': 0, 'native': 0, 'strict': 0, 'block': 0, 'repair': 0,
+            'failed': 0, 'retries': 0
+        })
+
+    @staticmethod
+    def record_parse(source: str, tier: str, structured: bool = False):
+        """Count a generate_json() outcome
+
+        Args:
+            source: Provider name
+            tier: 'native' (no parsing needed), 'strict', 'block', 'repair' or 'failed'
+            structured: A native structured-output mode was used
+        """
+        with JSONRecovery._stats_lock:
+            counters = JSONRecovery._counters(source, structured)
+            counters['calls'] += 1
+            counters[tier] += 1
+
+    @staticmethod
+    def record_retry(source: str, structured: bool = False):
+        """Count an extra LLM round-trip made because JSON output was unusable"""
+        with JSONRecovery._stats_lock:
+            JSONRecovery._counters(source, structured)['retries'] += 1
+
+    @staticmethod
+    def get_stats() -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Get per-provider JSON parse statistics
+
+        Returns:
+            {provider: {'structured'|'prompt': counters plus first_try_rate
+            (parsed without repair) and retry_rate (retries per call)}}
+        """
+        with JSONRecovery._stats_lock:
+            result = {}
+            for source, modes in JSONRecovery._stats.items():
+                result[source] = {}
+                for mode, counters in modes.items():
+                    calls = counters['calls']
+                    clean = counters['native'] + counters['strict'] + counters['block']
+                    result[source][mode] = dict(
+                        counters,
+                        first_try_rate=round(clean / calls, 3) if calls else 0.0,
+                        retry_rate=round(counters['retries'] / calls, 3) if calls else 0.0
+                    )
+            return result
+
+    @staticmethod
+    def capture_malformed(response_text: str, source: str = "llm"):
+        """Save a malformed completion for the benchmark corpus
+
+        Only active when Settings.JSON_CAPTURE_MALFORMED is set; files go to
+        data/logs/malformed_json/ and can be copied into benchmarks/json_corpus/.
+        """
+        from config.settings import Settings
+        if not Settings.JSON_CAPTURE_MALFORMED:
+            return
+        try:
+            capture_dir = Settings.LOGS_DIR / 'malformed_json'
+            capture_dir.mkdir(parents=True, exist_ok=True)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            with open(capture_dir / f"{source}_{timestamp}.txt", 'w', encoding='utf-8') as f:
+                f.write(response_text)
+        except Exception as e:
+            print(f"[WARNING] Could not capture malformed JSON: {e}")
+
+
+def extract_json(text: str, repair: bool = True) -> Any:
+    """Parse JSON from a completion (raises JSONRecoveryError)"""
+    return JSONRecovery.loads(text, repair)
+
+
+def parse_json_response(response_text: str, source: str = "llm") -> Dict[str, Any]:
+    """Parse a completion, returning an error dict on failure"""
+    return JSONRecovery.parse_response(response_text, source)
@@ -0,0 +1,141 @@
+"""
+JSON schemas for structured LLM output
+
+Passed to generate_json(schema=...) so providers with a native
+structured-output mode (OpenAI response_format, Anthropic tool use,
+Ollama format) return parseable JSON on the first try. Providers without
+one get the schema as a prompt instruction instead.
+
+Schemas stay within OpenAI's strict subset: every property is required
+and objects do not allow additional properties.
+"""
+import json
+from typing import Any, Dict, Optional, Tuple, get_args, get_origin
+
+from core.response_normalizer import CompatibilityAnalysisNormalizer
+
+_SCALAR_TYPES = {
+    str: {"type": "string"},
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    bool: {"type": "boolean"},
+}
+
+
+def object_schema(properties: Dict[str, Dict[str, Any]], title: Optional[str] = None) -> Dict[str, Any]:
+    """Build a strict object schema
+
+    Args:
+        properties: Property name -> JSON schema
+        title: Schema name (used as the response format / tool name)
+
+    Returns:
+        JSON schema dict
+    """
+    schema: Dict[str, Any] = {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False
+    }
+    if title:
+        schema = {"title": title, **schema}
+    return schema
+
+
+def schema_from_type(hint: Any) -> Dict[str, Any]:
+    """Convert a typing hint (str, List[str], ...) to a JSON schema
+
+    Raises:
+        ValueError: For hints with no strict JSON schema equivalent
+            (e.g. Dict[str, str]; describe those with object_schema())
+    """
+    if hint in _SCALAR_TYPES:
+        return dict(_SCALAR_TYPES[hint])
+    if get_origin(hint) is list:
+        args = get_args(hint)
+        return {"type": "array", "items": schema_from_type(args[0]) if args else {"type": "string"}}
+    raise ValueError(f"No JSON schema for type hint {hint!r}")
+
+
+def schema_from_types(type_map: Dict[str, Any], title: Optional[str] = None,
+                      overrides: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Build an object schema from a field -> typing hint map
+
+    Args:
+        type_map: Field name -> typing hint (e.g. a normalizer's CANONICAL_SCHEMA)
+        title: Schema name
+        overrides: Field name -> JSON schema used instead of the converted hint
+
+    Returns:
+        JSON schema dict
+    """
+    overrides = overrides or {}
+    properties = {
+        name: overrides[name] if name in overrides else schema_from_type(hint)
+        for name, hint in type_map.items()
+    }
+    return object_schema(properties, title)
+
+
+def split_schema(schema: Dict[str, Any], default_name: str = "response") -> Tuple[str, Dict[str, Any]]:
+    """Separate a schema's title from its body
+
+    Returns:
+        (name, schema without title) - the form provider APIs expect
+    """
+    body = {key: value for key, value in schema.items() if key != "title"}
+    return schema.get("title") or default_name, body
+
+
+def schema_instruction(schema: Dict[str, Any]) -> str:
+    """Prompt text asking for JSON matching schema (for providers without a native mode)"""
+    _, body = split_schema(schema)
+    return ("Respond with valid JSON only, matching this JSON schema:\n"
+            + json.dumps(body, ensure_ascii=False))
+
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+COMPATIBILITY_ANALYSIS_SCHEMA = schema_from_types(
+    CompatibilityAnalysisNormalizer.CANONICAL_SCHEMA,
+    title="compatibility_analysis",
+    overrides={
+        "strengths": {
+            "type": "array",
+            "items": object_schema({
+                "area": {"type": "string"},
+                "description": {"type": "string"}
+            })
+        }
+    }
+)
+
+# Top-level value must be an object for OpenAI and Anthropic, so the
+# question list is wrapped in {"questions": [...]}
+QUESTION_LIST_SCHEMA = object_schema({
+    "questions": {
+        "type": "array",
+        "items": object_schema({
+            "question": {"type": "string"},
+            "type": {"type": "string"},
+            "difficulty": {"type": "string", "enum": ["easy", "medium", "hard"]},
+            "ideal_answer_points": _STRING_LIST,
+            "evaluation_criteria": _STRING_LIST
+        })
+    }
+}, title="interview_questions")
+
+ANSWER_EVALUATION_SCHEMA = object_schema({
+    "score": {"type": "integer"},
+    "strengths": _STRING_LIST,
+    "weaknesses": _STRING_LIST,
+    "suggestions": _STRING_LIST,
+    "star_method_used": {"type": "boolean"},
+    "star_analysis": object_schema({
+        "situation": {"type": "string"},
+        "task": {"type": "string"},
+        "action": {"type": "string"},
+        "result": {"type": "string"}
+    })
+}, title="answer_evaluation")
@@ -0,0 +1,345 @@
+"""
+Prompt packer - fits documents into a model's token budget
+
+Replaces fixed character truncation: text is counted in tokens for the
+configured model and split into sections, and the sections most relevant
+to the other inputs (e.g. resume vs. job description) are kept until the
+budget is used up.
+"""
+import math
+import re
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Marker inserted where sections were dropped
+OMISSION_MARKER = "[...]"
+
+_WORD_RE = re.compile(r"\w+|[^\w\s]")
+_TERM_RE = re.compile(r"[a-z][a-z0-9+#.]{2,}")
+_HEADING_RE = re.compile(r"^\s*(?:[A-Z][A-Z &/]{2,}|[A-Z][\w &/]{1,40}:)\s*$")
+
+_STOP_WORDS = {
+    'the', 'and', 'for', 'with', 'from', 'was', 'are', 'were', 'have', 'has',
+    'had', 'will', 'would', 'should', 'can', 'could', 'may', 'might', 'must',
+    'this', 'that', 'these', 'those', 'our', 'you', 'your', 'their', 'who',
+    'all', 'not', 'but', 'into', 'about', 'etc', 'other', 'any', 'able'
+}
+
+
+class TokenCounter:
+    """Counts tokens for a model
+
+    Uses tiktoken for OpenAI models when it is installed; elsewhere an
+    approximation (~4 characters or ~0.75 words per token, whichever is
+    larger) that errs on the side of over-counting.
+    """
+
+    _encodings: Dict[str, object] = {}
+
+    def __init__(self, model_name: Optional[str] = None, use_tiktoken: bool = False):
+        """Initialize counter
+
+        Args:
+            model_name: Model name used to select the tiktoken encoding
+            use_tiktoken: Use tiktoken if it is installed
+        """
+        self.model_name = model_name or ""
+        self._encoding = self._get_encoding(self.model_name) if use_tiktoken else None
+
+    @classmethod
+    def _get_encoding(cls, model_name: str):
+        if not TIKTOKEN_AVAILABLE:
+            return None
+        if model_name not in cls._encodings:
+            try:
+                cls._encodings[model_name] = tiktoken.encoding_for_model(model_name)
+            except KeyError:
+                cls._encodings[model_name] = tiktoken.get_encoding("cl100k_base")
+        return cls._encodings[model_name]
+
+    @property
+    def exact(self) -> bool:
+        """True when counts come from the model's real tokenizer"""
+        return self._encoding is not None
+
+    def count(self, text: str) -> int:
+        """Count tokens in text"""
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        return max(math.ceil(len(text) / 4), math.ceil(len(_WORD_RE.findall(text)) * 4 / 3))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Cut text to at most max_tokens, preferring a line or word boundary"""
+        if max_tokens <= 0:
+            return ""
+        if self.count(text) <= max_tokens:
+            return text
+        if self._encoding is not None:
+            cut = self._encoding.decode(self._encoding.encode(text)[:max_tokens])
+        else:
+            # Binary search on character length against the approximation
+            low, high = 0, len(text)
+            while low < high:
+                mid = (low + high + 1) // 2
+                if self.count(text[:mid]) <= max_tokens:
+                    low = mid
+                else:
+                    high = mid - 1
+            cut = text[:low]
+
+        boundary = max(cut.rfind("\n"), cut.rfind(" "))
+        if boundary > len(cut) * 0.8:
+            cut = cut[:boundary]
+        return cut.rstrip()
+
+    def truncate_middle(self, text: str, max_tokens: int, head_share: float = 0.7) -> str:
+        """Cut the middle out of text, keeping its start and end
+
+        Args:
+            text: Text to shorten
+            max_tokens: Token budget
+            head_share: Fraction of the budget given to the start of the text
+
+        Returns:
+            Start and end of text joined by an omission marker
+        """
+        if self.count(text) <= max_tokens:
+            return text
+        available = max_tokens - self.count(OMISSION_MARKER) - 2
+        head = self.truncate(text, int(available * head_share))
+        tail_budget = available - self.count(head)
+        # Smallest suffix start whose tail still fits
+        low, high = len(head), len(text)
+        while low < high:
+            mid = (low + high) // 2
+            if self.count(text[mid:]) <= tail_budget:
+                high = mid
+            else:
+                low = mid + 1
+        tail = text[low:].lstrip()
+        return f"{head}\n{OMISSION_MARKER}\n{tail}" if tail else head
+
+
+class PromptPacker:
+    """Fits prompt inputs into a provider's prompt token budget"""
+
+    def __init__(self, budget_tokens: int, counter: Optional[TokenCounter] = None):
+        """Initialize packer
+
+        Args:
+            budget_tokens: Maximum tokens for system prompt plus user prompt
+            counter: Token counter (approximate if None)
+        """
+        self.budget_tokens = budget_tokens
+        self.counter = counter or TokenCounter()
+
+    @classmethod
+    def for_provider(cls, provider) -> "PromptPacker":
+        """Create a packer sized for an LLM provider
+
+        Args:
+            provider: BaseLLMProvider instance
+
+        Returns:
+            PromptPacker using the provider's tokenizer and budget
+        """
+        return cls(provider.prompt_token_budget(), provider.token_counter())
+
+    def count(self, text: str) -> int:
+        """Count tokens in text"""
+        return self.counter.count(text)
+
+    @staticmethod
+    def split_sections(text: str) -> List[str]:
+        """Split a document into sections
+
+        A section starts at a heading line (e.g. "EXPERIENCE", "Requirements:")
+        or after a blank line. Long sections are further split by line so a
+        single oversized block does not have to be kept or dropped whole.
+        """
+        sections: List[str] = []
+        current: List[str] = []
+        for line in text.splitlines():
+            if not line.strip() or _HEADING_RE.match(line):
+                if current:
+                    sections.append("\n".join(current))
+                    current = []
+                if not line.strip():
+                    continue
+            current.append(line)
+        if current:
+            sections.append("\n".join(current))
+
+        result = []
+        for section in sections:
+            lines = section.split("\n")
+            if len(section) > 1200 and len(lines) > 1:
+                # Keep a heading attached to its first line
+                chunk: List[str] = []
+                for line in lines:
+                    chunk.append(line)
+                    if sum(len(l) for l in chunk) > 400:
+                        result.append("\n".join(chunk))
+                        chunk = []
+                if chunk:
+                    result.append("\n".join(chunk))
+            else:
+                result.append(section)
+        return result
+
+    @staticmethod
+    def _terms(text: str) -> Dict[str, int]:
+        terms: Dict[str, int] = {}
+        for term in _TERM_RE.findall(text.lower()):
+            term = term.rstrip('.')
+            if term not in _STOP_WORDS:
+                terms[term] = terms.get(term, 0) + 1
+        return terms
+
+    def _rank(self, sections: List[str], query: Optional[str]) -> List[Tuple[float, int]]:
+        query_terms = self._terms(query) if query else {}
+        ranked = []
+        for index, section in enumerate(sections):
+            terms = self._terms(section)
+            overlap = sum(1 + math.log(count) for term, count in terms.items() if term in query_terms)
+            score = overlap / math.sqrt(max(len(terms), 1))
+            # Slight preference for earlier sections (summary/contact, role overview)
+            score += 0.5 / (1 + index)
+            ranked.append((score, index))
+        ranked.sort(key=lambda item: (-item[0], item[1]))
+        return ranked
+
+    def pack_text(self, text: str, max_tokens: int, query: Optional[str] = None) -> str:
+        """Reduce text to max_tokens, keeping the most relevant sections
+
+        Args:
+            text: Document text
+            max_tokens: Token budget for this document
+            query: Text to rank sections against (e.g. the other document)
+
+        Returns:
+            Packed text in original section order, with omission markers
+        """
+        if not text or self.count(text) <= max_tokens:
+            return text or ""
+
+        sections = self.split_sections(text)
+        remaining = max_tokens
+        chosen: Dict[int, str] = {}
+        added: List[int] = []
+
+        for _, index in self._rank(sections, query):
+            if remaining <= 0:
+                break
+            section = sections[index]
+            cost = self.count(section) + 1  # paragraph separator
+            if cost <= remaining:
+                chosen[index] = section
+            elif remaining > 32:
+                # Partially keep a relevant section rather than leave budget unused
+                chosen[index] = self.counter.truncate(section, remaining - 1)
+                cost = remaining
+            else:
+                continue
+            added.append(index)
+            remaining -= cost
+
+        # Omission markers were not budgeted above; drop the least relevant
+        # sections until the assembled text fits
+        packed = self._assemble(sections, chosen)
+        while added and self.count(packed) > max_tokens:
+            chosen.pop(added.pop())
+            packed = self._assemble(sections, chosen)
+        return packed
+
+    @staticmethod
+    def _assemble(sections: List[str], chosen: Dict[int, str]) -> str:
+        parts = []
+        previous = -1
+        for index in sorted(chosen):
+            if index != previous + 1:
+                parts.append(OMISSION_MARKER)
+            parts.append(chosen[index])
+            previous = index
+        if previous != len(sections) - 1:
+            parts.append(OMISSION_MARKER)
+        return "\n\n".join(parts)
+
+    def fit(self, template: str, documents: Dict[str, str],
+            system_prompt: Optional[str] = None,
+            relevance: Optional[Dict[str, str]] = None,
+            **fixed_fields) -> Dict[str, str]:
+        """Fit documents into a prompt template within the budget
+
+        The budget left after the template, system prompt and fixed fields is
+        shared between documents; a document needing less than its share
+        gives the remainder to the others.
+
+        Args:
+            template: str.format template the fields will be inserted into
+            documents: Field name -> document text to pack
+            system_prompt: System prompt sent alongside the prompt
+            relevance: Field name -> text to rank that document against
+                (defaults to the other documents)
+            **fixed_fields: Template fields inserted unchanged
+
+        Returns:
+            Dict of all template fields (packed documents plus fixed fields)
+        """
+        empty = {name: "" for name in documents}
+        overhead = (self.count(template.format(**empty, **fixed_fields))
+                    + self.count(system_prompt or ""))
+        available = max(self.budget_tokens - overhead, 0)
+
+        sizes = {name: self.count(text or "") for name, text in documents.items()}
+        allocation: Dict[str, int] = {}
+        pending = sorted(documents, key=lambda name: sizes[name])
+        while pending:
+            share = available // len(pending)
+            name = pending.pop(0)
+            allocation[name] = min(sizes[name], share)
+            available -= allocation[name]
+
+        fields = dict(fixed_fields)
+        for name, text in documents.items():
+            if relevance and name in relevance:
+                query = relevance[name]
+            else:
+                query = "\n".join(other for key, other in documents.items() if key != name and other)
+            fields[name] = self.pack_text(text or "", allocation[name], query)
+            if sizes[name] > allocation[name]:
+                print(f"[INFO] Packed {name}: {sizes[name]} -> {self.count(fields[name])} tokens")
+        return fields
+
+    def fit_history(self, messages: List[Dict[str, str]], max_tokens: int,
+                    max_message_tokens: Optional[int] = None) -> List[Dict[str, str]]:
+        """Keep the most recent messages that fit in max_tokens
+
+        Args:
+            messages: Messages in chronological order ({'role', 'content'})
+            max_tokens: Token budget for the history
+            max_message_tokens: Optional cap applied to each message
+
+        Returns:
+            Suffix of messages (chronological), long ones truncated
+        """
+        kept: List[Dict[str, str]] = []
+        remaining = max_tokens
+        for message in reversed(messages):
+            content = message.get('content', '') or ''
+            if max_message_tokens and self.count(content) > max_message_tokens:
+                content = self.counter.truncate(content, max_message_tokens) + "..."
+            cost = self.count(content) + 4  # role label and separators
+            if cost > remaining:
+                break
+            kept.append(dict(message, content=content))
+            remaining -= cost
+        kept.reverse()
+        return kept
@@ -13,6 +13,7 @@ from typing import Dict, Any, List, Optional
 import json
 import re
 from utils.logger import setup_logger
+from core.json_recovery import JSONRecovery, JSONRecoveryError
 
 # Set up logger
 logger = setup_logger("response_normalizer")
@@ -123,20 +124,19 @@ class CompatibilityAnalysisNormalizer:
                     logger.debug("Input is empty string")
                     return None
                 
-                # Try parsing as JSON
-                if (raw_response.startswith('{') or raw_response.startswith('[')):
-                    try:
-                        parsed = json.loads(raw_response)
-                        if isinstance(parsed, dict):
-                            logger.debug("Successfully parsed JSON string to dict")
-                            return parsed
-                        elif isinstance(parsed, list) and len(parsed) > 0:
-                            # If it's a list, wrap it
-                            logger.debug("Wrapping list in dict")
-                            return {"data": parsed}
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to parse JSON string: {e}")
-                        return None
+                # Try parsing as JSON (fences, prose and common mistakes tolerated)
+                try:
+                    parsed = JSONRecovery.loads(raw_response)
+                    if isinstance(parsed, dict):
+                        logger.debug("Successfully parsed JSON string to dict")
+                        return parsed
+                    elif isinstance(parsed, list) and len(parsed) > 0:
+                        # If it's a list, wrap it
+                        logger.debug("Wrapping list in dict")
+                        return {"data": parsed}
+                except JSONRecoveryError as e:
+                    logger.warning(f"Failed to parse JSON string: {e}")
+                    return None
             
             # If it's already a dict, return it
             if isinstance(raw_response, dict):
@@ -0,0 +1,140 @@
+"""
+Skill matcher - single-pass skill extraction over a skill taxonomy
+
+The taxonomy (core/skill_taxonomy.json) lists every skill once with a
+canonical id, a display name and its aliases ("k8s" -> kubernetes,
+"Postgres" -> postgresql). All terms are compiled into one regular
+expression shaped like a prefix trie, so a text is scanned once and each
+position only follows the branches that share its first characters.
+"""
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+TAXONOMY_PATH = Path(__file__).resolve().parent / "skill_taxonomy.json"
+
+# Terms start or end with symbols (C++, C#, .NET), so \b is not enough:
+# a term must not touch a word character, '+', '#' or '&' (R&D) on either side
+_BEFORE = r"(?<![\w+#&])"
+_AFTER = r"(?![\w+#&])"
+
+
+def _normalize(term: str) -> str:
+    return " ".join(term.split()).lower()
+
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    """Regex for a trie node; longer terms are tried before their prefixes"""
+    branches = []
+    for char in sorted(key for key in node if key):
+        step = r"\s+" if char == " " else re.escape(char)
+        branches.append(step + _trie_pattern(node[char]))
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        return "(?:" + body + ")?"
+    return body
+
+
+class SkillMatcher:
+    """Maps free text to canonical skill ids in one scan"""
+
+    _instance = None
+
+    def __init__(self, skills: List[Dict[str, Any]]):
+        """Build the matcher
+
+        Args:
+            skills: Taxonomy entries with 'id', 'name' and optional
+                'category', 'aliases' (case-insensitive) and 'exact'
+                (terms matched only with that capitalization, e.g. "Go")
+        """
+        self._skills: Dict[str, Dict[str, Any]] = {}
+        self._terms: Dict[str, str] = {}
+        self._exact: Dict[str, Set[str]] = {}
+
+        for skill in skills:
+            skill_id = skill['id']
+            self._skills[skill_id] = skill
+            exact = set(skill.get('exact', []))
+            for term in [skill['name'], *skill.get('aliases', []), *exact]:
+                key = _normalize(term)
+                if self._terms.get(key, skill_id) != skill_id:
+                    raise ValueError(f"Skill term {term!r} maps to both {self._terms[key]} and {skill_id}")
+                self._terms[key] = skill_id
+                if term in exact:
+                    self._exact.setdefault(key, set()).add(" ".join(term.split()))
+
+        trie: Dict[str, Any] = {}
+        for key in self._terms:
+            node = trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        pattern = _BEFORE + _trie_pattern(trie) + _AFTER
+        # Scanning lowercased text without IGNORECASE is about twice as fast;
+        # the IGNORECASE variant covers texts whose length changes when
+        # lowercased (offsets would no longer line up with the original)
+        self._pattern = re.compile(pattern)
+        self._pattern_ignorecase = re.compile(pattern, re.IGNORECASE)
+
+    @classmethod
+    def from_file(cls, path: Path = TAXONOMY_PATH) -> "SkillMatcher":
+        """Build a matcher from a taxonomy JSON file"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f)['skills'])
+
+    @classmethod
+    def get_instance(cls) -> "SkillMatcher":
+        """Get the shared matcher for the bundled taxonomy"""
+        if cls._instance is None:
+            cls._instance = cls.from_file()
+        return cls._instance
+
+    def match(self, text: Optional[str]) -> List[str]:
+        """Find the skills mentioned in text
+
+        Returns:
+            Sorted canonical skill ids
+        """
+        if not text:
+            return []
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            matches = self._pattern.finditer(lowered)
+        else:
+            matches = self._pattern_ignorecase.finditer(text)
+        
+        found = set()
+        for match in matches:
+            term = text[match.start():match.end()]
+            key = _normalize(term)
+            forms = self._exact.get(key)
+            if forms is not None and " ".join(term.split()) not in forms:
+                continue
+            found.add(self._terms[key])
+        return sorted(found)
+
+    def names(self, skill_ids: Iterable[str]) -> List[str]:
+        """Display names for skill ids (unknown ids are passed through), sorted"""
+        return sorted(self._skills[skill_id]['name'] if skill_id in self._skills else skill_id
+                      for skill_id in skill_ids)
+
+    def canonical_ids(self, names: Iterable[str]) -> Set[str]:
+        """Map stored skill names or aliases to canonical ids
+
+        Names outside the taxonomy are kept, lowercased, so they still
+        compare equal to each other.
+        """
+        ids = set()
+        for name in names:
+            if name:
+                key = _normalize(name)
+                ids.add(self._terms.get(key, key))
+        return ids
+
+    def get_skill(self, skill_id: str) -> Optional[Dict[str, Any]]:
+        """Taxonomy entry for a skill id"""
+        return self._skills.get(skill_id)
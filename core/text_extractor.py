@@ -2,27 +2,12 @@
 Text extractor - Extract structured information from text
 """
 import re
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
+from core.skill_matcher import SkillMatcher
 
 class TextExtractor:
     """Extract structured information from text"""
     
-    # Common skills patterns
-    SKILLS_PATTERNS = [
-        # Programming languages
-        r'\b(Python|Java|JavaScript|TypeScript|C\+\+|C#|Ruby|PHP|Swift|Kotlin|Go|Rust|R|MATLAB|Scala|Perl)\b',
-        # Web technologies
-        r'\b(HTML|CSS|React|Angular|Vue\.js|Node\.js|Django|Flask|FastAPI|Express|Spring|\.NET|Laravel)\b',
-        # Databases
-        r'\b(MySQL|PostgreSQL|MongoDB|Redis|SQLite|Oracle|SQL Server|DynamoDB|Cassandra|Neo4j)\b',
-        # Cloud & DevOps
-        r'\b(AWS|Azure|GCP|Docker|Kubernetes|Jenkins|GitLab|GitHub|CI/CD|Terraform|Ansible)\b',
-        # Data Science & ML
-        r'\b(TensorFlow|PyTorch|Scikit-learn|Pandas|NumPy|Keras|Machine Learning|Deep Learning|NLP|Computer Vision)\b',
-        # Tools & Other
-        r'\b(Git|Jira|Agile|Scrum|REST API|GraphQL|Microservices|Linux|Unix|Bash|PowerShell)\b',
-    ]
-    
     @staticmethod
     def extract_skills(text: str) -> List[str]:
         """
@@ -32,15 +17,24 @@ class TextExtractor:
             text: Text to extract skills from
             
         Returns:
-            List of unique skills found
+            Sorted canonical names of the skills found (aliases such as
+            "k8s" are reported as "Kubernetes")
         """
-        skills = set()
-        
-        for pattern in TextExtractor.SKILLS_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            skills.update(match.strip() for match in matches)
+        matcher = SkillMatcher.get_instance()
+        return matcher.names(matcher.match(text))
+    
+    @staticmethod
+    def extract_skill_ids(text: str) -> List[str]:
+        """
+        Extract canonical skill ids from text (see core/skill_taxonomy.json)
         
-        return sorted(list(skills))
+        Args:
+            text: Text to extract skills from
+            
+        Returns:
+            Sorted skill ids, e.g. ['kubernetes', 'postgresql']
+        """
+        return SkillMatcher.get_instance().match(text)
     
     @staticmethod
     def extract_email(text: str) -> Optional[str]:
@@ -145,6 +139,20 @@ class TextExtractor:
         Returns:
             List of keywords
         """
+        return [word for word, _ in TextExtractor.keyword_counts(text, top_n)]
+    
+    @staticmethod
+    def keyword_counts(text: str, top_n: int = 20) -> List[Tuple[str, int]]:
+        """
+        Count the top keywords in text
+        
+        Args:
+            text: Text to extract keywords from
+            top_n: Number of top keywords to return
+            
+        Returns:
+            List of (keyword, count), most frequent first
+        """
         # Remove common stop words
         stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
                      'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
@@ -163,7 +171,7 @@ class TextExtractor:
         # Sort by frequency
         sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
         
-        return [word for word, _ in sorted_words[:top_n]]
+        return sorted_words[:top_n]
     
     @staticmethod
     def clean_text(text: str) -> str:
@@ -1,4 +1,11 @@
 ﻿"""Database module for Interview Prep AI"""
-from .connection import DatabaseManager, get_connection, execute_query, init_pool
+from .connection import (
+    DatabaseManager, ConnectionPool, StatementCache, UnitOfWork, get_connection, get_pool_stats, execute_query,
+    init_pool, insert_with_legacy_id
+)
+from .pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor, fetch_page
+from .query_cache import QueryCache
 
-__all__ = ['DatabaseManager', 'get_connection', 'execute_query', 'init_pool']
+__all__ = ['DatabaseManager', 'ConnectionPool', 'StatementCache', 'UnitOfWork', 'get_connection', 'get_pool_stats',
+           'execute_query', 'init_pool', 'insert_with_legacy_id', 'DEFAULT_PAGE_SIZE', 'decode_cursor',
+           'encode_cursor', 'fetch_page', 'QueryCache']
@@ -0,0 +1,649 @@
+﻿"""
+Query plan check - EXPLAINs every service query against a seeded scratch database
+
+Creates <DB_NAME>_plancheck from database/schema.py, fills every table with
+synthetic rows (many users, so per-user filters are selective), runs EXPLAIN
+on each query in SERVICE_QUERIES and fails if any plan does a full table
+scan, a full index scan, a filesort or a temporary table that the query
+does not explicitly allow. Run it after changing a service query or an
+index to catch plan regressions before the tables grow.
+
+Each query (or, for queries assembled at runtime, each literal piece of
+it) must also appear in the source of the service named in the entry, so
+a service query edited without updating its entry here fails the check
+instead of leaving a stale copy green. --sources-only runs just that part
+and needs no database.
+
+Usage:
+    python database/check_query_plans.py [--rows N] [--keep] [--sources-only]
+"""
+import argparse
+import mysql.connector
+import os
+import re
+import sys
+from datetime import datetime, timedelta
+from dotenv import load_dotenv
+
+# Add parent directory to path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from database.pagination import page_query
+from database.schema import CREATE_TABLES
+
+load_dotenv()
+
+# Users the seeded rows are spread over
+SEED_USERS = 50
+
+# Directories searched for the class named in each entry
+SOURCE_DIRS = ('services', 'database', 'core')
+
+
+class ComposedQuery(str):
+    """Query a service assembles at runtime, with the literal pieces it is built from"""
+
+    def __new__(cls, text, fragments):
+        query = super().__new__(cls, text)
+        query.fragments = tuple(fragments)
+        return query
+
+
+def composed(*fragments):
+    """Query built by appending literal pieces (e.g. an optional filter)"""
+    return ComposedQuery(" ".join(fragments), fragments)
+
+
+def keyset_page(query, sort_column, id_column):
+    """Query fetch_page() runs for a page after the first"""
+    return ComposedQuery(page_query(query, sort_column, id_column, after_cursor=True),
+                         getattr(query, 'fragments', (query,)))
+
+
+def in_list(query, count=3):
+    """Query with an IN ({placeholders}) list expanded to count parameters"""
+    return ComposedQuery(query.replace("{placeholders}", ", ".join(["%s"] * count)), (query,))
+
+# (name, query as issued by the service, EXPLAIN parameters, allowed findings)
+# Allowed findings: 'full_scan', 'index_scan', 'filesort', 'temporary'
+SERVICE_QUERIES = [
+    # ApplicationService
+    ("ApplicationService.get_applications (status)",
+     "SELECT * FROM applications WHERE user_id = %s AND status = %s ORDER BY created_at DESC",
+     (1, 'applied'), ()),
+    ("ApplicationService.get_applications",
+     "SELECT * FROM applications WHERE user_id = %s ORDER BY created_at DESC",
+     (1,), ()),
+    # Keyset pages: the cursor predicate is a range on the (user_id, sort) index
+    ("ApplicationService.get_applications_page",
+     keyset_page("""SELECT id, application_id, company_name, job_title, location, status,
+        applied_date, interview_date, salary_offered, job_url, created_at, LEFT(notes, 101) AS notes
+        FROM applications WHERE user_id = %s""", 'created_at', 'id'),
+     (1, datetime(2025, 1, 2), datetime(2025, 1, 2), 1000, 21), ()),
+    ("ApplicationService.get_applications_page (status)",
+     keyset_page(composed("""SELECT id, application_id, company_name, job_title, location, status,
+        applied_date, interview_date, salary_offered, job_url, created_at, LEFT(notes, 101) AS notes
+        FROM applications WHERE user_id = %s""", "AND status = %s"), 'created_at', 'id'),
+     (1, 'applied', datetime(2025, 1, 2), datetime(2025, 1, 2), 1000, 21), ()),
+    ("ApplicationService.get_application_by_id",
+     "SELECT * FROM applications WHERE application_id = %s",
+     (1,), ()),
+    # Reminders are sorted across all of a user's applications, which no
+    # index on reminders can provide; the sorted set is one user's reminders
+    ("ApplicationService.get_reminders",
+     """SELECT r.*, a.company_name, a.job_title FROM reminders r
+        JOIN applications a ON r.application_id = a.application_id
+        WHERE a.user_id = %s ORDER BY r.reminder_date ASC""",
+     (1,), ('filesort', 'temporary')),
+    ("ApplicationService.get_reminders (pending)",
+     """SELECT r.*, a.company_name, a.job_title FROM reminders r
+        JOIN applications a ON r.application_id = a.application_id
+        WHERE a.user_id = %s AND r.is_completed = FALSE ORDER BY r.reminder_date ASC""",
+     (1,), ('filesort', 'temporary')),
+    ("ApplicationService._lock_application",
+     "SELECT user_id, status FROM applications WHERE application_id = %s FOR UPDATE",
+     (1,), ()),
+
+    # CoachService
+    ("CoachService.get_conversations",
+     "SELECT * FROM coach_conversations WHERE user_id = %s ORDER BY updated_at DESC LIMIT %s",
+     (1, 20), ()),
+    ("CoachService.get_conversations_page",
+     keyset_page("""SELECT cc.conversation_id, cc.title, cc.message_count, cc.updated_at,
+        (SELECT LEFT(m.content, 100) FROM coach_messages m
+         WHERE m.conversation_id = cc.conversation_id ORDER BY m.seq LIMIT 1) AS preview
+        FROM coach_conversations cc WHERE cc.user_id = %s""", 'cc.updated_at', 'cc.conversation_id'),
+     (1, datetime(2025, 1, 2), datetime(2025, 1, 2), 1000, 11), ()),
+    ("CoachService.get_messages",
+     """SELECT seq, role, content, created_at FROM coach_messages
+        WHERE conversation_id = %s AND seq < %s ORDER BY seq""",
+     (1, 2 ** 31 - 1), ()),
+    ("CoachService.get_messages (last N)",
+     """SELECT seq, role, content, created_at FROM coach_messages
+        WHERE conversation_id = %s AND seq < %s ORDER BY seq DESC LIMIT %s""",
+     (1, 2 ** 31 - 1, 40), ()),
+    ("CoachService.get_first_message",
+     """SELECT seq, role, content, created_at FROM coach_messages
+        WHERE conversation_id = %s ORDER BY seq LIMIT 1""",
+     (1,), ()),
+    ("CoachService.add_message",
+     """UPDATE coach_conversations SET message_count = LAST_INSERT_ID(message_count + 1),
+        updated_at = CURRENT_TIMESTAMP WHERE conversation_id = %s""",
+     (1,), ()),
+    ("CoachService.get_user_context",
+     """SELECT job_title, company_name FROM job_descriptions
+        WHERE user_id = %s ORDER BY jd_id DESC LIMIT 3""",
+     (1,), ()),
+
+    # CompatibilityService
+    ("CompatibilityService._build_analysis_request (resume)",
+     "SELECT resume_text, extracted_text FROM resumes WHERE id = %s AND user_id = %s",
+     (1, 1), ()),
+    ("CompatibilityService._build_analysis_request (JD)",
+     "SELECT id, jd_id, jd_text FROM job_descriptions WHERE jd_id = %s",
+     (1,), ()),
+    ("CompatibilityService.get_recent_analyses",
+     """SELECT ca.*, ca.id as analysis_id, r.file_name as resume_name, jd.company_name, jd.job_title
+        FROM compatibility_analyses ca
+        JOIN resumes r ON ca.resume_id = r.id
+        JOIN job_descriptions jd ON ca.jd_id = jd.jd_id
+        WHERE ca.user_id = %s ORDER BY ca.analyzed_at DESC LIMIT %s""",
+     (1, 10), ()),
+    ("CompatibilityService.get_recent_analyses_page",
+     keyset_page("""SELECT ca.id as analysis_id, ca.compatibility_score, ca.analyzed_at,
+        r.file_name as resume_name, jd.company_name, jd.job_title
+        FROM compatibility_analyses ca
+        JOIN resumes r ON ca.resume_id = r.id
+        JOIN job_descriptions jd ON ca.jd_id = jd.jd_id
+        WHERE ca.user_id = %s""", 'ca.analyzed_at', 'ca.id'),
+     (1, datetime(2025, 1, 2), datetime(2025, 1, 2), 1000, 11), ()),
+    ("CompatibilityService.get_analysis_by_id",
+     """SELECT ca.*, ca.id as analysis_id, r.file_name as resume_name, jd.company_name, jd.job_title
+        FROM compatibility_analyses ca
+        JOIN resumes r ON ca.resume_id = r.id
+        JOIN job_descriptions jd ON ca.jd_id = jd.jd_id
+        WHERE ca.id = %s AND ca.user_id = %s""",
+     (1, 1), ()),
+
+    # DocumentFeatureService
+    ("DocumentFeatureService._load",
+     in_list("""SELECT content_hash, text_length, skills, keywords, years_experience
+        FROM document_features
+        WHERE content_hash IN ({placeholders}) AND feature_version = %s"""),
+     ('content_hash_1', 'content_hash_2', 'content_hash_3', 1), ()),
+
+    # DocumentService
+    ("DocumentService.get_documents (type)",
+     "SELECT * FROM generated_documents WHERE user_id = %s AND document_type = %s ORDER BY created_at DESC",
+     (1, 'resume'), ()),
+    ("DocumentService.get_documents",
+     "SELECT * FROM generated_documents WHERE user_id = %s ORDER BY created_at DESC",
+     (1,), ()),
+
+    # JobDescriptionService
+    ("JobDescriptionService.get_jd",
+     "SELECT * FROM job_descriptions WHERE jd_id = %s",
+     (1,), ()),
+    ("JobDescriptionService.get_user_jds",
+     """SELECT jd_id, company_name, job_title, source_type, created_at FROM job_descriptions
+        WHERE user_id = %s ORDER BY created_at DESC LIMIT %s""",
+     (1, 50), ()),
+    ("JobDescriptionService.get_jd_text",
+     "SELECT jd_text, description_text FROM job_descriptions WHERE jd_id = %s",
+     (1,), ()),
+    ("JobDescriptionService.delete_jd",
+     "DELETE FROM job_descriptions WHERE jd_id = %s AND user_id = %s",
+     (1, 1), ()),
+    ("JobDescriptionService.get_user_job_descriptions",
+     "SELECT * FROM job_descriptions WHERE user_id = %s ORDER BY created_at DESC LIMIT %s",
+     (1, 50), ()),
+
+    # JobService
+    ("JobService.get_job_description",
+     "SELECT * FROM job_descriptions WHERE id = %s",
+     (1,), ()),
+    ("JobService.get_all_job_descriptions",
+     "SELECT * FROM job_descriptions WHERE user_id = %s ORDER BY created_at DESC",
+     (1,), ()),
+    ("JobService.get_analysis_history",
+     """SELECT ca.*, jd.title as job_title, jd.company FROM compatibility_analyses ca
+        JOIN job_descriptions jd ON ca.job_description_id = jd.id
+        WHERE ca.user_id = %s ORDER BY ca.created_at DESC LIMIT %s""",
+     (1, 10), ()),
+
+    # JSearchService
+    ("JSearchService.save_search (results count)",
+     "UPDATE jsearch_history SET results_count = %s WHERE user_id = %s ORDER BY searched_at DESC LIMIT 1",
+     (5, 1), ()),
+    ("JSearchService._save_job (existing job)",
+     "SELECT job_id FROM jsearch_jobs WHERE external_job_id = %s",
+     ('external_job_id_1',), ()),
+    # Ranking the whole cache reads the newest rows in primary key order
+    ("JSearchService.rank_cached_jobs",
+     composed("""SELECT j.job_id, j.external_job_id, j.title, j.company_name, j.location,
+        j.salary_min, j.salary_max, j.is_remote, j.job_url, j.posted_date,
+        j.content_hash, f.skills
+        FROM jsearch_jobs j
+        LEFT JOIN document_features f ON f.content_hash = j.content_hash AND f.feature_version = %s""",
+        "ORDER BY j.job_id DESC LIMIT %s"),
+     (1, 5000), ('index_scan',)),
+    ("JSearchService.rank_cached_jobs (user)",
+     composed("""SELECT j.job_id, j.external_job_id, j.title, j.company_name, j.location,
+        j.salary_min, j.salary_max, j.is_remote, j.job_url, j.posted_date,
+        j.content_hash, f.skills
+        FROM jsearch_jobs j
+        LEFT JOIN document_features f ON f.content_hash = j.content_hash AND f.feature_version = %s""",
+        "WHERE j.user_id = %s", "ORDER BY j.job_id DESC LIMIT %s"),
+     (1, 1, 5000), ()),
+    ("JSearchService._index_job_features",
+     in_list("SELECT job_id, description FROM jsearch_jobs WHERE job_id IN ({placeholders})"),
+     (1, 2, 3), ()),
+    ("JSearchService.get_job_by_external_id",
+     "SELECT * FROM jsearch_jobs WHERE external_job_id = %s",
+     ('external_job_id_1',), ()),
+    ("JSearchService.get_job_by_id",
+     "SELECT * FROM jsearch_jobs WHERE job_id = %s",
+     (1,), ()),
+    ("JSearchService.get_search_history",
+     "SELECT * FROM jsearch_history WHERE user_id = %s ORDER BY searched_at DESC LIMIT %s",
+     (1, 20), ()),
+    ("JSearchService.get_search_history_page",
+     keyset_page("""SELECT id, search_query, location, remote_only, results_count, searched_at
+        FROM jsearch_history WHERE user_id = %s""", 'searched_at', 'id'),
+     (1, datetime(2025, 1, 2), datetime(2025, 1, 2), 1000, 6), ()),
+    ("JSearchService.get_saved_job_summaries",
+     """SELECT job_id, external_job_id, title, company, company_name, location,
+        salary_min, salary_max, is_remote, job_url, apply_url, posted_date,
+        compatibility_score, created_at
+        FROM jsearch_jobs WHERE user_id = %s AND is_saved = TRUE ORDER BY created_at DESC""",
+     (1,), ()),
+    ("JSearchService.get_job_description_text",
+     "SELECT description FROM jsearch_jobs WHERE job_id = %s",
+     (1,), ()),
+    ("JSearchService.get_saved_jobs",
+     "SELECT * FROM jsearch_jobs WHERE user_id = %s AND is_saved = TRUE ORDER BY created_at DESC",
+     (1,), ()),
+
+    # LLMService / LLMSettingsService
+    ("LLMService.get_user_llm_settings",
+     """SELECT id, provider, model_name, api_key_encrypted, endpoint_url, temperature, max_tokens, top_p
+        FROM llm_settings WHERE user_id = %s AND is_active = TRUE LIMIT 1""",
+     (1,), ()),
+    ("LLMService.get_backup_llm_settings",
+     """SELECT id, provider, model_name, api_key_encrypted, endpoint_url, temperature, max_tokens, top_p
+        FROM llm_settings WHERE user_id = %s AND is_active = FALSE ORDER BY updated_at DESC""",
+     (1,), ()),
+    ("LLMService.save_llm_settings (existing row)",
+     "SELECT id FROM llm_settings WHERE user_id = %s AND provider = %s",
+     (1, 'openai'), ()),
+    # At most one row per provider for a user
+    ("LLMSettingsService.get_active_settings",
+     "SELECT * FROM llm_settings WHERE user_id = %s AND is_active = TRUE ORDER BY created_at DESC LIMIT 1",
+     (1,), ('filesort',)),
+
+    # MockInterviewService
+    ("MockInterviewService.get_session",
+     "SELECT * FROM mock_interview_sessions WHERE session_id = %s",
+     (1,), ()),
+    ("MockInterviewService.get_user_sessions",
+     "SELECT * FROM mock_interview_sessions WHERE user_id = %s ORDER BY created_at DESC LIMIT %s",
+     (1, 20), ()),
+    ("MockInterviewService.get_user_sessions_page",
+     keyset_page("""SELECT session_id, session_name, format_type, status, created_at
+        FROM mock_interview_sessions WHERE user_id = %s""", 'created_at', 'session_id'),
+     (1, datetime(2025, 1, 2), datetime(2025, 1, 2), 1000, 21), ()),
+    ("MockInterviewService.count_user_sessions",
+     "SELECT COUNT(*) AS total FROM mock_interview_sessions WHERE user_id = %s",
+     (1,), ()),
+    ("MockInterviewService.get_session_responses",
+     """SELECT mr.*, q.question_text, q.ideal_answer_points FROM mock_interview_responses mr
+        JOIN questions q ON mr.question_id = q.id
+        WHERE mr.session_id = %s ORDER BY mr.question_index ASC""",
+     (1,), ()),
+    ("MockInterviewService.get_session_feedback",
+     """SELECT * FROM mock_interview_feedback WHERE session_id = %s
+        ORDER BY feedback_type DESC, created_at ASC""",
+     (1,), ()),
+
+    # PracticeService
+    ("PracticeService.get_sessions",
+     """SELECT ps.*, q.question_text, qs.set_name, jd.job_title, jd.company_name
+        FROM practice_sessions ps
+        JOIN questions q ON ps.question_id = q.id
+        JOIN question_sets qs ON q.set_id = qs.set_id
+        LEFT JOIN job_descriptions jd ON qs.jd_id = jd.jd_id
+        WHERE ps.user_id = %s ORDER BY ps.session_date DESC LIMIT %s""",
+     (1, 20), ()),
+    ("PracticeService.get_session_summaries",
+     """SELECT ps.session_id, ps.question_id, ps.response_mode, ps.evaluation_score,
+        ps.status, ps.session_date, ps.duration_seconds,
+        q.question_text, qs.set_name, jd.job_title, jd.company_name
+        FROM practice_sessions ps
+        JOIN questions q ON ps.question_id = q.id
+        JOIN question_sets qs ON q.set_id = qs.set_id
+        LEFT JOIN job_descriptions jd ON qs.jd_id = jd.jd_id
+        WHERE ps.user_id = %s ORDER BY ps.session_date DESC LIMIT %s""",
+     (1, 20), ()),
+    ("PracticeService.get_sessions_page",
+     keyset_page("""SELECT ps.session_id, ps.evaluation_score, ps.session_date, q.question_text
+        FROM practice_sessions ps
+        JOIN questions q ON ps.question_id = q.id
+        WHERE ps.user_id = %s""", 'ps.session_date', 'ps.session_id'),
+     (1, datetime(2025, 1, 2), datetime(2025, 1, 2), 1000, 11), ()),
+    ("PracticeService.get_session_by_id",
+     """SELECT ps.*, q.question_text, q.ideal_answer_points, qs.set_name, jd.job_title, jd.company_name
+        FROM practice_sessions ps
+        JOIN questions q ON ps.question_id = q.id
+        JOIN question_sets qs ON q.set_id = qs.set_id
+        LEFT JOIN job_descriptions jd ON qs.jd_id = jd.jd_id
+        WHERE ps.session_id = %s""",
+     (1,), ()),
+    ("PracticeService.evaluate_response (question lookup)",
+     """SELECT q.*, qs.set_name FROM questions q
+        JOIN question_sets qs ON q.set_id = qs.set_id
+        WHERE q.id = %s""",
+     (1,), ()),
+    ("PracticeService._save_evaluation",
+     "SELECT user_id, evaluation_score FROM practice_sessions WHERE session_id = %s FOR UPDATE",
+     (1,), ()),
+
+    # UserStatsService
+    ("UserStatsService.get_stats",
+     """SELECT evaluated_sessions, score_sum, application_status_counts
+        FROM user_stats WHERE user_id = %s""",
+     (1,), ()),
+    ("UserStatsService.reconcile (practice)",
+     """SELECT COUNT(*) AS evaluated_sessions, COALESCE(SUM(evaluation_score), 0) AS score_sum
+        FROM practice_sessions
+        WHERE user_id = %s AND evaluation_score IS NOT NULL""",
+     (1,), ()),
+    ("UserStatsService.reconcile (applications)",
+     """SELECT status, COUNT(*) AS count FROM applications
+        WHERE user_id = %s GROUP BY status""",
+     (1,), ()),
+    ("UserStatsService.reconcile_all",
+     "SELECT id FROM users WHERE id > %s ORDER BY id LIMIT %s",
+     (0, 500), ()),
+
+    # QuestionService
+    ("QuestionService._insert_questions (ids)",
+     "SELECT id FROM questions WHERE question_set_id = %s ORDER BY id",
+     (1,), ()),
+    ("QuestionService.get_question_sets",
+     """SELECT qs.*, jd.job_title, jd.company_name FROM question_sets qs
+        LEFT JOIN job_descriptions jd ON qs.jd_id = jd.jd_id
+        WHERE qs.user_id = %s ORDER BY qs.created_at DESC LIMIT %s""",
+     (1, 20), ()),
+    ("QuestionService.get_questions",
+     "SELECT *, id AS question_id FROM questions WHERE set_id = %s ORDER BY id ASC",
+     (1,), ()),
+    ("QuestionService.get_question_set_with_questions",
+     "SELECT * FROM question_sets WHERE set_id = %s",
+     (1,), ()),
+
+    # ResumeService
+    ("ResumeService.upload_resume deactivate others",
+     "UPDATE resumes SET is_active = FALSE WHERE user_id = %s AND id != %s",
+     (1, 1), ()),
+    ("ResumeService.get_active_resume",
+     "SELECT *, id AS resume_id FROM resumes WHERE user_id = %s AND is_active = TRUE ORDER BY uploaded_at DESC LIMIT 1",
+     (1,), ()),
+    ("ResumeService.get_all_resumes",
+     "SELECT *, id AS resume_id FROM resumes WHERE user_id = %s ORDER BY uploaded_at DESC",
+     (1,), ()),
+    ("ResumeService.get_user_resumes",
+     "SELECT *, id AS resume_id FROM resumes WHERE user_id = %s AND is_active = TRUE ORDER BY uploaded_at DESC",
+     (1,), ()),
+    ("ResumeService.get_resume_summaries",
+     composed("""SELECT id AS resume_id, file_name, file_type, file_size, is_active, uploaded_at
+        FROM resumes WHERE user_id = %s""", "ORDER BY uploaded_at DESC"),
+     (1,), ()),
+    ("ResumeService.get_resume_summaries (active)",
+     composed("""SELECT id AS resume_id, file_name, file_type, file_size, is_active, uploaded_at
+        FROM resumes WHERE user_id = %s""", "AND is_active = TRUE", "ORDER BY uploaded_at DESC"),
+     (1,), ()),
+    ("ResumeService.get_resume_text",
+     "SELECT resume_text, extracted_text FROM resumes WHERE id = %s",
+     (1,), ()),
+    ("ResumeService.get_resume_by_id",
+     "SELECT *, id AS resume_id FROM resumes WHERE id = %s",
+     (1,), ()),
+
+    # SemanticMatchService
+    ("SemanticMatchService._load",
+     """SELECT segment_count, dimensions, embeddings FROM document_embeddings
+        WHERE segments_hash = %s AND model_name = %s""",
+     ('segments_hash_1', 'sentence-transformers/all-MiniLM-L6-v2'), ()),
+]
+
+LEGACY_ID_COLUMNS = {
+    'job_descriptions': 'jd_id',
+    'question_sets': 'set_id',
+    'applications': 'application_id',
+}
+
+
+def table_names():
+    """Table names in CREATE_TABLES order"""
+    names = []
+    for table_sql in CREATE_TABLES:
+        match = re.search(r"CREATE TABLE IF NOT EXISTS (\w+)", table_sql)
+        if match:
+            names.append(match.group(1))
+    return names
+
+
+def seed_value(column, row, rows):
+    """Synthetic value for one column of seeded row number row (0-based)"""
+    name = column['COLUMN_NAME']
+    data_type = column['DATA_TYPE']
+    column_type = column['COLUMN_TYPE']
+    unique = column['COLUMN_KEY'] in ('PRI', 'UNI')
+
+    if data_type in ('int', 'bigint', 'smallint', 'mediumint'):
+        if unique or name == LEGACY_ID_COLUMNS.get(column['TABLE_NAME']):
+            return row + 1
+        if name == 'user_id':
+            return row % SEED_USERS + 1
+        if name.endswith('_id'):
+            return row % max(rows // 10, 1) + 1
+        return row
+    if data_type == 'tinyint':
+        return row % 2
+    if data_type in ('decimal', 'float', 'double'):
+        return row % 100
+    if data_type == 'enum':
+        values = re.findall(r"'((?:[^']|'')*)'", column_type)
+        return values[row % len(values)]
+    if data_type == 'json':
+        return '[]'
+    if data_type in ('timestamp', 'datetime'):
+        return datetime(2025, 1, 1) + timedelta(minutes=row)
+    if data_type == 'date':
+        return (datetime(2025, 1, 1) + timedelta(days=row % 365)).date()
+    if data_type == 'time':
+        return '00:00:00'
+    if data_type in ('varchar', 'char', 'text', 'mediumtext', 'longtext', 'tinytext'):
+        value = f"{name}_{row + 1}"
+        length = column['CHARACTER_MAXIMUM_LENGTH']
+        return value[-length:] if length and len(value) > length else value
+    return None if column['IS_NULLABLE'] == 'YES' else ''
+
+
+def seed_tables(cursor, database_name, rows):
+    """Create the schema in the scratch database and fill every table"""
+    cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+    for table_sql in CREATE_TABLES:
+        cursor.execute(table_sql)
+
+    for table in table_names():
+        cursor.execute("""
+            SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, COLUMN_TYPE, COLUMN_KEY, IS_NULLABLE,
+                   CHARACTER_MAXIMUM_LENGTH, EXTRA
+            FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+            ORDER BY ORDINAL_POSITION
+        """, (database_name, table))
+        columns = [
+            {key: value.decode() if isinstance(value, (bytes, bytearray)) else value
+             for key, value in zip(cursor.column_names, row)}
+            for row in cursor.fetchall()
+        ]
+        columns = [c for c in columns
+                   if 'auto_increment' not in c['EXTRA']
+                   and c['EXTRA'] not in ('VIRTUAL GENERATED', 'STORED GENERATED')]
+        if not columns:
+            continue
+
+        # IGNORE skips rows that collide on composite unique keys
+        # (e.g. one llm_settings row per user and provider)
+        query = (f"INSERT IGNORE INTO {table} ({', '.join(c['COLUMN_NAME'] for c in columns)}) "
+                 f"VALUES ({', '.join(['%s'] * len(columns))})")
+        for start in range(0, rows, 500):
+            batch = [tuple(seed_value(c, row, rows) for c in columns)
+                     for row in range(start, min(start + 500, rows))]
+            cursor.executemany(query, batch)
+        cursor.execute(f"ANALYZE TABLE {table}")
+        cursor.fetchall()
+
+    cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+
+
+def normalize_sql(text):
+    """Whitespace-insensitive form of a query or source file"""
+    return " ".join(text.split())
+
+
+def class_sources():
+    """Class name -> normalized source of the file defining it"""
+    sources = {}
+    for directory in SOURCE_DIRS:
+        path = os.path.join(PROJECT_ROOT, directory)
+        for file_name in sorted(os.listdir(path)):
+            if not file_name.endswith('.py'):
+                continue
+            with open(os.path.join(path, file_name), encoding='utf-8-sig') as source_file:
+                source = source_file.read()
+            for class_name in re.findall(r"^class (\w+)", source, re.MULTILINE):
+                sources[class_name] = normalize_sql(source)
+    return sources
+
+
+def check_sources():
+    """Check every SERVICE_QUERIES entry against its service's source
+
+    Returns:
+        Number of entries whose query (or a piece of it) is not in the source
+    """
+    sources = class_sources()
+    failures = 0
+    for name, query, _, _ in SERVICE_QUERIES:
+        class_name = name.split('.')[0]
+        source = sources.get(class_name)
+        if source is None:
+            failures += 1
+            print(f"[FAIL] {name}: no class {class_name} in {', '.join(SOURCE_DIRS)}")
+            continue
+        missing = [fragment for fragment in getattr(query, 'fragments', (query,))
+                   if normalize_sql(fragment) not in source]
+        if missing:
+            failures += 1
+            print(f"[FAIL] {name}: query differs from {class_name}'s source: "
+                  f"{normalize_sql(missing[0])[:80]}...")
+    return failures
+
+
+def plan_problems(plan_rows):
+    """Findings in an EXPLAIN result (type ALL / index, filesort, temporary)"""
+    problems = []
+    for row in plan_rows:
+        table = row.get('table')
+        extra = row.get('Extra') or ''
+        if row.get('type') == 'ALL':
+            problems.append(('full_scan', f"full table scan of {table}"))
+        elif row.get('type') == 'index':
+            problems.append(('index_scan', f"full index scan of {table} ({row.get('key')})"))
+        if 'Using filesort' in extra:
+            problems.append(('filesort', f"filesort on {table}"))
+        if 'Using temporary' in extra:
+            problems.append(('temporary', f"temporary table for {table}"))
+    return problems
+
+
+def check_plans(rows=2000, keep=False):
+    """Seed a scratch database and EXPLAIN every service query
+
+    Returns:
+        True if every plan is free of disallowed findings
+    """
+    database_name = os.getenv('DB_NAME', 'interview_prep_ai') + '_plancheck'
+    connection = mysql.connector.connect(
+        host=os.getenv('DB_HOST', 'localhost'),
+        port=int(os.getenv('DB_PORT', 3306)),
+        user=os.getenv('DB_USER', 'root'),
+        password=os.getenv('DB_PASSWORD', '')
+    )
+    cursor = connection.cursor()
+    failures = check_sources()
+
+    try:
+        print(f"Seeding {database_name} ({rows} rows per table)...")
+        cursor.execute(f"DROP DATABASE IF EXISTS {database_name}")
+        cursor.execute(
+            f"CREATE DATABASE {database_name} CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci"
+        )
+        cursor.execute(f"USE {database_name}")
+        seed_tables(cursor, database_name, rows)
+        connection.commit()
+        print("[OK] Seeded\n")
+
+        for name, query, params, allowed in SERVICE_QUERIES:
+            try:
+                cursor.execute(f"EXPLAIN {query}", params)
+                plan = [dict(zip(cursor.column_names, row)) for row in cursor.fetchall()]
+            except mysql.connector.Error as err:
+                failures += 1
+                print(f"[FAIL] {name}: {err}")
+                continue
+
+            problems = [text for kind, text in plan_problems(plan) if kind not in allowed]
+            if problems:
+                failures += 1
+                print(f"[FAIL] {name}: {'; '.join(problems)}")
+                for row in plan:
+                    print(f"       {row.get('table')}: type={row.get('type')} key={row.get('key')} "
+                          f"rows={row.get('rows')} extra={row.get('Extra')}")
+            else:
+                keys = ", ".join(f"{row.get('table')}:{row.get('key')}" for row in plan)
+                print(f"[OK] {name} ({keys})")
+    finally:
+        connection.rollback()
+        if not keep:
+            cursor.execute(f"DROP DATABASE IF EXISTS {database_name}")
+        cursor.close()
+        connection.close()
+
+    print(f"\n{len(SERVICE_QUERIES) - failures}/{len(SERVICE_QUERIES)} query plans OK")
+    return failures == 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000, help="rows seeded per table")
+    parser.add_argument("--keep", action="store_true", help="keep the scratch database")
+    parser.add_argument("--sources-only", action="store_true",
+                        help="only check the queries against the service sources (no database)")
+    args = parser.parse_args()
+
+    if args.sources_only:
+        failures = check_sources()
+        print(f"{len(SERVICE_QUERIES) - failures}/{len(SERVICE_QUERIES)} queries match their service source")
+        sys.exit(0 if failures == 0 else 1)
+
+    try:
+        ok = check_plans(args.rows, args.keep)
+    except mysql.connector.Error as err:
+        print(f"\n[ERROR] {err}")
+        sys.exit(2)
+    sys.exit(0 if ok else 1)
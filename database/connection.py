@@ -2,9 +2,16 @@
 Database configuration and connection management
 """
 import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 import mysql.connector
-from mysql.connector import pooling
+from mysql.connector.errors import PoolError
 from dotenv import load_dotenv
+from config.settings import Settings
+from database.query_cache import QueryCache
 
 load_dotenv()
 
@@ -17,32 +24,504 @@ DB_CONFIG = {
     'database': os.getenv('DB_NAME', 'interview_prep_ai'),
 }
 
+class PooledConnection:
+    """Connection checked out of a ConnectionPool
+
+    Behaves like the underlying MySQL connection; close() returns it to
+    the pool instead of closing the socket.
+    """
+
+    def __init__(self, pool: "ConnectionPool", connection, created_at: float):
+        self._pool = pool
+        self._connection = connection
+        self._created_at = created_at
+
+    def __getattr__(self, name):
+        if self._connection is None:
+            raise PoolError("Connection has been returned to the pool")
+        return getattr(self._connection, name)
+
+    def close(self):
+        """Return the connection to the pool (safe to call twice)"""
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            self._pool._release(connection, self._created_at)
+
+    @property
+    def statements(self) -> "StatementCache":
+        """Prepared statements kept on the underlying connection"""
+        if self._connection is None:
+            raise PoolError("Connection has been returned to the pool")
+        return self._pool._statements_for(self._connection)
+
+
+class StatementCache:
+    """Prepared-statement cursors for one connection, keyed by SQL text
+
+    A prepared cursor re-executes its statement without MySQL parsing it
+    again, so keeping one per distinct query saves the parse on every call
+    after the first. Least recently used statements are closed (and
+    deallocated on the server) beyond ``max_statements``.
+    """
+
+    _stats = {'hits': 0, 'prepares': 0, 'evictions': 0}
+    _stats_lock = threading.Lock()
+
+    def __init__(self, connection, max_statements: int = 32):
+        """Initialize cache
+
+        Args:
+            connection: Raw MySQL connection the statements belong to
+            max_statements: Statements kept prepared
+        """
+        self._connection = connection
+        self.max_statements = max_statements
+        self._cursors: "OrderedDict[str, Any]" = OrderedDict()
+
+    @classmethod
+    def _record(cls, field: str):
+        with cls._stats_lock:
+            cls._stats[field] += 1
+
+    def cursor(self, query: str):
+        """Get the prepared cursor for query, preparing it on first use"""
+        cursor = self._cursors.get(query)
+        if cursor is not None:
+            self._cursors.move_to_end(query)
+            self._record('hits')
+            return cursor
+
+        cursor = self._connection.cursor(prepared=True)
+        self._cursors[query] = cursor
+        self._record('prepares')
+        while len(self._cursors) > self.max_statements:
+            _, evicted = self._cursors.popitem(last=False)
+            self._close_quietly(evicted)
+            self._record('evictions')
+        return cursor
+
+    def discard(self, query: str):
+        """Drop a statement (e.g. after it failed)"""
+        cursor = self._cursors.pop(query, None)
+        if cursor is not None:
+            self._close_quietly(cursor)
+
+    def close(self):
+        """Close every statement (before the connection itself is closed)"""
+        while self._cursors:
+            _, cursor = self._cursors.popitem()
+            self._close_quietly(cursor)
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    @staticmethod
+    def _close_quietly(cursor):
+        try:
+            cursor.close()
+        except Exception:
+            pass
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """Get process-wide statement cache metrics
+
+        Returns:
+            Dict with hits, prepares, evictions and hit_rate (0-1)
+        """
+        with cls._stats_lock:
+            stats = dict(cls._stats)
+        lookups = stats['hits'] + stats['prepares']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        return stats
+
+
+class ConnectionPool:
+    """Thread-safe MySQL connection pool with overflow, waiting and recycling
+
+    Keeps up to ``size`` idle connections. Under load up to ``max_overflow``
+    extra connections are opened and closed again when returned. When
+    every connection is in use, get_connection() waits up to ``timeout``
+    seconds before raising PoolError.
+
+    Idle connections are checked before reuse: ones idle longer than
+    ``recycle_seconds`` are replaced, and ones idle longer than
+    ``ping_after_seconds`` are pinged and replaced if the server dropped them.
+    """
+
+    def __init__(self, size: int = 5, max_overflow: int = 5, timeout: float = 30.0,
+                 recycle_seconds: float = 1800.0, ping_after_seconds: float = 30.0,
+                 **db_config):
+        """Initialize pool (connections are opened on demand)
+
+        Args:
+            size: Connections kept open when idle
+            max_overflow: Extra connections allowed under load
+            timeout: Seconds to wait for a free connection
+            recycle_seconds: Idle time after which a connection is replaced (0 disables)
+            ping_after_seconds: Idle time after which a connection is validated
+            **db_config: mysql.connector.connect() arguments
+        """
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.recycle_seconds = recycle_seconds
+        self.ping_after_seconds = ping_after_seconds
+        self.db_config = db_config
+        # Idle connections: (connection, created_at, returned_at); newest on the right
+        self._idle: deque = deque()
+        self._opened = 0
+        self._condition = threading.Condition()
+        # Raw connection -> StatementCache; removed (and its statements
+        # closed) by _close_quietly() when the pool closes the connection
+        self._statements: Dict[Any, StatementCache] = {}
+        self._metrics = {
+            'checkouts': 0, 'waits': 0, 'wait_time_total': 0.0, 'wait_time_max': 0.0,
+            'timeouts': 0, 'created': 0, 'recycled': 0, 'invalidated': 0, 'peak_active': 0
+        }
+
+    @property
+    def active(self) -> int:
+        """Connections currently checked out"""
+        return self._opened - len(self._idle)
+
+    def _connect(self):
+        return mysql.connector.connect(**self.db_config)
+
+    def get_connection(self, timeout: Optional[float] = None) -> PooledConnection:
+        """Check out a connection, waiting if the pool is exhausted
+
+        Args:
+            timeout: Seconds to wait (pool default if None)
+
+        Returns:
+            PooledConnection (call close() to return it)
+
+        Raises:
+            PoolError: If no connection became free within the timeout
+        """
+        timeout = self.timeout if timeout is None else timeout
+        entry = None
+        waited = None
+        with self._condition:
+            started = time.monotonic()
+            while True:
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._opened < self.size + self.max_overflow:
+                    # Reserve a slot; the connection is opened outside the lock
+                    self._opened += 1
+                    break
+                remaining = timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    self._metrics['timeouts'] += 1
+                    self._metrics['wait_time_total'] += timeout
+                    raise PoolError(
+                        f"No database connection available within {timeout:.1f}s "
+                        f"({self._opened} in use)"
+                    )
+                if waited is None:
+                    self._metrics['waits'] += 1
+                    waited = started
+                self._condition.wait(remaining)
+
+            if waited is not None:
+                wait_time = time.monotonic() - waited
+                self._metrics['wait_time_total'] += wait_time
+                self._metrics['wait_time_max'] = max(self._metrics['wait_time_max'], wait_time)
+            self._metrics['checkouts'] += 1
+            self._metrics['peak_active'] = max(self._metrics['peak_active'], self.active)
+
+        try:
+            if entry is None:
+                return self._open()
+            return self._validate(*entry)
+        except Exception:
+            self._discard_slot()
+            raise
+
+    def _open(self) -> PooledConnection:
+        connection = self._connect()
+        with self._condition:
+            self._metrics['created'] += 1
+        return PooledConnection(self, connection, time.monotonic())
+
+    def _validate(self, connection, created_at: float, returned_at: float) -> PooledConnection:
+        """Reuse an idle connection, replacing it if it is stale or dead"""
+        idle_for = time.monotonic() - returned_at
+        if self.recycle_seconds and idle_for > self.recycle_seconds:
+            self._close_quietly(connection)
+            with self._condition:
+                self._metrics['recycled'] += 1
+            return self._open()
+
+        if idle_for > self.ping_after_seconds:
+            try:
+                connection.ping(reconnect=False)
+            except Exception:
+                self._close_quietly(connection)
+                with self._condition:
+                    self._metrics['invalidated'] += 1
+                return self._open()
+
+        return PooledConnection(self, connection, created_at)
+
+    def _release(self, connection, created_at: float):
+        """Return a connection; overflow or broken connections are closed"""
+        try:
+            # Never hand an open transaction to the next caller
+            if connection.in_transaction:
+                connection.rollback()
+            healthy = True
+        except Exception:
+            healthy = False
+
+        with self._condition:
+            if healthy and len(self._idle) < self.size:
+                self._idle.append((connection, created_at, time.monotonic()))
+                self._condition.notify()
+                return
+            self._opened -= 1
+            if not healthy:
+                self._metrics['invalidated'] += 1
+            self._condition.notify()
+        self._close_quietly(connection)
+
+    def _statements_for(self, connection) -> StatementCache:
+        # A connection is used by one thread at a time, so only creating the
+        # cache needs the lock
+        cache = self._statements.get(connection)
+        if cache is None:
+            with self._condition:
+                cache = self._statements.setdefault(
+                    connection, StatementCache(connection, Settings.DB_STATEMENT_CACHE_SIZE)
+                )
+        return cache
+
+    def _discard_slot(self):
+        with self._condition:
+            self._opened -= 1
+            self._condition.notify()
+
+    def _close_quietly(self, connection):
+        with self._condition:
+            cache = self._statements.pop(connection, None)
+        if cache is not None:
+            cache.close()
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool metrics
+
+        Returns:
+            Dict with checkouts, waits, wait times (seconds), timeouts,
+            created/recycled/invalidated counts and current active/idle/open
+        """
+        with self._condition:
+            stats = dict(self._metrics)
+            stats['wait_time_total'] = round(stats['wait_time_total'], 3)
+            stats['wait_time_max'] = round(stats['wait_time_max'], 3)
+            waits = stats['waits']
+            stats['wait_time_avg'] = round(self._metrics['wait_time_total'] / waits, 3) if waits else 0.0
+            stats.update(active=self.active, idle=len(self._idle), open=self._opened,
+                         size=self.size, max_overflow=self.max_overflow)
+            return stats
+
+    def close_all(self):
+        """Close idle connections (checked-out ones close when returned)"""
+        with self._condition:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._opened -= len(idle)
+        for connection, _, _ in idle:
+            self._close_quietly(connection)
+
+
 # Connection pool
 connection_pool = None
+_pool_lock = threading.Lock()
 
 def init_pool():
     """Initialize database connection pool"""
     global connection_pool
     try:
-        connection_pool = pooling.MySQLConnectionPool(
-            pool_name="interview_prep_pool",
-            pool_size=5,
-            pool_reset_session=True,
+        pool = ConnectionPool(
+            size=Settings.DB_POOL_SIZE,
+            max_overflow=Settings.DB_POOL_MAX_OVERFLOW,
+            timeout=Settings.DB_POOL_TIMEOUT,
+            recycle_seconds=Settings.DB_POOL_RECYCLE_SECONDS,
+            ping_after_seconds=Settings.DB_POOL_PING_AFTER_SECONDS,
             **DB_CONFIG
         )
-        print("[OK] Database connection pool initialized")
+        # Open one connection up front so bad credentials fail here
+        pool.get_connection().close()
+        connection_pool = pool
+        print(f"[OK] Database connection pool initialized "
+              f"(size={pool.size}, overflow={pool.max_overflow}, timeout={pool.timeout}s)")
         return True
     except Exception as e:
         print(f"[ERROR] Error initializing database pool: {e}")
         return False
 
 def get_connection():
-    """Get a connection from the pool"""
+    """Get a connection from the pool (waits up to DB_POOL_TIMEOUT if exhausted)"""
     global connection_pool
     if connection_pool is None:
-        init_pool()
+        with _pool_lock:
+            if connection_pool is None:
+                init_pool()
     return connection_pool.get_connection()
 
+def get_pool_stats() -> Dict[str, Any]:
+    """Get connection pool metrics (empty if the pool is not initialized)"""
+    return connection_pool.get_stats() if connection_pool is not None else {}
+
+# Legacy id columns that mirror the AUTO_INCREMENT id. Each is the target of
+# a foreign key from another table (job_descriptions.jd_id, question_sets.set_id,
+# applications.application_id), so it must hold the id as soon as the row
+# exists. MySQL allows neither a generated column nor a default over an
+# AUTO_INCREMENT column, and a trigger cannot fill it (BEFORE INSERT does not
+# see the new id, AFTER INSERT may not update its own table), so it is written
+# in the same transaction as the INSERT (see migrations/007_fold_legacy_id_sync.sql).
+# resumes.resume_id and questions.question_id were only read, and are dropped
+# (migrations/014_drop_resume_question_legacy_ids.sql).
+LEGACY_ID_COLUMNS = {
+    'job_descriptions': 'jd_id',
+    'question_sets': 'set_id',
+    'applications': 'application_id',
+}
+
+def insert_with_legacy_id(cursor, table: str, query: str, params=None) -> Optional[int]:
+    """Insert a row and copy its id into the table's legacy id column
+    
+    Both statements run on the caller's cursor, so they are committed (or
+    rolled back) together with the rest of the caller's transaction.
+    
+    Args:
+        cursor: Open cursor
+        table: Table name (key of LEGACY_ID_COLUMNS)
+        query: INSERT statement
+        params: Query parameters
+    
+    Returns:
+        New row id, or None
+    """
+    cursor.execute(query, params or ())
+    row_id = cursor.lastrowid
+    if row_id:
+        cursor.execute(
+            f"UPDATE {table} SET {LEGACY_ID_COLUMNS[table]} = id WHERE id = %s",
+            (row_id,)
+        )
+    return row_id or None
+
+
+class UnitOfWork:
+    """Statements batched on one connection and committed once
+    
+    Obtained from DatabaseManager.transaction(); the transaction commits when
+    the with block exits normally and rolls back if it raises.
+    """
+    
+    def __init__(self, connection):
+        """Initialize unit of work
+        
+        Args:
+            connection: Pooled connection (owned by DatabaseManager.transaction())
+        """
+        self.connection = connection
+        self.cursor = connection.cursor(dictionary=True)
+        self._savepoints = 0
+    
+    @property
+    def lastrowid(self) -> Optional[int]:
+        """Id generated by the last INSERT on this unit of work (None if none)"""
+        row_id = self.cursor.lastrowid
+        return int(row_id) if row_id else None
+    
+    def execute(self, query: str, params: Optional[Sequence] = None) -> int:
+        """Execute a statement
+        
+        Returns:
+            Number of affected rows
+        """
+        self.cursor.execute(query, params or ())
+        return self.cursor.rowcount
+    
+    def execute_many(self, query: str, rows: Sequence[Sequence]) -> int:
+        """Execute a statement for each parameter row (one multi-row INSERT)
+        
+        Returns:
+            Number of affected rows
+        """
+        if not rows:
+            return 0
+        self.cursor.executemany(query, rows)
+        return self.cursor.rowcount
+    
+    def insert(self, query: str, params: Optional[Sequence] = None,
+               legacy_id_table: Optional[str] = None) -> int:
+        """Execute an INSERT and return the generated id
+        
+        Args:
+            query: INSERT statement
+            params: Query parameters
+            legacy_id_table: Table whose legacy id column (LEGACY_ID_COLUMNS)
+                should be set to the new id in this transaction
+        
+        Returns:
+            New row id
+        
+        Raises:
+            RuntimeError: If the statement did not generate an id
+        """
+        if legacy_id_table:
+            row_id = insert_with_legacy_id(self.cursor, legacy_id_table, query, params)
+        else:
+            self.cursor.execute(query, params or ())
+            row_id = self.lastrowid
+        if not row_id:
+            raise RuntimeError("INSERT did not generate an id")
+        return int(row_id)
+    
+    def fetch_one(self, query: str, params: Optional[Sequence] = None) -> Optional[Dict[str, Any]]:
+        """Execute a query and return the first row"""
+        self.cursor.execute(query, params or ())
+        return self.cursor.fetchone()
+    
+    def fetch_all(self, query: str, params: Optional[Sequence] = None) -> List[Dict[str, Any]]:
+        """Execute a query and return all rows"""
+        self.cursor.execute(query, params or ())
+        return self.cursor.fetchall()
+    
+    @contextmanager
+    def savepoint(self, name: Optional[str] = None) -> Iterator[str]:
+        """Run part of the transaction under a savepoint
+        
+        If the block raises, only its statements are rolled back and the
+        exception propagates; the caller may catch it and keep using the
+        rest of the transaction.
+        
+        Args:
+            name: Savepoint name (generated if None)
+        
+        Yields:
+            Savepoint name
+        """
+        self._savepoints += 1
+        name = name or f"sp_{self._savepoints}"
+        self.cursor.execute(f"SAVEPOINT {name}")
+        try:
+            yield name
+        except Exception:
+            self.cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            raise
+        self.cursor.execute(f"RELEASE SAVEPOINT {name}")
+
 class DatabaseManager:
     """Database manager class with static methods"""
     
@@ -66,6 +545,11 @@ class DatabaseManager:
         """Get a connection from the pool"""
         return get_connection()
     
+    @staticmethod
+    def get_pool_stats():
+        """Get connection pool metrics"""
+        return get_pool_stats()
+    
     @staticmethod
     def get_cursor():
         """Get a cursor context manager"""
@@ -88,12 +572,77 @@ class DatabaseManager:
         return cursor_manager()
     
     @staticmethod
-    def execute_query(query, params=None, fetch_one=False, fetch_all=False, commit=False):
+    @contextmanager
+    def transaction() -> Iterator[UnitOfWork]:
+        """Unit of work: several statements on one connection, one commit
+        
+        Usage:
+            with DatabaseManager.transaction() as uow:
+                jd_id = uow.insert(query, params, legacy_id_table='job_descriptions')
+                uow.execute("UPDATE ...", (jd_id,))
+        """
+        conn = get_connection()
+        uow = UnitOfWork(conn)
+        try:
+            yield uow
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            uow.cursor.close()
+            conn.close()
+    
+    @staticmethod
+    def get_statement_cache_stats():
+        """Get prepared statement cache metrics"""
+        return StatementCache.get_stats()
+    
+    @staticmethod
+    def get_query_cache_stats():
+        """Get read-through query cache metrics per namespace"""
+        return QueryCache.get_instance().get_stats()
+    
+    @staticmethod
+    def execute_query(query, params=None, fetch_one=False, fetch_all=False, commit=False, prepared=False):
         """Execute a query using the execute_query function"""
-        return execute_query(query, params, fetch_one, fetch_all, commit)
+        return execute_query(query, params, fetch_one, fetch_all, commit, prepared)
+
+
+def _decode_text(value):
+    # Some connector versions return text and JSON columns as bytearray over
+    # the binary (prepared) protocol; dictionary cursors return str
+    if isinstance(value, (bytes, bytearray)):
+        try:
+            return value.decode('utf-8')
+        except UnicodeDecodeError:
+            return bytes(value)
+    return value
+
+
+def _execute_prepared(conn, query, params, fetch_one, fetch_all, commit):
+    """Run a query on the connection's cached prepared cursor"""
+    statements = conn.statements
+    cursor = statements.cursor(query)
+    try:
+        cursor.execute(query, tuple(params or ()))
+        if commit:
+            conn.commit()
+            return cursor.lastrowid
+        if not (fetch_one or fetch_all):
+            return None
+        # Read the whole result so the cached cursor can be reused
+        columns = cursor.column_names
+        rows = [dict(zip(columns, map(_decode_text, row))) for row in cursor.fetchall()]
+        if fetch_one:
+            return rows[0] if rows else None
+        return rows
+    except Exception:
+        statements.discard(query)
+        raise
 
 
-def execute_query(query, params=None, fetch_one=False, fetch_all=False, commit=False):
+def execute_query(query, params=None, fetch_one=False, fetch_all=False, commit=False, prepared=False):
     """
     Execute a database query
     
@@ -103,6 +652,8 @@ def execute_query(query, params=None, fetch_one=False, fetch_all=False, commit=F
         fetch_one: Return single row
         fetch_all: Return all rows
         commit: Commit transaction
+        prepared: Run as a server-side prepared statement cached on the
+            connection (hot queries; ignored if DB_PREPARED_STATEMENTS is off)
     
     Returns:
         Query result or None
@@ -111,6 +662,8 @@ def execute_query(query, params=None, fetch_one=False, fetch_all=False, commit=F
     cursor = None
     try:
         conn = get_connection()
+        if prepared and Settings.DB_PREPARED_STATEMENTS:
+            return _execute_prepared(conn, query, params, fetch_one, fetch_all, commit)
         cursor = conn.cursor(dictionary=True)
         cursor.execute(query, params or ())
         
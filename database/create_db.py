@@ -61,18 +61,11 @@ def create_database():
             print(f"[INFO] set_id sync skipped (table may be empty): {e}")
         
         try:
-            cursor.execute("UPDATE resumes SET resume_id = id WHERE resume_id IS NULL OR resume_id != id")
+            cursor.execute("UPDATE questions SET set_id = question_set_id WHERE set_id IS NULL OR set_id != question_set_id")
             connection.commit()
-            print("[OK] Synced resume_id in resumes")
+            print("[OK] Synced set_id in questions")
         except Exception as e:
-            print(f"[INFO] resume_id sync skipped (table may be empty): {e}")
-        
-        try:
-            cursor.execute("UPDATE questions SET question_id = id, set_id = question_set_id WHERE question_id IS NULL OR question_id != id")
-            connection.commit()
-            print("[OK] Synced question_id and set_id in questions")
-        except Exception as e:
-            print(f"[INFO] question_id sync skipped (table may be empty): {e}")
+            print(f"[INFO] set_id sync skipped (table may be empty): {e}")
         
         try:
             cursor.execute("UPDATE applications SET application_id = id WHERE application_id IS NULL OR application_id != id")
@@ -88,13 +81,6 @@ def create_database():
         except Exception as e:
             print(f"[INFO] resume_text sync skipped (table may be empty): {e}")
         
-        try:
-            cursor.execute("UPDATE compatibility_analyses SET analysis_id = id WHERE analysis_id IS NULL OR analysis_id != id")
-            connection.commit()
-            print("[OK] Synced analysis_id in compatibility_analyses")
-        except Exception as e:
-            print(f"[INFO] analysis_id sync skipped (table may be empty): {e}")
-        
         cursor.close()
         connection.close()
         
@@ -0,0 +1,27 @@
+-- Migration 007: Fold legacy id sync into the creating transaction
+-- The legacy id columns (resume_id, jd_id, set_id, question_id, application_id)
+-- mirror the AUTO_INCREMENT id. They cannot become generated columns because
+-- MySQL does not allow generated columns (or column defaults) that reference an
+-- AUTO_INCREMENT column, so the services now write them inside the same
+-- transaction as the INSERT (database.connection.insert_with_legacy_id) instead
+-- of committing a separate UPDATE per row.
+-- compatibility_analyses.analysis_id is only read back as an alias of id, so it
+-- is dropped.
+
+-- The AFTER INSERT trigger from 006 updates the table it fires on, which MySQL
+-- rejects (error 1442), and the BEFORE INSERT trigger cannot see NEW.id
+DROP TRIGGER IF EXISTS job_descriptions_after_insert;
+DROP TRIGGER IF EXISTS job_descriptions_before_insert;
+
+-- Backfill rows written before this migration
+UPDATE resumes SET resume_id = id WHERE resume_id IS NULL OR resume_id != id;
+UPDATE job_descriptions SET jd_id = id WHERE jd_id IS NULL OR jd_id != id;
+UPDATE question_sets SET set_id = id WHERE set_id IS NULL OR set_id != id;
+UPDATE questions SET question_id = id WHERE question_id IS NULL OR question_id != id;
+UPDATE questions SET set_id = question_set_id WHERE set_id IS NULL;
+UPDATE applications SET application_id = id WHERE application_id IS NULL OR application_id != id;
+
+-- Drop the analysis_id alias column
+ALTER TABLE compatibility_analyses
+    DROP INDEX idx_analysis_id,
+    DROP COLUMN analysis_id;
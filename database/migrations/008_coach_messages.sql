@@ -0,0 +1,52 @@
+-- Migration 008: Append-only coach messages
+-- Coach chat history moves from the coach_conversations.messages JSON array
+-- (read, appended to and rewritten in full for every message) to one row per
+-- message in coach_messages. Each message gets a per-conversation sequence
+-- number; coach_conversations.message_count holds the last one and is
+-- incremented under the conversation's row lock when a message is appended.
+
+-- Sequence number and index for ordered / last-N reads
+ALTER TABLE coach_messages
+    ADD COLUMN seq INT NOT NULL DEFAULT 0 AFTER conversation_id,
+    MODIFY COLUMN content MEDIUMTEXT NOT NULL;
+
+UPDATE coach_messages cm
+JOIN (
+    SELECT message_id,
+           ROW_NUMBER() OVER (PARTITION BY conversation_id ORDER BY message_id) AS rn
+    FROM coach_messages
+) numbered ON numbered.message_id = cm.message_id
+SET cm.seq = numbered.rn;
+
+-- The unique index also serves the conversation_id foreign key
+ALTER TABLE coach_messages
+    ADD UNIQUE INDEX idx_conversation_seq (conversation_id, seq),
+    DROP INDEX idx_conversation_id;
+
+-- Backfill from the JSON blobs (conversations with no rows yet)
+INSERT INTO coach_messages (conversation_id, seq, role, content)
+SELECT c.conversation_id, m.seq, m.role, m.content
+FROM coach_conversations c,
+     JSON_TABLE(
+         c.messages, '$[*]' COLUMNS (
+             seq FOR ORDINALITY,
+             role VARCHAR(20) PATH '$.role',
+             content MEDIUMTEXT PATH '$.content'
+         )
+     ) m
+WHERE JSON_TYPE(c.messages) = 'ARRAY'
+  AND m.role IN ('user', 'assistant', 'system')
+  AND m.content IS NOT NULL
+  AND NOT EXISTS (
+      SELECT 1 FROM coach_messages existing
+      WHERE existing.conversation_id = c.conversation_id
+  );
+
+-- message_count is the last sequence number handed out
+UPDATE coach_conversations c
+SET c.message_count = COALESCE(
+    (SELECT MAX(cm.seq) FROM coach_messages cm WHERE cm.conversation_id = c.conversation_id), 0
+);
+
+-- The messages column is no longer written; it is kept so the backfill can be
+-- re-checked and can be dropped in a later migration
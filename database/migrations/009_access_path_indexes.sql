@@ -0,0 +1,75 @@
+-- Migration 009: Indexes for the queries the services actually run
+-- Each index serves the filter and ORDER BY of a service query so MySQL reads
+-- only the matching rows in order (no full scan or filesort). Check plans with
+-- python database/check_query_plans.py
+
+-- get_active_resume / get_user_resumes: user_id (+ is_active) ordered by uploaded_at
+ALTER TABLE resumes
+    ADD INDEX idx_user_active_uploaded (user_id, is_active, uploaded_at),
+    ADD INDEX idx_user_uploaded (user_id, uploaded_at);
+
+-- CoachService.get_user_context (latest by jd_id, covering title/company) and
+-- the per-user lists ordered by created_at
+ALTER TABLE job_descriptions
+    ADD INDEX idx_user_jd (user_id, jd_id, job_title, company_name),
+    ADD INDEX idx_user_created (user_id, created_at);
+
+-- Analysis history per user (CompatibilityService by analyzed_at, JobService by created_at)
+ALTER TABLE compatibility_analyses
+    ADD INDEX idx_user_analyzed (user_id, analyzed_at),
+    ADD INDEX idx_user_created (user_id, created_at);
+
+-- QuestionService.get_user_question_sets
+ALTER TABLE question_sets
+    ADD INDEX idx_user_created (user_id, created_at);
+
+-- QuestionService.get_questions: set_id ordered by question_id
+ALTER TABLE questions
+    ADD INDEX idx_set_question (set_id, question_id);
+
+-- PracticeService history (by session_date) and stats (covering evaluation_score)
+ALTER TABLE practice_sessions
+    ADD INDEX idx_user_session_date (user_id, session_date),
+    ADD INDEX idx_user_score (user_id, evaluation_score);
+
+-- ApplicationService lists (optionally by status) ordered by created_at, and stats
+ALTER TABLE applications
+    ADD INDEX idx_user_created (user_id, created_at),
+    ADD INDEX idx_user_status_created (user_id, status, created_at);
+
+-- Pending reminders per application
+ALTER TABLE reminders
+    ADD INDEX idx_application_completed_date (application_id, is_completed, reminder_date);
+
+-- DocumentService lists (optionally by type) ordered by created_at
+ALTER TABLE generated_documents
+    ADD INDEX idx_user_type_created (user_id, document_type, created_at),
+    ADD INDEX idx_user_created (user_id, created_at);
+
+-- CoachService.get_conversations
+ALTER TABLE coach_conversations
+    ADD INDEX idx_user_updated (user_id, updated_at);
+
+-- JSearchService.get_saved_jobs (external_job_id lookups use its UNIQUE key)
+ALTER TABLE jsearch_jobs
+    ADD INDEX idx_user_saved_created (user_id, is_saved, created_at);
+
+-- Search history and the results_count update of the latest search
+ALTER TABLE jsearch_history
+    ADD INDEX idx_user_searched (user_id, searched_at);
+
+-- LLMService backup settings: inactive rows by updated_at
+ALTER TABLE llm_settings
+    ADD INDEX idx_user_active_updated (user_id, is_active, updated_at);
+
+-- MockInterviewService.get_user_sessions
+ALTER TABLE mock_interview_sessions
+    ADD INDEX idx_user_created (user_id, created_at);
+
+-- Session responses in question order
+ALTER TABLE mock_interview_responses
+    ADD INDEX idx_session_question_index (session_id, question_index);
+
+-- Session feedback ordered by feedback_type DESC, created_at
+ALTER TABLE mock_interview_feedback
+    ADD INDEX idx_session_type_created (session_id, feedback_type DESC, created_at);
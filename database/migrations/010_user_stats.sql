@@ -0,0 +1,46 @@
+-- Migration 010: Materialized per-user dashboard statistics
+-- The home dashboard and planner stats row read one user_stats row instead of
+-- aggregating the user's practice sessions and applications on every
+-- navigation. PracticeService and ApplicationService keep the row current in
+-- the same transaction as each evaluation or status change;
+-- python database/reconcile_user_stats.py recomputes it to correct drift.
+
+CREATE TABLE IF NOT EXISTS user_stats (
+    user_id INT PRIMARY KEY,
+    evaluated_sessions INT NOT NULL DEFAULT 0,
+    score_sum DECIMAL(14,2) NOT NULL DEFAULT 0,
+    application_status_counts JSON,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    reconciled_at TIMESTAMP NULL,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Backfill every user from the current rows
+INSERT INTO user_stats (user_id, evaluated_sessions, score_sum, application_status_counts, reconciled_at)
+SELECT u.id,
+       COALESCE(p.evaluated_sessions, 0),
+       COALESCE(p.score_sum, 0),
+       COALESCE(a.status_counts, JSON_OBJECT()),
+       NOW()
+FROM users u
+LEFT JOIN (
+    SELECT user_id, COUNT(*) AS evaluated_sessions, SUM(evaluation_score) AS score_sum
+    FROM practice_sessions
+    WHERE evaluation_score IS NOT NULL
+    GROUP BY user_id
+) p ON p.user_id = u.id
+LEFT JOIN (
+    SELECT user_id, JSON_OBJECTAGG(status, status_count) AS status_counts
+    FROM (
+        SELECT user_id, status, COUNT(*) AS status_count
+        FROM applications
+        WHERE status IS NOT NULL
+        GROUP BY user_id, status
+    ) by_status
+    GROUP BY user_id
+) a ON a.user_id = u.id
+ON DUPLICATE KEY UPDATE
+    evaluated_sessions = VALUES(evaluated_sessions),
+    score_sum = VALUES(score_sum),
+    application_status_counts = VALUES(application_status_counts),
+    reconciled_at = VALUES(reconciled_at);
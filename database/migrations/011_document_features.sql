@@ -0,0 +1,17 @@
+-- Migration 011: Per-document feature store
+-- Skills and keyword counts extracted from a resume or job description are
+-- stored once per distinct text, keyed by the SHA-256 of the normalized text
+-- (see DocumentFeatureService), and reused by every later comparison instead
+-- of being re-extracted. Rows are derived data: deleting them only costs a
+-- recomputation. feature_version marks rows computed by an older extractor.
+
+CREATE TABLE IF NOT EXISTS document_features (
+    content_hash CHAR(64) PRIMARY KEY,
+    feature_version SMALLINT NOT NULL,
+    text_length INT NOT NULL,
+    skills JSON NOT NULL,
+    keywords JSON NOT NULL,
+    years_experience INT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,9 @@
+-- Migration 012: Link cached JSearch jobs to their document features
+-- JSearchService.rank_cached_jobs scores every cached job against the resume
+-- from document_features, joining on the hash of the job's description so
+-- the descriptions themselves are not read. New jobs get the hash when they
+-- are stored; existing rows are filled in on first ranking (the hash is
+-- computed in Python from the normalized text, see DocumentFeatureService).
+
+ALTER TABLE jsearch_jobs
+    ADD COLUMN content_hash CHAR(64) NULL AFTER description;
@@ -0,0 +1,18 @@
+-- Migration 013: Sentence embeddings of document segments
+-- SemanticMatchService embeds resume sections and job description requirement
+-- bullets with a local model and keeps the vectors per segment list (keyed by
+-- the SHA-256 of the segments, so two texts that segment alike share a row)
+-- and model, so a repeated comparison does not re-run the model. embeddings
+-- holds segment_count x dimensions float32 values, row-major. Rows are
+-- derived data: deleting them only costs a re-encode.
+
+CREATE TABLE IF NOT EXISTS document_embeddings (
+    segments_hash CHAR(64) NOT NULL,
+    model_name VARCHAR(100) NOT NULL,
+    segment_count SMALLINT NOT NULL,
+    dimensions SMALLINT NOT NULL,
+    embeddings MEDIUMBLOB NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (segments_hash, model_name)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,21 @@
+-- Migration 014: Drop the legacy id columns that nothing references
+-- resumes.resume_id and questions.question_id mirrored id only so old queries
+-- could read them; no foreign key points at either (compatibility_analyses,
+-- question_sets, mock_interview_sessions, practice_sessions, practice_responses
+-- and mock_interview_responses all reference resumes.id / questions.id). The
+-- services now read id, so inserts into these tables no longer pay for an
+-- extra UPDATE copying the new id.
+-- job_descriptions.jd_id, question_sets.set_id and applications.application_id
+-- stay: other tables' foreign keys reference them, so they are still written
+-- in the creating transaction (see 007).
+
+ALTER TABLE resumes
+    DROP INDEX idx_resume_id,
+    DROP COLUMN resume_id;
+
+-- QuestionService.get_questions now orders by id, which idx_set_id already
+-- provides (InnoDB secondary indexes end with the primary key)
+ALTER TABLE questions
+    DROP INDEX idx_set_question,
+    DROP INDEX idx_question_id,
+    DROP COLUMN question_id;
@@ -0,0 +1,119 @@
+﻿"""Keyset (cursor) pagination for history lists
+
+List queries page with WHERE (sort_column, id) < (last seen values) instead
+of OFFSET, so every page is an index range read on the (user_id, sort_column)
+indexes no matter how deep the user scrolls. The cursor handed to the UI is
+an opaque token holding the sort value and id of the last row returned.
+"""
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .connection import execute_query
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """Build an opaque cursor from the last row of a page
+
+    Args:
+        sort_value: Value of the sort column (datetime, date, number or string)
+        row_id: Primary key of the row (tie-breaker for equal sort values)
+
+    Returns:
+        URL-safe cursor string
+    """
+    if isinstance(sort_value, datetime):
+        value = ['dt', sort_value.isoformat()]
+    elif isinstance(sort_value, date):
+        value = ['d', sort_value.isoformat()]
+    elif isinstance(sort_value, Decimal):
+        value = ['dec', str(sort_value)]
+    else:
+        value = ['v', sort_value]
+    payload = json.dumps([value, int(row_id)], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    """Read the sort value and id back out of a cursor
+
+    Raises:
+        ValueError: If the cursor was not produced by encode_cursor()
+    """
+    try:
+        (kind, value), row_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        if kind == 'dt':
+            value = datetime.fromisoformat(value)
+        elif kind == 'd':
+            value = date.fromisoformat(value)
+        elif kind == 'dec':
+            value = Decimal(value)
+        return value, int(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid page cursor: {cursor!r}") from e
+
+
+def page_query(query: str, sort_column: str, id_column: str, after_cursor: bool) -> str:
+    """SQL fetch_page() runs for query (also used by database/check_query_plans.py)
+
+    Args:
+        query: SELECT ... FROM ... WHERE <filters>, without ORDER BY or LIMIT
+        sort_column: Column the list is ordered by, newest first
+        id_column: Primary key column used as the tie-breaker
+        after_cursor: Add the predicate for pages after the first
+
+    Returns:
+        query with the cursor predicate, ORDER BY and LIMIT %s appended
+    """
+    if after_cursor:
+        # Expanded form of (sort, id) < (%s, %s); MySQL turns it into a range read
+        query += f" AND ({sort_column} < %s OR ({sort_column} = %s AND {id_column} < %s))"
+    return query + f" ORDER BY {sort_column} DESC, {id_column} DESC LIMIT %s"
+
+
+def fetch_page(query: str, params: Sequence, sort_column: str, id_column: str,
+               limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None,
+               sort_key: Optional[str] = None, id_key: Optional[str] = None) -> Dict[str, Any]:
+    """Fetch one page of a newest-first list
+
+    Args:
+        query: SELECT ... FROM ... WHERE <filters>, without ORDER BY or LIMIT
+        params: Parameters for the filters in query
+        sort_column: Column the list is ordered by, newest first (e.g. 'ps.session_date')
+        id_column: Primary key column used as the tie-breaker (e.g. 'ps.session_id')
+        limit: Page size (capped at MAX_PAGE_SIZE)
+        cursor: next_cursor from the previous page, None for the first page
+        sort_key: Result key holding the sort value (default: sort_column without table alias)
+        id_key: Result key holding the id (default: id_column without table alias)
+
+    Returns:
+        {'items': rows, 'next_cursor': cursor for the following page or None}
+
+    Raises:
+        ValueError: If cursor is malformed
+    """
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    sort_key = sort_key or sort_column.split('.')[-1]
+    id_key = id_key or id_column.split('.')[-1]
+    params = list(params)
+
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        params += [sort_value, sort_value, row_id]
+
+    # One extra row tells whether another page exists
+    params.append(limit + 1)
+
+    rows = execute_query(page_query(query, sort_column, id_column, bool(cursor)), tuple(params),
+                         fetch_all=True) or []
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last[sort_key], last[id_key])
+    return {'items': rows, 'next_cursor': next_cursor}
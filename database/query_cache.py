@@ -0,0 +1,155 @@
+﻿"""
+Process-local read-through cache for rarely-changing reference data
+
+Resumes, job descriptions and question sets change only when the user
+uploads, saves or deletes one, but every view re-reads them on navigation.
+Their service getters go through QueryCache.get_or_load(); the services
+that write those rows call invalidate() after the write commits. Entries
+expire after ``ttl_seconds`` as a backstop for writes made by other
+processes, and the least recently used entries are dropped beyond
+``max_entries``.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class QueryCache:
+    """Size- and TTL-bounded LRU of service query results
+
+    Entries are grouped by namespace (e.g. 'resumes') and owner (the user
+    or row id the result belongs to), so a write can drop exactly the
+    results it affects. Values are deep-copied in and out, so callers may
+    mutate what they get back.
+    """
+
+    _instance = None
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: int = 300):
+        """Initialize cache
+
+        Args:
+            max_entries: Maximum entries kept (0 disables caching)
+            ttl_seconds: Entry lifetime in seconds (0 means no expiry)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def get_instance(cls) -> "QueryCache":
+        """Get shared cache instance configured from Settings"""
+        if cls._instance is None:
+            from config.settings import Settings
+            cls._instance = cls(
+                max_entries=Settings.QUERY_CACHE_MAX_ENTRIES if Settings.QUERY_CACHE_ENABLED else 0,
+                ttl_seconds=Settings.QUERY_CACHE_TTL_SECONDS
+            )
+        return cls._instance
+
+    def _record(self, namespace: str, field: str, count: int = 1):
+        stats = self._stats.setdefault(
+            namespace, {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+        )
+        stats[field] += count
+
+    def _expired(self, created_at: float) -> bool:
+        return bool(self.ttl_seconds) and (time.time() - created_at) > self.ttl_seconds
+
+    def get_or_load(self, namespace: str, owner: Hashable, key: Hashable,
+                    loader: Callable[[], Any]) -> Any:
+        """Return the cached result, or run loader and cache what it returns
+
+        Exceptions from loader propagate and nothing is cached. None
+        results are cached like any other value.
+
+        Args:
+            namespace: Data kind the result belongs to (e.g. 'resumes')
+            owner: User or row id the result belongs to (invalidation unit)
+            key: Identifies the query within the owner (method name, arguments)
+            loader: Runs the query on a miss
+
+        Returns:
+            The (copied) result
+        """
+        entry_key = (namespace, owner, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None:
+                created_at, value = entry
+                if not self._expired(created_at):
+                    self._entries.move_to_end(entry_key)
+                    self._record(namespace, 'hits')
+                    return copy.deepcopy(value)
+                del self._entries[entry_key]
+            self._record(namespace, 'misses')
+            generation = self._generations.get(namespace, 0)
+
+        value = loader()
+        if self.max_entries <= 0:
+            return value
+
+        with self._lock:
+            # An invalidation while the query ran means the result may
+            # predate the write; return it but do not cache it
+            if self._generations.get(namespace, 0) == generation:
+                self._entries[entry_key] = (time.time(), copy.deepcopy(value))
+                self._entries.move_to_end(entry_key)
+                while len(self._entries) > self.max_entries:
+                    (evicted_namespace, _, _), _ = self._entries.popitem(last=False)
+                    self._record(evicted_namespace, 'evictions')
+        return value
+
+    def invalidate(self, namespace: str, owner: Optional[Hashable] = None) -> int:
+        """Drop cached results after a write
+
+        Args:
+            namespace: Data kind that changed
+            owner: User or row id whose results to drop (None drops the namespace)
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            stale = [
+                entry_key for entry_key in self._entries
+                if entry_key[0] == namespace and (owner is None or entry_key[1] == owner)
+            ]
+            for entry_key in stale:
+                del self._entries[entry_key]
+            self._record(namespace, 'invalidations', len(stale))
+            return len(stale)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            for namespace in {entry_key[0] for entry_key in self._entries}:
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-namespace hit statistics
+
+        Returns:
+            Dict mapping namespace to hits, misses, evictions, invalidations,
+            current entries and hit_rate (0-1)
+        """
+        with self._lock:
+            entries: Dict[str, int] = {}
+            for namespace, _, _ in self._entries:
+                entries[namespace] = entries.get(namespace, 0) + 1
+            result = {}
+            for namespace, stats in self._stats.items():
+                lookups = stats['hits'] + stats['misses']
+                result[namespace] = dict(
+                    stats,
+                    entries=entries.get(namespace, 0),
+                    hit_rate=round(stats['hits'] / lookups, 3) if lookups else 0.0
+                )
+            return result
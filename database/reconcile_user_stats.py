@@ -0,0 +1,53 @@
+﻿"""
+User stats reconciliation - recompute user_stats from the base tables
+
+user_stats is maintained incrementally by PracticeService and
+ApplicationService. This job recomputes each user's row from
+practice_sessions and applications, rewrites it and reports the users
+whose stored totals had drifted. Run it periodically (e.g. nightly from
+cron) or after fixing data by hand.
+
+Usage:
+    python database/reconcile_user_stats.py [--user-id N] [--batch-size N]
+"""
+import argparse
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.user_stats_service import UserStatsService
+
+
+def reconcile(user_id=None, batch_size=500):
+    """Reconcile one user or every user; returns the drifted user ids"""
+    if user_id is not None:
+        row = UserStatsService.reconcile(user_id)
+        print(f"[INFO] User {user_id}: {row['evaluated_sessions']} evaluated sessions, "
+              f"{sum(row['application_status_counts'].values())} applications")
+        return [user_id] if row['drifted'] else []
+
+    result = UserStatsService.reconcile_all(batch_size)
+    print(f"[INFO] Reconciled {result['users']} users")
+    return result['drifted']
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user-id", type=int, default=None, help="reconcile only this user")
+    parser.add_argument("--batch-size", type=int, default=500, help="users read per batch")
+    args = parser.parse_args()
+
+    try:
+        drifted = reconcile(args.user_id, args.batch_size)
+    except Exception as err:
+        print(f"\n[ERROR] {err}")
+        sys.exit(2)
+
+    if drifted:
+        print(f"[WARNING] Corrected drifted stats for {len(drifted)} users: "
+              f"{', '.join(str(user_id) for user_id in drifted)}")
+    else:
+        print("[OK] No drift found")
+    sys.exit(1 if drifted else 0)
@@ -49,7 +49,6 @@ CREATE_TABLES = [
     """
     CREATE TABLE IF NOT EXISTS resumes (
         id INT AUTO_INCREMENT PRIMARY KEY,
-        resume_id INT,
         user_id INT NOT NULL,
         file_name VARCHAR(255) NOT NULL,
         file_path VARCHAR(500) NOT NULL,
@@ -66,7 +65,8 @@ CREATE_TABLES = [
         INDEX idx_user_id (user_id),
         INDEX idx_is_active (is_active),
         INDEX idx_uploaded_at (uploaded_at),
-        INDEX idx_resume_id (resume_id)
+        INDEX idx_user_active_uploaded (user_id, is_active, uploaded_at),
+        INDEX idx_user_uploaded (user_id, uploaded_at)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
     
@@ -106,7 +106,9 @@ CREATE_TABLES = [
         INDEX idx_job_title (job_title),
         INDEX idx_jd_id (jd_id),
         INDEX idx_source_type (source_type),
-        UNIQUE INDEX idx_jd_id_unique (jd_id)
+        UNIQUE INDEX idx_jd_id_unique (jd_id),
+        INDEX idx_user_jd (user_id, jd_id, job_title, company_name),
+        INDEX idx_user_created (user_id, created_at)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
     
@@ -114,7 +116,6 @@ CREATE_TABLES = [
     """
     CREATE TABLE IF NOT EXISTS compatibility_analyses (
         id INT AUTO_INCREMENT PRIMARY KEY,
-        analysis_id INT,
         user_id INT NOT NULL,
         resume_id INT NOT NULL,
         job_description_id INT NOT NULL,
@@ -137,7 +138,8 @@ CREATE_TABLES = [
         INDEX idx_score (compatibility_score),
         INDEX idx_jd_id (jd_id),
         INDEX idx_analyzed_at (analyzed_at),
-        INDEX idx_analysis_id (analysis_id)
+        INDEX idx_user_analyzed (user_id, analyzed_at),
+        INDEX idx_user_created (user_id, created_at)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
     
@@ -163,7 +165,8 @@ CREATE_TABLES = [
         FOREIGN KEY (resume_id) REFERENCES resumes(id) ON DELETE SET NULL,
         INDEX idx_user_id (user_id),
         INDEX idx_jd_id (jd_id),
-        INDEX idx_set_id (set_id)
+        INDEX idx_set_id (set_id),
+        INDEX idx_user_created (user_id, created_at)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
     
@@ -171,7 +174,6 @@ CREATE_TABLES = [
     """
     CREATE TABLE IF NOT EXISTS questions (
         id INT AUTO_INCREMENT PRIMARY KEY,
-        question_id INT,
         question_set_id INT NOT NULL,
         set_id INT NOT NULL,
         question_text LONGTEXT NOT NULL,
@@ -187,7 +189,6 @@ CREATE_TABLES = [
         FOREIGN KEY (set_id) REFERENCES question_sets(set_id) ON DELETE CASCADE,
         INDEX idx_question_set_id (question_set_id),
         INDEX idx_set_id (set_id),
-        INDEX idx_question_id (question_id),
         INDEX idx_type (question_type)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
@@ -218,7 +219,9 @@ CREATE_TABLES = [
         INDEX idx_user_id (user_id),
         INDEX idx_status (status),
         INDEX idx_evaluation_score (evaluation_score),
-        INDEX idx_session_date (session_date)
+        INDEX idx_session_date (session_date),
+        INDEX idx_user_session_date (user_id, session_date),
+        INDEX idx_user_score (user_id, evaluation_score)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
     
@@ -280,7 +283,9 @@ CREATE_TABLES = [
         INDEX idx_application_date (application_date),
         INDEX idx_applied_date (applied_date),
         INDEX idx_application_id (application_id),
-        INDEX idx_jd_id (jd_id)
+        INDEX idx_jd_id (jd_id),
+        INDEX idx_user_created (user_id, created_at),
+        INDEX idx_user_status_created (user_id, status, created_at)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
     
@@ -298,7 +303,8 @@ CREATE_TABLES = [
         FOREIGN KEY (application_id) REFERENCES applications(application_id) ON DELETE CASCADE,
         INDEX idx_application_id (application_id),
         INDEX idx_reminder_date (reminder_date),
-        INDEX idx_is_completed (is_completed)
+        INDEX idx_is_completed (is_completed),
+        INDEX idx_application_completed_date (application_id, is_completed, reminder_date)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
     
@@ -318,7 +324,9 @@ CREATE_TABLES = [
         FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
         FOREIGN KEY (job_description_id) REFERENCES job_descriptions(id) ON DELETE SET NULL,
         INDEX idx_user_id (user_id),
-        INDEX idx_document_type (document_type)
+        INDEX idx_document_type (document_type),
+        INDEX idx_user_type_created (user_id, document_type, created_at),
+        INDEX idx_user_created (user_id, created_at)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
     
@@ -342,7 +350,8 @@ CREATE_TABLES = [
         INDEX idx_user_id (user_id),
         INDEX idx_session_id (session_id),
         INDEX idx_last_message_at (last_message_at),
-        INDEX idx_updated_at (updated_at)
+        INDEX idx_updated_at (updated_at),
+        INDEX idx_user_updated (user_id, updated_at)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
     
@@ -351,11 +360,12 @@ CREATE_TABLES = [
     CREATE TABLE IF NOT EXISTS coach_messages (
         message_id INT AUTO_INCREMENT PRIMARY KEY,
         conversation_id INT NOT NULL,
+        seq INT NOT NULL DEFAULT 0,
         role ENUM('user', 'assistant', 'system') NOT NULL,
-        content TEXT NOT NULL,
+        content MEDIUMTEXT NOT NULL,
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         FOREIGN KEY (conversation_id) REFERENCES coach_conversations(conversation_id) ON DELETE CASCADE,
-        INDEX idx_conversation_id (conversation_id),
+        UNIQUE INDEX idx_conversation_seq (conversation_id, seq),
         INDEX idx_created_at (created_at)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
@@ -371,6 +381,7 @@ CREATE_TABLES = [
         company_name VARCHAR(255),
         location VARCHAR(255),
         description LONGTEXT,
+        content_hash CHAR(64),
         salary_min DECIMAL(12,2),
         salary_max DECIMAL(12,2),
         is_remote BOOLEAN DEFAULT FALSE,
@@ -385,7 +396,8 @@ CREATE_TABLES = [
         INDEX idx_user_id (user_id),
         INDEX idx_external_job_id (external_job_id),
         INDEX idx_is_saved (is_saved),
-        INDEX idx_compatibility_score (compatibility_score)
+        INDEX idx_compatibility_score (compatibility_score),
+        INDEX idx_user_saved_created (user_id, is_saved, created_at)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
     
@@ -401,7 +413,8 @@ CREATE_TABLES = [
         searched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
         INDEX idx_user_id (user_id),
-        INDEX idx_searched_at (searched_at)
+        INDEX idx_searched_at (searched_at),
+        INDEX idx_user_searched (user_id, searched_at)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
     
@@ -441,7 +454,8 @@ CREATE_TABLES = [
         FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
         UNIQUE KEY unique_user_provider (user_id, provider),
         INDEX idx_user_id (user_id),
-        INDEX idx_is_active (is_active)
+        INDEX idx_is_active (is_active),
+        INDEX idx_user_active_updated (user_id, is_active, updated_at)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
     
@@ -471,7 +485,8 @@ CREATE_TABLES = [
         FOREIGN KEY (job_description_id) REFERENCES job_descriptions(id) ON DELETE SET NULL,
         FOREIGN KEY (jd_id) REFERENCES job_descriptions(jd_id) ON DELETE SET NULL,
         INDEX idx_user_id (user_id),
-        INDEX idx_status (status)
+        INDEX idx_status (status),
+        INDEX idx_user_created (user_id, created_at)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
     
@@ -496,7 +511,8 @@ CREATE_TABLES = [
         FOREIGN KEY (question_id) REFERENCES questions(id) ON DELETE CASCADE,
         INDEX idx_session_id (session_id),
         INDEX idx_question_id (question_id),
-        INDEX idx_question_index (question_index)
+        INDEX idx_question_index (question_index),
+        INDEX idx_session_question_index (session_id, question_index)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
     
@@ -518,7 +534,8 @@ CREATE_TABLES = [
         FOREIGN KEY (session_id) REFERENCES mock_interview_sessions(session_id) ON DELETE CASCADE,
         FOREIGN KEY (response_id) REFERENCES mock_interview_responses(response_id) ON DELETE CASCADE,
         INDEX idx_session_id (session_id),
-        INDEX idx_response_id (response_id)
+        INDEX idx_response_id (response_id),
+        INDEX idx_session_type_created (session_id, feedback_type DESC, created_at)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """,
     
@@ -537,6 +554,47 @@ CREATE_TABLES = [
         FOREIGN KEY (session_id) REFERENCES mock_interview_sessions(session_id) ON DELETE CASCADE,
         INDEX idx_session_id (session_id)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+    """,
+    
+    # Per-user dashboard statistics (maintained by the services, see UserStatsService)
+    """
+    CREATE TABLE IF NOT EXISTS user_stats (
+        user_id INT PRIMARY KEY,
+        evaluated_sessions INT NOT NULL DEFAULT 0,
+        score_sum DECIMAL(14,2) NOT NULL DEFAULT 0,
+        application_status_counts JSON,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        reconciled_at TIMESTAMP NULL,
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+    """,
+    
+    # Extracted skills/keywords per distinct document text (see DocumentFeatureService)
+    """
+    CREATE TABLE IF NOT EXISTS document_features (
+        content_hash CHAR(64) PRIMARY KEY,
+        feature_version SMALLINT NOT NULL,
+        text_length INT NOT NULL,
+        skills JSON NOT NULL,
+        keywords JSON NOT NULL,
+        years_experience INT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+    """,
+    
+    # Sentence embeddings per document segment list and model (see SemanticMatchService)
+    """
+    CREATE TABLE IF NOT EXISTS document_embeddings (
+        segments_hash CHAR(64) NOT NULL,
+        model_name VARCHAR(100) NOT NULL,
+        segment_count SMALLINT NOT NULL,
+        dimensions SMALLINT NOT NULL,
+        embeddings MEDIUMBLOB NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        PRIMARY KEY (segments_hash, model_name)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
     """
 ]
 
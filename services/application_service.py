@@ -3,7 +3,9 @@ Application tracking service
 """
 from typing import List, Dict, Optional
 from datetime import datetime
-from database.connection import execute_query
+from database.connection import DatabaseManager, execute_query
+from database.pagination import DEFAULT_PAGE_SIZE, fetch_page
+from services.user_stats_service import UserStatsService
 
 class ApplicationService:
     """Handle job application tracking"""
@@ -20,8 +22,6 @@ class ApplicationService:
                           salary_offered: Optional[float] = None) -> Optional[int]:
         """Create application record"""
         try:
-            from database.connection import get_connection
-            
             print(f"[DEBUG] create_application called: user_id={user_id}, company={company_name}, title={job_title}")
             print(f"[DEBUG] Dates: applied_date={applied_date}, interview_date={interview_date}, salary={salary_offered}")
             
@@ -39,37 +39,13 @@ class ApplicationService:
             
             print(f"[DEBUG] Executing query with {len(params)} parameters")
             
-            # Use direct connection to get lastrowid properly
-            conn = None
-            cursor = None
-            try:
-                conn = get_connection()
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                conn.commit()
-                application_id = cursor.lastrowid
-                
-                # Sync application_id column with id for code compatibility
-                if application_id:
-                    cursor.execute(
-                        "UPDATE applications SET application_id = id WHERE id = %s",
-                        (application_id,)
-                    )
-                    conn.commit()
-                
-                cursor.close()
-                conn.close()
-                
-                print(f"[DEBUG] Application created successfully with ID: {application_id}")
-                return application_id if application_id and application_id > 0 else None
-            except Exception as db_error:
-                if conn:
-                    conn.rollback()
-                if cursor:
-                    cursor.close()
-                if conn:
-                    conn.close()
-                raise db_error
+            # Insert and legacy id sync commit together (rolled back on error)
+            with DatabaseManager.transaction() as uow:
+                application_id = uow.insert(query, params, legacy_id_table='applications')
+                UserStatsService.record_application_status(uow, user_id, None, status)
+            
+            print(f"[DEBUG] Application created successfully with ID: {application_id}")
+            return application_id
                 
         except Exception as e:
             print(f"[ERROR] Error creating application: {e}")
@@ -95,12 +71,50 @@ class ApplicationService:
             """
             return execute_query(query, (user_id,), fetch_all=True) or []
     
+    @staticmethod
+    def get_applications_page(user_id: int, status: Optional[str] = None,
+                              limit: int = DEFAULT_PAGE_SIZE,
+                              cursor: Optional[str] = None) -> Dict:
+        """Get one page of applications for the planner cards, newest first
+        
+        Notes come back cut to a preview (101 characters, so the card can
+        tell it was shortened); load the full row with get_application_by_id()
+        before editing.
+        
+        Returns:
+            {'items': applications, 'next_cursor': str or None}
+        """
+        try:
+            query = """
+            SELECT id, application_id, company_name, job_title, location, status,
+                   applied_date, interview_date, salary_offered, job_url, created_at,
+                   LEFT(notes, 101) AS notes
+            FROM applications
+            WHERE user_id = %s
+            """
+            params = [user_id]
+            if status:
+                query += " AND status = %s"
+                params.append(status)
+            return fetch_page(query, params, 'created_at', 'id', limit, cursor)
+        except Exception as e:
+            print(f"Error fetching applications page: {e}")
+            return {'items': [], 'next_cursor': None}
+    
     @staticmethod
     def get_application_by_id(application_id: int) -> Optional[Dict]:
         """Get a specific application"""
         query = "SELECT * FROM applications WHERE application_id = %s"
         return execute_query(query, (application_id,), fetch_one=True)
     
+    @staticmethod
+    def _lock_application(uow, application_id: int) -> Optional[Dict]:
+        """Read an application's owner and status, locking the row until commit"""
+        return uow.fetch_one(
+            "SELECT user_id, status FROM applications WHERE application_id = %s FOR UPDATE",
+            (application_id,)
+        )
+    
     @staticmethod
     def update_status(application_id: int, status: str) -> bool:
         """Update application status"""
@@ -110,7 +124,14 @@ class ApplicationService:
                 SET status = %s, updated_at = NOW()
                 WHERE application_id = %s
             """
-            execute_query(query, (status, application_id), commit=True)
+            # Status change and user_stats counts commit together
+            with DatabaseManager.transaction() as uow:
+                current = ApplicationService._lock_application(uow, application_id)
+                uow.execute(query, (status, application_id))
+                if current:
+                    UserStatsService.record_application_status(
+                        uow, current['user_id'], current['status'], status
+                    )
             return True
         except Exception as e:
             print(f"Error updating application status: {e}")
@@ -149,7 +170,13 @@ class ApplicationService:
             values.append(application_id)
             query = f"UPDATE applications SET {', '.join(updates)}, updated_at = NOW() WHERE application_id = %s"
             
-            execute_query(query, tuple(values), commit=True)
+            with DatabaseManager.transaction() as uow:
+                current = ApplicationService._lock_application(uow, application_id)
+                uow.execute(query, tuple(values))
+                if current and 'status' in kwargs:
+                    UserStatsService.record_application_status(
+                        uow, current['user_id'], current['status'], kwargs['status']
+                    )
             return True
         except Exception as e:
             print(f"Error updating application: {e}")
@@ -160,7 +187,11 @@ class ApplicationService:
         """Delete an application"""
         try:
             query = "DELETE FROM applications WHERE application_id = %s"
-            execute_query(query, (application_id,), commit=True)
+            with DatabaseManager.transaction() as uow:
+                current = ApplicationService._lock_application(uow, application_id)
+                uow.execute(query, (application_id,))
+                if current:
+                    UserStatsService.record_application_status(uow, current['user_id'], current['status'], None)
             return True
         except Exception as e:
             print(f"Error deleting application: {e}")
@@ -224,44 +255,10 @@ class ApplicationService:
     
     @staticmethod
     def get_application_stats(user_id: int) -> Dict:
-        """Get application statistics for a user"""
-        query = """
-        SELECT 
-            COUNT(*) as total,
-            SUM(CASE WHEN status IN ('interview', 'final_round', 'offer') THEN 1 ELSE 0 END) as interviews,
-            SUM(CASE WHEN status = 'offer' THEN 1 ELSE 0 END) as offers
-        FROM applications 
-        WHERE user_id = %s
-        """
-        result = execute_query(query, (user_id,), fetch_one=True)
-        
-        if result and result.get('total', 0):
-            total = result.get('total', 0) or 0
-            interviews = result.get('interviews', 0) or 0
-            interview_rate = round((interviews / total * 100) if total > 0 else 0, 1)
-            
-            return {
-                'total': total,
-                'interviews': interviews,
-                'offers': result.get('offers', 0) or 0,
-                'interview_rate': interview_rate
-            }
-        
-        return {'total': 0, 'interviews': 0, 'offers': 0, 'interview_rate': 0}
+        """Get application statistics for a user (from user_stats)"""
+        return UserStatsService.get_stats(user_id)['applications']
     
     @staticmethod
     def get_stats_by_status(user_id: int) -> Dict[str, int]:
-        """Get count of applications by status"""
-        query = """
-        SELECT status, COUNT(*) as count
-        FROM applications
-        WHERE user_id = %s
-        GROUP BY status
-        """
-        results = execute_query(query, (user_id,), fetch_all=True) or []
-        
-        stats = {}
-        for row in results:
-            stats[row['status']] = row['count']
-        
-        return stats
+        """Get count of applications by status (from user_stats)"""
+        return UserStatsService.get_stats(user_id)['status_counts']
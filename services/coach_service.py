@@ -2,10 +2,13 @@
 Career coach service - AI-powered career coaching
 """
 import json
-from typing import List, Dict, Optional, Any
-from database.connection import execute_query
+from typing import List, Dict, Optional, Any, Callable
+from database.connection import DatabaseManager, execute_query
+from database.pagination import DEFAULT_PAGE_SIZE, fetch_page
 from services.llm_service import LLMService
 from config.prompts import Prompts
+from config.settings import Settings
+from core.prompt_packer import PromptPacker
 
 class CoachService:
     """Handle career coach operations"""
@@ -18,14 +21,15 @@ class CoachService:
             # Generate unique session_id
             session_id = str(uuid.uuid4())
             
-            # Insert conversation with session_id and empty messages JSON
+            # Messages are stored in coach_messages; message_count is the
+            # last sequence number handed out
             query = """
-            INSERT INTO coach_conversations (user_id, session_id, messages) 
-            VALUES (%s, %s, %s)
+            INSERT INTO coach_conversations (user_id, session_id, message_count) 
+            VALUES (%s, %s, 0)
             """
             conversation_id = execute_query(
                 query, 
-                (user_id, session_id, json.dumps([])), 
+                (user_id, session_id), 
                 commit=True
             )
             
@@ -54,55 +58,110 @@ class CoachService:
         return execute_query(query, (user_id, limit), fetch_all=True) or []
     
     @staticmethod
-    def get_messages(conversation_id: int) -> List[Dict]:
-        """Get messages in a conversation"""
+    def get_conversations_page(user_id: int, limit: int = DEFAULT_PAGE_SIZE,
+                               cursor: Optional[str] = None) -> Dict:
+        """Get one page of conversations for the session list, most recent first
+        
+        Each row carries a short preview of the opening message, read through
+        the (conversation_id, seq) key, instead of the agent state blobs.
+        
+        Returns:
+            {'items': conversations, 'next_cursor': str or None}
+        """
         try:
             query = """
-            SELECT messages FROM coach_conversations 
-            WHERE conversation_id = %s
+            SELECT cc.conversation_id, cc.title, cc.message_count, cc.updated_at,
+                   (SELECT LEFT(m.content, 100) FROM coach_messages m
+                    WHERE m.conversation_id = cc.conversation_id
+                    ORDER BY m.seq LIMIT 1) AS preview
+            FROM coach_conversations cc
+            WHERE cc.user_id = %s
             """
-            result = execute_query(query, (conversation_id,), fetch_one=True)
-            
-            if result and result.get('messages'):
-                messages_json = result['messages']
-                if isinstance(messages_json, str):
-                    messages = json.loads(messages_json)
-                else:
-                    messages = messages_json
-                return messages if isinstance(messages, list) else []
-            return []
+            return fetch_page(query, (user_id,), 'cc.updated_at', 'cc.conversation_id', limit, cursor)
+        except Exception as e:
+            print(f"[ERROR] Error fetching conversations page: {e}")
+            return {'items': [], 'next_cursor': None}
+    
+    @staticmethod
+    def get_messages(conversation_id: int, limit: Optional[int] = None,
+                     before_seq: Optional[int] = None) -> List[Dict]:
+        """Get messages in a conversation
+        
+        Args:
+            conversation_id: Conversation ID
+            limit: Return only the most recent N messages (all if None)
+            before_seq: Only messages before this sequence number (for paging back)
+            
+        Returns:
+            Messages in chronological order (role, content, seq, created_at)
+        """
+        try:
+            if limit is None:
+                query = """
+                SELECT seq, role, content, created_at FROM coach_messages
+                WHERE conversation_id = %s AND seq < %s
+                ORDER BY seq
+                """
+                params = (conversation_id, before_seq or 2 ** 31 - 1)
+                return execute_query(query, params, fetch_all=True, prepared=True) or []
+            
+            # Newest first through the (conversation_id, seq) index, then reversed
+            query = """
+            SELECT seq, role, content, created_at FROM coach_messages
+            WHERE conversation_id = %s AND seq < %s
+            ORDER BY seq DESC
+            LIMIT %s
+            """
+            params = (conversation_id, before_seq or 2 ** 31 - 1, limit)
+            messages = execute_query(query, params, fetch_all=True, prepared=True) or []
+            messages.reverse()
+            return messages
         except Exception as e:
             print(f"[ERROR] Error getting messages: {e}")
             return []
     
+    @staticmethod
+    def get_first_message(conversation_id: int) -> Optional[Dict]:
+        """Get the opening message of a conversation (for previews)"""
+        query = """
+        SELECT seq, role, content, created_at FROM coach_messages
+        WHERE conversation_id = %s
+        ORDER BY seq
+        LIMIT 1
+        """
+        return execute_query(query, (conversation_id,), fetch_one=True, prepared=True)
+    
     @staticmethod
     def add_message(conversation_id: int, role: str, content: str) -> Optional[int]:
-        """Add a message to conversation"""
+        """Append a message to a conversation
+        
+        Takes the next sequence number from coach_conversations.message_count
+        (the row lock serializes concurrent appends) and inserts one row, so
+        the cost does not grow with the length of the conversation.
+        
+        Returns:
+            Sequence number of the new message, or None if failed
+        """
         try:
-            # Get current messages
-            current_messages = CoachService.get_messages(conversation_id)
-            
-            # Add new message
-            new_message = {
-                "role": role,
-                "content": content,
-                "timestamp": str(json.dumps({"created_at": "now"}))  # Simple timestamp
-            }
-            current_messages.append(new_message)
-            
-            # Update conversation with new messages
-            query = """
-            UPDATE coach_conversations 
-            SET messages = %s, updated_at = CURRENT_TIMESTAMP
-            WHERE conversation_id = %s
-            """
-            execute_query(
-                query,
-                (json.dumps(current_messages), conversation_id),
-                commit=True
-            )
+            with DatabaseManager.transaction() as uow:
+                # LAST_INSERT_ID(expr) hands the new count back as lastrowid
+                updated = uow.execute("""
+                    UPDATE coach_conversations 
+                    SET message_count = LAST_INSERT_ID(message_count + 1),
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE conversation_id = %s
+                """, (conversation_id,))
+                if not updated:
+                    print(f"[ERROR] Conversation {conversation_id} not found")
+                    return None
+                seq = uow.lastrowid
+                
+                uow.execute(
+                    "INSERT INTO coach_messages (conversation_id, seq, role, content) VALUES (%s, %s, %s, %s)",
+                    (conversation_id, seq, role, content)
+                )
             
-            return len(current_messages)  # Return message count as ID
+            return seq
         except Exception as e:
             print(f"[ERROR] Error adding message: {e}")
             import traceback
@@ -131,7 +190,7 @@ class CoachService:
             
             # Generate personalized greeting
             llm_service = LLMService.get_instance()
-            provider = llm_service.get_provider(user_id)
+            provider = llm_service.get_provider(user_id, service='coach')
             
             if not provider:
                 # Fallback greeting if no LLM configured
@@ -219,7 +278,8 @@ Greeting:"""
             return "No profile information available yet."
     
     @staticmethod
-    def chat(user_id: int, conversation_id: int, user_message: str) -> Dict[str, Any]:
+    def chat(user_id: int, conversation_id: int, user_message: str,
+             on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
         Send a message and get AI response
         
@@ -227,20 +287,23 @@ Greeting:"""
             user_id: User ID
             conversation_id: Conversation ID
             user_message: User's message
+            on_token: Optional callback receiving response chunks as they stream in
             
         Returns:
             Dict with 'response' or 'error'
         """
         try:
             # Add user message
-            CoachService.add_message(conversation_id, 'user', user_message)
+            user_seq = CoachService.add_message(conversation_id, 'user', user_message)
             
-            # Get conversation history
-            messages = CoachService.get_messages(conversation_id)
+            # Get the recent history (everything before the message just added)
+            history = CoachService.get_messages(
+                conversation_id, limit=Settings.COACH_HISTORY_MESSAGES, before_seq=user_seq
+            )
             
             # Get LLM provider
             llm_service = LLMService.get_instance()
-            provider = llm_service.get_provider(user_id)
+            provider = llm_service.get_provider(user_id, service='coach', use_cache=False)
             
             if not provider:
                 return {"error": "No LLM provider configured. Please configure an LLM in Settings."}
@@ -252,16 +315,25 @@ Greeting:"""
             user_context = CoachService.get_user_context(user_id)
             system_prompt = Prompts.CAREER_COACH_SYSTEM.format(user_context=user_context)
             
-            # Add conversation history (last 8 messages to avoid token limits)
-            recent_messages = messages[-8:] if len(messages) > 8 else messages
+            # Fit system context, the current message and as much recent
+            # history as the model's token budget allows
+            packer = PromptPacker.for_provider(provider)
+            budget = packer.budget_tokens
             
-            # Build prompt - keep it concise
+            if system_prompt and packer.count(system_prompt) > budget // 3:
+                system_prompt = packer.counter.truncate(system_prompt, budget // 3) + "..."
+            
+            user_msg_truncated = user_message
+            if packer.count(user_message) > budget // 4:
+                user_msg_truncated = packer.counter.truncate(user_message, budget // 4) + "..."
+            
+            history_budget = budget - packer.count(system_prompt or "") - packer.count(user_msg_truncated) - 16
+            recent_messages = packer.fit_history(history, history_budget, max_message_tokens=budget // 6)
+            
+            # Build prompt
             prompt_parts = []
             
-            # Add system context (truncate if too long)
             if system_prompt:
-                if len(system_prompt) > 1000:
-                    system_prompt = system_prompt[:1000] + "..."
                 prompt_parts.append(system_prompt)
             
             # Add conversation history
@@ -270,9 +342,6 @@ Greeting:"""
                 for msg in recent_messages:
                     role = msg.get('role', 'user')
                     content = msg.get('content', '')
-                    # Truncate long messages
-                    if len(content) > 500:
-                        content = content[:500] + "..."
                     
                     if role == 'user':
                         prompt_parts.append(f"User: {content}\n")
@@ -280,23 +349,14 @@ Greeting:"""
                         prompt_parts.append(f"Assistant: {content}\n")
             
             # Add current user message
-            user_msg_truncated = user_message[:500] if len(user_message) > 500 else user_message
             prompt_parts.append(f"\nUser: {user_msg_truncated}\n")
             prompt_parts.append("Assistant: ")
             
             full_prompt = "".join(prompt_parts)
             
-            # Limit total prompt length to avoid Ollama errors
-            if len(full_prompt) > 3000:
-                # Keep system prompt and last few messages
-                prompt_parts = [system_prompt[:500]] if system_prompt else []
-                prompt_parts.append(f"\n\nUser: {user_msg_truncated}\n")
-                prompt_parts.append("Assistant: ")
-                full_prompt = "".join(prompt_parts)
-            
             # Use generate method (works for all providers)
             print(f"[DEBUG] Sending prompt to LLM (length: {len(full_prompt)})")
-            response = provider.generate(full_prompt, system_prompt=None)  # System prompt already in full_prompt
+            response = LLMService.generate_text(provider, full_prompt, on_token=on_token)  # System prompt already in full_prompt
             
             # Check if response contains an error
             if response and response.startswith("Error:"):
@@ -365,7 +425,7 @@ Greeting:"""
             
             # Get target role from user's recent job descriptions
             from services.jd_service import JobDescriptionService
-            recent_jds = JobDescriptionService.get_user_job_descriptions(user_id)[:1]
+            recent_jds = JobDescriptionService.get_user_jds(user_id, limit=1)
             target_role = recent_jds[0].get('job_title', 'your target role') if recent_jds else 'your target role'
             industry = recent_jds[0].get('company_name', 'your industry') if recent_jds else 'your industry'
             
@@ -378,7 +438,7 @@ Greeting:"""
             
             # Get LLM provider
             llm_service = LLMService.get_instance()
-            provider = llm_service.get_provider(user_id)
+            provider = llm_service.get_provider(user_id, service='coach')
             
             if not provider:
                 return {"error": "No LLM provider configured. Please configure an LLM in Settings."}
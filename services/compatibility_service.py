@@ -1,12 +1,16 @@
 """Compatibility analysis service - analyzes resume vs JD fit"""
 
+import asyncio
 from typing import Optional, Dict, Any
 from database import DatabaseManager
+from database.pagination import DEFAULT_PAGE_SIZE, fetch_page
 from services.llm_service import LLMService
 from services.resume_service import ResumeService
 from services.jd_service import JobDescriptionService
 from config.prompts import Prompts
 from core.response_normalizer import CompatibilityAnalysisNormalizer
+from core.json_schemas import COMPATIBILITY_ANALYSIS_SCHEMA
+from core.prompt_packer import PromptPacker
 import json
 
 class CompatibilityService:
@@ -55,8 +59,8 @@ class CompatibilityService:
         return list(dict.fromkeys([s.strip() for s in extracted if s and s.strip()]))
     
     @staticmethod
-    def analyze_compatibility(user_id: int, resume_id: int, jd_id: int) -> Optional[Dict[str, Any]]:
-        """Analyze compatibility between resume and JD
+    def _build_analysis_request(user_id: int, resume_id: int, jd_id: int) -> Dict[str, Any]:
+        """Load resume and JD and build the LLM request for an analysis
         
         Args:
             user_id: User ID
@@ -64,83 +68,204 @@ class CompatibilityService:
             jd_id: Job description ID
             
         Returns:
-            Analysis results dict
+            Dict with provider, prompt, system_prompt and job_description_id,
+            or an error dict
         """
-        try:
-            # Get resume
-            with DatabaseManager.get_cursor() as cursor:
-                cursor.execute("""
-                    SELECT resume_text, extracted_text FROM resumes
-                    WHERE resume_id = %s AND user_id = %s
-                """, (resume_id, user_id))
-                resume_result = cursor.fetchone()
-                
-                if not resume_result:
-                    return {"error": "Resume not found"}
-                
-                # Get JD (need both id and jd_id for the INSERT)
-                cursor.execute("""
-                    SELECT id, jd_id, jd_text FROM job_descriptions
-                    WHERE jd_id = %s
-                """, (jd_id,))
-                jd_result = cursor.fetchone()
-                
-                if not jd_result:
-                    return {"error": "Job description not found"}
-            
-            # Use resume_text if available, fallback to extracted_text
-            resume_text = resume_result.get('resume_text') or resume_result.get('extracted_text', '')
-            if not resume_text:
-                return {"error": "Resume text not found"}
-            jd_text = jd_result['jd_text']
-            job_description_id = jd_result['id']  # Get the actual id for job_description_id column
+        # Get resume
+        with DatabaseManager.get_cursor() as cursor:
+            cursor.execute("""
+                SELECT resume_text, extracted_text FROM resumes
+                WHERE id = %s AND user_id = %s
+            """, (resume_id, user_id))
+            resume_result = cursor.fetchone()
             
-            print(f"[INFO] Resume text length: {len(resume_text)}, JD text length: {len(jd_text)}")
+            if not resume_result:
+                return {"error": "Resume not found"}
             
-            # Intelligently truncate resume and JD text to fit within prompt limits
-            # Reserve ~500 chars for prompt template and format instructions
-            # System prompt is ~500 chars, so we have ~1000 chars for data
-            max_data_length = 1000
-            max_resume_length = max_data_length // 2  # Split between resume and JD
-            max_jd_length = max_data_length // 2
+            # Get JD (need both id and jd_id for the INSERT)
+            cursor.execute("""
+                SELECT id, jd_id, jd_text FROM job_descriptions
+                WHERE jd_id = %s
+            """, (jd_id,))
+            jd_result = cursor.fetchone()
             
-            def truncate_text(text: str, max_length: int) -> str:
-                """Truncate text intelligently, preserving important parts"""
-                if len(text) <= max_length:
-                    return text
-                # Keep first 60% and last 40% to preserve context
-                first_part = int(max_length * 0.6)
-                last_part = max_length - first_part - 50  # Reserve 50 chars for separator
-                return text[:first_part] + "\n\n[... content truncated for length ...]\n\n" + text[-last_part:]
+            if not jd_result:
+                return {"error": "Job description not found"}
+        
+        # Use resume_text if available, fallback to extracted_text
+        resume_text = resume_result.get('resume_text') or resume_result.get('extracted_text', '')
+        if not resume_text:
+            return {"error": "Resume text not found"}
+        jd_text = jd_result['jd_text']
+        job_description_id = jd_result['id']  # Get the actual id for job_description_id column
+        
+        print(f"[INFO] Resume text length: {len(resume_text)}, JD text length: {len(jd_text)}")
+        
+        # Call LLM for analysis
+        llm_service = LLMService.get_instance()
+        provider = llm_service.get_provider(user_id, service='compatibility')
+        
+        if not provider:
+            print("[ERROR] No LLM provider available")
+            return {"error": "No LLM provider configured. Please configure an LLM in Settings."}
+        
+        print(f"[INFO] Using LLM provider: {type(provider).__name__}")
+        
+        # Get system prompt (role definition and instructions)
+        system_prompt = Prompts.COMPATIBILITY_ANALYSIS_SYSTEM
+        
+        # Fit resume and JD into the model's token budget, keeping the
+        # sections of each that are most relevant to the other
+        packer = PromptPacker.for_provider(provider)
+        fields = packer.fit(
+            Prompts.COMPATIBILITY_ANALYSIS,
+            {'resume_text': resume_text, 'job_description': jd_text},
+            system_prompt=system_prompt
+        )
+        prompt = Prompts.COMPATIBILITY_ANALYSIS.format(**fields)
+        
+        return {
+            "provider": provider,
+            "prompt": prompt,
+            "system_prompt": system_prompt,
+            "job_description_id": job_description_id
+        }
+    
+    @staticmethod
+    def _save_analysis(user_id: int, resume_id: int, jd_id: int, job_description_id: int,
+                       raw_analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize an LLM analysis and store it
+        
+        Args:
+            user_id: User ID
+            resume_id: Resume ID
+            jd_id: Job description ID
+            job_description_id: Primary key of the job description row
+            raw_analysis: Parsed LLM response
             
-            truncated_resume = truncate_text(resume_text, max_resume_length)
-            truncated_jd = truncate_text(jd_text, max_jd_length)
+        Returns:
+            Normalized analysis with analysis_id, or an error dict
+        """
+        if "error" in raw_analysis:
+            error_msg = raw_analysis.get('error', 'Unknown error')
+            print(f"[ERROR] Analysis returned error: {error_msg}")
+            return {"error": error_msg, "compatibility_score": 0}
+        
+        if not raw_analysis:
+            return {"error": "Analysis returned empty result", "compatibility_score": 0}
+        
+        # Normalize the response to canonical format (works with any LLM provider)
+        analysis = CompatibilityAnalysisNormalizer.normalize(raw_analysis)
+        print(f"[INFO] Normalized analysis (canonical format): {analysis}")
+        
+        # All data is now in canonical format - extract directly
+        compatibility_score = analysis.get('compatibility_score', 0.0)
+        matched_skills = analysis.get('matched_skills', [])
+        missing_skills = analysis.get('missing_skills', [])
+        strengths = analysis.get('strengths', [])
+        suggestions = analysis.get('suggestions', [])
+        missing_qualifications = analysis.get('missing_qualifications', [])
+        
+        # Save to database
+        # All data is already in canonical format from normalizer
+        with DatabaseManager.get_cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO compatibility_analyses
+                (user_id, resume_id, job_description_id, jd_id, compatibility_score, matched_skills,
+                 missing_skills, missing_qualifications, strengths, improvement_suggestions)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, (user_id, resume_id, job_description_id, jd_id,
+                  compatibility_score,
+                  json.dumps(matched_skills),
+                  json.dumps(missing_skills),
+                  json.dumps(missing_qualifications),
+                  json.dumps(strengths),
+                  json.dumps(suggestions)))
             
-            if len(resume_text) > max_resume_length or len(jd_text) > max_jd_length:
-                print(f"[INFO] Text truncated: resume {len(resume_text)}->{len(truncated_resume)}, JD {len(jd_text)}->{len(truncated_jd)}")
+            analysis_id = cursor.lastrowid
             
-            # Call LLM for analysis
-            llm_service = LLMService.get_instance()
-            provider = llm_service.get_provider(user_id)
+            # Analysis is already normalized - all fields are in canonical format
+            # Add analysis_id for tracking
+            analysis['analysis_id'] = analysis_id
+        
+        print(f"[INFO] Analysis saved successfully (ID: {analysis_id})")
+        print(f"[DEBUG] Final normalized analysis keys: {list(analysis.keys())}")
+        print(f"[DEBUG] Compatibility score: {compatibility_score}")
+        print(f"[DEBUG] Matched skills count: {len(matched_skills)}")
+        print(f"[DEBUG] Missing skills count: {len(missing_skills)}")
+        print(f"[DEBUG] Strengths count: {len(strengths)}")
+        print(f"[DEBUG] Suggestions count: {len(suggestions)}")
+        
+        return analysis
+    
+    @staticmethod
+    def analyze_compatibility(user_id: int, resume_id: int, jd_id: int) -> Optional[Dict[str, Any]]:
+        """Analyze compatibility between resume and JD
+        
+        Args:
+            user_id: User ID
+            resume_id: Resume ID
+            jd_id: Job description ID
             
-            if not provider:
-                print("[ERROR] No LLM provider available")
-                return {"error": "No LLM provider configured. Please configure an LLM in Settings."}
+        Returns:
+            Analysis results dict
+        """
+        try:
+            request = CompatibilityService._build_analysis_request(user_id, resume_id, jd_id)
+            if "error" in request:
+                return request
+            provider = request["provider"]
+            prompt = request["prompt"]
+            system_prompt = request["system_prompt"]
             
-            print(f"[INFO] Using LLM provider: {type(provider).__name__}")
+            print("[INFO] Calling LLM for analysis...")
+            try:
+                raw_analysis = provider.generate_json(prompt, system_prompt=system_prompt,
+                                                      schema=COMPATIBILITY_ANALYSIS_SCHEMA)
+                print(f"[INFO] LLM analysis complete (raw): {raw_analysis}")
+            except Exception as llm_error:
+                print(f"[ERROR] LLM generation failed: {llm_error}")
+                import traceback
+                traceback.print_exc()
+                return {"error": f"LLM analysis failed: {str(llm_error)}"}
             
-            # Build user prompt with truncated data
-            prompt = Prompts.COMPATIBILITY_ANALYSIS.format(
-                resume_text=truncated_resume,
-                job_description=truncated_jd
+            return CompatibilityService._save_analysis(
+                user_id, resume_id, jd_id, request["job_description_id"], raw_analysis
             )
+        
+        except Exception as e:
+            print(f"Error analyzing compatibility: {e}")
+            return {"error": str(e)}
+    
+    @staticmethod
+    async def aanalyze_compatibility(user_id: int, resume_id: int, jd_id: int) -> Optional[Dict[str, Any]]:
+        """Async variant of analyze_compatibility for use with page.run_task
+        
+        The LLM call is awaited on the event loop; database work runs in a
+        worker thread.
+        
+        Args:
+            user_id: User ID
+            resume_id: Resume ID
+            jd_id: Job description ID
             
-            # Get system prompt (role definition and instructions)
-            system_prompt = Prompts.COMPATIBILITY_ANALYSIS_SYSTEM
+        Returns:
+            Analysis results dict
+        """
+        try:
+            request = await asyncio.to_thread(
+                CompatibilityService._build_analysis_request, user_id, resume_id, jd_id
+            )
+            if "error" in request:
+                return request
+            provider = request["provider"]
+            prompt = request["prompt"]
+            system_prompt = request["system_prompt"]
             
-            print(f"[INFO] Calling LLM for analysis...")
+            print("[INFO] Calling LLM for analysis...")
             try:
-                raw_analysis = provider.generate_json(prompt, system_prompt=system_prompt)
+                raw_analysis = await provider.agenerate_json(prompt, system_prompt=system_prompt,
+                                                             schema=COMPATIBILITY_ANALYSIS_SCHEMA)
                 print(f"[INFO] LLM analysis complete (raw): {raw_analysis}")
             except Exception as llm_error:
                 print(f"[ERROR] LLM generation failed: {llm_error}")
@@ -148,63 +273,10 @@ class CompatibilityService:
                 traceback.print_exc()
                 return {"error": f"LLM analysis failed: {str(llm_error)}"}
             
-            if "error" in raw_analysis:
-                error_msg = raw_analysis.get('error', 'Unknown error')
-                print(f"[ERROR] Analysis returned error: {error_msg}")
-                return {"error": error_msg, "compatibility_score": 0}
-            
-            if not raw_analysis:
-                return {"error": "Analysis returned empty result", "compatibility_score": 0}
-            
-            # Normalize the response to canonical format (works with any LLM provider)
-            analysis = CompatibilityAnalysisNormalizer.normalize(raw_analysis)
-            print(f"[INFO] Normalized analysis (canonical format): {analysis}")
-            
-            # All data is now in canonical format - extract directly
-            compatibility_score = analysis.get('compatibility_score', 0.0)
-            matched_skills = analysis.get('matched_skills', [])
-            missing_skills = analysis.get('missing_skills', [])
-            strengths = analysis.get('strengths', [])
-            suggestions = analysis.get('suggestions', [])
-            missing_qualifications = analysis.get('missing_qualifications', [])
-            
-            # Save to database
-            # All data is already in canonical format from normalizer
-            with DatabaseManager.get_cursor() as cursor:
-                cursor.execute("""
-                    INSERT INTO compatibility_analyses
-                    (user_id, resume_id, job_description_id, jd_id, compatibility_score, matched_skills,
-                     missing_skills, missing_qualifications, strengths, improvement_suggestions)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (user_id, resume_id, job_description_id, jd_id,
-                      compatibility_score,
-                      json.dumps(matched_skills),
-                      json.dumps(missing_skills),
-                      json.dumps(missing_qualifications),
-                      json.dumps(strengths),
-                      json.dumps(suggestions)))
-                
-                analysis_id = cursor.lastrowid
-                # Sync analysis_id column with id for code compatibility
-                if analysis_id:
-                    cursor.execute(
-                        "UPDATE compatibility_analyses SET analysis_id = id WHERE id = %s",
-                        (analysis_id,)
-                    )
-                
-                # Analysis is already normalized - all fields are in canonical format
-                # Add analysis_id for tracking
-                analysis['analysis_id'] = analysis_id
-            
-            print(f"[INFO] Analysis saved successfully (ID: {analysis_id})")
-            print(f"[DEBUG] Final normalized analysis keys: {list(analysis.keys())}")
-            print(f"[DEBUG] Compatibility score: {compatibility_score}")
-            print(f"[DEBUG] Matched skills count: {len(matched_skills)}")
-            print(f"[DEBUG] Missing skills count: {len(missing_skills)}")
-            print(f"[DEBUG] Strengths count: {len(strengths)}")
-            print(f"[DEBUG] Suggestions count: {len(suggestions)}")
-            
-            return analysis
+            return await asyncio.to_thread(
+                CompatibilityService._save_analysis,
+                user_id, resume_id, jd_id, request["job_description_id"], raw_analysis
+            )
         
         except Exception as e:
             print(f"Error analyzing compatibility: {e}")
@@ -224,10 +296,10 @@ class CompatibilityService:
         try:
             with DatabaseManager.get_cursor() as cursor:
                 cursor.execute("""
-                    SELECT ca.*, r.file_name as resume_name,
+                    SELECT ca.*, ca.id as analysis_id, r.file_name as resume_name,
                            jd.company_name, jd.job_title
                     FROM compatibility_analyses ca
-                    JOIN resumes r ON ca.resume_id = r.resume_id
+                    JOIN resumes r ON ca.resume_id = r.id
                     JOIN job_descriptions jd ON ca.jd_id = jd.jd_id
                     WHERE ca.user_id = %s
                     ORDER BY ca.analyzed_at DESC
@@ -239,6 +311,35 @@ class CompatibilityService:
             print(f"Error fetching analyses: {e}")
             return []
     
+    @staticmethod
+    def get_recent_analyses_page(user_id: int, limit: int = DEFAULT_PAGE_SIZE,
+                                 cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Get one page of analyses for the history list, newest first
+        
+        Returns only the columns the list cards show; load the full analysis
+        with get_analysis_by_id().
+        
+        Args:
+            user_id: User ID
+            limit: Page size
+            cursor: next_cursor from the previous page (None for the first page)
+            
+        Returns:
+            {'items': analyses, 'next_cursor': str or None}
+        """
+        try:
+            return fetch_page("""
+                SELECT ca.id as analysis_id, ca.compatibility_score, ca.analyzed_at,
+                       r.file_name as resume_name, jd.company_name, jd.job_title
+                FROM compatibility_analyses ca
+                JOIN resumes r ON ca.resume_id = r.id
+                JOIN job_descriptions jd ON ca.jd_id = jd.jd_id
+                WHERE ca.user_id = %s
+            """, (user_id,), 'ca.analyzed_at', 'ca.id', limit, cursor, id_key='analysis_id')
+        except Exception as e:
+            print(f"Error fetching analyses page: {e}")
+            return {'items': [], 'next_cursor': None}
+    
     @staticmethod
     def get_analysis_by_id(analysis_id: int, user_id: int) -> Optional[Dict[str, Any]]:
         """Get a specific analysis by ID
@@ -253,12 +354,12 @@ class CompatibilityService:
         try:
             with DatabaseManager.get_cursor() as cursor:
                 cursor.execute("""
-                    SELECT ca.*, r.file_name as resume_name,
+                    SELECT ca.*, ca.id as analysis_id, r.file_name as resume_name,
                            jd.company_name, jd.job_title
                     FROM compatibility_analyses ca
-                    JOIN resumes r ON ca.resume_id = r.resume_id
+                    JOIN resumes r ON ca.resume_id = r.id
                     JOIN job_descriptions jd ON ca.jd_id = jd.jd_id
-                    WHERE ca.analysis_id = %s AND ca.user_id = %s
+                    WHERE ca.id = %s AND ca.user_id = %s
                 """, (analysis_id, user_id))
                 
                 result = cursor.fetchone()
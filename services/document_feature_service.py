@@ -0,0 +1,171 @@
+"""
+Per-document feature store
+
+Skills, keyword counts and years of experience extracted from a resume or
+job description depend only on its text, so they are computed once per
+distinct text and stored in document_features under the SHA-256 of the
+normalized text. Uploads and job searches compute them at ingest time;
+comparisons (job ranking, compatibility) read them back instead of
+re-extracting. A bounded in-process LRU sits in front of the table.
+"""
+import hashlib
+import json
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+from core.skill_matcher import SkillMatcher
+from core.text_extractor import TextExtractor
+from database.connection import DatabaseManager, execute_query
+
+# Bump when extraction changes (skill taxonomy, keyword rules) so stored
+# rows computed by the old extractor are recomputed on next use
+FEATURE_VERSION = 1
+
+# Keyword counts kept per document
+KEYWORD_LIMIT = 50
+
+
+class DocumentFeatureService:
+    """Compute, store and look up features of document texts"""
+    
+    MEMORY_ENTRIES = 1024
+    
+    _memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    _lock = threading.Lock()
+    
+    @staticmethod
+    def normalize_text(text: Optional[str]) -> str:
+        """Canonical form of a text for hashing (NFC, whitespace collapsed)"""
+        return unicodedata.normalize('NFC', " ".join((text or "").split()))
+    
+    @staticmethod
+    def content_hash(text: Optional[str]) -> str:
+        """SHA-256 hex digest of the normalized text"""
+        normalized = DocumentFeatureService.normalize_text(text)
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def compute(text: Optional[str]) -> Dict[str, Any]:
+        """Extract features from text (no caching)
+        
+        Returns:
+            {'content_hash', 'text_length', 'skills': [skill ids],
+             'keywords': [[word, count], ...], 'years_experience'}
+        """
+        normalized = DocumentFeatureService.normalize_text(text)
+        return {
+            'content_hash': hashlib.sha256(normalized.encode('utf-8')).hexdigest(),
+            'text_length': len(normalized),
+            'skills': SkillMatcher.get_instance().match(normalized),
+            'keywords': [list(pair) for pair in TextExtractor.keyword_counts(normalized, KEYWORD_LIMIT)],
+            'years_experience': TextExtractor.extract_years_experience(normalized)
+        }
+    
+    @staticmethod
+    def get_features(text: Optional[str]) -> Dict[str, Any]:
+        """Features of one text (memory, then document_features, then computed)"""
+        return DocumentFeatureService.get_many([text])[0]
+    
+    @staticmethod
+    def get_many(texts: List[Optional[str]]) -> List[Dict[str, Any]]:
+        """Features of several texts, with one query and one write for the batch
+        
+        Args:
+            texts: Document texts (duplicates and empty texts allowed)
+            
+        Returns:
+            Feature dicts in the order of texts (see compute())
+        """
+        hashes = [DocumentFeatureService.content_hash(text) for text in texts]
+        found: Dict[str, Dict[str, Any]] = {}
+        
+        with DocumentFeatureService._lock:
+            for content_hash in hashes:
+                features = DocumentFeatureService._memory.get(content_hash)
+                if features is not None:
+                    DocumentFeatureService._memory.move_to_end(content_hash)
+                    found[content_hash] = features
+        
+        missing = [content_hash for content_hash in dict.fromkeys(hashes) if content_hash not in found]
+        if missing:
+            found.update(DocumentFeatureService._load(missing))
+        
+        computed = {}
+        for text, content_hash in zip(texts, hashes):
+            if content_hash not in found and content_hash not in computed:
+                computed[content_hash] = DocumentFeatureService.compute(text)
+        if computed:
+            DocumentFeatureService._store(list(computed.values()))
+            found.update(computed)
+        
+        with DocumentFeatureService._lock:
+            for content_hash in missing:
+                DocumentFeatureService._remember(content_hash, found[content_hash])
+        
+        return [dict(found[content_hash]) for content_hash in hashes]
+    
+    @staticmethod
+    def skill_names(features: Dict[str, Any]) -> List[str]:
+        """Display names of a document's skills"""
+        return SkillMatcher.get_instance().names(features.get('skills', []))
+    
+    @staticmethod
+    def _remember(content_hash: str, features: Dict[str, Any]):
+        DocumentFeatureService._memory[content_hash] = features
+        DocumentFeatureService._memory.move_to_end(content_hash)
+        while len(DocumentFeatureService._memory) > DocumentFeatureService.MEMORY_ENTRIES:
+            DocumentFeatureService._memory.popitem(last=False)
+    
+    @staticmethod
+    def _load(hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Stored features for hashes computed by the current extractor"""
+        try:
+            placeholders = ", ".join(["%s"] * len(hashes))
+            rows = execute_query(f"""
+                SELECT content_hash, text_length, skills, keywords, years_experience
+                FROM document_features
+                WHERE content_hash IN ({placeholders}) AND feature_version = %s
+            """, (*hashes, FEATURE_VERSION), fetch_all=True) or []
+        except Exception as e:
+            print(f"[ERROR] Error loading document features: {e}")
+            return {}
+        
+        loaded = {}
+        for row in rows:
+            loaded[row['content_hash']] = {
+                'content_hash': row['content_hash'],
+                'text_length': row['text_length'],
+                'skills': DocumentFeatureService._json(row['skills']),
+                'keywords': DocumentFeatureService._json(row['keywords']),
+                'years_experience': row['years_experience']
+            }
+        return loaded
+    
+    @staticmethod
+    def _json(value) -> Any:
+        if isinstance(value, (bytes, bytearray)):
+            value = value.decode('utf-8')
+        return json.loads(value) if isinstance(value, str) else value
+    
+    @staticmethod
+    def _store(features_list: List[Dict[str, Any]]):
+        """Upsert computed features; a failed write only costs a recompute later"""
+        try:
+            with DatabaseManager.transaction() as uow:
+                uow.execute_many("""
+                    INSERT INTO document_features
+                    (content_hash, feature_version, text_length, skills, keywords, years_experience)
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                    ON DUPLICATE KEY UPDATE
+                        feature_version = VALUES(feature_version), text_length = VALUES(text_length),
+                        skills = VALUES(skills), keywords = VALUES(keywords),
+                        years_experience = VALUES(years_experience)
+                """, [
+                    (features['content_hash'], FEATURE_VERSION, features['text_length'],
+                     json.dumps(features['skills']), json.dumps(features['keywords']),
+                     features['years_experience'])
+                    for features in features_list
+                ])
+        except Exception as e:
+            print(f"[ERROR] Error storing document features: {e}")
@@ -1,12 +1,13 @@
 ﻿"""
 Document generation service - AI-powered document generation
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from database.connection import execute_query
 from services.llm_service import LLMService
 from services.resume_service import ResumeService
 from services.jd_service import JobDescriptionService
 from config.prompts import Prompts
+from core.prompt_packer import PromptPacker
 import json
 
 class DocumentService:
@@ -15,7 +16,9 @@ class DocumentService:
     @staticmethod
     def generate_resume(user_id: int, jd_id: int,
                        template: str = 'professional',
-                       resume_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+                       resume_id: Optional[int] = None,
+                       use_cache: bool = True,
+                       on_token: Optional[Callable[[str], None]] = None) -> Optional[Dict[str, Any]]:
         """Generate optimized resume
         
         Args:
@@ -23,6 +26,8 @@ class DocumentService:
             jd_id: Job description ID
             template: Resume template style
             resume_id: Optional specific resume ID (uses active resume if not provided)
+            use_cache: Set False to force a fresh generation instead of a cached one
+            on_token: Optional callback receiving text chunks as they are generated
             
         Returns:
             Dict with document_id and content, or None if failed
@@ -44,7 +49,7 @@ class DocumentService:
             
             # Get LLM provider
             llm_service = LLMService.get_instance()
-            provider = llm_service.get_provider(user_id)
+            provider = llm_service.get_provider(user_id, service='documents', use_cache=use_cache)
             
             if not provider:
                 return {"error": "No LLM provider configured. Please configure an LLM in Settings."}
@@ -52,21 +57,23 @@ class DocumentService:
             # Prepare user info from resume
             user_info = f"""
 Resume Text:
-{resume.get('resume_text', '')[:3000]}
+{resume.get('resume_text', '')}
 
 Skills: {json.dumps(resume.get('parsed_data', {}).get('skills', [])) if isinstance(resume.get('parsed_data'), dict) else 'N/A'}
 """
             
-            # Format prompt
-            prompt = Prompts.RESUME_GENERATION.format(
-                user_info=user_info,
-                job_description=jd.get('jd_text', '')[:2000]
+            # Format prompt, packing resume and JD into the token budget
+            packer = PromptPacker.for_provider(provider)
+            fields = packer.fit(
+                Prompts.RESUME_GENERATION,
+                {'user_info': user_info, 'job_description': jd.get('jd_text', '') or ''}
             )
+            prompt = Prompts.RESUME_GENERATION.format(**fields)
             
             print(f"[INFO] Generating resume with template: {template}")
             
             # Generate with LLM
-            resume_content = provider.generate(prompt)
+            resume_content = LLMService.generate_text(provider, prompt, on_token=on_token)
             
             if not resume_content or "error" in resume_content.lower():
                 return {"error": "Failed to generate resume content"}
@@ -102,7 +109,9 @@ Skills: {json.dumps(resume.get('parsed_data', {}).get('skills', [])) if isinstan
     @staticmethod
     def generate_cover_letter(user_id: int, jd_id: int,
                              length: str = 'medium',
-                             resume_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+                             resume_id: Optional[int] = None,
+                             use_cache: bool = True,
+                             on_token: Optional[Callable[[str], None]] = None) -> Optional[Dict[str, Any]]:
         """Generate cover letter
         
         Args:
@@ -110,6 +119,8 @@ Skills: {json.dumps(resume.get('parsed_data', {}).get('skills', [])) if isinstan
             jd_id: Job description ID
             length: Letter length (short, medium, long)
             resume_id: Optional specific resume ID (uses active resume if not provided)
+            use_cache: Set False to force a fresh generation instead of a cached one
+            on_token: Optional callback receiving text chunks as they are generated
             
         Returns:
             Dict with document_id and content, or None if failed
@@ -131,7 +142,7 @@ Skills: {json.dumps(resume.get('parsed_data', {}).get('skills', [])) if isinstan
             
             # Get LLM provider
             llm_service = LLMService.get_instance()
-            provider = llm_service.get_provider(user_id)
+            provider = llm_service.get_provider(user_id, service='documents', use_cache=use_cache)
             
             if not provider:
                 return {"error": "No LLM provider configured. Please configure an LLM in Settings."}
@@ -148,9 +159,8 @@ Skills: {json.dumps(resume.get('parsed_data', {}).get('skills', [])) if isinstan
             # Build detailed resume summary
             resume_summary_parts = []
             
-            # Add full resume text (truncated if needed)
-            resume_text_portion = resume_text[:2000] if len(resume_text) > 2000 else resume_text
-            resume_summary_parts.append(f"Full Resume Text:\n{resume_text_portion}")
+            # Add full resume text (packed to the token budget below)
+            resume_summary_parts.append(f"Full Resume Text:\n{resume_text}")
             
             # Add structured information if available
             if isinstance(parsed_data, dict):
@@ -167,19 +177,21 @@ Skills: {json.dumps(resume.get('parsed_data', {}).get('skills', [])) if isinstan
             
             resume_summary = "\n".join(resume_summary_parts)
             
-            # Format prompt
-            prompt = Prompts.COVER_LETTER_GENERATION.format(
-                resume_summary=resume_summary,
+            # Format prompt, packing resume summary and JD into the token budget
+            packer = PromptPacker.for_provider(provider)
+            fields = packer.fit(
+                Prompts.COVER_LETTER_GENERATION,
+                {'resume_summary': resume_summary, 'job_description': jd.get('jd_text', '') or ''},
                 company_name=jd.get('company_name', 'the company'),
                 position=jd.get('job_title', 'the position'),
-                job_description=jd.get('jd_text', '')[:2000],
                 length=length
             )
+            prompt = Prompts.COVER_LETTER_GENERATION.format(**fields)
             
             print(f"[INFO] Generating cover letter with length: {length}")
             
             # Generate with LLM
-            cover_letter_content = provider.generate(prompt)
+            cover_letter_content = LLMService.generate_text(provider, prompt, on_token=on_token)
             
             if not cover_letter_content or "error" in cover_letter_content.lower():
                 return {"error": "Failed to generate cover letter content"}
@@ -216,7 +228,9 @@ Skills: {json.dumps(resume.get('parsed_data', {}).get('skills', [])) if isinstan
     def generate_cold_email(user_id: int, purpose: str, company: str,
                            recipient_type: str = 'recruiter',
                            jd_id: Optional[int] = None,
-                           resume_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+                           resume_id: Optional[int] = None,
+                           use_cache: bool = True,
+                           on_token: Optional[Callable[[str], None]] = None) -> Optional[Dict[str, Any]]:
         """Generate cold email
         
         Args:
@@ -226,6 +240,8 @@ Skills: {json.dumps(resume.get('parsed_data', {}).get('skills', [])) if isinstan
             recipient_type: Type of recipient (recruiter, hiring_manager, employee, etc.)
             jd_id: Optional job description ID if related to a specific job
             resume_id: Optional specific resume ID (uses active resume if not provided)
+            use_cache: Set False to force a fresh generation instead of a cached one
+            on_token: Optional callback receiving text chunks as they are generated
             
         Returns:
             Dict with document_id and content, or None if failed
@@ -242,7 +258,7 @@ Skills: {json.dumps(resume.get('parsed_data', {}).get('skills', [])) if isinstan
             
             # Get LLM provider
             llm_service = LLMService.get_instance()
-            provider = llm_service.get_provider(user_id)
+            provider = llm_service.get_provider(user_id, service='documents', use_cache=use_cache)
             
             if not provider:
                 return {"error": "No LLM provider configured. Please configure an LLM in Settings."}
@@ -259,9 +275,8 @@ Skills: {json.dumps(resume.get('parsed_data', {}).get('skills', [])) if isinstan
             # Build detailed resume summary
             resume_summary_parts = []
             
-            # Add full resume text (truncated if needed)
-            resume_text_portion = resume_text[:1500] if len(resume_text) > 1500 else resume_text
-            resume_summary_parts.append(f"Resume Text:\n{resume_text_portion}")
+            # Add full resume text (packed to the token budget below)
+            resume_summary_parts.append(f"Resume Text:\n{resume_text}")
             
             # Add structured information if available
             if isinstance(parsed_data, dict):
@@ -276,31 +291,35 @@ Skills: {json.dumps(resume.get('parsed_data', {}).get('skills', [])) if isinstan
             resume_summary = "\n".join(resume_summary_parts)
             
             # Get JD if provided
-            jd_context = ""
+            template = Prompts.COLD_EMAIL_GENERATION
+            documents = {'resume_summary': resume_summary}
+            jd_fields = {}
             if jd_id:
                 jd = JobDescriptionService.get_jd(jd_id)
                 if jd:
-                    jd_text = jd.get('jd_text', '')[:800]
-                    job_title = jd.get('job_title', '')
-                    company_name = jd.get('company_name', '')
-                    jd_context = f"\n\nRelevant Job Context:\nPosition: {job_title} at {company_name}\nJob Description:\n{jd_text}"
-            
-            # Format prompt
-            prompt = Prompts.COLD_EMAIL_GENERATION.format(
+                    template += "\n\nRelevant Job Context:\nPosition: {job_title} at {company_name}\nJob Description:\n{jd_text}"
+                    documents['jd_text'] = jd.get('jd_text', '') or ''
+                    jd_fields = {
+                        'job_title': jd.get('job_title', ''),
+                        'company_name': jd.get('company_name', '')
+                    }
+            
+            # Format prompt, packing resume summary (and JD) into the token budget
+            packer = PromptPacker.for_provider(provider)
+            fields = packer.fit(
+                template,
+                documents,
                 purpose=purpose,
                 recipient_type=recipient_type,
                 company=company,
-                resume_summary=resume_summary
+                **jd_fields
             )
-            
-            # Add JD context if available
-            if jd_context:
-                prompt += jd_context
+            prompt = template.format(**fields)
             
             print(f"[INFO] Generating cold email for {purpose} to {recipient_type} at {company}")
             
             # Generate with LLM
-            email_content = provider.generate(prompt)
+            email_content = LLMService.generate_text(provider, prompt, on_token=on_token)
             
             if not email_content or "error" in email_content.lower():
                 return {"error": "Failed to generate email content"}
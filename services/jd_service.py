@@ -2,10 +2,10 @@
 
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from database import DatabaseManager
+from database import DatabaseManager, QueryCache
 from database.connection import execute_query
 from core.document_parser import DocumentParser
-from core.text_extractor import extract_skills
+from services.document_feature_service import DocumentFeatureService
 from config.settings import Settings
 import json
 from datetime import datetime
@@ -45,9 +45,10 @@ class JobDescriptionService:
             if not jd_text:
                 return None
             
-            # Extract requirements
+            # Extract requirements (features are stored for later comparisons)
+            features = DocumentFeatureService.get_features(jd_text)
             parsed_requirements = {
-                "required_skills": extract_skills(jd_text),
+                "required_skills": DocumentFeatureService.skill_names(features),
                 "text_length": len(jd_text)
             }
             
@@ -62,19 +63,14 @@ class JobDescriptionService:
                  jd_text, description_text, parsed_requirements)
                 VALUES (%s, 'upload', %s, %s, %s, %s, %s, %s, %s)
             """
-            jd_id = execute_query(
-                query,
-                (user_id, str(file_path), company_name, job_title, job_title or "Job Position",
-                 jd_text, jd_text, json.dumps(parsed_requirements)),
-                commit=True
-            )
-            # Sync jd_id column with id for code compatibility
-            if jd_id:
-                execute_query(
-                    "UPDATE job_descriptions SET jd_id = id WHERE id = %s",
-                    (jd_id,),
-                    commit=True
+            with DatabaseManager.transaction() as uow:
+                jd_id = uow.insert(
+                    query,
+                    (user_id, str(file_path), company_name, job_title, job_title or "Job Position",
+                     jd_text, jd_text, json.dumps(parsed_requirements)),
+                    legacy_id_table='job_descriptions'
                 )
+            QueryCache.get_instance().invalidate('user_jds', user_id)
             print(f"[INFO] JD saved from file with ID: {jd_id}")
             return jd_id
         
@@ -102,9 +98,10 @@ class JobDescriptionService:
             JD ID if successful
         """
         try:
-            # Extract requirements
+            # Extract requirements (features are stored for later comparisons)
+            features = DocumentFeatureService.get_features(jd_text)
             parsed_requirements = {
-                "required_skills": extract_skills(jd_text),
+                "required_skills": DocumentFeatureService.skill_names(features),
                 "text_length": len(jd_text)
             }
             
@@ -113,26 +110,20 @@ class JobDescriptionService:
                 # Try to extract from text or use default
                 job_title = "Job Position"  # Default title
             
-            # Use execute_query instead of get_cursor for consistency
             query = """
                 INSERT INTO job_descriptions
                 (user_id, source_type, company_name, job_title, title, job_url,
                  jd_text, description_text, parsed_requirements)
                 VALUES (%s, 'paste', %s, %s, %s, %s, %s, %s, %s)
             """
-            jd_id = execute_query(
-                query,
-                (user_id, company_name, job_title, job_title or "Job Position", job_url,
-                 jd_text, jd_text, json.dumps(parsed_requirements)),
-                commit=True
-            )
-            # Sync jd_id column with id for code compatibility
-            if jd_id:
-                execute_query(
-                    "UPDATE job_descriptions SET jd_id = id WHERE id = %s",
-                    (jd_id,),
-                    commit=True
+            with DatabaseManager.transaction() as uow:
+                jd_id = uow.insert(
+                    query,
+                    (user_id, company_name, job_title, job_title or "Job Position", job_url,
+                     jd_text, jd_text, json.dumps(parsed_requirements)),
+                    legacy_id_table='job_descriptions'
                 )
+            QueryCache.get_instance().invalidate('user_jds', user_id)
             print(f"[INFO] JD saved from text with ID: {jd_id}")
             return jd_id
         
@@ -154,8 +145,6 @@ class JobDescriptionService:
             JD ID if successful
         """
         try:
-            from database.connection import get_connection
-            
             print(f"[DEBUG] ===== Saving JD from JSearch =====")
             print(f"[DEBUG] User ID: {user_id}")
             print(f"[DEBUG] Job data keys: {list(job_data.keys())}")
@@ -181,9 +170,10 @@ class JobDescriptionService:
             if not jd_text or len(jd_text.strip()) == 0:
                 jd_text = "Job description not available"
             
-            # Extract requirements
+            # Extract requirements (features are stored for later comparisons)
+            features = DocumentFeatureService.get_features(jd_text)
             parsed_requirements = {
-                "required_skills": job_data.get('job_required_skills', []),
+                "required_skills": job_data.get('job_required_skills') or DocumentFeatureService.skill_names(features),
                 "required_experience": job_data.get('job_required_experience', {}),
                 "text_length": len(jd_text)
             }
@@ -216,37 +206,13 @@ class JobDescriptionService:
             
             print(f"[DEBUG] Executing query with {len(params)} parameters")
             
-            # Execute query and get lastrowid
-            conn = None
-            cursor = None
-            try:
-                from database.connection import get_connection
-                conn = get_connection()
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                conn.commit()
-                jd_id = cursor.lastrowid
-                # Sync jd_id column with id for code compatibility
-                if jd_id:
-                    cursor.execute("UPDATE job_descriptions SET jd_id = id WHERE id = %s", (jd_id,))
-                    conn.commit()
-                cursor.close()
-                conn.close()
-                
-                if jd_id and jd_id > 0:
-                    print(f"[DEBUG] Successfully saved JD with ID: {jd_id}")
-                    return jd_id
-                else:
-                    print(f"[DEBUG] lastrowid is {jd_id}, which is invalid")
-                    return None
-            except Exception as db_error:
-                if conn:
-                    conn.rollback()
-                if cursor:
-                    cursor.close()
-                if conn:
-                    conn.close()
-                raise db_error
+            # Insert and legacy id sync commit together (rolled back on error)
+            with DatabaseManager.transaction() as uow:
+                jd_id = uow.insert(query, params, legacy_id_table='job_descriptions')
+            QueryCache.get_instance().invalidate('user_jds', user_id)
+            
+            print(f"[DEBUG] Successfully saved JD with ID: {jd_id}")
+            return jd_id
         
         except Exception as e:
             print(f"[ERROR] Error saving JD from JSearch: {e}")
@@ -268,7 +234,7 @@ class JobDescriptionService:
     
     @staticmethod
     def get_jd(jd_id: int) -> Optional[Dict[str, Any]]:
-        """Get job description by ID
+        """Get job description by ID (cached until the JD is deleted)
         
         Args:
             jd_id: JD ID
@@ -276,7 +242,7 @@ class JobDescriptionService:
         Returns:
             JD dict or None
         """
-        try:
+        def load():
             with DatabaseManager.get_cursor() as cursor:
                 cursor.execute("""
                     SELECT * FROM job_descriptions
@@ -284,6 +250,9 @@ class JobDescriptionService:
                 """, (jd_id,))
                 
                 return cursor.fetchone()
+        
+        try:
+            return QueryCache.get_instance().get_or_load('jds', jd_id, 'row', load)
         except Exception as e:
             print(f"Error fetching JD: {e}")
             return None
@@ -292,6 +261,10 @@ class JobDescriptionService:
     def get_user_jds(user_id: int, limit: int = 50) -> List[Dict[str, Any]]:
         """Get all JDs for user
         
+        Summary variant for lists and dropdowns: no JD text. Load it with
+        get_jd() or get_jd_text() when needed. Cached until the user saves
+        or deletes a JD.
+        
         Args:
             user_id: User ID
             limit: Maximum number to return
@@ -306,7 +279,29 @@ class JobDescriptionService:
         ORDER BY created_at DESC
         LIMIT %s
         """
-        return execute_query(query, (user_id, limit), fetch_all=True) or []
+        return QueryCache.get_instance().get_or_load(
+            'user_jds', user_id, ('summaries', limit),
+            lambda: execute_query(query, (user_id, limit), fetch_all=True) or []
+        )
+    
+    @staticmethod
+    def get_jd_text(jd_id: int) -> Optional[str]:
+        """Get a JD's text on demand
+        
+        Args:
+            jd_id: JD ID
+            
+        Returns:
+            JD text (jd_text, else description_text) or None if not found
+        """
+        query = "SELECT jd_text, description_text FROM job_descriptions WHERE jd_id = %s"
+        result = QueryCache.get_instance().get_or_load(
+            'jds', jd_id, 'text',
+            lambda: execute_query(query, (jd_id,), fetch_one=True)
+        )
+        if not result:
+            return None
+        return result.get('jd_text') or result.get('description_text') or ''
     
     @staticmethod
     def delete_jd(jd_id: int, user_id: int) -> bool:
@@ -325,15 +320,20 @@ class JobDescriptionService:
                     DELETE FROM job_descriptions
                     WHERE jd_id = %s AND user_id = %s
                 """, (jd_id, user_id))
-                
-                return True
+            
+            # Question set lists show the JD's title
+            cache = QueryCache.get_instance()
+            cache.invalidate('jds', jd_id)
+            cache.invalidate('user_jds', user_id)
+            cache.invalidate('user_question_sets', user_id)
+            return True
         except Exception as e:
             print(f"Error deleting JD: {e}")
             return False
     
     @staticmethod
     def get_user_job_descriptions(user_id: int, limit: int = 20) -> List[Dict]:
-        """Get all job descriptions for a user"""
+        """Get all job descriptions for a user with their full text (detail variant)"""
         query = """
         SELECT * FROM job_descriptions 
         WHERE user_id = %s 
@@ -4,9 +4,11 @@ Job description and compatibility analysis service
 import json
 from typing import Optional, Dict, List
 from database.connection import execute_query
-from core.text_extractor import TextExtractor
-from ai.provider_factory import ProviderFactory
+from database.query_cache import QueryCache
+from services.document_feature_service import DocumentFeatureService
+from ai.providers import ProviderRegistry
 from config.prompts import COMPATIBILITY_ANALYSIS_PROMPT
+from core.json_recovery import JSONRecovery
 
 class JobService:
     """Handle job description operations"""
@@ -29,13 +31,12 @@ class JobService:
         """
         try:
             # Extract information from description
-            skills = TextExtractor.extract_skills(description_text)
-            years_exp = TextExtractor.extract_years_experience(description_text)
+            features = DocumentFeatureService.get_features(description_text)
             
             parsed_data = {
-                'skills': skills,
-                'years_experience': years_exp,
-                'keywords': TextExtractor.extract_keywords(description_text, top_n=15)
+                'skills': DocumentFeatureService.skill_names(features),
+                'years_experience': features['years_experience'],
+                'keywords': [word for word, _ in features['keywords'][:15]]
             }
             
             query = """
@@ -54,6 +55,7 @@ class JobService:
                 commit=True
             )
             
+            QueryCache.get_instance().invalidate('user_jds', user_id)
             return job_id
         except Exception as e:
             print(f"Error creating job description: {e}")
@@ -107,10 +109,11 @@ class JobService:
             )
             
             # Get LLM provider
-            provider = ProviderFactory.create_provider(
-                provider_name=provider_settings['provider'],
-                api_key=provider_settings['api_key'],
-                model=provider_settings['model'],
+            provider = ProviderRegistry.create(
+                provider_settings['provider'],
+                provider_settings['model'],
+                api_key=provider_settings.get('api_key'),
+                endpoint_url=provider_settings.get('endpoint_url'),
                 temperature=provider_settings.get('temperature', 0.7),
                 max_tokens=provider_settings.get('max_tokens', 2000)
             )
@@ -119,13 +122,7 @@ class JobService:
             response = provider.generate(prompt)
             
             # Parse JSON response
-            # Remove markdown code blocks if present
-            if '```json' in response:
-                response = response.split('```json')[1].split('```')[0].strip()
-            elif '```' in response:
-                response = response.split('```')[1].split('```')[0].strip()
-            
-            analysis = json.loads(response)
+            analysis = JSONRecovery.loads(response)
             
             # Store in database
             query = """
@@ -3,10 +3,15 @@ JSearch API integration service for job opportunities
 """
 import os
 import json
+import asyncio
+import threading
 import requests
+from collections import OrderedDict
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
-from database.connection import execute_query
+from database.connection import DatabaseManager, execute_query
+from database.pagination import DEFAULT_PAGE_SIZE, fetch_page
+from services.document_feature_service import FEATURE_VERSION, DocumentFeatureService
 
 load_dotenv()
 
@@ -16,6 +21,12 @@ class JSearchService:
     API_URL = "https://jsearch.p.rapidapi.com/search"
     API_KEY = os.getenv('JSEARCH_API_KEY', '')
     
+    # (user_id, limit) -> (job_id/content_hash signature, EncodedJobs) of the
+    # last cached-job rankings, reused while the job set is unchanged
+    ENCODED_JOB_SETS = 8
+    _encoded_jobs: "OrderedDict[tuple, tuple]" = OrderedDict()
+    _encoded_lock = threading.Lock()
+    
     @staticmethod
     def search_jobs(query: str, location: str = "", 
                    remote_only: bool = False, num_pages: int = 1,
@@ -89,6 +100,10 @@ class JSearchService:
                     if job_data:
                         saved_jobs.append(job_data)
                 
+                # Extract and store the descriptions' features now, in one
+                # batch, so ranking and compatibility reuse them
+                DocumentFeatureService.get_many([job.get('description') for job in saved_jobs])
+                
                 # Update search history with results count
                 execute_query(
                     """UPDATE jsearch_history 
@@ -125,6 +140,22 @@ class JSearchService:
             traceback.print_exc()
             return {"error": error_msg, "jobs": []}
     
+    @staticmethod
+    async def asearch_jobs(query: str, location: str = "",
+                           remote_only: bool = False, num_pages: int = 1,
+                           user_id: Optional[int] = None) -> Dict:
+        """Async variant of search_jobs for use with page.run_task
+        
+        The API request and database writes run in a worker thread so the
+        event loop stays free.
+        
+        Returns:
+            Dict with 'jobs' list or 'error' message
+        """
+        return await asyncio.to_thread(
+            JSearchService.search_jobs, query, location, remote_only, num_pages, user_id
+        )
+    
     @staticmethod
     def _format_job(job_data: Dict) -> Dict:
         """Format job data from API to our format"""
@@ -199,9 +230,9 @@ class JSearchService:
             # Map to migration schema structure (001_initial_schema.sql)
             query = """
             INSERT INTO jsearch_jobs 
-            (user_id, external_job_id, title, company_name, location, description, 
+            (user_id, external_job_id, title, company_name, location, description, content_hash,
              salary_min, salary_max, job_url, posted_date)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """
             
             job_title = job_data.get('job_title', job_data.get('title', 'Unknown Position'))
@@ -235,6 +266,7 @@ class JSearchService:
             db_job_id = execute_query(
                 query,
                 (user_id, external_job_id, job_title, company_name, location, description,
+                 DocumentFeatureService.content_hash(description),
                  salary_min, salary_max, job_url, posted_date),
                 commit=True
             )
@@ -279,7 +311,7 @@ class JSearchService:
     def get_job_by_id(db_job_id: int) -> Optional[Dict]:
         """Get job by database job_id (migration schema)"""
         query = "SELECT * FROM jsearch_jobs WHERE job_id = %s"
-        result = execute_query(query, (db_job_id,), fetch_one=True)
+        result = execute_query(query, (db_job_id,), fetch_one=True, prepared=True)
         if result:
             # Map migration schema columns to expected format
             # Schema uses 'title', not 'job_title'
@@ -320,20 +352,20 @@ class JSearchService:
             Sorted list of jobs by compatibility score
         """
         try:
-            from core.text_extractor import TextExtractor
-            
-            # Extract skills from resume
-            resume_skills = set(skill.lower() for skill in TextExtractor.extract_skills(resume_text))
+            # Skills from the stored document features (one lookup for all jobs).
+            # A page of search results is small; set overlap beats encoding a
+            # matrix per call, which only pays off in rank_cached_jobs.
+            resume_skills = set(DocumentFeatureService.get_features(resume_text)['skills'])
+            job_descs = [job.get('description', job.get('job_description', '')) for job in jobs]
+            job_features = DocumentFeatureService.get_many(job_descs)
             
             # Calculate compatibility for each job
-            for job in jobs:
-                job_desc = job.get('description', job.get('job_description', ''))
+            for job, job_desc, features in zip(jobs, job_descs, job_features):
                 if not job_desc:
                     job['compatibility_score'] = 0.0
                     continue
                 
-                # Extract skills from job description
-                job_skills = set(skill.lower() for skill in TextExtractor.extract_skills(job_desc))
+                job_skills = set(features['skills'])
                 
                 if not job_skills:
                     job['compatibility_score'] = 50.0  # Default if no skills found
@@ -353,6 +385,132 @@ class JSearchService:
             print(f"Error ranking jobs: {e}")
             return jobs
     
+    @staticmethod
+    def rank_cached_jobs(resume_text: str, top_k: int = 20, user_id: Optional[int] = None,
+                         limit: int = 5000) -> List[Dict]:
+        """
+        Rank the jobs cached in jsearch_jobs against a resume
+        
+        Reads each job's skills from document_features (joined on the
+        description hash) rather than the descriptions, so thousands of
+        jobs are scored in one batch. Jobs stored before their hash was
+        recorded get it computed here once; jobs without a description
+        score 0, as in rank_jobs_by_compatibility. The encoded job set is
+        kept (a few per user/limit, least recently used dropped) and
+        reused while the same jobs (and hashes) come back.
+        
+        Args:
+            resume_text: User's resume text
+            top_k: Number of best jobs to return
+            user_id: Only rank jobs this user found (None ranks the whole cache)
+            limit: Most recent jobs considered
+            
+        Returns:
+            Job summaries (no description) with compatibility_score,
+            weighted_jaccard and tfidf_cosine, best first
+        """
+        try:
+            from core.job_ranker import JobRanker
+            
+            query = """
+            SELECT j.job_id, j.external_job_id, j.title, j.company_name, j.location,
+                   j.salary_min, j.salary_max, j.is_remote, j.job_url, j.posted_date,
+                   j.content_hash, f.skills
+            FROM jsearch_jobs j
+            LEFT JOIN document_features f
+                ON f.content_hash = j.content_hash AND f.feature_version = %s
+            """
+            params = [FEATURE_VERSION]
+            if user_id is not None:
+                query += " WHERE j.user_id = %s"
+                params.append(user_id)
+            query += " ORDER BY j.job_id DESC LIMIT %s"
+            params.append(limit)
+            rows = execute_query(query, tuple(params), fetch_all=True) or []
+            if not rows:
+                return []
+            
+            signature = tuple((row['job_id'], row.pop('content_hash')) for row in rows)
+            cache_key = (user_id, limit)
+            with JSearchService._encoded_lock:
+                cached = JSearchService._encoded_jobs.get(cache_key)
+                if cached:
+                    JSearchService._encoded_jobs.move_to_end(cache_key)
+            if cached and cached[0] == signature:
+                encoded = cached[1]
+                for row in rows:
+                    row.pop('skills')
+            else:
+                # An empty description is stored under the hash of the empty text
+                empty_hash = DocumentFeatureService.content_hash('')
+                job_skills = {}
+                for row, (_, content_hash) in zip(rows, signature):
+                    skills = row.pop('skills')
+                    if content_hash == empty_hash:
+                        job_skills[row['job_id']] = None
+                    elif skills is not None:
+                        job_skills[row['job_id']] = json.loads(skills) if isinstance(skills, (str, bytes, bytearray)) else skills
+                
+                missing = [row['job_id'] for row in rows if row['job_id'] not in job_skills]
+                if missing:
+                    job_skills.update(JSearchService._index_job_features(missing))
+                
+                encoded = JobRanker.encode([job_skills.get(row['job_id']) for row in rows])
+                if not missing:
+                    # Hashes just recorded change the signature; cache on the next call
+                    JSearchService._remember_encoded(cache_key, (signature, encoded))
+            
+            results = JobRanker().rank(
+                DocumentFeatureService.get_features(resume_text)['skills'],
+                encoded,
+                top_k=top_k
+            )
+            
+            ranked = []
+            for result in results:
+                job = rows[result['index']]
+                job['compatibility_score'] = result['match_score']
+                job['weighted_jaccard'] = result['weighted_jaccard']
+                job['tfidf_cosine'] = result['tfidf_cosine']
+                ranked.append(job)
+            return ranked
+            
+        except Exception as e:
+            print(f"[ERROR] Error ranking cached jobs: {e}")
+            return []
+    
+    @staticmethod
+    def _remember_encoded(cache_key: tuple, entry: tuple):
+        with JSearchService._encoded_lock:
+            JSearchService._encoded_jobs[cache_key] = entry
+            JSearchService._encoded_jobs.move_to_end(cache_key)
+            while len(JSearchService._encoded_jobs) > JSearchService.ENCODED_JOB_SETS:
+                JSearchService._encoded_jobs.popitem(last=False)
+    
+    @staticmethod
+    def _index_job_features(job_ids: List[int]) -> Dict[int, Optional[List[str]]]:
+        """Compute features for cached jobs and record their description hashes
+        
+        Returns:
+            job_id -> skill ids (None for a job without a description)
+        """
+        placeholders = ", ".join(["%s"] * len(job_ids))
+        rows = execute_query(
+            f"SELECT job_id, description FROM jsearch_jobs WHERE job_id IN ({placeholders})",
+            tuple(job_ids), fetch_all=True
+        ) or []
+        features_list = DocumentFeatureService.get_many([row['description'] for row in rows])
+        
+        with DatabaseManager.transaction() as uow:
+            uow.execute_many(
+                "UPDATE jsearch_jobs SET content_hash = %s WHERE job_id = %s",
+                [(features['content_hash'], row['job_id']) for row, features in zip(rows, features_list)]
+            )
+        return {
+            row['job_id']: features['skills'] if row['description'] else None
+            for row, features in zip(rows, features_list)
+        }
+    
     @staticmethod
     def save_search(user_id: int, query: str, location: str, remote_only: bool, results_count: int) -> bool:
         """
@@ -405,9 +563,60 @@ class JSearchService:
             print(f"Error getting search history: {e}")
             return []
     
+    @staticmethod
+    def get_search_history_page(user_id: int, limit: int = DEFAULT_PAGE_SIZE,
+                                cursor: Optional[str] = None) -> Dict:
+        """
+        Get one page of search history, most recent first
+        
+        Args:
+            user_id: User ID
+            limit: Page size
+            cursor: next_cursor from the previous page (None for the first page)
+            
+        Returns:
+            {'items': searches, 'next_cursor': str or None}
+        """
+        try:
+            query = """
+            SELECT id, search_query, location, remote_only, results_count, searched_at
+            FROM jsearch_history
+            WHERE user_id = %s
+            """
+            return fetch_page(query, (user_id,), 'searched_at', 'id', limit, cursor)
+        except Exception as e:
+            print(f"Error getting search history page: {e}")
+            return {'items': [], 'next_cursor': None}
+    
+    @staticmethod
+    def get_saved_job_summaries(user_id: int) -> List[Dict]:
+        """
+        Get user's saved jobs for lists and cards
+        
+        Summary variant: no description or raw job data. Load those with
+        get_job_by_id() or get_job_description_text() when needed.
+        """
+        query = """
+        SELECT job_id, external_job_id, title, company, company_name, location,
+               salary_min, salary_max, is_remote, job_url, apply_url, posted_date,
+               compatibility_score, created_at
+        FROM jsearch_jobs 
+        WHERE user_id = %s AND is_saved = TRUE 
+        ORDER BY created_at DESC
+        """
+        return execute_query(query, (user_id,), fetch_all=True) or []
+    
+    @staticmethod
+    def get_job_description_text(job_id: int) -> Optional[str]:
+        """Get a job's description on demand"""
+        result = execute_query(
+            "SELECT description FROM jsearch_jobs WHERE job_id = %s", (job_id,), fetch_one=True
+        )
+        return result['description'] if result else None
+    
     @staticmethod
     def get_saved_jobs(user_id: int) -> List[Dict]:
-        """Get user's saved jobs"""
+        """Get user's saved jobs with description and job data (detail variant)"""
         query = """
         SELECT * FROM jsearch_jobs 
         WHERE user_id = %s AND is_saved = TRUE 
@@ -449,17 +658,22 @@ class JSearchService:
             if not resume or not resume.get('parsed_data'):
                 return 0.0
             
-            resume_data = json.loads(resume['parsed_data'])
-            resume_skills = set(skill.lower() for skill in resume_data.get('skills', []))
+            resume_text = resume.get('resume_text') or resume.get('extracted_text')
+            if resume_text:
+                resume_skills = set(DocumentFeatureService.get_features(resume_text)['skills'])
+            else:
+                # Stored names may predate the taxonomy; map them to skill ids
+                from core.skill_matcher import SkillMatcher
+                resume_data = json.loads(resume['parsed_data'])
+                resume_skills = SkillMatcher.get_instance().canonical_ids(resume_data.get('skills', []))
             
             # Get job requirements
             job = JSearchService.get_job_by_id(job_id)
             if not job or not job.get('description'):
                 return 0.0
             
-            # Extract skills from job description
-            from core.text_extractor import TextExtractor
-            job_skills = set(skill.lower() for skill in TextExtractor.extract_skills(job['description']))
+            # Skills from the stored document features
+            job_skills = set(DocumentFeatureService.get_features(job['description'])['skills'])
             
             if not job_skills:
                 return 50.0  # Default if no skills found
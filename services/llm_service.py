@@ -1,12 +1,12 @@
 """LLM service - manages LLM provider selection and usage"""
 
-from typing import Optional, Dict, Any
-from ai.providers import (
-    BaseLLMProvider, OpenAIProvider, AnthropicProvider,
-    BedrockProvider, OllamaProvider
-)
+import threading
+from typing import Optional, Dict, Any, List, Tuple, Callable
+from ai.providers import BaseLLMProvider, ProviderRegistry, RoutingLLMProvider, StreamInterruptedError
+from ai.providers.cached_provider import CachedLLMProvider, ResponseCache
 from database import DatabaseManager
 from core.encryption import Encryption
+from core.json_recovery import JSONRecovery
 from config.settings import Settings
 
 class LLMService:
@@ -15,6 +15,12 @@ class LLMService:
     _instance = None
     _current_provider: Optional[BaseLLMProvider] = None
     
+    # Per-user provider cache: user_id -> (settings fingerprint, provider)
+    _provider_cache: Dict[int, Tuple[Optional[tuple], BaseLLMProvider]] = {}
+    _invalidated_users: set = set()
+    _cache_lock = threading.Lock()
+    _cache_stats = {'hits': 0, 'misses': 0, 'rebuilds': 0}
+    
     @classmethod
     def get_instance(cls):
         """Get singleton instance"""
@@ -22,6 +28,44 @@ class LLMService:
             cls._instance = cls()
         return cls._instance
     
+    @classmethod
+    def invalidate_provider_cache(cls, user_id: Optional[int] = None):
+        """Drop cached provider(s) so the next call rebuilds from settings
+        
+        Args:
+            user_id: User whose provider should be dropped (all users if None)
+        """
+        with cls._cache_lock:
+            if user_id is None:
+                cls._invalidated_users.update(cls._provider_cache.keys())
+                cls._provider_cache.clear()
+            elif cls._provider_cache.pop(user_id, None) is not None:
+                cls._invalidated_users.add(user_id)
+    
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, int]:
+        """Get provider cache counters
+        
+        Returns:
+            Dictionary with hits, misses, rebuilds and cached provider count
+        """
+        with cls._cache_lock:
+            stats = dict(cls._cache_stats)
+            stats['cached_providers'] = len(cls._provider_cache)
+        return stats
+    
+    @staticmethod
+    def _settings_fingerprint(settings: Optional[Dict[str, Any]]) -> Optional[tuple]:
+        """Build a cache key from the active settings row"""
+        if not settings:
+            return None
+        return (
+            settings.get('id'), settings.get('provider'), settings.get('model_name'),
+            settings.get('api_key_encrypted'), settings.get('endpoint_url'),
+            str(settings.get('temperature')), settings.get('max_tokens'),
+            str(settings.get('top_p'))
+        )
+    
     def get_user_llm_settings(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get user's active LLM settings from database
         
@@ -34,7 +78,7 @@ class LLMService:
         try:
             with DatabaseManager.get_cursor() as cursor:
                 cursor.execute("""
-                    SELECT provider, model_name, api_key_encrypted, endpoint_url,
+                    SELECT id, provider, model_name, api_key_encrypted, endpoint_url,
                            temperature, max_tokens, top_p
                     FROM llm_settings
                     WHERE user_id = %s AND is_active = TRUE
@@ -52,72 +96,247 @@ class LLMService:
             print(f"Error fetching LLM settings: {e}")
             return None
     
-    def get_provider(self, user_id: int) -> BaseLLMProvider:
+    def get_provider(self, user_id: int, service: Optional[str] = None,
+                     use_cache: bool = True) -> BaseLLMProvider:
         """Get LLM provider for user
         
+        Providers are cached per user so repeated calls reuse the same
+        client (and its connection pool) until the settings change.
+        When LLM_CACHE_ENABLED is set the provider is wrapped in a
+        CachedLLMProvider so identical prompts are served from the
+        response cache.
+        
         Args:
             user_id: User ID
+            service: Calling service name, used for response cache hit rates
+            use_cache: Set False to bypass the response cache (e.g. chat)
             
         Returns:
             LLM provider instance
         """
-        # Try to get user settings
+        cls = type(self)
+        with cls._cache_lock:
+            cached = cls._provider_cache.get(user_id)
+            if cached is not None:
+                cls._cache_stats['hits'] += 1
+                return self._for_service(cached[1], service, use_cache)
+        
         settings = self.get_user_llm_settings(user_id)
+        fingerprint = self._settings_fingerprint(settings)
+        provider = self._build_provider(settings)
+        if Settings.LLM_FAILOVER_ENABLED:
+            provider = self._with_backups(user_id, settings, provider)
+        if Settings.LLM_CACHE_ENABLED:
+            provider = CachedLLMProvider(provider)
+        
+        with cls._cache_lock:
+            cached = cls._provider_cache.get(user_id)
+            if cached is not None and cached[0] == fingerprint:
+                # Another caller built a provider for the same settings row meanwhile
+                cls._cache_stats['hits'] += 1
+                return self._for_service(cached[1], service, use_cache)
+            if user_id in cls._invalidated_users:
+                cls._invalidated_users.discard(user_id)
+                cls._cache_stats['rebuilds'] += 1
+            else:
+                cls._cache_stats['misses'] += 1
+            cls._provider_cache[user_id] = (fingerprint, provider)
+        
+        return self._for_service(provider, service, use_cache)
+    
+    @staticmethod
+    def _for_service(provider: BaseLLMProvider, service: Optional[str],
+                     use_cache: bool) -> BaseLLMProvider:
+        """Tag a cached provider with the calling service or unwrap it for bypass"""
+        if not isinstance(provider, CachedLLMProvider):
+            return provider
+        if not use_cache:
+            provider.cache.record_bypass(service or provider.service)
+            return provider.provider
+        return provider.for_service(service)
+    
+    def get_backup_llm_settings(self, user_id: int) -> List[Dict[str, Any]]:
+        """Get user's other (inactive) LLM settings, most recently used first
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            List of settings dictionaries (API keys decrypted)
+        """
+        try:
+            with DatabaseManager.get_cursor() as cursor:
+                cursor.execute("""
+                    SELECT id, provider, model_name, api_key_encrypted, endpoint_url,
+                           temperature, max_tokens, top_p
+                    FROM llm_settings
+                    WHERE user_id = %s AND is_active = FALSE
+                    ORDER BY updated_at DESC
+                """, (user_id,))
+                
+                results = cursor.fetchall() or []
+                for result in results:
+                    if result['api_key_encrypted']:
+                        result['api_key'] = Encryption.decrypt(result['api_key_encrypted'])
+                return results
+        except Exception as e:
+            print(f"Error fetching backup LLM settings: {e}")
+            return []
+    
+    def _with_backups(self, user_id: int, settings: Optional[Dict[str, Any]],
+                      provider: BaseLLMProvider) -> BaseLLMProvider:
+        """Wrap a provider in a RoutingLLMProvider when backups are configured
+        
+        Backups are the user's other saved LLM settings; a user without
+        saved settings gets no backup (nothing they configured to route to).
+        
+        Args:
+            user_id: User ID
+            settings: Active LLM settings (or None)
+            provider: Primary provider built from settings
+            
+        Returns:
+            RoutingLLMProvider, or provider unchanged if there is no backup
+        """
+        backups = []
+        if settings:
+            for backup_settings in self.get_backup_llm_settings(user_id):
+                if not backup_settings.get('model_name'):
+                    continue
+                try:
+                    backups.append(self._build_provider(backup_settings))
+                except Exception as e:
+                    print(f"[WARNING] Skipping backup LLM provider {backup_settings.get('provider')}: {e}")
+        
+        if not backups:
+            return provider
+        return RoutingLLMProvider(
+            [provider] + backups,
+            hedge=Settings.LLM_HEDGE_ENABLED,
+            min_hedge_delay=Settings.LLM_HEDGE_MIN_DELAY_SECONDS
+        )
+    
+    @staticmethod
+    def get_routing_stats() -> Dict[str, Any]:
+        """Get failover/hedging counters and per-backend latency and circuit state
+        
+        Returns:
+            Dict with routing counters and a 'backends' mapping
+        """
+        return RoutingLLMProvider.get_stats()
+    
+    @staticmethod
+    def get_response_cache_stats() -> Dict[str, Dict[str, Any]]:
+        """Get LLM response cache hit rates per service
+        
+        Returns:
+            Dict mapping service name to hit/miss counters and hit_rate
+        """
+        return ResponseCache.get_instance().get_stats()
+    
+    @staticmethod
+    def get_structured_output_stats() -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Get JSON parse and retry rates per provider
+        
+        Counters are split by mode: 'structured' (native JSON/tool calling)
+        and 'prompt' (JSON requested in the prompt only), so the effect of
+        LLM_STRUCTURED_OUTPUT on retries can be compared.
         
+        Returns:
+            Dict mapping provider name to per-mode counters and rates
+        """
+        return JSONRecovery.get_stats()
+    
+    @staticmethod
+    def generate_text(provider: BaseLLMProvider, prompt: str,
+                      system_prompt: Optional[str] = None,
+                      on_token: Optional[Callable[[str], None]] = None) -> str:
+        """Generate text, optionally streaming chunks to a callback
+        
+        Without on_token this is provider.generate(). With it, chunks from
+        provider.generate_stream() are forwarded as they arrive and the
+        full text is returned. An error reported before the first chunk
+        is returned as-is and not forwarded; a stream cut short after it
+        returns an "Error:" string too (the chunks already forwarded stay
+        with the callback), so the partial text is not used as complete.
+        
+        Args:
+            provider: LLM provider
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            on_token: Callback receiving each text chunk
+            
+        Returns:
+            Full generated text (or provider error string)
+        """
+        if on_token is None:
+            return provider.generate(prompt, system_prompt)
+        
+        chunks = []
+        try:
+            for chunk in provider.generate_stream(prompt, system_prompt):
+                if not chunks and chunk.startswith(("Error:", "Error generating response")):
+                    return chunk
+                chunks.append(chunk)
+                on_token(chunk)
+        except StreamInterruptedError as e:
+            print(f"[ERROR] {e}")
+            return f"Error: {e}"
+        return "".join(chunks)
+    
+    def _build_provider(self, settings: Optional[Dict[str, Any]]) -> BaseLLMProvider:
+        """Create a provider instance from a settings row
+        
+        Args:
+            settings: LLM settings row (or None for the default fallback)
+            
+        Returns:
+            LLM provider instance
+        """
         if settings:
             provider_type = settings['provider']
             model_name = settings['model_name']
             temperature = float(settings.get('temperature', 0.7))
             max_tokens = settings.get('max_tokens', 2000)
             
-            if provider_type == 'openai':
-                api_key = settings.get('api_key') or Settings.OPENAI_API_KEY
-                return OpenAIProvider(
-                    api_key=api_key,
-                    model_name=model_name,
-                    temperature=temperature,
-                    max_tokens=max_tokens
-                )
-            
-            elif provider_type == 'anthropic':
-                api_key = settings.get('api_key') or Settings.ANTHROPIC_API_KEY
-                return AnthropicProvider(
-                    api_key=api_key,
-                    model_name=model_name,
-                    temperature=temperature,
-                    max_tokens=max_tokens
-                )
-            
-            elif provider_type == 'bedrock':
-                return BedrockProvider(
-                    model_name=model_name,
-                    region_name=Settings.AWS_REGION,
-                    temperature=temperature,
-                    max_tokens=max_tokens
-                )
+            # Environment defaults for fields the settings row leaves empty
+            default_api_keys = {
+                'openai': Settings.OPENAI_API_KEY,
+                'anthropic': Settings.ANTHROPIC_API_KEY,
+            }
+            default_endpoints = {
+                'bedrock': Settings.AWS_REGION,
+                'ollama': Settings.OLLAMA_BASE_URL,
+            }
             
-            elif provider_type == 'ollama':
-                base_url = settings.get('endpoint_url') or Settings.OLLAMA_BASE_URL
-                return OllamaProvider(
-                    model_name=model_name,
-                    base_url=base_url,
+            if provider_type in ProviderRegistry.available_providers():
+                endpoint_url = default_endpoints.get(provider_type)
+                if provider_type == 'ollama':
+                    endpoint_url = settings.get('endpoint_url') or endpoint_url
+                return ProviderRegistry.create(
+                    provider_type,
+                    model_name,
+                    api_key=settings.get('api_key') or default_api_keys.get(provider_type),
+                    endpoint_url=endpoint_url,
                     temperature=temperature,
                     max_tokens=max_tokens
                 )
         
         # Default fallback: try OpenAI if key is available
         if Settings.OPENAI_API_KEY:
-            return OpenAIProvider(
+            return ProviderRegistry.create(
+                'openai',
+                "gpt-4",
                 api_key=Settings.OPENAI_API_KEY,
-                model_name="gpt-4",
                 temperature=0.7,
                 max_tokens=2000
             )
         
         # Fallback to Ollama (local)
-        return OllamaProvider(
-            model_name="llama3.2",
-            base_url=Settings.OLLAMA_BASE_URL
+        return ProviderRegistry.create(
+            'ollama',
+            "llama3.2",
+            endpoint_url=Settings.OLLAMA_BASE_URL
         )
     
     def save_llm_settings(self, user_id: int, provider: str, model_name: str,
@@ -185,6 +404,7 @@ class LLMService:
                     """, (user_id, provider, model_name, model_name, api_key_encrypted, endpoint_url,
                           temperature, max_tokens))
             
+            self.invalidate_provider_cache(user_id)
             return True
         except Exception as e:
             print(f"Error saving LLM settings: {e}")
@@ -5,7 +5,8 @@ import json
 from typing import Optional, Dict
 from database.connection import execute_query
 from core.encryption import get_encryptor
-from ai.provider_factory import ProviderFactory
+from ai.providers import ProviderRegistry
+from services.llm_service import LLMService
 
 class LLMSettingsService:
     """Handle LLM settings operations"""
@@ -50,12 +51,14 @@ class LLMSettingsService:
             
             config_json = json.dumps(additional_config) if additional_config else None
             
-            return execute_query(
+            settings_id = execute_query(
                 query,
                 (user_id, provider, model, encrypted_key, temperature, max_tokens,
                  config_json, True),
                 commit=True
             )
+            LLMService.invalidate_provider_cache(user_id)
+            return settings_id
         except Exception as e:
             print(f"Error saving settings: {e}")
             return None
@@ -106,10 +109,10 @@ class LLMSettingsService:
             True if connection successful, False otherwise
         """
         try:
-            provider_instance = ProviderFactory.create_provider(
-                provider_name=provider,
+            provider_instance = ProviderRegistry.create(
+                provider,
+                model,
                 api_key=api_key,
-                model=model,
                 **kwargs
             )
             
@@ -121,9 +124,9 @@ class LLMSettingsService:
     @staticmethod
     def get_available_providers() -> list:
         """Get list of available LLM providers"""
-        return ProviderFactory.get_available_providers()
+        return ProviderRegistry.available_providers()
     
     @staticmethod
     def get_models_for_provider(provider: str) -> list:
         """Get available models for a provider"""
-        return ProviderFactory.get_models_for_provider(provider)
+        return ProviderRegistry.get_available_models(provider)
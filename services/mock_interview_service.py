@@ -2,12 +2,20 @@
 Mock Interview Service - Comprehensive mock interview session management
 """
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Any
 from datetime import datetime
+from database import DatabaseManager
 from database.connection import execute_query
+from database.pagination import DEFAULT_PAGE_SIZE, fetch_page
+from services.llm_service import LLMService
+from services.practice_service import PracticeService
 from services.question_service import QuestionService
 from services.resume_service import ResumeService
 from services.jd_service import JobDescriptionService
+from config.prompts import Prompts
+from config.settings import Settings
+from core.json_schemas import ANSWER_EVALUATION_SCHEMA
 
 class MockInterviewService:
     """Handle mock interview sessions, responses, and feedback"""
@@ -120,7 +128,9 @@ class MockInterviewService:
                     resume_id=resume_id,
                     jd_id=jd_id,
                     question_type=question_type_map.get(format_type, 'behavioral'),
-                    count=num_questions
+                    count=num_questions,
+                    # Each session gets a fresh set, not a cached one
+                    use_cache=False
                 )
                 
                 if result and result.get('questions'):
@@ -156,7 +166,7 @@ class MockInterviewService:
         query = """
         SELECT * FROM mock_interview_sessions WHERE session_id = %s
         """
-        return execute_query(query, (session_id,), fetch_one=True)
+        return execute_query(query, (session_id,), fetch_one=True, prepared=True)
     
     @staticmethod
     def get_user_sessions(user_id: int, limit: int = 20) -> List[Dict]:
@@ -169,6 +179,36 @@ class MockInterviewService:
         """
         return execute_query(query, (user_id, limit), fetch_all=True) or []
     
+    @staticmethod
+    def get_user_sessions_page(user_id: int, limit: int = DEFAULT_PAGE_SIZE,
+                               cursor: Optional[str] = None) -> Dict:
+        """Get one page of mock interview sessions for list cards, newest first
+        
+        Returns:
+            {'items': sessions, 'next_cursor': str or None}
+        """
+        try:
+            query = """
+            SELECT session_id, session_name, format_type, status, created_at
+            FROM mock_interview_sessions
+            WHERE user_id = %s
+            """
+            return fetch_page(query, (user_id,), 'created_at', 'session_id', limit, cursor)
+        except Exception as e:
+            print(f"[ERROR] Error fetching mock interview sessions page: {e}")
+            return {'items': [], 'next_cursor': None}
+    
+    @staticmethod
+    def count_user_sessions(user_id: int) -> int:
+        """Count a user's mock interview sessions"""
+        try:
+            query = "SELECT COUNT(*) AS total FROM mock_interview_sessions WHERE user_id = %s"
+            result = execute_query(query, (user_id,), fetch_one=True)
+            return int(result['total']) if result else 0
+        except Exception as e:
+            print(f"[ERROR] Error counting sessions: {e}")
+            return 0
+    
     @staticmethod
     def start_session(session_id: int) -> bool:
         """Start a mock interview session"""
@@ -226,7 +266,9 @@ class MockInterviewService:
                     resume_id=resume_id,
                     jd_id=jd_id,
                     question_type=question_type_map.get(format_type, 'behavioral'),
-                    count=num_questions
+                    count=num_questions,
+                    # Each session gets a fresh set, not a cached one
+                    use_cache=False
                 )
                 
                 if result and result.get('questions'):
@@ -327,9 +369,9 @@ class MockInterviewService:
     def get_session_responses(session_id: int) -> List[Dict]:
         """Get all responses for a session"""
         query = """
-        SELECT mr.*, q.question_text
+        SELECT mr.*, q.question_text, q.ideal_answer_points
         FROM mock_interview_responses mr
-        JOIN questions q ON mr.question_id = q.question_id
+        JOIN questions q ON mr.question_id = q.id
         WHERE mr.session_id = %s
         ORDER BY mr.question_index ASC
         """
@@ -385,6 +427,130 @@ class MockInterviewService:
             traceback.print_exc()
             return None
     
+    @staticmethod
+    def _evaluate_single_response(provider, response: Dict) -> Optional[Dict]:
+        """Score one session response with the practice evaluation prompt"""
+        try:
+            ideal_points = response.get('ideal_answer_points') or []
+            if isinstance(ideal_points, str):
+                try:
+                    ideal_points = json.loads(ideal_points)
+                except:
+                    ideal_points = []
+            
+            prompt = Prompts.PRACTICE_EVALUATION.format(
+                question=response.get('question_text', ''),
+                response=response.get('response_text') or response.get('transcript') or '',
+                ideal_points=json.dumps(ideal_points) if ideal_points else "[]"
+            )
+            
+            llm_response = provider.generate_json(prompt, schema=ANSWER_EVALUATION_SCHEMA)
+            if not llm_response or (isinstance(llm_response, dict) and 'error' in llm_response):
+                print(f"[ERROR] LLM error evaluating response {response.get('response_id')}: {llm_response}")
+                return None
+            
+            return PracticeService._parse_evaluation(llm_response)
+        except Exception as e:
+            print(f"[ERROR] Error evaluating response {response.get('response_id')}: {e}")
+            return None
+    
+    @staticmethod
+    def evaluate_session(session_id: int, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Evaluate every response of a session in one batch
+        
+        Used for post_session feedback mode. Evaluations run concurrently on a
+        bounded thread pool, so the pass takes roughly as long as the slowest
+        single evaluation. All feedback rows (one per response plus a session
+        summary) are written with a single executemany, replacing the
+        session's earlier feedback in the same transaction, so re-running the
+        evaluation does not duplicate it.
+        
+        Args:
+            session_id: Session ID
+            max_workers: Maximum concurrent LLM calls (defaults to LLM_BATCH_MAX_WORKERS)
+            
+        Returns:
+            Dict with evaluated/failed counts and average_score, or 'error'
+        """
+        try:
+            session = MockInterviewService.get_session(session_id)
+            if not session:
+                return {"error": "Session not found"}
+            
+            responses = [
+                r for r in MockInterviewService.get_session_responses(session_id)
+                if not r.get('is_skipped') and (r.get('response_text') or r.get('transcript'))
+            ]
+            if not responses:
+                return {"evaluated": 0, "failed": 0, "average_score": None}
+            
+            llm_service = LLMService.get_instance()
+            provider = llm_service.get_provider(session['user_id'], service='mock_interview')
+            
+            workers = max(1, min(max_workers or Settings.LLM_BATCH_MAX_WORKERS, len(responses)))
+            print(f"[INFO] Evaluating {len(responses)} responses for session {session_id} with {workers} workers")
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                evaluations = list(executor.map(
+                    lambda r: MockInterviewService._evaluate_single_response(provider, r),
+                    responses
+                ))
+            
+            rows = []
+            scores = []
+            for response, evaluation in zip(responses, evaluations):
+                if not evaluation:
+                    continue
+                score = evaluation.get('score')
+                if isinstance(score, (int, float)):
+                    scores.append(float(score))
+                rows.append((
+                    session_id, response['response_id'], 'question',
+                    score, None, score,
+                    json.dumps(evaluation.get('star_analysis')) if evaluation.get('star_analysis') else None,
+                    json.dumps(evaluation.get('strengths')) if evaluation.get('strengths') else None,
+                    json.dumps(evaluation.get('weaknesses')) if evaluation.get('weaknesses') else None,
+                    json.dumps(evaluation.get('suggestions')) if evaluation.get('suggestions') else None,
+                    None, None, None
+                ))
+            
+            average_score = round(sum(scores) / len(scores), 2) if scores else None
+            if rows:
+                rows.append((
+                    session_id, None, 'session',
+                    None, None, average_score,
+                    None, None, None, None, None,
+                    f"Average score {average_score} across {len(rows)} evaluated answers" if average_score is not None else None,
+                    None
+                ))
+                
+                with DatabaseManager.transaction() as uow:
+                    uow.execute(
+                        "DELETE FROM mock_interview_feedback WHERE session_id = %s",
+                        (session_id,)
+                    )
+                    uow.execute_many("""
+                        INSERT INTO mock_interview_feedback
+                        (session_id, response_id, feedback_type, score_content, score_delivery,
+                         score_overall, star_analysis, strengths, weaknesses, suggestions,
+                         delivery_metrics, recommendations, skill_tags)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    """, rows)
+            
+            evaluated = sum(1 for e in evaluations if e)
+            print(f"[INFO] Session {session_id} evaluated: {evaluated}/{len(responses)} responses")
+            return {
+                "evaluated": evaluated,
+                "failed": len(responses) - evaluated,
+                "average_score": average_score
+            }
+            
+        except Exception as e:
+            print(f"[ERROR] Error evaluating session: {e}")
+            import traceback
+            traceback.print_exc()
+            return {"error": str(e)}
+    
     @staticmethod
     def get_session_feedback(session_id: int) -> List[Dict]:
         """Get all feedback for a session"""
@@ -3,12 +3,16 @@ Practice session service
 """
 import json
 import os
-from typing import List, Dict, Optional
-from database.connection import execute_query
+from typing import List, Dict, Optional, Union
+from database.connection import DatabaseManager, execute_query
+from database.pagination import DEFAULT_PAGE_SIZE, fetch_page
 from services.llm_service import LLMService
 from services.question_service import QuestionService
+from services.user_stats_service import UserStatsService
 from config.prompts import Prompts
 from core.recording_service import TranscriptionService
+from core.json_recovery import JSONRecovery
+from core.json_schemas import ANSWER_EVALUATION_SCHEMA
 from config.settings import Settings
 
 class PracticeService:
@@ -60,11 +64,11 @@ class PracticeService:
     
     @staticmethod
     def get_sessions(user_id: int, limit: int = 20) -> List[Dict]:
-        """Get user's practice sessions"""
+        """Get user's practice sessions with responses and feedback (detail variant)"""
         query = """
         SELECT ps.*, q.question_text, qs.set_name, jd.job_title, jd.company_name
         FROM practice_sessions ps
-        JOIN questions q ON ps.question_id = q.question_id
+        JOIN questions q ON ps.question_id = q.id
         JOIN question_sets qs ON q.set_id = qs.set_id
         LEFT JOIN job_descriptions jd ON qs.jd_id = jd.jd_id
         WHERE ps.user_id = %s 
@@ -73,6 +77,50 @@ class PracticeService:
         """
         return execute_query(query, (user_id, limit), fetch_all=True) or []
     
+    @staticmethod
+    def get_session_summaries(user_id: int, limit: int = 20) -> List[Dict]:
+        """Get user's practice sessions for lists, newest first
+        
+        Summary variant: no response text, transcript or feedback. Load those
+        with get_session_by_id() when a session is opened.
+        """
+        query = """
+        SELECT ps.session_id, ps.question_id, ps.response_mode, ps.evaluation_score,
+               ps.status, ps.session_date, ps.duration_seconds,
+               q.question_text, qs.set_name, jd.job_title, jd.company_name
+        FROM practice_sessions ps
+        JOIN questions q ON ps.question_id = q.id
+        JOIN question_sets qs ON q.set_id = qs.set_id
+        LEFT JOIN job_descriptions jd ON qs.jd_id = jd.jd_id
+        WHERE ps.user_id = %s 
+        ORDER BY ps.session_date DESC
+        LIMIT %s
+        """
+        return execute_query(query, (user_id, limit), fetch_all=True) or []
+    
+    @staticmethod
+    def get_sessions_page(user_id: int, limit: int = DEFAULT_PAGE_SIZE,
+                          cursor: Optional[str] = None) -> Dict:
+        """Get one page of practice sessions for the history list, newest first
+        
+        Returns only the card columns (no response, transcript or feedback);
+        load those with get_session_by_id().
+        
+        Returns:
+            {'items': sessions, 'next_cursor': str or None}
+        """
+        try:
+            query = """
+            SELECT ps.session_id, ps.evaluation_score, ps.session_date, q.question_text
+            FROM practice_sessions ps
+            JOIN questions q ON ps.question_id = q.id
+            WHERE ps.user_id = %s
+            """
+            return fetch_page(query, (user_id,), 'ps.session_date', 'ps.session_id', limit, cursor)
+        except Exception as e:
+            print(f"[ERROR] Error fetching practice sessions page: {e}")
+            return {'items': [], 'next_cursor': None}
+    
     @staticmethod
     def get_session_by_id(session_id: int) -> Optional[Dict]:
         """Get a practice session by ID"""
@@ -80,7 +128,7 @@ class PracticeService:
         SELECT ps.*, q.question_text, q.ideal_answer_points, qs.set_name, 
                jd.job_title, jd.company_name
         FROM practice_sessions ps
-        JOIN questions q ON ps.question_id = q.question_id
+        JOIN questions q ON ps.question_id = q.id
         JOIN question_sets qs ON q.set_id = qs.set_id
         LEFT JOIN job_descriptions jd ON qs.jd_id = jd.jd_id
         WHERE ps.session_id = %s
@@ -108,9 +156,9 @@ class PracticeService:
             SELECT q.*, qs.set_name
             FROM questions q
             JOIN question_sets qs ON q.set_id = qs.set_id
-            WHERE q.question_id = %s
+            WHERE q.id = %s
             """
-            question = execute_query(question_query, (question_id,), fetch_one=True)
+            question = execute_query(question_query, (question_id,), fetch_one=True, prepared=True)
             
             if not question:
                 print(f"[ERROR] Question {question_id} not found")
@@ -130,7 +178,7 @@ class PracticeService:
             
             # Get LLM provider
             llm_service = LLMService.get_instance()
-            provider = llm_service.get_provider(user_id)
+            provider = llm_service.get_provider(user_id, service='practice')
             
             # Format prompt
             prompt = Prompts.PRACTICE_EVALUATION.format(
@@ -141,7 +189,7 @@ class PracticeService:
             
             # Get LLM response
             print(f"[INFO] Evaluating practice response for session {session_id}")
-            llm_response = provider.generate(prompt)
+            llm_response = provider.generate_json(prompt, schema=ANSWER_EVALUATION_SCHEMA)
             
             if not llm_response:
                 print("[ERROR] LLM returned empty response")
@@ -169,7 +217,8 @@ class PracticeService:
             WHERE session_id = %s
             """
             
-            execute_query(
+            PracticeService._save_evaluation(
+                session_id,
                 update_query,
                 (
                     response_text,
@@ -180,7 +229,7 @@ class PracticeService:
                     duration_seconds,
                     session_id
                 ),
-                commit=True
+                evaluation.get('score', 0)
             )
             
             return evaluation
@@ -296,9 +345,9 @@ class PracticeService:
             SELECT q.*, qs.set_name
             FROM questions q
             JOIN question_sets qs ON q.set_id = qs.set_id
-            WHERE q.question_id = %s
+            WHERE q.id = %s
             """
-            question = execute_query(question_query, (question_id,), fetch_one=True)
+            question = execute_query(question_query, (question_id,), fetch_one=True, prepared=True)
             
             if not question:
                 print(f"[ERROR] Question {question_id} not found")
@@ -318,7 +367,7 @@ class PracticeService:
             
             # Get LLM provider
             llm_service = LLMService.get_instance()
-            provider = llm_service.get_provider(user_id)
+            provider = llm_service.get_provider(user_id, service='practice')
             
             # Format prompt (same as written, but can add audio/video specific notes)
             prompt = Prompts.PRACTICE_EVALUATION.format(
@@ -329,7 +378,7 @@ class PracticeService:
             
             # Get LLM response
             print(f"[INFO] Evaluating audio/video response for session {session_id}")
-            llm_response = provider.generate(prompt)
+            llm_response = provider.generate_json(prompt, schema=ANSWER_EVALUATION_SCHEMA)
             
             if not llm_response:
                 print("[ERROR] LLM returned empty response")
@@ -358,7 +407,8 @@ class PracticeService:
             WHERE session_id = %s
             """
             
-            execute_query(
+            PracticeService._save_evaluation(
+                session_id,
                 update_query,
                 (
                     transcript,
@@ -370,7 +420,7 @@ class PracticeService:
                     duration_seconds,
                     session_id
                 ),
-                commit=True
+                evaluation.get('score', 0)
             )
             
             return evaluation
@@ -382,26 +432,18 @@ class PracticeService:
             return None
     
     @staticmethod
-    def _parse_evaluation(llm_response: str) -> Optional[Dict]:
-        """Parse LLM evaluation response"""
+    def _parse_evaluation(llm_response: Union[str, Dict]) -> Optional[Dict]:
+        """Parse LLM evaluation response (completion text or generate_json() result)"""
         try:
-            # Try to extract JSON from response
-            import re
-            
-            # Remove markdown code blocks if present
-            llm_response = re.sub(r'```json\s*', '', llm_response)
-            llm_response = re.sub(r'```\s*', '', llm_response)
-            llm_response = llm_response.strip()
-            
-            # Try to find JSON object
-            json_match = re.search(r'\{.*\}', llm_response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
+            if isinstance(llm_response, dict):
+                if 'error' in llm_response:
+                    raise ValueError(llm_response['error'])
+                evaluation = llm_response
             else:
-                json_str = llm_response
-            
-            # Parse JSON
-            evaluation = json.loads(json_str)
+                # Extract (and if needed repair) the JSON object
+                evaluation = JSONRecovery.loads(llm_response)
+            if not isinstance(evaluation, dict):
+                raise ValueError(f"Expected a JSON object, got {type(evaluation).__name__}")
             
             # Ensure required fields
             if 'score' not in evaluation:
@@ -426,25 +468,24 @@ class PracticeService:
             
         except Exception as e:
             print(f"[ERROR] Error parsing evaluation: {e}")
-            print(f"[DEBUG] LLM Response: {llm_response[:500]}")
+            print(f"[DEBUG] LLM Response: {str(llm_response)[:500]}")
             return None
     
+    @staticmethod
+    def _save_evaluation(session_id: int, update_query: str, params: tuple, score):
+        """Write an evaluation and fold its score into user_stats in one transaction"""
+        with DatabaseManager.transaction() as uow:
+            previous = uow.fetch_one(
+                "SELECT user_id, evaluation_score FROM practice_sessions WHERE session_id = %s FOR UPDATE",
+                (session_id,)
+            )
+            uow.execute(update_query, params)
+            if previous:
+                UserStatsService.record_session_score(
+                    uow, previous['user_id'], previous['evaluation_score'], score
+                )
+    
     @staticmethod
     def get_session_stats(user_id: int) -> Dict:
-        """Get practice session statistics for a user"""
-        query = """
-        SELECT 
-            COUNT(*) as total_sessions,
-            AVG(evaluation_score) as average_score
-        FROM practice_sessions 
-        WHERE user_id = %s AND evaluation_score IS NOT NULL
-        """
-        result = execute_query(query, (user_id,), fetch_one=True)
-        
-        if result:
-            return {
-                'total_sessions': result.get('total_sessions', 0) or 0,
-                'average_score': round(result.get('average_score', 0) or 0, 1)
-            }
-        
-        return {'total_sessions': 0, 'average_score': 0}
\ No newline at end of file
+        """Get practice session statistics for a user (from user_stats)"""
+        return UserStatsService.get_stats(user_id)['practice']
\ No newline at end of file
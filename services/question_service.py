@@ -2,11 +2,15 @@
 Question generation and management service
 """
 from typing import List, Dict, Optional, Any
-from database.connection import execute_query
+from database.connection import DatabaseManager, UnitOfWork, execute_query
+from database.query_cache import QueryCache
 from services.resume_service import ResumeService
 from services.jd_service import JobDescriptionService
 from services.llm_service import LLMService
 from config.prompts import Prompts
+from core.prompt_packer import PromptPacker
+from core.json_recovery import JSONRecovery, JSONRecoveryError
+from core.json_schemas import QUESTION_LIST_SCHEMA
 import json
 
 class QuestionService:
@@ -16,7 +20,8 @@ class QuestionService:
     def generate_questions(user_id: int, resume_id: int, jd_id: int,
                           question_type: str = 'behavioral',
                           count: int = 5,
-                          set_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+                          set_name: Optional[str] = None,
+                          use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Generate interview questions using LLM
         
@@ -27,6 +32,7 @@ class QuestionService:
             question_type: Type of questions (behavioral, technical, situational)
             count: Number of questions to generate
             set_name: Optional name for the question set
+            use_cache: Set False to force a fresh generation instead of a cached one
             
         Returns:
             Dict with set_id and questions, or None if failed
@@ -42,20 +48,25 @@ class QuestionService:
             
             # 2. Get LLM provider
             llm_service = LLMService.get_instance()
-            provider = llm_service.get_provider(user_id)
+            provider = llm_service.get_provider(user_id, service='questions', use_cache=use_cache)
             
             if not provider:
                 print("[ERROR] No LLM provider configured")
                 return None
             
-            # 3. Format prompt
-            prompt = Prompts.QUESTION_GENERATION.format(
+            # 3. Format prompt, packing resume and JD into the token budget
+            packer = PromptPacker.for_provider(provider)
+            fields = packer.fit(
+                Prompts.QUESTION_GENERATION,
+                {
+                    'resume_summary': resume.get('resume_text', '') or '',
+                    'job_description': jd.get('jd_text', '') or ''
+                },
                 count=count,
                 difficulty='medium',
-                question_type=question_type,
-                resume_summary=resume.get('resume_text', '')[:2000],
-                job_description=jd.get('jd_text', '')[:2000]
+                question_type=question_type
             )
+            prompt = Prompts.QUESTION_GENERATION.format(**fields)
             
             print(f"[INFO] Generating {count} {question_type} questions...")
             
@@ -64,7 +75,10 @@ class QuestionService:
             # 4. Generate with LLM using generate_json to handle text before JSON
             # Use generate_json if available, otherwise fall back to generate
             if hasattr(provider, 'generate_json'):
-                response_data = provider.generate_json(prompt)
+                # With native structured output the response matches the schema,
+                # so a failure here is a provider error and is not retried
+                structured = provider.supports_structured_output()
+                response_data = provider.generate_json(prompt, schema=QUESTION_LIST_SCHEMA)
                 
                 # Check for errors and fall back to manual parsing when possible
                 if isinstance(response_data, dict) and 'error' in response_data:
@@ -74,8 +88,9 @@ class QuestionService:
                     if raw_response:
                         questions_data = QuestionService._parse_questions_from_text(raw_response)
                     
-                    if not questions_data:
+                    if not questions_data and not structured:
                         print("[INFO] Retrying question generation using plain text response")
+                        JSONRecovery.record_retry(provider.provider_name)
                         raw_response = provider.generate(prompt)
                         questions_data = QuestionService._parse_questions_from_text(raw_response)
                 else:
@@ -96,75 +111,79 @@ class QuestionService:
                 print("[ERROR] No questions generated")
                 return None
             
-            # 6. Create question set
+            # 6. Save the question set
             if not set_name:
                 set_name = f"{question_type.title()} Questions - {jd.get('job_title', 'Unknown')}"
             
-            # Both 'name' and 'set_name' are required in the schema
-            set_query = """
-                INSERT INTO question_sets (user_id, name, set_name, jd_id, resume_id, question_count)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """
-            set_id = execute_query(
-                set_query, 
-                (user_id, set_name, set_name, jd_id, resume_id, len(questions_data)),
-                commit=True
+            return QuestionService.save_question_set(
+                user_id, set_name, questions_data, jd_id=jd_id, resume_id=resume_id
             )
             
-            if not set_id:
-                print("[ERROR] Failed to create question set")
-                return None
-            
-            # Sync set_id column with id for code compatibility
-            execute_query(
-                "UPDATE question_sets SET set_id = id WHERE id = %s",
-                (set_id,),
-                commit=True
-            )
-            
-            print(f"[INFO] Created question set with ID: {set_id}")
+        except Exception as e:
+            print(f"[ERROR] Error generating questions: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+    
+    @staticmethod
+    def save_question_set(user_id: int, set_name: str, questions_data: List[Any],
+                          jd_id: Optional[int] = None,
+                          resume_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Save a question set and its questions in one transaction
+        
+        The questions are written with a single executemany (one multi-row
+        INSERT), so a set costs one connection checkout and one commit
+        however many questions it has.
+        
+        Args:
+            user_id: User ID
+            set_name: Name for the question set
+            questions_data: Question dicts (question, type, difficulty,
+                ideal_answer_points, category) or plain question strings
+            jd_id: Optional job description ID
+            resume_id: Optional resume ID
             
-            # 7. Save questions
-            saved_questions = []
-            for q_data in questions_data:
-                question_text = q_data.get('question', '') if isinstance(q_data, dict) else str(q_data)
-                
-                if not question_text:
-                    continue
-                
-                question_type = q_data.get('type', 'behavioral') if isinstance(q_data, dict) else 'behavioral'
-                difficulty = q_data.get('difficulty', 'medium') if isinstance(q_data, dict) else 'medium'
-                ideal_answer_points = json.dumps(q_data.get('ideal_answer_points', [])) if isinstance(q_data, dict) else '[]'
-                
-                question_query = """
-                    INSERT INTO questions 
-                    (question_set_id, set_id, question_text, question_type, difficulty, ideal_answer_points)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                """
-                
-                question_id = execute_query(
-                    question_query,
-                    (set_id, set_id, question_text, question_type, difficulty, ideal_answer_points),
-                    commit=True
+        Returns:
+            Dict with set_id and questions (ids in input order), or None if failed
+        """
+        questions = []
+        for q_data in questions_data:
+            q_data = q_data if isinstance(q_data, dict) else {'question': str(q_data)}
+            if q_data.get('question'):
+                questions.append(q_data)
+        
+        if not questions:
+            print("[ERROR] No questions to save")
+            return None
+        
+        # Both 'name' and 'set_name' are required in the schema
+        set_query = """
+            INSERT INTO question_sets (user_id, name, set_name, jd_id, resume_id, question_count)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """
+        
+        try:
+            with DatabaseManager.transaction() as uow:
+                set_id = uow.insert(
+                    set_query,
+                    (user_id, set_name, set_name, jd_id, resume_id, len(questions)),
+                    legacy_id_table='question_sets'
                 )
-                
-                # Sync question_id column with id for code compatibility
-                if question_id:
-                    execute_query(
-                        "UPDATE questions SET question_id = id WHERE id = %s",
-                        (question_id,),
-                        commit=True
-                    )
-                
-                if question_id:
-                    saved_questions.append({
-                        'question_id': question_id,
-                        'question': question_text,
-                        'difficulty': q_data.get('difficulty', 'medium') if isinstance(q_data, dict) else 'medium',
-                        'category': q_data.get('category', '') if isinstance(q_data, dict) else '',
-                        'ideal_answer_points': q_data.get('ideal_answer_points', []) if isinstance(q_data, dict) else []
-                    })
+                print(f"[INFO] Created question set with ID: {set_id}")
+                question_ids = QuestionService._insert_questions(uow, set_id, questions)
+            QueryCache.get_instance().invalidate('user_question_sets', user_id)
             
+            saved_questions = [
+                {
+                    'question_id': question_id,
+                    'question': q_data['question'],
+                    'difficulty': q_data.get('difficulty', 'medium'),
+                    'category': q_data.get('category', ''),
+                    'ideal_answer_points': q_data.get('ideal_answer_points', [])
+                }
+                for question_id, q_data in zip(question_ids, questions)
+            ]
             print(f"[INFO] Saved {len(saved_questions)} questions")
             
             return {
@@ -175,41 +194,48 @@ class QuestionService:
             }
             
         except Exception as e:
-            print(f"[ERROR] Error generating questions: {e}")
+            print(f"[ERROR] Error saving question set: {e}")
             import traceback
             traceback.print_exc()
             return None
     
+    @staticmethod
+    def _insert_questions(uow: UnitOfWork, set_id: int, questions: List[Dict[str, Any]]) -> List[int]:
+        """Bulk insert questions into a set created in the same unit of work
+        
+        Returns:
+            Question IDs in the order of questions
+        """
+        rows = [
+            (set_id, set_id, q_data['question'],
+             q_data.get('type', 'behavioral'),
+             q_data.get('difficulty', 'medium'),
+             json.dumps(q_data.get('ideal_answer_points', [])))
+            for q_data in questions
+        ]
+        uow.execute_many("""
+            INSERT INTO questions 
+            (question_set_id, set_id, question_text, question_type, difficulty, ideal_answer_points)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """, rows)
+        
+        # The set was created in this transaction, so its rows are exactly the
+        # ones just inserted; ids increase in insert order within the statement
+        inserted = uow.fetch_all(
+            "SELECT id FROM questions WHERE question_set_id = %s ORDER BY id",
+            (set_id,)
+        )
+        return [row['id'] for row in inserted]
+    
     @staticmethod
     def _parse_questions_from_text(response_text: Optional[str]) -> List[Dict[str, Any]]:
         """Extract questions list from a raw LLM response"""
         if not response_text:
             return []
         
-        response_clean = response_text.strip()
-        
-        # Remove markdown code fences
-        if response_clean.startswith("```json"):
-            response_clean = response_clean[7:]
-        if response_clean.startswith("```"):
-            response_clean = response_clean[3:]
-        if response_clean.endswith("```"):
-            response_clean = response_clean[:-3]
-        response_clean = response_clean.strip()
-        
-        if not response_clean:
-            return []
-        
-        # Try to locate a complete JSON block
-        json_block = QuestionService._extract_json_block(response_clean)
-        if not json_block:
-            print("[ERROR] Could not locate JSON block in LLM response")
-            print(f"[DEBUG] Response snippet: {response_text[:500]}")
-            return []
-        
         try:
-            parsed = json.loads(json_block)
-        except json.JSONDecodeError as e:
+            parsed = JSONRecovery.loads(response_text)
+        except JSONRecoveryError as e:
             print(f"[ERROR] Failed to parse LLM response as JSON: {e}")
             print(f"[DEBUG] Response snippet: {response_text[:500]}")
             return []
@@ -226,60 +252,9 @@ class QuestionService:
         print(f"[WARN] Parsed JSON did not contain questions list (type={type(parsed)})")
         return []
     
-    @staticmethod
-    def _extract_json_block(text: str) -> Optional[str]:
-        """Extract the first complete JSON object/array from text"""
-        start_idx = -1
-        opening_char = ''
-        closing_char = ''
-        
-        for i, char in enumerate(text):
-            if char in ['[', '{']:
-                start_idx = i
-                opening_char = char
-                closing_char = ']' if char == '[' else '}'
-                break
-        
-        if start_idx == -1:
-            return None
-        
-        depth = 0
-        in_string = False
-        escape_next = False
-        
-        for i in range(start_idx, len(text)):
-            char = text[i]
-            
-            if escape_next:
-                escape_next = False
-                continue
-            
-            if char == '\\':
-                escape_next = True
-                continue
-            
-            if char == '"':
-                prev_char = text[i-1] if i > 0 else ''
-                if prev_char == '\\':
-                    continue
-                in_string = not in_string
-                continue
-            
-            if in_string:
-                continue
-            
-            if char == opening_char:
-                depth += 1
-            elif char == closing_char:
-                depth -= 1
-                if depth == 0:
-                    return text[start_idx:i+1]
-        
-        return text[start_idx:]  # Return whatever we have (may still fail to parse)
-    
     @staticmethod
     def get_question_sets(user_id: int, limit: int = 20) -> List[Dict]:
-        """Get user's question sets"""
+        """Get user's question sets (cached until the user saves or deletes one)"""
         query = """
         SELECT qs.*, jd.job_title, jd.company_name 
         FROM question_sets qs
@@ -288,17 +263,23 @@ class QuestionService:
         ORDER BY qs.created_at DESC
         LIMIT %s
         """
-        return execute_query(query, (user_id, limit), fetch_all=True) or []
+        return QueryCache.get_instance().get_or_load(
+            'user_question_sets', user_id, limit,
+            lambda: execute_query(query, (user_id, limit), fetch_all=True) or []
+        )
     
     @staticmethod
     def get_questions(set_id: int) -> List[Dict]:
-        """Get questions in a set"""
+        """Get questions in a set (cached; a saved set's questions do not change)"""
         query = """
-        SELECT * FROM questions 
+        SELECT *, id AS question_id FROM questions 
         WHERE set_id = %s 
-        ORDER BY question_id ASC
+        ORDER BY id ASC
         """
-        return execute_query(query, (set_id,), fetch_all=True) or []
+        return QueryCache.get_instance().get_or_load(
+            'questions', set_id, 'all',
+            lambda: execute_query(query, (set_id,), fetch_all=True) or []
+        )
     
     @staticmethod
     def get_question_set_with_questions(set_id: int) -> Optional[Dict]:
@@ -321,6 +302,11 @@ class QuestionService:
             # Questions will be deleted automatically due to CASCADE
             query = "DELETE FROM question_sets WHERE set_id = %s"
             execute_query(query, (set_id,), commit=True)
+            
+            # The owner is not known here, so drop every user's set lists
+            cache = QueryCache.get_instance()
+            cache.invalidate('questions', set_id)
+            cache.invalidate('user_question_sets')
             return True
         except Exception as e:
             print(f"Error deleting question set: {e}")
@@ -5,10 +5,12 @@ import os
 import json
 from datetime import datetime
 from typing import Optional, Dict, List
-from database.connection import execute_query
+from database.connection import DatabaseManager, execute_query
+from database.query_cache import QueryCache
 from core.document_parser import DocumentParser
 from core.text_extractor import TextExtractor
 from core.file_manager import FileManager
+from services.document_feature_service import DocumentFeatureService
 
 class ResumeService:
     """Handle resume operations"""
@@ -35,20 +37,20 @@ class ResumeService:
             if not text:
                 raise ValueError("Could not extract text from resume")
             
-            # Extract information
-            skills = TextExtractor.extract_skills(text)
+            # Extract information (skills/keywords are stored per text for
+            # later comparisons, see DocumentFeatureService)
+            features = DocumentFeatureService.get_features(text)
             email = TextExtractor.extract_email(text)
             phone = TextExtractor.extract_phone(text)
-            years_exp = TextExtractor.extract_years_experience(text)
             education = TextExtractor.extract_education(text)
             
             parsed_data = {
-                'skills': skills,
+                'skills': DocumentFeatureService.skill_names(features),
                 'email': email,
                 'phone': phone,
-                'years_experience': years_exp,
+                'years_experience': features['years_experience'],
                 'education': education,
-                'keywords': TextExtractor.extract_keywords(text)
+                'keywords': [word for word, _ in features['keywords'][:20]]
             }
             
             # Save file
@@ -70,27 +72,24 @@ class ResumeService:
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
             """
             
-            resume_id = execute_query(
-                query,
-                (user_id, display_name, saved_path, file_info['type'], 
-                 text, text, json.dumps(parsed_data), True),
-                commit=True
-            )
-            
-            # Sync resume_id column with id for code compatibility
-            if resume_id:
-                execute_query(
-                    "UPDATE resumes SET resume_id = id WHERE id = %s",
-                    (resume_id,),
-                    commit=True
+            # Insert and deactivation commit together
+            with DatabaseManager.transaction() as uow:
+                resume_id = uow.insert(
+                    query,
+                    (user_id, display_name, saved_path, file_info['type'], 
+                     text, text, json.dumps(parsed_data), True)
+                )
+                
+                # Mark other resumes as inactive
+                uow.execute(
+                    "UPDATE resumes SET is_active = FALSE WHERE user_id = %s AND id != %s",
+                    (user_id, resume_id)
                 )
             
-            # Mark other resumes as inactive
-            execute_query(
-                "UPDATE resumes SET is_active = FALSE WHERE user_id = %s AND resume_id != %s",
-                (user_id, resume_id),
-                commit=True
-            )
+            # The new resume changes the user's lists and every resume's is_active
+            cache = QueryCache.get_instance()
+            cache.invalidate('user_resumes', user_id)
+            cache.invalidate('resumes')
             
             return resume_id
         except Exception as e:
@@ -99,19 +98,55 @@ class ResumeService:
     
     @staticmethod
     def get_active_resume(user_id: int) -> Optional[Dict]:
-        """Get user's active resume"""
+        """Get user's active resume (cached)"""
         query = """
-        SELECT * FROM resumes 
+        SELECT *, id AS resume_id FROM resumes 
         WHERE user_id = %s AND is_active = TRUE 
         ORDER BY uploaded_at DESC LIMIT 1
         """
-        return execute_query(query, (user_id,), fetch_one=True)
+        return QueryCache.get_instance().get_or_load(
+            'user_resumes', user_id, 'active',
+            lambda: execute_query(query, (user_id,), fetch_one=True)
+        )
+    
+    @staticmethod
+    def get_resume_summaries(user_id: int, active_only: bool = False) -> List[Dict]:
+        """Get a user's resumes for lists and dropdowns, newest first
+        
+        Summary variant: metadata only, no extracted text or parsed data.
+        Load those with get_resume_by_id() or get_resume_text() when needed.
+        Cached until the user uploads or deletes a resume.
+        """
+        query = """
+        SELECT id AS resume_id, file_name, file_type, file_size, is_active, uploaded_at
+        FROM resumes 
+        WHERE user_id = %s
+        """
+        if active_only:
+            query += " AND is_active = TRUE"
+        query += " ORDER BY uploaded_at DESC"
+        return QueryCache.get_instance().get_or_load(
+            'user_resumes', user_id, ('summaries', active_only),
+            lambda: execute_query(query, (user_id,), fetch_all=True) or []
+        )
+    
+    @staticmethod
+    def get_resume_text(resume_id: int) -> Optional[str]:
+        """Get a resume's text on demand (resume_text, else the extracted text; cached)"""
+        query = "SELECT resume_text, extracted_text FROM resumes WHERE id = %s"
+        result = QueryCache.get_instance().get_or_load(
+            'resumes', resume_id, 'text',
+            lambda: execute_query(query, (resume_id,), fetch_one=True)
+        )
+        if not result:
+            return None
+        return result.get('resume_text') or result.get('extracted_text') or ''
     
     @staticmethod
     def get_all_resumes(user_id: int) -> List[Dict]:
-        """Get all resumes for user"""
+        """Get all resumes for user with their full text (detail variant)"""
         query = """
-        SELECT * FROM resumes 
+        SELECT *, id AS resume_id FROM resumes 
         WHERE user_id = %s 
         ORDER BY uploaded_at DESC
         """
@@ -119,9 +154,12 @@ class ResumeService:
     
     @staticmethod
     def get_resume_by_id(resume_id: int) -> Optional[Dict]:
-        """Get resume by ID"""
-        query = "SELECT * FROM resumes WHERE resume_id = %s"
-        return execute_query(query, (resume_id,), fetch_one=True)
+        """Get resume by ID (cached)"""
+        query = "SELECT *, id AS resume_id FROM resumes WHERE id = %s"
+        return QueryCache.get_instance().get_or_load(
+            'resumes', resume_id, 'row',
+            lambda: execute_query(query, (resume_id,), fetch_one=True)
+        )
     
     @staticmethod
     def delete_resume(resume_id: int) -> bool:
@@ -134,10 +172,15 @@ class ResumeService:
             
             # Delete from database
             execute_query(
-                "DELETE FROM resumes WHERE resume_id = %s",
+                "DELETE FROM resumes WHERE id = %s",
                 (resume_id,),
                 commit=True
             )
+            
+            cache = QueryCache.get_instance()
+            cache.invalidate('resumes', resume_id)
+            if resume:
+                cache.invalidate('user_resumes', resume['user_id'])
             return True
         except Exception as e:
             print(f"Error deleting resume: {e}")
@@ -147,7 +190,7 @@ class ResumeService:
     def get_user_resumes(user_id: int) -> List[Dict]:
         """Get all active resumes for a user"""
         query = """
-        SELECT * FROM resumes 
+        SELECT *, id AS resume_id FROM resumes 
         WHERE user_id = %s AND is_active = TRUE 
         ORDER BY uploaded_at DESC
         """
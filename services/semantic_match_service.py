@@ -0,0 +1,292 @@
+"""
+Semantic match service - fast resume vs job description fit without the LLM
+
+Middle tier between skill overlap (JSearchService.calculate_compatibility)
+and the full LLM analysis (CompatibilityService.analyze_compatibility):
+resume sections and JD requirement bullets are embedded with the local
+EmbeddingModel, each requirement is scored by its closest resume section,
+and the JD's taxonomy skills are split into matched / missing (directly
+named in the resume, or semantically covered by a resume section).
+
+Embeddings depend only on the segments and the model, so they are stored
+in document_embeddings under the SHA-256 of the segment list behind a
+small in-process LRU; a repeated comparison only runs the similarity math.
+"""
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.embedding_model import EmbeddingModel
+from core.prompt_packer import PromptPacker
+from core.skill_matcher import SkillMatcher
+from database.connection import DatabaseManager, execute_query
+from services.document_feature_service import DocumentFeatureService
+from services.jd_service import JobDescriptionService
+from services.resume_service import ResumeService
+
+# Cosine similarity (MiniLM scale) at which a requirement counts as not
+# covered at all / fully covered by its closest resume section
+SIMILARITY_FLOOR = 0.20
+SIMILARITY_FULL = 0.60
+
+# A JD skill not named in the resume still counts as matched when a resume
+# section is at least this similar to the skill name
+SKILL_SIMILARITY = 0.45
+
+MAX_RESUME_SEGMENTS = 80
+MAX_REQUIREMENTS = 40
+MIN_SEGMENT_CHARS = 15
+SEGMENT_CHARS = 300
+
+_BULLET_RE = re.compile(r"^\s*(?:[-*•·▪●◦–]|\d+[.)])\s+")
+_SENTENCE_RE = re.compile(r"(?<=[.;!?])\s+")
+
+
+class SemanticMatchService:
+    """Embedding-based resume vs job description scoring"""
+    
+    MEMORY_ENTRIES = 256
+    
+    # (segments_hash, model_name) -> embeddings
+    _memory: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+    # model_name -> {skill id: embedding of its name}
+    _skill_vectors: Dict[str, Dict[str, np.ndarray]] = {}
+    _lock = threading.Lock()
+    
+    @staticmethod
+    def warm_up():
+        """Start loading the embedding model in the background"""
+        EmbeddingModel.get_instance().warm_up()
+    
+    @staticmethod
+    def resume_segments(text: Optional[str]) -> List[str]:
+        """Resume sections split into bullets / chunks of at most ~SEGMENT_CHARS
+        
+        Section headings are dropped; a bullet starts a new segment and
+        wrapped lines are joined to the one before.
+        """
+        segments = []
+        for section in PromptPacker.split_sections(text or ""):
+            chunk = ""
+            for line in section.splitlines():
+                bullet = bool(_BULLET_RE.match(line))
+                line = _BULLET_RE.sub("", line).strip()
+                if not line or line.isupper() or line.endswith(":"):
+                    continue
+                if chunk and (bullet or len(chunk) + len(line) > SEGMENT_CHARS):
+                    segments.append(chunk)
+                    chunk = ""
+                chunk = f"{chunk} {line}" if chunk else line
+            if chunk:
+                segments.append(chunk)
+        segments = [segment for segment in dict.fromkeys(segments) if len(segment) >= MIN_SEGMENT_CHARS]
+        return segments[:MAX_RESUME_SEGMENTS]
+    
+    @staticmethod
+    def requirement_bullets(text: Optional[str]) -> List[str]:
+        """JD requirement bullets (bulleted lines; sentences if there are few)"""
+        lines = (text or "").splitlines()
+        bullets = [_BULLET_RE.sub("", line).strip() for line in lines if _BULLET_RE.match(line)]
+        if len(bullets) < 3:
+            bullets = [sentence.strip() for sentence in _SENTENCE_RE.split(" ".join(lines))]
+        bullets = [bullet for bullet in dict.fromkeys(bullets) if len(bullet) >= MIN_SEGMENT_CHARS]
+        return bullets[:MAX_REQUIREMENTS]
+    
+    @staticmethod
+    def match(user_id: int, resume_id: int, jd_id: int) -> Dict[str, Any]:
+        """Quick match of a stored resume against a stored job description
+        
+        Args:
+            user_id: User ID (resume owner)
+            resume_id: Resume ID
+            jd_id: Job description ID
+            
+        Returns:
+            Match dict (see match_texts) or an error dict
+        """
+        try:
+            resume = ResumeService.get_resume_by_id(resume_id)
+            if not resume or resume.get('user_id') != user_id:
+                return {"error": "Resume not found"}
+            resume_text = ResumeService.get_resume_text(resume_id)
+            jd_text = JobDescriptionService.get_jd_text(jd_id)
+            if not resume_text:
+                return {"error": "Resume text not found"}
+            if jd_text is None:
+                return {"error": "Job description not found"}
+            return SemanticMatchService.match_texts(resume_text, jd_text)
+        except Exception as e:
+            print(f"[ERROR] Error in semantic match: {e}")
+            return {"error": str(e)}
+    
+    @staticmethod
+    def match_texts(resume_text: str, jd_text: str) -> Dict[str, Any]:
+        """Score a resume against a job description
+        
+        Args:
+            resume_text: Resume text
+            jd_text: Job description text
+            
+        Returns:
+            {'compatibility_score': 0-100, 'semantic_score' (None without
+             the model), 'skill_score', 'matched_skills', 'missing_skills',
+             'requirements': [{'requirement', 'best_match', 'similarity',
+             'met'}], 'missing_qualifications': unmet requirements, weakest
+             first, 'method': 'semantic' or 'skills', 'model', 'elapsed_ms'}
+        """
+        started = time.perf_counter()
+        resume_features, jd_features = DocumentFeatureService.get_many([resume_text, jd_text])
+        resume_skills = set(resume_features['skills'])
+        jd_skills = jd_features['skills']
+        matched = [skill for skill in jd_skills if skill in resume_skills]
+        missing = [skill for skill in jd_skills if skill not in resume_skills]
+        
+        model = EmbeddingModel.get_instance()
+        segments = SemanticMatchService.resume_segments(resume_text)
+        requirements = SemanticMatchService.requirement_bullets(jd_text)
+        resume_vectors = SemanticMatchService._embeddings(segments)
+        requirement_vectors = SemanticMatchService._embeddings(requirements)
+        
+        semantic_score = None
+        requirement_matches = []
+        if resume_vectors is not None and requirement_vectors is not None and len(segments) and len(requirements):
+            similarity = requirement_vectors @ resume_vectors.T
+            best = similarity.argmax(axis=1)
+            best_similarity = similarity[np.arange(len(requirements)), best]
+            coverage = np.clip((best_similarity - SIMILARITY_FLOOR) / (SIMILARITY_FULL - SIMILARITY_FLOOR), 0.0, 1.0)
+            semantic_score = round(float(coverage.mean()) * 100, 2)
+            requirement_matches = [
+                {
+                    'requirement': requirement,
+                    'best_match': segments[index],
+                    'similarity': round(float(score), 4),
+                    'met': bool(score >= SIMILARITY_FULL)
+                }
+                for requirement, index, score in zip(requirements, best, best_similarity)
+            ]
+            
+            # Skills the resume describes without naming them
+            if missing:
+                skill_vectors = SemanticMatchService._skill_embeddings(missing)
+                if skill_vectors is not None:
+                    covered = (skill_vectors @ resume_vectors.T).max(axis=1) >= SKILL_SIMILARITY
+                    matched += [skill for skill, hit in zip(missing, covered) if hit]
+                    missing = [skill for skill, hit in zip(missing, covered) if not hit]
+        
+        skill_score = round(len(matched) / len(jd_skills) * 100, 2) if jd_skills else None
+        if semantic_score is None:
+            # Same score calculate_compatibility gives (50 when the JD names no skills)
+            compatibility_score = skill_score if skill_score is not None else 50.0
+        elif skill_score is None:
+            compatibility_score = semantic_score
+        else:
+            compatibility_score = round((semantic_score + skill_score) / 2, 2)
+        
+        matcher = SkillMatcher.get_instance()
+        return {
+            'compatibility_score': compatibility_score,
+            'semantic_score': semantic_score,
+            'skill_score': skill_score,
+            'matched_skills': matcher.names(matched),
+            'missing_skills': matcher.names(missing),
+            'requirements': requirement_matches,
+            'missing_qualifications': [
+                item['requirement']
+                for item in sorted(requirement_matches, key=lambda item: item['similarity'])
+                if not item['met']
+            ],
+            'method': 'semantic' if semantic_score is not None else 'skills',
+            'model': model.model_name if semantic_score is not None else None,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 1)
+        }
+    
+    @staticmethod
+    def segments_hash(segments: List[str]) -> str:
+        """SHA-256 hex digest of a segment list (the embeddings' cache key)"""
+        return hashlib.sha256(json.dumps(segments, ensure_ascii=False).encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _embeddings(segments: List[str]) -> Optional[np.ndarray]:
+        """Embeddings of a document's segments (memory, then table, then the model)
+        
+        Keyed on the segments themselves, not the document text: texts
+        that differ only in line breaks segment differently.
+        """
+        model = EmbeddingModel.get_instance()
+        if not model.available:
+            return None
+        key = (SemanticMatchService.segments_hash(segments), model.model_name)
+        with SemanticMatchService._lock:
+            vectors = SemanticMatchService._memory.get(key)
+            if vectors is not None:
+                SemanticMatchService._memory.move_to_end(key)
+                return vectors
+        
+        vectors = SemanticMatchService._load(key)
+        if vectors is None:
+            vectors = model.encode(segments)
+            if vectors is None:
+                return None
+            SemanticMatchService._store(key, vectors)
+        
+        with SemanticMatchService._lock:
+            SemanticMatchService._memory[key] = vectors
+            SemanticMatchService._memory.move_to_end(key)
+            while len(SemanticMatchService._memory) > SemanticMatchService.MEMORY_ENTRIES:
+                SemanticMatchService._memory.popitem(last=False)
+        return vectors
+    
+    @staticmethod
+    def _skill_embeddings(skill_ids: List[str]) -> Optional[np.ndarray]:
+        """Embeddings of skill display names (taxonomy is small; kept in memory)"""
+        model = EmbeddingModel.get_instance()
+        with SemanticMatchService._lock:
+            known = SemanticMatchService._skill_vectors.setdefault(model.model_name, {})
+            new = [skill for skill in skill_ids if skill not in known]
+        if new:
+            vectors = model.encode(SkillMatcher.get_instance().names(new))
+            if vectors is None:
+                return None
+            with SemanticMatchService._lock:
+                known.update(zip(new, vectors))
+        return np.stack([known[skill] for skill in skill_ids])
+    
+    @staticmethod
+    def _load(key: Tuple[str, str]) -> Optional[np.ndarray]:
+        """Stored embeddings for (segments_hash, model_name)"""
+        try:
+            row = execute_query("""
+                SELECT segment_count, dimensions, embeddings FROM document_embeddings
+                WHERE segments_hash = %s AND model_name = %s
+            """, key, fetch_one=True)
+        except Exception as e:
+            print(f"[ERROR] Error loading document embeddings: {e}")
+            return None
+        if not row:
+            return None
+        return np.frombuffer(bytes(row['embeddings']), dtype=np.float32).reshape(
+            row['segment_count'], row['dimensions'])
+    
+    @staticmethod
+    def _store(key: Tuple[str, str], vectors: np.ndarray):
+        """Upsert computed embeddings; a failed write only costs a re-encode later"""
+        segments_hash, model_name = key
+        try:
+            with DatabaseManager.transaction() as uow:
+                uow.execute("""
+                    INSERT INTO document_embeddings
+                    (segments_hash, model_name, segment_count, dimensions, embeddings)
+                    VALUES (%s, %s, %s, %s, %s)
+                    ON DUPLICATE KEY UPDATE
+                        segment_count = VALUES(segment_count), dimensions = VALUES(dimensions),
+                        embeddings = VALUES(embeddings)
+                """, (segments_hash, model_name, vectors.shape[0], vectors.shape[1],
+                      np.ascontiguousarray(vectors, dtype=np.float32).tobytes()))
+        except Exception as e:
+            print(f"[ERROR] Error storing document embeddings: {e}")
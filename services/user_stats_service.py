@@ -0,0 +1,202 @@
+"""
+Per-user dashboard statistics
+
+user_stats holds one row per user with the running totals the home
+dashboard and planner show. Services adjust it inside the transaction that
+changes the underlying rows, so reading the stats is a single primary-key
+lookup; reconcile() recomputes a row from the base tables to correct drift
+(see database/reconcile_user_stats.py).
+"""
+import json
+from typing import Dict, Any, Optional, List
+from database.connection import DatabaseManager, UnitOfWork, execute_query
+
+# Statuses counted as having reached the interview stage
+INTERVIEW_STATUSES = ('interview', 'final_round', 'offer')
+
+
+class UserStatsService:
+    """Maintain and read the user_stats summary table"""
+    
+    @staticmethod
+    def _load_counts(value) -> Dict[str, int]:
+        if not value:
+            return {}
+        if isinstance(value, (bytes, bytearray)):
+            value = value.decode('utf-8')
+        if isinstance(value, str):
+            value = json.loads(value)
+        return {status: int(count) for status, count in value.items()}
+    
+    @staticmethod
+    def _lock_row(uow: UnitOfWork, user_id: int) -> Optional[Dict[str, Any]]:
+        """Create the user's row if missing and lock it for this transaction"""
+        uow.execute("INSERT IGNORE INTO user_stats (user_id) VALUES (%s)", (user_id,))
+        return uow.fetch_one("""
+            SELECT evaluated_sessions, score_sum, application_status_counts
+            FROM user_stats WHERE user_id = %s FOR UPDATE
+        """, (user_id,))
+    
+    @staticmethod
+    def record_session_score(uow: UnitOfWork, user_id: int,
+                             old_score: Optional[float], new_score: Optional[float]):
+        """Apply a practice session's score change to the user's totals
+        
+        Call inside the transaction that updates the session.
+        
+        Args:
+            uow: Open unit of work
+            user_id: Session owner
+            old_score: Score before the update (None if not evaluated yet)
+            new_score: Score after the update (None if cleared)
+        """
+        sessions_delta = (new_score is not None) - (old_score is not None)
+        score_delta = float(new_score or 0) - float(old_score or 0)
+        if not sessions_delta and not score_delta:
+            return
+        UserStatsService._lock_row(uow, user_id)
+        uow.execute("""
+            UPDATE user_stats
+            SET evaluated_sessions = evaluated_sessions + %s,
+                score_sum = score_sum + %s
+            WHERE user_id = %s
+        """, (sessions_delta, score_delta, user_id))
+    
+    @staticmethod
+    def record_application_status(uow: UnitOfWork, user_id: int,
+                                  old_status: Optional[str], new_status: Optional[str]):
+        """Move one application between status counts
+        
+        Call inside the transaction that creates, updates or deletes the
+        application.
+        
+        Args:
+            uow: Open unit of work
+            user_id: Application owner
+            old_status: Status before the change (None for a new application)
+            new_status: Status after the change (None for a deleted application)
+        """
+        if old_status == new_status:
+            return
+        row = UserStatsService._lock_row(uow, user_id)
+        counts = UserStatsService._load_counts(row.get('application_status_counts') if row else None)
+        if old_status:
+            counts[old_status] = counts.get(old_status, 0) - 1
+            if counts[old_status] <= 0:
+                del counts[old_status]
+        if new_status:
+            counts[new_status] = counts.get(new_status, 0) + 1
+        uow.execute(
+            "UPDATE user_stats SET application_status_counts = %s WHERE user_id = %s",
+            (json.dumps(counts), user_id)
+        )
+    
+    @staticmethod
+    def get_stats(user_id: int) -> Dict[str, Any]:
+        """Get a user's dashboard statistics (one row read)
+        
+        Returns:
+            {'practice': {'total_sessions', 'average_score'},
+             'applications': {'total', 'interviews', 'offers', 'interview_rate'},
+             'status_counts': {status: count}}
+        """
+        try:
+            row = execute_query("""
+                SELECT evaluated_sessions, score_sum, application_status_counts
+                FROM user_stats WHERE user_id = %s
+            """, (user_id,), fetch_one=True)
+            if row is None:
+                # No row yet (user predates the table): build it once
+                row = UserStatsService.reconcile(user_id)
+            return UserStatsService._format(row)
+        except Exception as e:
+            print(f"[ERROR] Error reading user stats: {e}")
+            return UserStatsService._format(None)
+    
+    @staticmethod
+    def _format(row: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        row = row or {}
+        sessions = int(row.get('evaluated_sessions') or 0)
+        score_sum = float(row.get('score_sum') or 0)
+        counts = UserStatsService._load_counts(row.get('application_status_counts'))
+        
+        total = sum(counts.values())
+        interviews = sum(counts.get(status, 0) for status in INTERVIEW_STATUSES)
+        return {
+            'practice': {
+                'total_sessions': sessions,
+                'average_score': round(score_sum / sessions, 1) if sessions else 0
+            },
+            'applications': {
+                'total': total,
+                'interviews': interviews,
+                'offers': counts.get('offer', 0),
+                'interview_rate': round(interviews / total * 100, 1) if total else 0
+            },
+            'status_counts': counts
+        }
+    
+    @staticmethod
+    def reconcile(user_id: int) -> Dict[str, Any]:
+        """Recompute a user's row from practice_sessions and applications
+        
+        Locks the row first, so evaluations and status changes committed
+        meanwhile wait and are applied on top of the recomputed totals.
+        
+        Returns:
+            The recomputed row, plus 'drifted' (True if it differed)
+        """
+        with DatabaseManager.transaction() as uow:
+            current = UserStatsService._lock_row(uow, user_id) or {}
+            practice = uow.fetch_one("""
+                SELECT COUNT(*) AS evaluated_sessions, COALESCE(SUM(evaluation_score), 0) AS score_sum
+                FROM practice_sessions
+                WHERE user_id = %s AND evaluation_score IS NOT NULL
+            """, (user_id,))
+            statuses = uow.fetch_all("""
+                SELECT status, COUNT(*) AS count FROM applications
+                WHERE user_id = %s GROUP BY status
+            """, (user_id,))
+            counts = {row['status']: int(row['count']) for row in statuses if row['status']}
+            
+            row = {
+                'evaluated_sessions': int(practice['evaluated_sessions']),
+                'score_sum': float(practice['score_sum']),
+                'application_status_counts': counts
+            }
+            drifted = (
+                int(current.get('evaluated_sessions') or 0) != row['evaluated_sessions']
+                or round(float(current.get('score_sum') or 0), 2) != round(row['score_sum'], 2)
+                or UserStatsService._load_counts(current.get('application_status_counts')) != counts
+            )
+            uow.execute("""
+                UPDATE user_stats
+                SET evaluated_sessions = %s, score_sum = %s,
+                    application_status_counts = %s, reconciled_at = NOW()
+                WHERE user_id = %s
+            """, (row['evaluated_sessions'], row['score_sum'], json.dumps(counts), user_id))
+        return dict(row, drifted=drifted)
+    
+    @staticmethod
+    def reconcile_all(batch_size: int = 500) -> Dict[str, Any]:
+        """Recompute every user's row (one short transaction per user)
+        
+        Returns:
+            {'users': users checked, 'drifted': [user ids whose row was wrong]}
+        """
+        drifted: List[int] = []
+        checked = 0
+        last_id = 0
+        while True:
+            users = execute_query(
+                "SELECT id FROM users WHERE id > %s ORDER BY id LIMIT %s",
+                (last_id, batch_size), fetch_all=True
+            ) or []
+            if not users:
+                break
+            for user in users:
+                if UserStatsService.reconcile(user['id'])['drifted']:
+                    drifted.append(user['id'])
+                checked += 1
+            last_id = users[-1]['id']
+        return {'users': checked, 'drifted': drifted}
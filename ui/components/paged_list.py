@@ -0,0 +1,107 @@
+"""Incrementally loaded list for keyset-paginated service methods"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import flet as ft
+
+
+class PagedList:
+    """List that fetches the next page as the user scrolls near its end
+    
+    fetch_page(cursor) must return {'items': [...], 'next_cursor': str or None},
+    the shape of the services' *_page methods. A "Load more" button stays at
+    the bottom while more pages exist, for lists too short to scroll.
+    """
+    
+    def __init__(self, fetch_page: Callable[[Optional[str]], Dict[str, Any]],
+                 build_item: Callable[[Dict], Optional[ft.Control]],
+                 list_view: Optional[ft.Control] = None,
+                 empty_content: Optional[ft.Control] = None,
+                 threshold: float = 200, **list_view_args):
+        """Initialize list
+        
+        Args:
+            fetch_page: Callable taking a cursor and returning a page
+            build_item: Builds the control for one row (None skips the row)
+            list_view: Existing ListView or scrollable Column to fill
+                (a new ListView is created if None)
+            empty_content: Shown when the first page is empty
+            threshold: Distance from the end (pixels) that triggers the next page
+            **list_view_args: ListView arguments (spacing, height, expand, ...)
+        """
+        self.fetch_page = fetch_page
+        self.build_item = build_item
+        self.empty_content = empty_content
+        self.threshold = threshold
+        self.list_view = list_view or ft.ListView(**list_view_args)
+        self.list_view.on_scroll = self._on_scroll
+        self.next_cursor = None
+        self.item_count = 0
+        self._loading = False
+        self._lock = threading.Lock()
+        self.load_more_button = ft.TextButton(
+            "Load more",
+            icon=ft.Icons.EXPAND_MORE,
+            on_click=lambda e: self.load_more()
+        )
+    
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+    
+    def reload(self):
+        """Clear the list and load the first page"""
+        with self._lock:
+            self.next_cursor = None
+            self.item_count = 0
+            self.list_view.controls.clear()
+        self._load(None)
+    
+    def load_more(self):
+        """Append the next page, if there is one"""
+        if self.has_more:
+            self._load(self.next_cursor)
+    
+    def _load(self, cursor: Optional[str]):
+        with self._lock:
+            # Scroll events arrive in bursts; only one fetch at a time
+            if self._loading:
+                return
+            self._loading = True
+        try:
+            page = self.fetch_page(cursor) or {}
+            controls = self.list_view.controls
+            if self.load_more_button in controls:
+                controls.remove(self.load_more_button)
+            
+            for item in page.get('items') or []:
+                control = self.build_item(item)
+                if control is not None:
+                    controls.append(control)
+                    self.item_count += 1
+            
+            self.next_cursor = page.get('next_cursor')
+            if self.has_more:
+                controls.append(self.load_more_button)
+            elif self.item_count == 0 and self.empty_content is not None:
+                controls.append(self.empty_content)
+        except Exception as e:
+            print(f"[ERROR] Error loading list page: {e}")
+        finally:
+            self._loading = False
+        self.update()
+    
+    def _on_scroll(self, e: ft.OnScrollEvent):
+        if not self.has_more or e.max_scroll_extent is None:
+            return
+        if e.pixels >= e.max_scroll_extent - self.threshold:
+            self.load_more()
+    
+    def update(self):
+        """Refresh the list if it is on the page"""
+        try:
+            self.list_view.update()
+        except Exception:
+            # Not added to the page yet; shown with the parent's next update
+            pass
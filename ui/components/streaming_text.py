@@ -0,0 +1,46 @@
+"""Streamed LLM text rendered into a Text control as it arrives"""
+
+import time
+from typing import Callable, Optional
+
+import flet as ft
+
+
+class StreamingText:
+    """on_token callback that shows streamed text with throttled redraws
+    
+    The Text control is created by create_text() when the first chunk
+    arrives, so views can keep their loading state until then. Tokens can
+    arrive far faster than the UI needs them; refresh() runs at most once
+    per min_interval seconds.
+    """
+    
+    def __init__(self, create_text: Callable[[], ft.Text], refresh: Callable[[], None],
+                 min_interval: float = 0.05):
+        """Initialize streaming text
+        
+        Args:
+            create_text: Builds (and places) the Text control on the first chunk
+            refresh: Redraws the page or the control holding the text
+            min_interval: Minimum seconds between redraws
+        """
+        self.create_text = create_text
+        self.refresh = refresh
+        self.min_interval = min_interval
+        self.text: Optional[ft.Text] = None
+        self.content = ""
+        self._last_update = 0.0
+    
+    @property
+    def started(self) -> bool:
+        return self.text is not None
+    
+    def __call__(self, token: str):
+        if self.text is None:
+            self.text = self.create_text()
+        self.content += token
+        self.text.value = self.content
+        now = time.monotonic()
+        if now - self._last_update >= self.min_interval:
+            self._last_update = now
+            self.refresh()
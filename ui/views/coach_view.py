@@ -4,6 +4,8 @@ import flet as ft
 import re
 from ui.styles.theme import AppTheme
 from ui.components.file_uploader import FileUploadComponent
+from ui.components.paged_list import PagedList
+from ui.components.streaming_text import StreamingText
 from services.coach_service import CoachService
 from services.resume_service import ResumeService
 from services.jd_service import JobDescriptionService
@@ -315,16 +317,34 @@ class CoachView:
         self.messages_container.controls.append(loading_indicator)
         self.page.update()
         
+        # Streamed response bubble, created when the first chunk arrives
+        stream_bubble = None
+        
+        def create_stream_text() -> ft.Text:
+            nonlocal stream_bubble
+            if loading_indicator in self.messages_container.controls:
+                self.messages_container.controls.remove(loading_indicator)
+            stream_bubble = self._add_message("assistant", "", update_page=False)
+            return stream_bubble.content.controls[1]
+        
+        stream = StreamingText(create_stream_text, self.page.update)
+        
         try:
         # Send to coach
-            result = CoachService.chat(self.user_id, self.current_session_id, message_text)
+            result = CoachService.chat(self.user_id, self.current_session_id, message_text,
+                                       on_token=stream)
             
             # Remove loading
             if loading_indicator in self.messages_container.controls:
                 self.messages_container.controls.remove(loading_indicator)
             
             if result and "error" not in result:
-                self._add_message("assistant", result.get('response', 'No response received'))
+                response_text = result.get('response', 'No response received')
+                if stream.started:
+                    # Re-render the streamed plain text with markdown formatting
+                    stream_bubble.content.controls[1] = self._parse_markdown(response_text)
+                else:
+                    self._add_message("assistant", response_text)
             else:
                 error_msg = result.get('error', 'Unknown error') if result else 'No response from service'
                 self._add_message("assistant", f"Sorry, I encountered an error: {error_msg}")
@@ -462,6 +482,7 @@ class CoachView:
         self.messages_container.controls.append(message_container)
         if update_page:
             self.page.update()
+        return message_container
     
     def _get_quick_advice(self, advice_type: str):
         """Get quick advice"""
@@ -594,7 +615,7 @@ class CoachView:
     def _load_latest_session(self):
         """Load the most recent active session if available"""
         try:
-            conversations = CoachService.get_conversations(self.user_id, limit=1)
+            conversations = CoachService.get_conversations_page(self.user_id, limit=1)['items']
             if conversations:
                 latest = conversations[0]
                 session_id = latest.get('conversation_id')
@@ -695,82 +716,20 @@ class CoachView:
             traceback.print_exc()
     
     def _load_previous_sessions(self):
-        """Load and display previous chat sessions"""
+        """Load and display previous chat sessions (more pages load as the list scrolls)"""
         try:
-            conversations = CoachService.get_conversations(self.user_id, limit=10)
-            
-            if not conversations:
-                self.previous_sessions_container.content = ft.Column([
-                    ft.Text("Previous Sessions", size=14, weight=ft.FontWeight.BOLD),
-                    ft.Text("No previous sessions yet", size=12, color="grey", italic=True)
-                ], spacing=5)
-                if hasattr(self, 'page'):
-                    try:
-                        self.previous_sessions_container.update()
-                    except:
-                        pass
-                return
-            
-            session_cards = []
-            for conv in conversations:
-                conversation_id = conv.get('conversation_id')
-                updated_at = conv.get('updated_at')
-                
-                # Get first message for preview
-                messages = CoachService.get_messages(conversation_id)
-                preview = "New conversation"
-                if messages and len(messages) > 0:
-                    first_msg = messages[0].get('content', '')
-                    if first_msg:
-                        preview = first_msg[:50] + "..." if len(first_msg) > 50 else first_msg
-                
-                # Format date
-                date_str = "Recently"
-                if updated_at:
-                    try:
-                        from datetime import datetime
-                        if isinstance(updated_at, str):
-                            dt = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                        else:
-                            dt = updated_at
-                        date_str = dt.strftime("%b %d, %Y")
-                    except:
-                        date_str = str(updated_at)[:10] if updated_at else "Recently"
-                
-                # Create session card
-                is_active = (conversation_id == self.current_session_id)
-                card = ft.Container(
-                    content=ft.Column([
-                        ft.Row([
-                            ft.Text(
-                                f"Session {conversation_id}",
-                                size=12,
-                                weight=ft.FontWeight.BOLD,
-                                color=AppTheme.PRIMARY if is_active else ft.Colors.BLACK
-                            ),
-                            ft.Container(
-                                content=ft.Text("Active", size=10, color=ft.Colors.GREEN, weight=ft.FontWeight.BOLD),
-                                bgcolor=ft.Colors.GREEN_100,
-                                padding=ft.padding.symmetric(4, 8),
-                                border_radius=4,
-                                visible=is_active
-                            )
-                        ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-                        ft.Text(preview, size=11, color="grey", max_lines=2),
-                        ft.Text(date_str, size=10, color="grey", italic=True)
-                    ], spacing=4, tight=True),
-                    padding=10,
-                    border=ft.border.all(1, AppTheme.PRIMARY if is_active else ft.Colors.OUTLINE),
-                    border_radius=6,
-                    bgcolor=ft.Colors.BLUE_50 if is_active else ft.Colors.WHITE,
-                    on_click=lambda e, cid=conversation_id: self._load_session(cid),
-                    ink=True
-                )
-                session_cards.append(card)
+            self.previous_sessions_list = PagedList(
+                lambda cursor: CoachService.get_conversations_page(self.user_id, limit=10, cursor=cursor),
+                self._build_session_card,
+                empty_content=ft.Text("No previous sessions yet", size=12, color="grey", italic=True),
+                spacing=8,
+                height=400
+            )
+            self.previous_sessions_list.reload()
             
             self.previous_sessions_container.content = ft.Column([
                 ft.Text("Previous Sessions", size=14, weight=ft.FontWeight.BOLD),
-                ft.Column(session_cards, spacing=8, scroll=ft.ScrollMode.AUTO, height=400)
+                self.previous_sessions_list.list_view
             ], spacing=8)
             
             if hasattr(self, 'page'):
@@ -784,6 +743,61 @@ class CoachView:
             import traceback
             traceback.print_exc()
     
+    def _build_session_card(self, conv: dict) -> ft.Container:
+        """Build a previous-session card"""
+        conversation_id = conv.get('conversation_id')
+        updated_at = conv.get('updated_at')
+        
+        # Opening message preview comes with the page row
+        preview = "New conversation"
+        first_msg = conv.get('preview')
+        if first_msg:
+            preview = first_msg[:50] + "..." if len(first_msg) > 50 else first_msg
+        
+        # Format date
+        date_str = "Recently"
+        if updated_at:
+            try:
+                from datetime import datetime
+                if isinstance(updated_at, str):
+                    dt = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
+                else:
+                    dt = updated_at
+                date_str = dt.strftime("%b %d, %Y")
+            except:
+                date_str = str(updated_at)[:10] if updated_at else "Recently"
+        
+        # Create session card
+        is_active = (conversation_id == self.current_session_id)
+        card = ft.Container(
+            content=ft.Column([
+                ft.Row([
+                    ft.Text(
+                        f"Session {conversation_id}",
+                        size=12,
+                        weight=ft.FontWeight.BOLD,
+                        color=AppTheme.PRIMARY if is_active else ft.Colors.BLACK
+                    ),
+                    ft.Container(
+                        content=ft.Text("Active", size=10, color=ft.Colors.GREEN, weight=ft.FontWeight.BOLD),
+                        bgcolor=ft.Colors.GREEN_100,
+                        padding=ft.padding.symmetric(4, 8),
+                        border_radius=4,
+                        visible=is_active
+                    )
+                ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                ft.Text(preview, size=11, color="grey", max_lines=2),
+                ft.Text(date_str, size=10, color="grey", italic=True)
+            ], spacing=4, tight=True),
+            padding=10,
+            border=ft.border.all(1, AppTheme.PRIMARY if is_active else ft.Colors.OUTLINE),
+            border_radius=6,
+            bgcolor=ft.Colors.BLUE_50 if is_active else ft.Colors.WHITE,
+            on_click=lambda e, cid=conversation_id: self._load_session(cid),
+            ink=True
+        )
+        return card
+    
     def _load_session(self, conversation_id: int):
         """Load a previous conversation session"""
         try:
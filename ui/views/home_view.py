@@ -2,8 +2,7 @@
 
 import flet as ft
 from ui.styles.theme import AppTheme
-from services.practice_service import PracticeService
-from services.application_service import ApplicationService
+from services.user_stats_service import UserStatsService
 from core.auth import SessionManager
 
 class HomeView:
@@ -15,9 +14,10 @@ class HomeView:
         
     def build(self) -> ft.Container:
         """Build home view"""
-        # Get stats
-        practice_stats = PracticeService.get_session_stats(self.user_id)
-        app_stats = ApplicationService.get_application_stats(self.user_id)
+        # Get stats (one user_stats row)
+        stats = UserStatsService.get_stats(self.user_id)
+        practice_stats = stats['practice']
+        app_stats = stats['applications']
         
         # Header
         header = ft.Container(
@@ -8,6 +8,7 @@ from typing import Dict, List, Optional
 import flet as ft
 from datetime import datetime
 from services.mock_interview_service import MockInterviewService
+from ui.components.paged_list import PagedList
 from services.question_service import QuestionService
 from services.resume_service import ResumeService
 from services.jd_service import JobDescriptionService
@@ -197,8 +198,8 @@ class MockInterviewView:
         )
         
         # Get resumes and JDs
-        resumes = ResumeService.get_all_resumes(self.user_id) or []
-        jds = JobDescriptionService.get_user_job_descriptions(self.user_id) or []
+        resumes = ResumeService.get_resume_summaries(self.user_id) or []
+        jds = JobDescriptionService.get_user_jds(self.user_id, limit=20) or []
         
         resume_dropdown = ft.Dropdown(
             label="Select Resume",
@@ -1032,31 +1033,50 @@ class MockInterviewView:
         self._stop_timer()
         self._stop_recordings()
         MockInterviewService.complete_session(self.current_session_id)
+        if self.session_config.get('feedback_mode', 'post_session') == 'post_session':
+            self.page.run_task(self._evaluate_session, self.current_session_id)
         self._show_analytics(None)
     
+    async def _evaluate_session(self, session_id: int):
+        """Run post-session feedback in the background"""
+        result = await asyncio.to_thread(MockInterviewService.evaluate_session, session_id)
+        if "error" in result:
+            self._show_error(f"Feedback generation failed: {result['error']}")
+        elif result.get('evaluated'):
+            self._show_success(f"Feedback ready for {result['evaluated']} answers")
+    
     def _show_analytics(self, e):
         """Show analytics dashboard"""
         self.analytics_active = True
         self.live_session_active = False
         
         # Get user sessions
-        sessions = MockInterviewService.get_user_sessions(self.user_id, limit=10)
+        sessions_list = self._build_sessions_list(page_size=10)
         
         # Build analytics view
         analytics_content = ft.Column([
             ft.Text("📊 Analytics Dashboard", size=24, weight=ft.FontWeight.BOLD),
             ft.Divider(),
-            ft.Text(f"Total Sessions: {len(sessions)}", size=16),
+            ft.Text(f"Total Sessions: {MockInterviewService.count_user_sessions(self.user_id)}", size=16),
             ft.Divider(),
             ft.Text("Recent Sessions:", size=18, weight=ft.FontWeight.BOLD),
-            ft.Column([
-                self._build_session_card(session) for session in sessions
-            ], spacing=10, scroll=ft.ScrollMode.AUTO)
-        ], spacing=15)
+            sessions_list.list_view
+        ], spacing=15, expand=True)
         
         self.content_area.content = analytics_content
         self.page.update()
     
+    def _build_sessions_list(self, page_size: int = 20) -> PagedList:
+        """Session card list that loads more sessions as it scrolls"""
+        sessions_list = PagedList(
+            lambda cursor: MockInterviewService.get_user_sessions_page(self.user_id, limit=page_size, cursor=cursor),
+            self._build_session_card,
+            spacing=10,
+            expand=True
+        )
+        sessions_list.reload()
+        return sessions_list
+    
     def _build_session_card(self, session: Dict) -> ft.Container:
         """Build a session card for display"""
         session_name = session.get('session_name', 'Unnamed Session')
@@ -1088,17 +1108,15 @@ class MockInterviewView:
     
     def _show_library(self, e):
         """Show practice library"""
-        sessions = MockInterviewService.get_user_sessions(self.user_id)
+        sessions_list = self._build_sessions_list()
         
         library_content = ft.Column([
             ft.Text("📚 Practice Library", size=24, weight=ft.FontWeight.BOLD),
             ft.Divider(),
-            ft.Text(f"Total Sessions: {len(sessions)}", size=16),
+            ft.Text(f"Total Sessions: {MockInterviewService.count_user_sessions(self.user_id)}", size=16),
             ft.Divider(),
-            ft.Column([
-                self._build_session_card(session) for session in sessions
-            ], spacing=10, scroll=ft.ScrollMode.AUTO)
-        ], spacing=15)
+            sessions_list.list_view
+        ], spacing=15, expand=True)
         
         self.content_area.content = library_content
         self.page.update()
@@ -1,8 +1,10 @@
 """Job opportunities view with JSearch integration"""
 
+import asyncio
 import flet as ft
 from ui.styles.theme import AppTheme
 from ui.components.job_card import JobCard
+from ui.components.paged_list import PagedList
 from services.jsearch_service import JSearchService
 from services.resume_service import ResumeService
 from services.jd_service import JobDescriptionService
@@ -53,6 +55,13 @@ class OpportunitiesView:
             style=ft.ButtonStyle(bgcolor=AppTheme.PRIMARY, color="white")
         )
         
+        self.best_matches_button = ft.OutlinedButton(
+            text="Best Matches",
+            icon=ft.Icons.STAR,
+            tooltip="Rank the jobs from your saved searches against your resume",
+            on_click=self._on_best_matches
+        )
+        
         search_section = ft.Container(
             content=ft.Column([
                 ft.Row([
@@ -61,7 +70,8 @@ class OpportunitiesView:
                 ], spacing=12),
                 ft.Row([
                     self.remote_only_checkbox,
-                    self.search_button
+                    self.search_button,
+                    self.best_matches_button
                 ], spacing=12)
             ], spacing=12),
             **AppTheme.card_style()
@@ -145,8 +155,12 @@ class OpportunitiesView:
         self.search_button.disabled = True
         self.page.update()
         
+        self.page.run_task(self._run_search, query, location, remote_only)
+    
+    async def _run_search(self, query: str, location: str, remote_only: bool):
+        """Search jobs and display results without blocking the UI"""
         # Search jobs
-        result = JSearchService.search_jobs(
+        result = await JSearchService.asearch_jobs(
             query=query,
             location=location or "",
             remote_only=remote_only,
@@ -178,9 +192,10 @@ class OpportunitiesView:
             return
         
         # Rank by compatibility if user has resume
-        resume = ResumeService.get_active_resume(self.user_id)
+        resume = await asyncio.to_thread(ResumeService.get_active_resume, self.user_id)
         if resume and resume.get('resume_text'):
-            jobs = JSearchService.rank_jobs_by_compatibility(
+            jobs = await asyncio.to_thread(
+                JSearchService.rank_jobs_by_compatibility,
                 jobs,
                 resume['resume_text'],
                 self.user_id
@@ -208,6 +223,68 @@ class OpportunitiesView:
         
         self.page.update()
     
+    def _on_best_matches(self, e):
+        """Handle best matches from saved searches"""
+        self.loading_indicator.visible = True
+        self.results_container.controls.clear()
+        self.results_title.value = "Ranking your saved jobs..."
+        self.results_wrapper.visible = True
+        self.best_matches_button.disabled = True
+        self.page.update()
+        
+        self.page.run_task(self._run_best_matches)
+    
+    async def _run_best_matches(self):
+        """Rank the jobs cached by this user's searches without blocking the UI"""
+        resume = await asyncio.to_thread(ResumeService.get_active_resume, self.user_id)
+        jobs = []
+        if resume and resume.get('resume_text'):
+            jobs = await asyncio.to_thread(self._load_best_matches, resume['resume_text'])
+        
+        # Hide loading
+        self.loading_indicator.visible = False
+        self.best_matches_button.disabled = False
+        
+        if not resume or not resume.get('resume_text'):
+            self.results_title.value = "No active resume"
+            self.results_container.controls.append(
+                ft.Text("Upload a resume to rank your saved jobs", color="grey")
+            )
+            self.page.update()
+            return
+        
+        if not jobs:
+            self.results_title.value = "No saved jobs to rank"
+            self.results_container.controls.append(
+                ft.Text("Jobs from your searches will appear here", color="grey")
+            )
+            self.page.update()
+            return
+        
+        self.current_jobs = jobs
+        self.results_title.value = f"Top {len(jobs)} matches from your saved searches"
+        
+        for job in jobs:
+            job_card = JobCard.build(
+                job=job,
+                on_save=self._on_save_job,
+                on_view_details=self._on_view_job_details,
+                on_show_details=self._show_job_details_dialog
+            )
+            self.results_container.controls.append(job_card)
+        
+        self.page.update()
+    
+    def _load_best_matches(self, resume_text: str, top_k: int = 20) -> list:
+        """Best cached jobs for the resume, loaded in full for the job cards"""
+        jobs = []
+        for ranked in JSearchService.rank_cached_jobs(resume_text, top_k=top_k, user_id=self.user_id):
+            job = JSearchService.get_job_by_id(ranked['job_id'])
+            if job:
+                job['compatibility_score'] = ranked['compatibility_score']
+                jobs.append(job)
+        return jobs
+    
     def _on_save_job(self, job: dict):
         """Handle save job button - saves as JD"""
         self._save_job_from_dialog(job, None)
@@ -499,70 +576,20 @@ class OpportunitiesView:
             self.page.launch_url(url)
     
     def _load_search_history(self):
-        """Load and display search history"""
+        """Load and display search history (more pages load as the list scrolls)"""
         try:
-            history = JSearchService.get_search_history(self.user_id, limit=5)
-            
-            if not history:
-                self.search_history_container.content = ft.Column([
-                    ft.Text("Recent Searches", size=14, weight=ft.FontWeight.BOLD),
-                    ft.Text("No recent searches", size=12, color="grey", italic=True)
-                ], spacing=5)
-                if hasattr(self, 'page'):
-                    try:
-                        self.search_history_container.update()
-                    except:
-                        pass
-                return
-            
-            history_cards = []
-            for search in history:
-                query = search.get('search_query', '')
-                location = search.get('location', '')
-                remote = search.get('remote_only', False)
-                results_count = search.get('results_count', 0)
-                searched_at = search.get('searched_at', '')
-                
-                # Format date
-                date_str = "Recently"
-                if searched_at:
-                    try:
-                        from datetime import datetime
-                        if isinstance(searched_at, str):
-                            dt = datetime.fromisoformat(searched_at.replace('Z', '+00:00'))
-                        else:
-                            dt = searched_at
-                        date_str = dt.strftime("%b %d, %Y")
-                    except:
-                        date_str = str(searched_at)[:10] if searched_at else "Recently"
-                
-                # Build search text
-                search_text = query
-                if location:
-                    search_text += f" in {location}"
-                if remote:
-                    search_text += " (Remote)"
-                
-                card = ft.Container(
-                    content=ft.Column([
-                        ft.Text(search_text, size=12, weight=ft.FontWeight.BOLD, max_lines=2),
-                        ft.Row([
-                            ft.Text(f"{results_count} results", size=10, color="grey"),
-                            ft.Text(date_str, size=10, color="grey", italic=True)
-                        ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
-                    ], spacing=4, tight=True),
-                    padding=10,
-                    border=ft.border.all(1, ft.Colors.OUTLINE),
-                    border_radius=6,
-                    bgcolor=ft.Colors.WHITE,
-                    on_click=lambda e, q=query, loc=location, rem=remote: self._reuse_search(q, loc, rem),
-                    ink=True
-                )
-                history_cards.append(card)
+            self.search_history_list = PagedList(
+                lambda cursor: JSearchService.get_search_history_page(self.user_id, limit=5, cursor=cursor),
+                self._build_search_history_card,
+                empty_content=ft.Text("No recent searches", size=12, color="grey", italic=True),
+                spacing=8,
+                height=200
+            )
+            self.search_history_list.reload()
             
             self.search_history_container.content = ft.Column([
                 ft.Text("Recent Searches", size=14, weight=ft.FontWeight.BOLD),
-                ft.Column(history_cards, spacing=8, scroll=ft.ScrollMode.AUTO, height=200)
+                self.search_history_list.list_view
             ], spacing=8)
             
             if hasattr(self, 'page'):
@@ -576,6 +603,51 @@ class OpportunitiesView:
             import traceback
             traceback.print_exc()
     
+    def _build_search_history_card(self, search: dict) -> ft.Container:
+        """Build a recent-search card"""
+        query = search.get('search_query', '')
+        location = search.get('location', '')
+        remote = search.get('remote_only', False)
+        results_count = search.get('results_count', 0)
+        searched_at = search.get('searched_at', '')
+        
+        # Format date
+        date_str = "Recently"
+        if searched_at:
+            try:
+                from datetime import datetime
+                if isinstance(searched_at, str):
+                    dt = datetime.fromisoformat(searched_at.replace('Z', '+00:00'))
+                else:
+                    dt = searched_at
+                date_str = dt.strftime("%b %d, %Y")
+            except:
+                date_str = str(searched_at)[:10] if searched_at else "Recently"
+        
+        # Build search text
+        search_text = query
+        if location:
+            search_text += f" in {location}"
+        if remote:
+            search_text += " (Remote)"
+        
+        card = ft.Container(
+            content=ft.Column([
+                ft.Text(search_text, size=12, weight=ft.FontWeight.BOLD, max_lines=2),
+                ft.Row([
+                    ft.Text(f"{results_count} results", size=10, color="grey"),
+                    ft.Text(date_str, size=10, color="grey", italic=True)
+                ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
+            ], spacing=4, tight=True),
+            padding=10,
+            border=ft.border.all(1, ft.Colors.OUTLINE),
+            border_radius=6,
+            bgcolor=ft.Colors.WHITE,
+            on_click=lambda e, q=query, loc=location, rem=remote: self._reuse_search(q, loc, rem),
+            ink=True
+        )
+        return card
+    
     def _reuse_search(self, query: str, location: str, remote_only: bool):
         """Reuse a previous search"""
         self.search_query.value = query
@@ -4,6 +4,8 @@ import flet as ft
 from typing import Optional, List, Dict
 from services.application_service import ApplicationService
 from services.jsearch_service import JSearchService
+from services.user_stats_service import UserStatsService
+from ui.components.paged_list import PagedList
 from core.auth import SessionManager
 from datetime import datetime
 
@@ -85,11 +87,13 @@ class PlannerView:
     
     def _build_stats_row(self) -> ft.Row:
         """Build stats row with current data"""
-        stats = ApplicationService.get_stats_by_status(self.user_id)
-        total_stats = ApplicationService.get_application_stats(self.user_id)
+        # One user_stats row holds both the per-status counts and the totals
+        user_stats = UserStatsService.get_stats(self.user_id)
+        stats = user_stats['status_counts']
+        total_stats = user_stats['applications']
         
         # Count saved jobs from job search
-        saved_jobs_count = len(JSearchService.get_saved_jobs(self.user_id) or [])
+        saved_jobs_count = len(JSearchService.get_saved_job_summaries(self.user_id) or [])
         total_saved = stats.get('saved', 0) + saved_jobs_count
         
         return ft.Row([
@@ -137,38 +141,21 @@ class PlannerView:
         print(f"[DEBUG] Loading applications for user_id={self.user_id}, status={status}")
         
         try:
-            apps = ApplicationService.get_applications(self.user_id, status)
-            print(f"[DEBUG] get_applications returned {len(apps) if apps else 0} applications")
-            
-            # If status is 'saved', also include saved jobs from job search
-            if status == 'saved' or status is None:
-                saved_jobs = self._load_saved_jobs()
-                print(f"[DEBUG] Found {len(saved_jobs)} saved jobs from job search")
-                
-                # Convert saved jobs to application format and add to apps list
-                for job in saved_jobs:
-                    app_from_job = self._convert_job_to_application(job)
-                    if app_from_job:
-                        apps.append(app_from_job)
-            
-            if not apps:
-                self.applications_container.controls.append(
-                    ft.Container(
-                        content=ft.Column([
-                            ft.Icon(ft.Icons.INBOX, size=64, color="grey"),
-                            ft.Text("No applications yet", size=18, color="grey"),
-                            ft.Text("Click 'New Application' to track your first job application", size=14, color="grey"),
-                        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=10),
-                        alignment=ft.alignment.center,
-                        padding=50
-                    )
+            self.applications_pager = PagedList(
+                lambda cursor: self._fetch_applications_page(status, cursor),
+                self.build_application_card,
+                list_view=self.applications_container,
+                empty_content=ft.Container(
+                    content=ft.Column([
+                        ft.Icon(ft.Icons.INBOX, size=64, color="grey"),
+                        ft.Text("No applications yet", size=18, color="grey"),
+                        ft.Text("Click 'New Application' to track your first job application", size=14, color="grey"),
+                    ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=10),
+                    alignment=ft.alignment.center,
+                    padding=50
                 )
-            else:
-                for app in apps:
-                    print(f"[DEBUG] Building card for app_id={app.get('application_id')}, company={app.get('company_name')}")
-                    self.applications_container.controls.append(
-                        self.build_application_card(app)
-                    )
+            )
+            self.applications_pager.reload()
         except Exception as e:
             print(f"[ERROR] Error loading applications: {e}")
             import traceback
@@ -182,10 +169,30 @@ class PlannerView:
         
         self.page.update()
     
+    def _fetch_applications_page(self, status: Optional[str], cursor: Optional[str]) -> Dict:
+        """Fetch one page of application cards
+        
+        Saved jobs from job search are listed after the last page of
+        applications when showing 'saved' or all statuses.
+        """
+        page = ApplicationService.get_applications_page(self.user_id, status, limit=20, cursor=cursor)
+        print(f"[DEBUG] get_applications_page returned {len(page['items'])} applications")
+        
+        if page['next_cursor'] is None and (status == 'saved' or status is None):
+            saved_jobs = self._load_saved_jobs()
+            print(f"[DEBUG] Found {len(saved_jobs)} saved jobs from job search")
+            
+            # Convert saved jobs to application format and add to the last page
+            for job in saved_jobs:
+                app_from_job = self._convert_job_to_application(job)
+                if app_from_job:
+                    page['items'].append(app_from_job)
+        return page
+    
     def _load_saved_jobs(self) -> List[Dict]:
         """Load saved jobs from job search"""
         try:
-            saved_jobs = JSearchService.get_saved_jobs(self.user_id)
+            saved_jobs = JSearchService.get_saved_job_summaries(self.user_id)
             return saved_jobs or []
         except Exception as e:
             print(f"[ERROR] Error loading saved jobs: {e}")
@@ -208,7 +215,6 @@ class PlannerView:
                 'job_url': job.get('job_url', ''),
                 'salary_min': job.get('salary_min'),
                 'salary_max': job.get('salary_max'),
-                'description': job.get('description', ''),
                 'applied_date': None,
                 'interview_date': None,
                 'notes': f"Saved from job search",
@@ -672,6 +678,11 @@ class PlannerView:
     
     def show_edit_dialog(self, app: dict):
         """Show dialog to edit application"""
+        # List cards only carry a notes preview; edit the full row
+        full_app = ApplicationService.get_application_by_id(app.get('application_id'))
+        if full_app:
+            app = full_app
+        
         def format_date_for_input(date_value):
             if not date_value:
                 return ""
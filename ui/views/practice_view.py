@@ -9,6 +9,7 @@ from services.question_service import QuestionService
 from core.auth import SessionManager
 from core.recording_service import AudioRecorder, VideoRecorder
 from ui.styles.theme import AppTheme
+from ui.components.paged_list import PagedList
 from config.settings import Settings
 
 class PracticeView:
@@ -40,6 +41,7 @@ class PracticeView:
         self.evaluation_container = None
         self.sessions_container = None
         self.sessions_list = None
+        self.sessions_pager = None
         self.skill_focus_field = None
         self.question_card = None
         self.video_audio_recorder = None
@@ -1063,18 +1065,18 @@ class PracticeView:
         self._update_question_card()
     
     def _load_previous_sessions(self):
-        """Load previous practice sessions"""
+        """Load previous practice sessions (more pages load as the list scrolls)"""
         try:
-            sessions = PracticeService.get_sessions(self.user_id, limit=10) or []
-            
             if not self.sessions_list:
                 return
             
-            self.sessions_list.controls.clear()
-            
-            if not sessions:
-                self.sessions_list.controls.append(
-                    ft.Container(
+            # build() creates a new list each time the view is shown
+            if not self.sessions_pager or self.sessions_pager.list_view is not self.sessions_list:
+                self.sessions_pager = PagedList(
+                    lambda cursor: PracticeService.get_sessions_page(self.user_id, limit=10, cursor=cursor),
+                    self._build_session_card,
+                    list_view=self.sessions_list,
+                    empty_content=ft.Container(
                         content=ft.Column([
                             ft.Text("No previous sessions", size=14, color="grey", italic=True),
                             ft.Text("Complete a practice to see it here.", size=11, color="grey")
@@ -1083,77 +1085,73 @@ class PracticeView:
                         alignment=ft.alignment.center
                     )
                 )
-                self.sessions_list.update()
-                return
-            
-            session_cards = []
-            for session in sessions:
-                question_text = session.get('question_text', 'Unknown question')
-                score = session.get('evaluation_score')
-                session_date = session.get('session_date')
-                
-                # Format date
-                date_str = "Unknown date"
-                if session_date:
-                    if isinstance(session_date, str):
-                        try:
-                            dt = datetime.fromisoformat(session_date.replace('Z', '+00:00'))
-                            date_str = dt.strftime("%Y-%m-%d %H:%M")
-                        except:
-                            date_str = session_date[:16]
-                    elif isinstance(session_date, datetime):
-                        date_str = session_date.strftime("%Y-%m-%d %H:%M")
-                
-                # Score display
-                score_text = ""
-                if score is not None:
-                    score_color = ft.Colors.GREEN if score >= 70 else ft.Colors.ORANGE if score >= 50 else ft.Colors.RED
-                    score_text = ft.Text(
-                        f"Score: {score}/100",
-                        size=12,
-                        weight=ft.FontWeight.BOLD,
-                        color=score_color
-                    )
-                else:
-                    score_text = ft.Text("Not evaluated", size=12, color="grey", italic=True)
-                
-                card = ft.Container(
-                    content=ft.Column([
-                        ft.Text(
-                            question_text[:60] + ('...' if len(question_text) > 60 else ''),
-                            size=12,
-                            weight=ft.FontWeight.BOLD,
-                            max_lines=2
-                        ),
-                        ft.Text(date_str, size=10, color="grey"),
-                        score_text,
-                        ft.ElevatedButton(
-                            "View Details",
-                            icon=ft.Icons.VISIBILITY,
-                            on_click=lambda e, sid=session['session_id']: self._view_session_details(sid),
-                            style=ft.ButtonStyle(
-                                bgcolor=ft.Colors.PRIMARY,
-                                color=ft.Colors.WHITE
-                            ),
-                            height=30
-                        )
-                    ], spacing=5, tight=True),
-                    padding=10,
-                    bgcolor=ft.Colors.SURFACE,
-                    border_radius=8,
-                    border=ft.border.all(1, ft.Colors.OUTLINE),
-                    width=320
-                )
-                session_cards.append(card)
-            
-            self.sessions_list.controls.extend(session_cards)
-            self.sessions_list.update()
+            self.sessions_pager.reload()
             
         except Exception as ex:
             print(f"[ERROR] Error loading previous sessions: {ex}")
             import traceback
             traceback.print_exc()
     
+    def _build_session_card(self, session: dict) -> ft.Container:
+        """Build a previous-session card"""
+        question_text = session.get('question_text') or 'Unknown question'
+        score = session.get('evaluation_score')
+        session_date = session.get('session_date')
+        
+        # Format date
+        date_str = "Unknown date"
+        if session_date:
+            if isinstance(session_date, str):
+                try:
+                    dt = datetime.fromisoformat(session_date.replace('Z', '+00:00'))
+                    date_str = dt.strftime("%Y-%m-%d %H:%M")
+                except:
+                    date_str = session_date[:16]
+            elif isinstance(session_date, datetime):
+                date_str = session_date.strftime("%Y-%m-%d %H:%M")
+        
+        # Score display
+        score_text = ""
+        if score is not None:
+            score_color = ft.Colors.GREEN if score >= 70 else ft.Colors.ORANGE if score >= 50 else ft.Colors.RED
+            score_text = ft.Text(
+                f"Score: {score}/100",
+                size=12,
+                weight=ft.FontWeight.BOLD,
+                color=score_color
+            )
+        else:
+            score_text = ft.Text("Not evaluated", size=12, color="grey", italic=True)
+        
+        card = ft.Container(
+            content=ft.Column([
+                ft.Text(
+                    question_text[:60] + ('...' if len(question_text) > 60 else ''),
+                    size=12,
+                    weight=ft.FontWeight.BOLD,
+                    max_lines=2
+                ),
+                ft.Text(date_str, size=10, color="grey"),
+                score_text,
+                ft.ElevatedButton(
+                    "View Details",
+                    icon=ft.Icons.VISIBILITY,
+                    on_click=lambda e, sid=session['session_id']: self._view_session_details(sid),
+                    style=ft.ButtonStyle(
+                        bgcolor=ft.Colors.PRIMARY,
+                        color=ft.Colors.WHITE
+                    ),
+                    height=30
+                )
+            ], spacing=5, tight=True),
+            padding=10,
+            bgcolor=ft.Colors.SURFACE,
+            border_radius=8,
+            border=ft.border.all(1, ft.Colors.OUTLINE),
+            width=320
+        )
+        return card
+    
     def _view_session_details(self, session_id: int):
         """View session details in a dialog"""
         try:
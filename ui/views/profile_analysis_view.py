@@ -1,13 +1,16 @@
 """Profile analysis view - Resume vs JD compatibility"""
 
+import asyncio
 import json
 import flet as ft
 from ui.styles.theme import AppTheme
 from ui.components.file_uploader import FileUploadComponent
 from ui.components.score_card import ScoreCard
+from ui.components.paged_list import PagedList
 from services.resume_service import ResumeService
 from services.jd_service import JobDescriptionService
 from services.compatibility_service import CompatibilityService
+from services.semantic_match_service import SemanticMatchService
 from core.auth import SessionManager
 from datetime import datetime
 
@@ -21,6 +24,7 @@ class ProfileAnalysisView:
         self.resume_id = None
         self.jd_id = None
         self.analysis_result = None
+        self.analysis_running = False
         
         # Initialize file uploaders
         self.resume_uploader = None
@@ -34,6 +38,9 @@ class ProfileAnalysisView:
         
     def build(self) -> ft.Container:
         """Build profile analysis view"""
+        # Load the embedding model now so the quick match is ready when needed
+        SemanticMatchService.warm_up()
+        
         # Header
         header = ft.Container(
             content=ft.Row([
@@ -306,129 +313,21 @@ class ProfileAnalysisView:
         self.page.update()
     
     def _load_previous_analyses(self):
-        """Load and display previous analyses"""
+        """Load and display previous analyses (more pages load as the list scrolls)"""
         try:
-            analyses = CompatibilityService.get_recent_analyses(self.user_id, limit=5)
-            
-            if not analyses:
-                self.previous_analyses_container.content = ft.Column([
-                    ft.Text("Previous Analyses", size=14, weight=ft.FontWeight.BOLD),
-                    ft.Text("No previous analyses yet", size=12, color="grey", italic=True)
-                ], spacing=5)
-                return
-            
-            analysis_cards = []
-            for analysis in analyses:
-                score = analysis.get('compatibility_score') or 0
-                if score is None:
-                    score = 0
-                
-                # Get resume name - the query returns it as 'resume_name' from r.file_name
-                resume_name = analysis.get('resume_name')
-                
-                # Handle None, empty string, or string 'None'
-                if not resume_name or resume_name == 'None' or (isinstance(resume_name, str) and resume_name.strip() == ''):
-                    resume_name = 'Unknown Resume'
-                
-                # Debug logging to see what we're getting
-                print(f"[DEBUG] Analysis {analysis.get('analysis_id')}: resume_name='{resume_name}' (type: {type(resume_name)}), company='{analysis.get('company_name')}'")
-                
-                job_title = analysis.get('job_title')
-                if not job_title or job_title == 'None' or job_title == '':
-                    job_title = 'Job Position'
-                
-                company = analysis.get('company_name')
-                # Only use company if it's a valid non-empty string
-                if not company or company == 'None' or company == '':
-                    company = None  # Don't show company if it's missing
-                
-                analyzed_at = analysis.get('analyzed_at')
-                analysis_id = analysis.get('analysis_id')
-                
-                # Format date
-                date_str = "Recently"
-                if analyzed_at:
-                    try:
-                        if isinstance(analyzed_at, str):
-                            dt = datetime.fromisoformat(analyzed_at.replace('Z', '+00:00'))
-                        else:
-                            dt = analyzed_at
-                        date_str = dt.strftime("%b %d, %Y")
-                    except:
-                        date_str = "Recently"
-                
-                # Skip if no valid analysis_id
-                if not analysis_id:
-                    continue
-                
-                # Build card content - conditionally show company
-                card_content_items = []
-                
-                # Header row with company (if available) or job title, and score
-                if company:
-                    header_row = ft.Row([
-                        ft.Text(company, size=12, weight=ft.FontWeight.BOLD, expand=True),
-                        ft.Container(
-                            content=ft.Text(f"{int(score)}%", size=14, weight=ft.FontWeight.BOLD),
-                            bgcolor=ft.Colors.GREEN_100 if score >= 70 else ft.Colors.ORANGE_100 if score >= 50 else ft.Colors.RED_100,
-                            padding=ft.padding.symmetric(horizontal=8, vertical=4),
-                            border_radius=4
-                        )
-                    ])
-                else:
-                    # No company, show job title in header instead
-                    header_row = ft.Row([
-                        ft.Text(job_title, size=12, weight=ft.FontWeight.BOLD, expand=True),
-                        ft.Container(
-                            content=ft.Text(f"{int(score)}%", size=14, weight=ft.FontWeight.BOLD),
-                            bgcolor=ft.Colors.GREEN_100 if score >= 70 else ft.Colors.ORANGE_100 if score >= 50 else ft.Colors.RED_100,
-                            padding=ft.padding.symmetric(horizontal=8, vertical=4),
-                            border_radius=4
-                        )
-                    ])
-                
-                card_content_items.append(header_row)
-                
-                # Show job title only if we showed company in header
-                if company:
-                    card_content_items.append(ft.Text(job_title, size=11, color="grey600"))
-                
-                # Always show resume name
-                card_content_items.append(ft.Text(f"Resume: {resume_name}", size=11, color=ft.Colors.BLUE_700, weight=ft.FontWeight.W_500))
-                
-                # Date
-                card_content_items.append(ft.Text(date_str, size=10, color="grey", italic=True))
-                
-                # Create card
-                card = ft.Card(
-                    content=ft.Container(
-                        content=ft.Column(card_content_items, spacing=4, tight=True),
-                        padding=10,
-                        on_click=lambda e, aid=analysis_id: self._view_previous_analysis(aid)
-                    ),
-                    elevation=1
-                )
-                analysis_cards.append(card)
+            self.previous_analyses_list = PagedList(
+                lambda cursor: CompatibilityService.get_recent_analyses_page(self.user_id, limit=10, cursor=cursor),
+                self._build_analysis_card,
+                empty_content=ft.Text("No previous analyses yet", size=12, color="grey", italic=True),
+                spacing=5,
+                height=200  # Fixed height for scrollable area
+            )
+            self.previous_analyses_list.reload()
             
-            if not analysis_cards:
-                # No valid cards, show empty message
-                self.previous_analyses_container.content = ft.Column([
-                    ft.Text("Previous Analyses", size=14, weight=ft.FontWeight.BOLD),
-                    ft.Text("No previous analyses yet", size=12, color="grey", italic=True)
-                ], spacing=5)
-            else:
-                # Limit height to prevent overflow
-                cards_column = ft.Column(
-                    analysis_cards, 
-                    spacing=5, 
-                    scroll=ft.ScrollMode.AUTO,
-                    height=200  # Fixed height for scrollable area
-                )
-                
-                self.previous_analyses_container.content = ft.Column([
-                    ft.Text("Previous Analyses", size=14, weight=ft.FontWeight.BOLD),
-                    cards_column
-                ], spacing=8)
+            self.previous_analyses_container.content = ft.Column([
+                ft.Text("Previous Analyses", size=14, weight=ft.FontWeight.BOLD),
+                self.previous_analyses_list.list_view
+            ], spacing=8)
             
             # Only update if container is already on page
             try:
@@ -445,6 +344,99 @@ class ProfileAnalysisView:
                 ft.Text("Error loading analyses", size=12, color="red", italic=True)
             ], spacing=5)
     
+    def _build_analysis_card(self, analysis: dict):
+        """Build a previous-analysis card (None if the row has no ID)"""
+        score = analysis.get('compatibility_score') or 0
+        if score is None:
+            score = 0
+        
+        # Get resume name - the query returns it as 'resume_name' from r.file_name
+        resume_name = analysis.get('resume_name')
+        
+        # Handle None, empty string, or string 'None'
+        if not resume_name or resume_name == 'None' or (isinstance(resume_name, str) and resume_name.strip() == ''):
+            resume_name = 'Unknown Resume'
+        
+        # Debug logging to see what we're getting
+        print(f"[DEBUG] Analysis {analysis.get('analysis_id')}: resume_name='{resume_name}' (type: {type(resume_name)}), company='{analysis.get('company_name')}'")
+        
+        job_title = analysis.get('job_title')
+        if not job_title or job_title == 'None' or job_title == '':
+            job_title = 'Job Position'
+        
+        company = analysis.get('company_name')
+        # Only use company if it's a valid non-empty string
+        if not company or company == 'None' or company == '':
+            company = None  # Don't show company if it's missing
+        
+        analyzed_at = analysis.get('analyzed_at')
+        analysis_id = analysis.get('analysis_id')
+        
+        # Format date
+        date_str = "Recently"
+        if analyzed_at:
+            try:
+                if isinstance(analyzed_at, str):
+                    dt = datetime.fromisoformat(analyzed_at.replace('Z', '+00:00'))
+                else:
+                    dt = analyzed_at
+                date_str = dt.strftime("%b %d, %Y")
+            except:
+                date_str = "Recently"
+        
+        # Skip if no valid analysis_id
+        if not analysis_id:
+            return None
+        
+        # Build card content - conditionally show company
+        card_content_items = []
+        
+        # Header row with company (if available) or job title, and score
+        if company:
+            header_row = ft.Row([
+                ft.Text(company, size=12, weight=ft.FontWeight.BOLD, expand=True),
+                ft.Container(
+                    content=ft.Text(f"{int(score)}%", size=14, weight=ft.FontWeight.BOLD),
+                    bgcolor=ft.Colors.GREEN_100 if score >= 70 else ft.Colors.ORANGE_100 if score >= 50 else ft.Colors.RED_100,
+                    padding=ft.padding.symmetric(horizontal=8, vertical=4),
+                    border_radius=4
+                )
+            ])
+        else:
+            # No company, show job title in header instead
+            header_row = ft.Row([
+                ft.Text(job_title, size=12, weight=ft.FontWeight.BOLD, expand=True),
+                ft.Container(
+                    content=ft.Text(f"{int(score)}%", size=14, weight=ft.FontWeight.BOLD),
+                    bgcolor=ft.Colors.GREEN_100 if score >= 70 else ft.Colors.ORANGE_100 if score >= 50 else ft.Colors.RED_100,
+                    padding=ft.padding.symmetric(horizontal=8, vertical=4),
+                    border_radius=4
+                )
+            ])
+        
+        card_content_items.append(header_row)
+        
+        # Show job title only if we showed company in header
+        if company:
+            card_content_items.append(ft.Text(job_title, size=11, color="grey600"))
+        
+        # Always show resume name
+        card_content_items.append(ft.Text(f"Resume: {resume_name}", size=11, color=ft.Colors.BLUE_700, weight=ft.FontWeight.W_500))
+        
+        # Date
+        card_content_items.append(ft.Text(date_str, size=10, color="grey", italic=True))
+        
+        # Create card
+        card = ft.Card(
+            content=ft.Container(
+                content=ft.Column(card_content_items, spacing=4, tight=True),
+                padding=10,
+                on_click=lambda e, aid=analysis_id: self._view_previous_analysis(aid)
+            ),
+            elevation=1
+        )
+        return card
+    
     def _view_previous_analysis(self, analysis_id: int):
         """Load and display a previous analysis"""
         try:
@@ -750,8 +742,11 @@ class ProfileAnalysisView:
         """Check if ready to analyze"""
         if self.resume_id and self.jd_id:
             self.analyze_button.disabled = False
-            self.analyze_button.text = "🔍 Analyze Compatibility"
+            self.analyze_button.text = "🧠 Detailed AI Analysis"
             self.analyze_button.update()
+            
+            # Quick local match first; the LLM analysis runs only on click
+            self.page.run_task(self._run_quick_match)
         else:
             self.analyze_button.disabled = True
             missing = []
@@ -777,6 +772,7 @@ class ProfileAnalysisView:
             return
         
         # Show loading
+        self.analysis_running = True
         self.analyze_button.disabled = True
         self.analyze_button.text = "⏳ Analyzing... Please wait"
         self.analyze_button.update()
@@ -784,9 +780,32 @@ class ProfileAnalysisView:
         
         print(f"[INFO] Starting compatibility analysis...")
         
+        # Run on the event loop so the UI stays responsive during the LLM call
+        self.page.run_task(self._run_analysis)
+    
+    async def _run_quick_match(self):
+        """Show the fast semantic match for the selected resume and JD"""
+        resume_id, jd_id = self.resume_id, self.jd_id
+        try:
+            result = await asyncio.to_thread(SemanticMatchService.match, self.user_id, resume_id, jd_id)
+            print(f"[INFO] Quick match ({result.get('method')}, {result.get('elapsed_ms')} ms): "
+                  f"{result.get('compatibility_score')}")
+            
+            # Skip if the selection changed or the detailed analysis started meanwhile
+            if (resume_id, jd_id) != (self.resume_id, self.jd_id) or self.analysis_running:
+                return
+            if "error" not in result:
+                self._show_results(result, title="Quick Match")
+            else:
+                print(f"[WARNING] Quick match failed: {result['error']}")
+        except Exception as ex:
+            print(f"[ERROR] Exception during quick match: {ex}")
+    
+    async def _run_analysis(self):
+        """Run compatibility analysis and show results"""
         try:
             # Perform analysis
-            result = CompatibilityService.analyze_compatibility(
+            result = await CompatibilityService.aanalyze_compatibility(
                 self.user_id,
                 self.resume_id,
                 self.jd_id
@@ -830,13 +849,14 @@ class ProfileAnalysisView:
             self.page.update()
         finally:
             # Reset button - update via page, not directly
-            self.analyze_button.text = "🔍 Analyze Compatibility"
+            self.analysis_running = False
+            self.analyze_button.text = "🧠 Detailed AI Analysis"
             self.analyze_button.disabled = False
             # Don't call update() directly on button - update page instead
             self.page.update()
     
-    def _show_results(self, result: dict):
-        """Display analysis results"""
+    def _show_results(self, result: dict, title: str = "Results"):
+        """Display analysis results (LLM analysis or quick match)"""
         print(f"[DEBUG] _show_results called with result keys: {result.keys()}")
         score = result.get('compatibility_score', 0)
         print(f"[DEBUG] Compatibility score: {score}")
@@ -923,6 +943,11 @@ class ProfileAnalysisView:
                     border=ft.border.only(bottom=ft.BorderSide(1, ft.Colors.GREY_300))
                 ) for s in suggestions[:10]  # Show up to 10 suggestions
             ]
+        elif result.get('method'):
+            # Quick match: strengths and suggestions come from the LLM analysis
+            suggestion_items = [
+                ft.Text("Run the detailed AI analysis for strengths and suggestions", color="grey", italic=True)
+            ]
         else:
             suggestion_items = [
                 ft.Text("No suggestions available", color="grey", italic=True)
@@ -952,7 +977,7 @@ class ProfileAnalysisView:
         # Build results content, filtering out None values
         print(f"[DEBUG] Building results_items, matched_chips type: {type(matched_chips)}, missing_chips type: {type(missing_chips)}")
         results_items = [
-            ft.Text("Results", size=20, weight=ft.FontWeight.BOLD),
+            ft.Text(title, size=20, weight=ft.FontWeight.BOLD),
             score_card,
             ft.Divider(height=1),
             ft.Text("Matched Skills", size=14, weight=ft.FontWeight.BOLD),
@@ -14,12 +14,15 @@ class QuestionsView:
         self.user_id = SessionManager.get_user_id()
         self.current_questions = []
         self.jd_dropdown = None  # Will be set in build
+        # Inputs already generated once; generating them again asks for
+        # new questions instead of the cached ones
+        self.generated_requests = set()
         
     def _refresh_jd_dropdown(self):
         """Refresh JD dropdown with latest JDs"""
         if self.jd_dropdown:
             from services.jd_service import JobDescriptionService
-            jds = JobDescriptionService.get_user_job_descriptions(self.user_id) or []
+            jds = JobDescriptionService.get_user_jds(self.user_id, limit=20) or []
             self.jd_dropdown.options = [
                 ft.dropdown.Option(str(jd['jd_id']), jd.get('job_title', 'Job')) 
                 for jd in jds
@@ -46,9 +49,9 @@ class QuestionsView:
             padding=ft.padding.only(bottom=20)
         )
         
-        # Get resumes and JDs - use get_all_resumes to show all resumes, not just active ones
-        resumes = ResumeService.get_all_resumes(self.user_id) or []
-        jds = JobDescriptionService.get_user_job_descriptions(self.user_id) or []
+        # Get resumes and JDs - use get_resume_summaries to show all resumes, not just active ones
+        resumes = ResumeService.get_resume_summaries(self.user_id) or []
+        jds = JobDescriptionService.get_user_jds(self.user_id, limit=20) or []
         
         # Form controls
         self.resume_dropdown = ft.Dropdown(
@@ -193,13 +196,18 @@ class QuestionsView:
         self.page.update()
         
         # Generate questions
+        request = (int(self.resume_dropdown.value), int(self.jd_dropdown.value),
+                   self.type_dropdown.value, int(self.count_slider.value))
         result = QuestionService.generate_questions(
             user_id=self.user_id,
-            resume_id=int(self.resume_dropdown.value),
-            jd_id=int(self.jd_dropdown.value),
-            question_type=self.type_dropdown.value,
-            count=int(self.count_slider.value)
+            resume_id=request[0],
+            jd_id=request[1],
+            question_type=request[2],
+            count=request[3],
+            use_cache=request not in self.generated_requests
         )
+        if result and result.get('questions'):
+            self.generated_requests.add(request)
         
         # Display results
         self.questions_container.controls.clear()
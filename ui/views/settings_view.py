@@ -3,7 +3,7 @@
 import flet as ft
 from ui.styles.theme import AppTheme
 from services.llm_service import LLMService
-from ai.providers.ollama_provider import OllamaProvider
+from ai.providers import ProviderRegistry
 from core.auth import SessionManager
 from config.settings import Settings
 
@@ -296,7 +296,7 @@ class SettingsView:
             # Try to get available models from Ollama
             try:
                 base_url = self.endpoint_field.value if self.endpoint_field.value else Settings.OLLAMA_BASE_URL
-                ollama = OllamaProvider(base_url=base_url)
+                ollama = ProviderRegistry.create('ollama', "llama3.2", endpoint_url=base_url)
                 models = ollama.list_models()
                 if models:
                     self.model_dropdown.options = [
@@ -416,28 +416,20 @@ class SettingsView:
                 return
             
             # Create provider instance with form values
-            from ai.providers import OpenAIProvider, AnthropicProvider, BedrockProvider, OllamaProvider
-            
-            if provider == 'openai':
-                test_provider = OpenAIProvider(
-                    api_key=api_key,
-                    model_name=model,
-                    temperature=temperature,
-                    max_tokens=max_tokens
-                )
-            elif provider == 'anthropic':
-                test_provider = AnthropicProvider(
+            if provider in ['openai', 'anthropic']:
+                test_provider = ProviderRegistry.create(
+                    provider,
+                    model,
                     api_key=api_key,
-                    model_name=model,
                     temperature=temperature,
                     max_tokens=max_tokens
                 )
             elif provider == 'bedrock':
-                # Extract region from endpoint or use default
-                region = endpoint if endpoint else 'us-east-1'
-                test_provider = BedrockProvider(
-                    model_name=model,
-                    region_name=region,
+                # Endpoint field holds the region (defaults to us-east-1)
+                test_provider = ProviderRegistry.create(
+                    provider,
+                    model,
+                    endpoint_url=endpoint,
                     temperature=temperature,
                     max_tokens=max_tokens
                 )
@@ -505,9 +497,10 @@ class SettingsView:
                     print(f"[WARNING] Could not verify model, proceeding with test: {e}")
                     test_model = model
                 
-                test_provider = OllamaProvider(
-                    model_name=test_model,
-                    base_url=endpoint,
+                test_provider = ProviderRegistry.create(
+                    provider,
+                    test_model,
+                    endpoint_url=endpoint,
                     temperature=temperature,
                     max_tokens=max_tokens
                 )
@@ -3,6 +3,7 @@
 import flet as ft
 from ui.styles.theme import AppTheme
 from ui.components.file_uploader import FileUploadComponent
+from ui.components.streaming_text import StreamingText
 from services.document_service import DocumentService
 from services.resume_service import ResumeService
 from services.jd_service import JobDescriptionService
@@ -23,11 +24,14 @@ class WriterView:
         self.resume_jd_dropdown = None
         self.cover_letter_jd_dropdown = None
         self.cold_email_jd_dropdown = None
+        # Inputs already generated once; generating them again asks for a
+        # fresh document instead of the cached one
+        self.generated_requests = set()
         
     def _refresh_jd_dropdowns(self):
         """Refresh all JD dropdowns with latest JDs"""
         from services.jd_service import JobDescriptionService
-        jds = JobDescriptionService.get_user_job_descriptions(self.user_id) or []
+        jds = JobDescriptionService.get_user_jds(self.user_id, limit=20) or []
         jd_options = [
             ft.dropdown.Option(str(jd['jd_id']), 
                 f"{jd.get('company_name', 'Company')} - {jd.get('job_title', 'Position')}") 
@@ -150,7 +154,7 @@ class WriterView:
     def _build_resume_section(self) -> ft.Container:
         """Build resume upload/selection section"""
         # Get existing resumes
-        resumes = ResumeService.get_all_resumes(self.user_id) or []
+        resumes = ResumeService.get_resume_summaries(self.user_id) or []
         
         # Resume dropdown
         self.resume_dropdown = ft.Dropdown(
@@ -163,7 +167,8 @@ class WriterView:
         )
         
         # Set default to active resume if available
-        active_resume = ResumeService.get_active_resume(self.user_id)
+        active_resumes = ResumeService.get_resume_summaries(self.user_id, active_only=True)
+        active_resume = active_resumes[0] if active_resumes else None
         if active_resume and self.resume_dropdown.options:
             for opt in self.resume_dropdown.options:
                 if opt.key == str(active_resume['resume_id']):
@@ -236,7 +241,7 @@ class WriterView:
     
     def _refresh_resume_dropdown(self):
         """Refresh resume dropdown with latest resumes"""
-        resumes = ResumeService.get_all_resumes(self.user_id) or []
+        resumes = ResumeService.get_resume_summaries(self.user_id) or []
         
         self.resume_dropdown.options = [
             ft.dropdown.Option(str(r['resume_id']), r.get('file_name', 'Resume')) 
@@ -253,7 +258,7 @@ class WriterView:
     
     def _update_resume_status(self):
         """Update resume status text"""
-        resumes = ResumeService.get_all_resumes(self.user_id) or []
+        resumes = ResumeService.get_resume_summaries(self.user_id) or []
         if self.selected_resume_id:
             selected_resume = next((r for r in resumes if r['resume_id'] == self.selected_resume_id), None)
             resume_name = selected_resume.get('file_name', 'Resume') if selected_resume else 'Selected Resume'
@@ -269,8 +274,8 @@ class WriterView:
     def _build_resume_tab(self) -> ft.Container:
         """Build resume generation tab"""
         # Get resumes and JDs
-        resumes = ResumeService.get_all_resumes(self.user_id) or []
-        jds = JobDescriptionService.get_user_job_descriptions(self.user_id) or []
+        resumes = ResumeService.get_resume_summaries(self.user_id) or []
+        jds = JobDescriptionService.get_user_jds(self.user_id, limit=20) or []
         
         self.resume_jd_dropdown = ft.Dropdown(
             label="Select Job Description",
@@ -317,7 +322,7 @@ class WriterView:
     
     def _build_cover_letter_tab(self) -> ft.Container:
         """Build cover letter generation tab"""
-        jds = JobDescriptionService.get_user_job_descriptions(self.user_id) or []
+        jds = JobDescriptionService.get_user_jds(self.user_id, limit=20) or []
         
         self.cover_letter_jd_dropdown = ft.Dropdown(
             label="Select Job Description",
@@ -340,9 +345,6 @@ class WriterView:
             width=350
         )
         
-        # Check if resume exists
-        resume = ResumeService.get_active_resume(self.user_id)
-        
         self.generate_cover_letter_btn = ft.ElevatedButton(
             "Generate Cover Letter",
             icon=ft.Icons.AUTO_FIX_HIGH,
@@ -366,7 +368,7 @@ class WriterView:
     
     def _build_cold_email_tab(self) -> ft.Container:
         """Build cold email generation tab"""
-        jds = JobDescriptionService.get_user_job_descriptions(self.user_id) or []
+        jds = JobDescriptionService.get_user_jds(self.user_id, limit=20) or []
         
         self.cold_email_purpose_field = ft.TextField(
             label="Email Purpose",
@@ -466,15 +468,19 @@ class WriterView:
             self._show_error("Please select or upload a resume first")
             return
         
+        request = ('resume', jd_id, template, self.selected_resume_id)
         try:
             result = DocumentService.generate_resume(
                 self.user_id,
                 jd_id,
                 template=template,
-                resume_id=self.selected_resume_id
+                resume_id=self.selected_resume_id,
+                on_token=self._stream_handler("Resume"),
+                use_cache=request not in self.generated_requests
             )
             
             if result and "error" not in result:
+                self.generated_requests.add(request)
                 self._show_document(result.get('content', ''), "Resume")
                 self._show_success("Resume generated successfully!")
             else:
@@ -509,15 +515,19 @@ class WriterView:
             self._show_error("Please select or upload a resume first")
             return
         
+        request = ('cover_letter', jd_id, length, self.selected_resume_id)
         try:
             result = DocumentService.generate_cover_letter(
                 self.user_id,
                 jd_id,
                 length=length,
-                resume_id=self.selected_resume_id
+                resume_id=self.selected_resume_id,
+                on_token=self._stream_handler("Cover Letter"),
+                use_cache=request not in self.generated_requests
             )
             
             if result and "error" not in result:
+                self.generated_requests.add(request)
                 self._show_document(result.get('content', ''), "Cover Letter")
                 self._show_success("Cover letter generated successfully!")
             else:
@@ -559,6 +569,7 @@ class WriterView:
             self._show_error("Please select or upload a resume first")
             return
         
+        request = ('cold_email', purpose, company, recipient_type, jd_id, self.selected_resume_id)
         try:
             result = DocumentService.generate_cold_email(
                 self.user_id,
@@ -566,10 +577,13 @@ class WriterView:
                 company=company,
                 recipient_type=recipient_type,
                 jd_id=jd_id,
-                resume_id=self.selected_resume_id
+                resume_id=self.selected_resume_id,
+                on_token=self._stream_handler("Cold Email"),
+                use_cache=request not in self.generated_requests
             )
             
             if result and "error" not in result:
+                self.generated_requests.add(request)
                 self._show_document(result.get('content', ''), "Cold Email")
                 self._show_success("Cold email generated successfully!")
             else:
@@ -593,6 +607,26 @@ class WriterView:
         ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=10)
         self.document_display.update()
     
+    def _stream_handler(self, doc_type: str):
+        """Create a callback that renders generated text as it streams in
+        
+        The streamed text is shown read-only; _show_document replaces it with
+        the editable view once generation completes.
+        """
+        def create_text() -> ft.Text:
+            text = ft.Text("", size=14, selectable=True)
+            self.document_display.content = ft.Column([
+                ft.Row([
+                    ft.Text(f"{doc_type}", size=18, weight=ft.FontWeight.BOLD, expand=True),
+                    ft.ProgressRing(width=16, height=16)
+                ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                ft.Divider(),
+                text
+            ], spacing=10, expand=True, scroll=ft.ScrollMode.AUTO)
+            return text
+        
+        return StreamingText(create_text, self.document_display.update)
+    
     def _show_document(self, content: str, doc_type: str):
         """Display generated document"""
         # Store document content and type